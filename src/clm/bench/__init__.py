@@ -0,0 +1,37 @@
+"""Built-in benchmark suite (``clm bench``).
+
+Public API:
+    SyntheticCourseConfig, generate_course -> SyntheticCourse
+    BenchRunner(course, workdir, config, options).run(scenarios) -> BenchReport
+    compare_reports(current, baseline, *, threshold, min_delta) -> list[ScenarioComparison]
+"""
+
+from clm.bench.baseline import (
+    BaselineError,
+    ScenarioComparison,
+    compare_reports,
+    load_baseline,
+)
+from clm.bench.scenarios import (
+    SCENARIOS,
+    BenchOptions,
+    BenchReport,
+    BenchRunner,
+    ScenarioResult,
+)
+from clm.bench.synthetic import SyntheticCourse, SyntheticCourseConfig, generate_course
+
+__all__ = [
+    "SCENARIOS",
+    "BaselineError",
+    "BenchOptions",
+    "BenchReport",
+    "BenchRunner",
+    "ScenarioComparison",
+    "ScenarioResult",
+    "SyntheticCourse",
+    "SyntheticCourseConfig",
+    "compare_reports",
+    "generate_course",
+    "load_baseline",
+]
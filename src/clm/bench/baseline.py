@@ -0,0 +1,103 @@
+"""Compare a ``clm bench`` report against a stored baseline.
+
+A scenario regresses when it got slower than the baseline by more than the
+relative ``threshold`` *and* by more than ``min_delta`` seconds — the
+absolute floor keeps millisecond-scale scenarios (monitor refresh, slide
+search) from flapping on scheduler noise. A scenario that succeeded in the
+baseline but failed now is always a regression.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from clm.bench.scenarios import REPORT_SCHEMA_VERSION
+
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_MIN_DELTA = 0.05
+
+
+class BaselineError(ValueError):
+    """The baseline file is unreadable or incompatible with this report."""
+
+
+@dataclass
+class ScenarioComparison:
+    """One scenario's current timing next to its baseline."""
+
+    name: str
+    baseline: float | None
+    current: float | None
+    regressed: bool
+    reason: str = ""
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "baseline": self.baseline,
+            "current": self.current,
+            "ratio": self.ratio,
+            "regressed": self.regressed,
+            "reason": self.reason,
+        }
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    """Read a baseline report written by ``clm bench --output``."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise BaselineError(f"cannot read baseline {path}: {exc}") from None
+    if not isinstance(data, dict) or data.get("schema_version") != REPORT_SCHEMA_VERSION:
+        raise BaselineError(
+            f"baseline {path} has schema version {data.get('schema_version')!r} "
+            f"(expected {REPORT_SCHEMA_VERSION}); re-record it with this clm version"
+            if isinstance(data, dict)
+            else f"baseline {path} is not a clm bench report"
+        )
+    return data
+
+
+def compare_reports(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> list[ScenarioComparison]:
+    """Compare every scenario present in both reports, in ``current``'s order."""
+    if current.get("course") != baseline.get("course"):
+        raise BaselineError(
+            "baseline was recorded for a different synthetic course "
+            f"({baseline.get('course')} vs {current.get('course')}); "
+            "timings are not comparable"
+        )
+    base_scenarios: dict[str, Any] = baseline.get("scenarios", {})
+    comparisons: list[ScenarioComparison] = []
+    for name, cur in current.get("scenarios", {}).items():
+        base = base_scenarios.get(name)
+        if base is None:
+            continue
+        base_s = base.get("seconds")
+        cur_s = cur.get("seconds")
+        if base.get("ok") and not cur.get("ok"):
+            comparisons.append(
+                ScenarioComparison(name, base_s, cur_s, True, "failed (passed in baseline)")
+            )
+            continue
+        if base_s is None or cur_s is None or not base.get("ok"):
+            comparisons.append(ScenarioComparison(name, base_s, cur_s, False, "not comparable"))
+            continue
+        delta = cur_s - base_s
+        regressed = delta > min_delta and cur_s > base_s * (1.0 + threshold)
+        reason = f"{delta:+.3f}s ({cur_s / base_s - 1.0:+.0%})" if base_s else f"{delta:+.3f}s"
+        comparisons.append(ScenarioComparison(name, base_s, cur_s, regressed, reason))
+    return comparisons
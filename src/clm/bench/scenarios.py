@@ -0,0 +1,393 @@
+"""Standard ``clm bench`` scenarios and the JSON report they produce.
+
+Build scenarios run the real ``clm build`` in a subprocess (``sys.executable
+-m clm``), exactly like ``scripts/profile_build_stall.py`` and ``clm
+kernel-triage`` do, against isolated cache/jobs databases inside the bench
+work directory — a benchmark never touches a real course's databases. The
+in-process scenarios (monitor refresh, slide search) time the same library
+calls ``clm status`` and ``clm slides search`` make.
+
+Scenario order matters and is fixed by :data:`SCENARIOS`: ``noop_build`` and
+``one_deck_edit`` measure the warm state ``cold_build`` leaves behind, and
+``monitor_refresh`` reads the jobs database the builds populated.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from clm.__version__ import __version__
+from clm.bench.synthetic import EDIT_MARKER, SyntheticCourse, SyntheticCourseConfig
+
+#: Version of the JSON report layout; bump on incompatible changes so
+#: :func:`clm.bench.baseline.compare_reports` can refuse a stale baseline.
+REPORT_SCHEMA_VERSION = 1
+
+#: Every scenario, in execution order.
+SCENARIOS: tuple[str, ...] = (
+    "cold_build",
+    "noop_build",
+    "one_deck_edit",
+    "watch_roundtrip",
+    "monitor_refresh",
+    "slide_search",
+)
+
+_WATCH_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class BenchOptions:
+    """How the scenarios drive the build."""
+
+    execute: bool = False  # False: --no-html, no kernel is ever started
+    render_diagrams: bool = False  # False: --no-diagrams
+    workers: str = "direct"
+    repeat: int = 5  # iterations of the in-process scenarios
+    timeout: float = 1800.0  # per build subprocess
+    watch_timeout: float = 300.0
+
+
+@dataclass
+class ScenarioResult:
+    """Timing of one scenario; ``seconds`` is what baselines compare."""
+
+    name: str
+    seconds: float | None
+    ok: bool = True
+    detail: dict[str, Any] = field(default_factory=dict)
+    error: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"seconds": self.seconds, "ok": self.ok}
+        if self.detail:
+            data["detail"] = self.detail
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+@dataclass
+class BenchReport:
+    """Machine-readable result of one ``clm bench`` run."""
+
+    config: SyntheticCourseConfig
+    options: BenchOptions
+    results: list[ScenarioResult] = field(default_factory=list)
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    @property
+    def ok(self) -> bool:
+        return all(r.ok for r in self.results)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema_version": REPORT_SCHEMA_VERSION,
+            "clm_version": __version__,
+            "created_at": self.created_at,
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "course": self.config.to_dict(),
+            "options": {
+                "execute": self.options.execute,
+                "render_diagrams": self.options.render_diagrams,
+                "workers": self.options.workers,
+                "repeat": self.options.repeat,
+            },
+            "scenarios": {r.name: r.to_dict() for r in self.results},
+        }
+
+
+class BenchRunner:
+    """Run scenarios against one generated course in ``workdir``."""
+
+    def __init__(
+        self,
+        course: SyntheticCourse,
+        workdir: Path,
+        config: SyntheticCourseConfig,
+        options: BenchOptions,
+        *,
+        progress: Callable[[str], None] | None = None,
+    ) -> None:
+        self.course = course
+        self.workdir = workdir
+        self.config = config
+        self.options = options
+        self.cache_db = workdir / "bench_cache.db"
+        self.jobs_db = workdir / "bench_jobs.db"
+        self.output_dir = workdir / "output"
+        self._progress = progress or (lambda _msg: None)
+        self._edit_counter = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def run(self, scenarios: Sequence[str]) -> BenchReport:
+        unknown = [s for s in scenarios if s not in SCENARIOS]
+        if unknown:
+            raise ValueError(f"unknown scenario(s): {', '.join(unknown)}")
+        report = BenchReport(config=self.config, options=self.options)
+        for name in SCENARIOS:
+            if name not in scenarios:
+                continue
+            self._progress(f"running {name} ...")
+            try:
+                result = getattr(self, f"_scenario_{name}")()
+            except Exception as exc:  # a broken scenario must not hide the others
+                result = ScenarioResult(name=name, seconds=None, ok=False, error=str(exc))
+            report.results.append(result)
+            if result.ok:
+                self._progress(f"  {name}: {result.seconds:.3f}s")
+            else:
+                self._progress(f"  {name}: FAILED ({result.error})")
+        return report
+
+    # ------------------------------------------------------------------
+    # Build scenarios
+    # ------------------------------------------------------------------
+
+    def build_command(self, *extra: str) -> list[str]:
+        cmd = [
+            sys.executable,
+            "-m",
+            "clm",
+            "--cache-db-path",
+            str(self.cache_db),
+            "--jobs-db-path",
+            str(self.jobs_db),
+            "build",
+            str(self.course.spec_file),
+            "--data-dir",
+            str(self.course.data_dir),
+            "--output-dir",
+            str(self.output_dir),
+            "--workers",
+            self.options.workers,
+            "--no-progress",
+            "--log-level",
+            "WARNING",
+        ]
+        if not self.options.execute:
+            cmd.append("--no-html")
+        if not self.options.render_diagrams:
+            cmd.append("--no-diagrams")
+        if len(self.config.languages) == 1:
+            cmd.extend(["--language", self.config.languages[0]])
+        cmd.extend(extra)
+        return cmd
+
+    def _timed_build(self, name: str) -> ScenarioResult:
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            self.build_command(),
+            cwd=str(self.workdir),
+            capture_output=True,
+            text=True,
+            timeout=self.options.timeout,
+            env=_bench_env(),
+        )
+        elapsed = time.perf_counter() - t0
+        if proc.returncode != 0:
+            tail = "\n".join((proc.stderr or proc.stdout).splitlines()[-5:])
+            return ScenarioResult(
+                name=name,
+                seconds=elapsed,
+                ok=False,
+                error=f"clm build exited {proc.returncode}: {tail}",
+            )
+        return ScenarioResult(name=name, seconds=elapsed)
+
+    def _scenario_cold_build(self) -> ScenarioResult:
+        for db in (self.cache_db, self.jobs_db):
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{db}{suffix}").unlink(missing_ok=True)
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        return self._timed_build("cold_build")
+
+    def _scenario_noop_build(self) -> ScenarioResult:
+        return self._timed_build("noop_build")
+
+    def _scenario_one_deck_edit(self) -> ScenarioResult:
+        self._next_edit()
+        return self._timed_build("one_deck_edit")
+
+    def _scenario_watch_roundtrip(self) -> ScenarioResult:
+        """Edit one deck under ``clm build --watch``; time until its output changes.
+
+        The watcher's initial build is excluded: the clock starts at the edit
+        and stops when a file under the output tree carrying the edit's unique
+        marker appears.
+        """
+        proc = subprocess.Popen(
+            self.build_command("--watch"),
+            cwd=str(self.workdir),
+            # Never read: a PIPE would fill up over a long watch and stall it.
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=_bench_env(),
+        )
+        try:
+            # The watcher builds once before it starts observing; wait until
+            # the output tree has settled so the edit is not swallowed by it.
+            if not _wait_for_quiet_tree(self.output_dir, proc, self.options.watch_timeout):
+                return ScenarioResult(
+                    name="watch_roundtrip",
+                    seconds=None,
+                    ok=False,
+                    error="watch build did not settle before the timeout",
+                )
+            counter = self._next_edit()
+            needle = f"{EDIT_MARKER} {counter}"
+            t_edit = time.time()
+            t0 = time.perf_counter()
+            deadline = t0 + self.options.watch_timeout
+            while time.perf_counter() < deadline:
+                if proc.poll() is not None:
+                    return ScenarioResult(
+                        name="watch_roundtrip",
+                        seconds=None,
+                        ok=False,
+                        error=f"watch process exited {proc.returncode}",
+                    )
+                if _output_contains(self.output_dir, needle, since=t_edit):
+                    return ScenarioResult(name="watch_roundtrip", seconds=time.perf_counter() - t0)
+                time.sleep(_WATCH_POLL_INTERVAL)
+            return ScenarioResult(
+                name="watch_roundtrip",
+                seconds=None,
+                ok=False,
+                error="edited deck was not rebuilt before the timeout",
+            )
+        finally:
+            _stop_process(proc)
+
+    # ------------------------------------------------------------------
+    # In-process scenarios
+    # ------------------------------------------------------------------
+
+    def _scenario_monitor_refresh(self) -> ScenarioResult:
+        from clm.cli.status.collector import StatusCollector
+
+        def refresh() -> None:
+            with StatusCollector(db_path=self.jobs_db) as collector:
+                collector.collect()
+
+        return _repeat("monitor_refresh", refresh, self.options.repeat)
+
+    def _scenario_slide_search(self) -> ScenarioResult:
+        from clm.slides.search import search_slides
+
+        query = f"Synthetic Topic {max(1, self.config.decks // 2)}"
+
+        def search() -> None:
+            search_slides(query, self.course.slides_dir, course_spec_path=self.course.spec_file)
+
+        return _repeat("slide_search", search, self.options.repeat)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _next_edit(self) -> int:
+        self._edit_counter += 1
+        self.course.edit_deck(self.config.decks // 2, self._edit_counter)
+        return self._edit_counter
+
+
+def _bench_env() -> dict[str, str]:
+    env = dict(os.environ)
+    # Bench builds must not pick up a course's jobs DB redirect, nor pay for
+    # the profiler or the build trace.
+    env.pop("CLM_JOBS_DB_PATH", None)
+    env.pop("CLM_CACHE_DB_PATH", None)
+    env.pop("CLM_PROFILE_BUILD", None)
+    env.pop("CLM_BUILD_TRACE", None)
+    return env
+
+
+def _repeat(name: str, fn: Callable[[], None], repeat: int) -> ScenarioResult:
+    timings: list[float] = []
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return ScenarioResult(
+        name=name,
+        seconds=statistics.median(timings),
+        detail={"runs": len(timings), "min": min(timings), "max": max(timings)},
+    )
+
+
+def _latest_mtime(root: Path) -> float:
+    latest = 0.0
+    if not root.is_dir():
+        return latest
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                latest = max(latest, os.stat(os.path.join(dirpath, filename)).st_mtime)
+            except OSError:
+                continue
+    return latest
+
+
+def _wait_for_quiet_tree(
+    root: Path, proc: subprocess.Popen, timeout: float, quiet_for: float = 2.0
+) -> bool:
+    """Wait until ``root`` exists and no file in it changed for ``quiet_for`` s."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            return False
+        latest = _latest_mtime(root)
+        if latest and time.time() - latest >= quiet_for:
+            return True
+        time.sleep(_WATCH_POLL_INTERVAL * 5)
+    return False
+
+
+def _output_contains(root: Path, needle: str, *, since: float) -> bool:
+    """Whether a file under ``root`` modified after ``since`` contains ``needle``."""
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            try:
+                if os.stat(path).st_mtime < since:
+                    continue
+                with open(path, encoding="utf-8", errors="ignore") as fh:
+                    if needle in fh.read():
+                        return True
+            except OSError:
+                continue
+    return False
+
+
+def _stop_process(proc: subprocess.Popen) -> None:
+    if proc.poll() is not None:
+        return
+    try:
+        if sys.platform == "win32":
+            proc.terminate()
+        else:
+            proc.send_signal(signal.SIGINT)  # lets the watcher stop its pool cleanly
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
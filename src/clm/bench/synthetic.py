@@ -0,0 +1,229 @@
+"""Synthetic course generator for ``clm bench``.
+
+Generates a self-contained course (spec + ``slides/`` tree) whose size is
+controlled by :class:`SyntheticCourseConfig`. Every deck is plain Python
+with no imports beyond the standard library, so an executing build needs
+nothing but the local Python kernel — the benchmark runs offline. Diagram
+sources are generated as real PlantUML / Draw.io files; whether they are
+*rendered* is the scenario runner's decision (``--no-diagrams`` keeps the
+benchmark independent of the diagram binaries while still exercising file
+discovery).
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+#: Marker line the edit scenarios append to a deck. The ``{n}`` counter keeps
+#: every edit a real content change, so the build cache never short-circuits.
+EDIT_MARKER = "clm-bench-edit"
+
+_SLIDE_TEMPLATE = """\
+# j2 from 'macros.j2' import header
+# {{{{ header("Synthetisches Thema {k}", "Synthetic Topic {k}") }}}}
+
+# %% [markdown] lang="de"
+# ## Synthetisches Thema {k}
+#
+{filler_de}
+
+# %% [markdown] lang="en"
+# ## Synthetic Topic {k}
+#
+{filler_en}
+
+# %%
+def compute_{k}(n):
+    total = 0
+    for i in range(n):
+        total += i * {k}
+    return total
+
+# %%
+compute_{k}(10)
+{extra_cells}"""
+
+_CODE_CELL = """
+# %%
+values_{k}_{c} = [compute_{k}(i) for i in range({c} + 3)]
+values_{k}_{c}[-1]
+"""
+
+_PLANTUML_TEMPLATE = """\
+@startuml
+
+title Synthetic Diagram {k}.{d}
+
+class Synthetic{k}x{d} {{
+    +name: string
+    +value(): int
+}}
+
+@enduml
+"""
+
+_DRAWIO_TEMPLATE = """\
+<mxfile host="clm-bench" type="embed">
+  <diagram id="synthetic-{k}-{d}" name="Synthetic {k}.{d}">
+    <mxGraphModel dx="800" dy="600" grid="1" gridSize="10">
+      <root>
+        <mxCell id="0" />
+        <mxCell id="1" parent="0" />
+        <mxCell id="2" value="Box {k}.{d}" style="rounded=1;html=1;" vertex="1" parent="1">
+          <mxGeometry x="200" y="200" width="120" height="60" as="geometry" />
+        </mxCell>
+      </root>
+    </mxGraphModel>
+  </diagram>
+</mxfile>
+"""
+
+
+@dataclass(frozen=True)
+class SyntheticCourseConfig:
+    """Size knobs of a synthetic benchmark course."""
+
+    decks: int = 24
+    decks_per_module: int = 8
+    code_cells: int = 4
+    diagrams: int = 0  # PlantUML + Draw.io sources per deck (alternating)
+    data_files: int = 1  # sibling files under each topic's ``data/``
+    data_file_kb: int = 8
+    languages: tuple[str, ...] = ("de", "en")
+
+    def __post_init__(self) -> None:
+        if self.decks < 1:
+            raise ValueError("a synthetic course needs at least one deck")
+        if self.decks_per_module < 1:
+            raise ValueError("decks_per_module must be positive")
+        for lang in self.languages:
+            if lang not in ("de", "en"):
+                raise ValueError(f"unsupported language {lang!r} (expected 'de' or 'en')")
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["languages"] = list(self.languages)
+        return data
+
+
+@dataclass
+class SyntheticCourse:
+    """A generated course on disk."""
+
+    root: Path
+    spec_file: Path
+    data_dir: Path
+    slides_dir: Path
+    deck_files: list[Path]
+
+    def edit_deck(self, index: int, counter: int) -> Path:
+        """Append a uniquely-marked code cell to deck ``index``; return its path."""
+        deck = self.deck_files[index % len(self.deck_files)]
+        with deck.open("a", encoding="utf-8") as fh:
+            fh.write(f'\n# %%\n"{EDIT_MARKER} {counter}"\n')
+        return deck
+
+
+def _topic_id(k: int) -> str:
+    return f"synth_{k:04d}"
+
+
+def generate_course(root: Path, config: SyntheticCourseConfig) -> SyntheticCourse:
+    """Write a synthetic course under ``root`` and describe it.
+
+    The layout mirrors a real course repository: ``course.xml`` next to a
+    ``slides/module_NNN_*/topic_NNN_*/`` tree, with one section per module.
+    Generation is deterministic — the same config always produces byte-equal
+    files — so results from different runs and machines are comparable.
+    """
+    slides_dir = root / "slides"
+    filler_de = "\n".join(f"# Kontextzeile {i} des synthetischen Foliensatzes." for i in range(12))
+    filler_en = "\n".join(f"# Context line {i} of the synthetic deck." for i in range(12))
+    data_blob = ("synthetic data payload; " * 40 + "\n") * max(
+        1, config.data_file_kb * 1024 // 1000
+    )
+
+    deck_files: list[Path] = []
+    modules: list[list[str]] = []
+    for k in range(1, config.decks + 1):
+        module_index = (k - 1) // config.decks_per_module
+        if module_index == len(modules):
+            modules.append([])
+        topic_id = _topic_id(k)
+        modules[module_index].append(topic_id)
+
+        topic_dir = (
+            slides_dir / f"module_{module_index * 10 + 100:03d}_synth" / f"topic_{k:04d}_{topic_id}"
+        )
+        topic_dir.mkdir(parents=True, exist_ok=True)
+        extra_cells = "".join(_CODE_CELL.format(k=k, c=c) for c in range(config.code_cells))
+        deck = topic_dir / f"slides_{topic_id}.py"
+        deck.write_text(
+            _SLIDE_TEMPLATE.format(
+                k=k, filler_de=filler_de, filler_en=filler_en, extra_cells=extra_cells
+            ),
+            encoding="utf-8",
+        )
+        deck_files.append(deck)
+
+        for d in range(config.diagrams):
+            if d % 2 == 0:
+                (topic_dir / "pu").mkdir(exist_ok=True)
+                (topic_dir / "pu" / f"diagram_{k}_{d}.pu").write_text(
+                    _PLANTUML_TEMPLATE.format(k=k, d=d), encoding="utf-8"
+                )
+            else:
+                (topic_dir / "drawio").mkdir(exist_ok=True)
+                (topic_dir / "drawio" / f"drawing_{k}_{d}.drawio").write_text(
+                    _DRAWIO_TEMPLATE.format(k=k, d=d), encoding="utf-8"
+                )
+        if config.diagrams:
+            (topic_dir / "img").mkdir(exist_ok=True)
+
+        for f in range(config.data_files):
+            (topic_dir / "data").mkdir(exist_ok=True)
+            (topic_dir / "data" / f"sibling_{f}.txt").write_text(data_blob, encoding="utf-8")
+
+    sections_xml = []
+    for m, topic_ids in enumerate(modules, start=1):
+        topics_xml = "\n".join(f"                <topic>{tid}</topic>" for tid in topic_ids)
+        sections_xml.append(
+            f"""        <section>
+            <name>
+                <de>Woche {m}</de>
+                <en>Week {m}</en>
+            </name>
+            <topics>
+{topics_xml}
+            </topics>
+        </section>"""
+        )
+
+    spec_file = root / "course.xml"
+    spec_file.write_text(
+        f"""<course>
+    <name>
+        <de>Synthetischer Benchmark-Kurs</de>
+        <en>Synthetic Benchmark Course</en>
+    </name>
+    <prog-lang>python</prog-lang>
+    <description>
+        <de>Benchmark</de>
+        <en>Benchmark</en>
+    </description>
+    <sections>
+{chr(10).join(sections_xml)}
+    </sections>
+</course>
+""",
+        encoding="utf-8",
+    )
+    return SyntheticCourse(
+        root=root,
+        spec_file=spec_file,
+        data_dir=root,
+        slides_dir=slides_dir,
+        deck_files=deck_files,
+    )
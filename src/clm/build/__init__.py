@@ -23,6 +23,7 @@ from clm.build.config import (
     resolve_write_provenance_manifest,
 )
 from clm.build.engine import (
+    create_worker_daemon,
     initialize_paths_and_course,
     process_course_with_backend,
     run_build,
@@ -39,6 +40,7 @@ __all__ = [
     "OutputFormatter",
     "SpecValidationFailure",
     "UnownedOutputRootError",
+    "create_worker_daemon",
     "initialize_paths_and_course",
     "process_course_with_backend",
     "resolve_explain_rebuilds",
@@ -59,6 +59,7 @@ from clm.core.course_spec import (
     SectionSelection,
 )
 from clm.core.messaging.correlation_ids import all_correlation_ids
+from clm.core.output_write_registry import OutputWriteRegistry
 from clm.core.utils.path_utils import output_path_for
 from clm.infrastructure.backends.sqlite_backend import SqliteBackend
 from clm.infrastructure.database.db_operations import DatabaseManager
@@ -143,10 +144,11 @@ def discard_implicit_execution_scratch(course: Course) -> None:
 
     An implicit execution exists only to warm the executed-notebook cache for
     the HTML a target actually asked for (see
-    ``clm.core.execution_dependencies``); the HTML it emits has no consumer. It
-    is written under ``Course.implicit_execution_root`` during the build and
-    dropped here, so a build restricted to e.g. ``completed`` HTML leaves no
-    recording material behind (issue #890).
+    ``clm.core.execution_dependencies``). It now runs execute-only and writes
+    nothing, but builds from earlier versions rendered its HTML under
+    ``Course.implicit_execution_root``; dropping that directory here keeps a
+    build restricted to e.g. ``completed`` HTML free of recording material
+    (issue #890).
 
     Called at both ends of a build: after it, so nothing survives a normal run,
     and before it, so a run killed mid-flight self-heals instead of leaving a
@@ -240,6 +242,7 @@ def _maybe_start_mitmproxy_transport(
     import certifi
 
     from clm.infrastructure.http_replay_mitm import MitmproxyManager
+    from clm.infrastructure.http_replay_mitm.http_replay_cassette import default_index_path
     from clm.workers.notebook.notebook_processor import resolve_http_replay_ignore_hosts
 
     base = Path(jobs_db_path).resolve().parent / "mitm"
@@ -282,6 +285,7 @@ def _maybe_start_mitmproxy_transport(
         confdir=confdir,
         ignore_hosts=ignore_hosts,
         trace_dir=trace_dir,
+        index_path=default_index_path(),
     )
     manager.start()
 
@@ -832,6 +836,80 @@ def start_managed_workers(lifecycle_manager, worker_config) -> list:
     return started_workers
 
 
+def create_worker_daemon(config: BuildConfig, *, idle_timeout: float | None, prewarm: bool):
+    """Set up a ``clm workers daemon`` pool exactly as :func:`run_build` would.
+
+    The daemon is only useful if a later build's fingerprint matches it, so
+    the worker configuration, workspace mount root, data directory and
+    notebook kernel interpreter are resolved from the course spec through
+    the same helpers the build uses.
+    """
+    from clm.infrastructure.workers.daemon import WorkerDaemon
+    from clm.infrastructure.workers.kernel_env import (
+        resolve_kernel_interpreter,
+        resolve_notebook_kernel_python,
+    )
+
+    course, _root_dirs, data_dir = initialize_paths_and_course(config)
+    worker_config = configure_workers(config)
+    enable_jupyterlite_workers_if_needed(course, worker_config)
+    disable_diagram_workers_if_requested(config, worker_config)
+
+    return WorkerDaemon(
+        worker_config,
+        jobs_db_path=config.jobs_db_path,
+        workspace_path=_resolve_worker_workspace_path(course, worker_config),
+        cache_db_path=config.cache_db_path,
+        data_dir=data_dir,
+        notebook_kernel_python=resolve_kernel_interpreter(
+            resolve_notebook_kernel_python(course.spec.kernel_python)
+        ),
+        idle_timeout=idle_timeout,
+        prewarm=prewarm,
+    )
+
+
+def _find_worker_daemon(
+    config: BuildConfig,
+    worker_config,
+    *,
+    workspace_path: Path,
+    data_dir: Path,
+    notebook_kernel_python: str,
+    course_uses_http_replay: bool,
+):
+    """The running ``clm workers daemon`` this build can attach to, or ``None``.
+
+    Attaching is skipped when disabled in the config, when workers would not
+    be started anyway (``auto_start`` off), and for HTTP-replay courses: the
+    replay proxy's environment must be in place before the workers spawn,
+    and the daemon's workers spawned without it.
+    """
+    if not worker_config.attach_daemon or not worker_config.auto_start:
+        return None
+    if course_uses_http_replay:
+        logger.info("Not attaching to a worker daemon: course uses HTTP replay")
+        return None
+
+    from clm.infrastructure.workers.daemon import daemon_fingerprint, find_attachable_daemon
+
+    try:
+        fingerprint = daemon_fingerprint(
+            worker_config.get_all_worker_configs(),
+            workspace_path=workspace_path,
+            data_dir=data_dir,
+            cache_db_path=config.cache_db_path,
+            notebook_kernel_python=notebook_kernel_python,
+        )
+        daemon = find_attachable_daemon(config.jobs_db_path, fingerprint)
+    except Exception as exc:  # noqa: BLE001 — the daemon is an optimization
+        logger.warning(f"Could not check for a worker daemon: {exc}")
+        return None
+    if daemon is not None:
+        logger.info(f"Attaching to worker daemon {daemon.session_id} (pid {daemon.pid})")
+    return daemon
+
+
 def _report_duplicate_file_warnings(course: Course, build_reporter: BuildReporter) -> None:
     """Check for duplicate output files and report warnings."""
     from clm.core.build_data_classes import BuildWarning
@@ -1151,6 +1229,7 @@ def _maybe_run_sweep(
     only ``process_course_with_backend`` passes one.
     """
     from clm.build.output_sweep import sweep_stray_files
+    from clm.core.output_inventory import OutputInventory, default_inventory_db_path
 
     if not config.sweep:
         return
@@ -1177,13 +1256,24 @@ def _maybe_run_sweep(
     if ownership is not None and not config.allow_unowned_output:
         unowned_roots = ownership.unowned_roots
 
+    # The previous build's directory listings: directories whose mtime is
+    # unchanged are not listed again. Only worth loading when the sweep runs.
+    inventory: OutputInventory | None = None
+    if skip_reason is None:
+        inventory = OutputInventory.load(
+            default_inventory_db_path(config.cache_db_path), dict.fromkeys(root_dirs)
+        )
+
     report = sweep_stray_files(
         root_dirs,
         backend.output_write_registry,
         image_registry=getattr(backend, "image_registry", None),
         skip_reason=skip_reason,
         unowned_roots=unowned_roots,
+        inventory=inventory,
     )
+    if inventory is not None:
+        inventory.save()
 
     if report.skipped:
         # ``config.unowned_output_roots`` deliberately keeps its snapshot
@@ -1762,7 +1852,10 @@ async def run_build(
 
     # Show startup progress for loading course
     output_formatter.show_startup_message("Loading course specification...")
-    course, root_dirs, data_dir = initialize_paths_and_course(config)
+    from clm.core import build_trace as _build_trace
+
+    with _build_trace.tracer.span(_build_trace.SPEC_LOAD, "host"):
+        course, root_dirs, data_dir = initialize_paths_and_course(config)
     output_formatter.show_startup_message(
         f"Loaded {len(course.files)} files from {len(course.sections)} sections"
     )
@@ -1831,10 +1924,23 @@ async def run_build(
         resolve_notebook_kernel_python(course.spec.kernel_python)
     )
 
+    course_uses_http_replay = any(getattr(f, "http_replay", False) for f in course.files)
+    daemon = _find_worker_daemon(
+        config,
+        worker_config,
+        workspace_path=worker_workspace_path,
+        data_dir=data_dir,
+        notebook_kernel_python=notebook_kernel_python,
+        course_uses_http_replay=course_uses_http_replay,
+    )
+
     lifecycle_manager = WorkerLifecycleManager(
         config=worker_config,
         db_path=config.jobs_db_path,
         workspace_path=worker_workspace_path,
+        # Adopting the daemon's session stamps this build's jobs for the
+        # daemon's workers (issue #620 claim scoping).
+        session_id=daemon.session_id if daemon is not None else None,
         cache_db_path=config.cache_db_path,
         data_dir=data_dir,
         notebook_kernel_python=notebook_kernel_python,
@@ -1847,7 +1953,6 @@ async def run_build(
     # with no replay topics never needs the proxy (and so never requires
     # mitmdump). ``worker_config`` lets it bind 0.0.0.0 when Docker workers
     # will reach it via host.docker.internal.
-    course_uses_http_replay = any(getattr(f, "http_replay", False) for f in course.files)
     mitm_manager = (
         _maybe_start_mitmproxy_transport(
             config.http_replay_mode, config.jobs_db_path, worker_config=worker_config
@@ -1856,10 +1961,14 @@ async def run_build(
         else None
     )
 
-    output_formatter.show_startup_message("Starting workers...")
-    started_workers = start_managed_workers(lifecycle_manager, worker_config)
-    if started_workers:
-        output_formatter.show_startup_message(f"Started {len(started_workers)} worker(s)")
+    if daemon is not None:
+        output_formatter.show_startup_message(f"Using worker daemon (pid {daemon.pid})")
+        started_workers: list = []
+    else:
+        output_formatter.show_startup_message("Starting workers...")
+        started_workers = start_managed_workers(lifecycle_manager, worker_config)
+        if started_workers:
+            output_formatter.show_startup_message(f"Started {len(started_workers)} worker(s)")
 
     # A single notebook worker serializes every notebook job; on a large
     # course that is almost always an unintentional default rather than a
@@ -1897,6 +2006,9 @@ async def run_build(
     )
 
     summary: BuildSummary | None = None
+    # Kept past the backend's lifetime: the provenance manifest below takes
+    # the digests of everything this build wrote or verified from it.
+    output_write_registry: OutputWriteRegistry | None = None
     try:
         with DatabaseManager(config.cache_db_path, force_init=config.clear_cache) as db_manager:
             backend = SqliteBackend(
@@ -1931,6 +2043,7 @@ async def run_build(
                 job_stall_timeout=worker_config.job_stall_timeout or None,
                 max_wait_for_completion_duration=(worker_config.max_wait_for_completion or None),
             )
+            output_write_registry = backend.output_write_registry
 
             async with backend:
                 summary = await process_course_with_backend(
@@ -2004,6 +2117,7 @@ async def run_build(
         from datetime import datetime, timezone
 
         from clm.core.git_info import get_git_info
+        from clm.core.output_inventory import OutputInventory, default_inventory_db_path
         from clm.core.provenance_manifest import write_provenance_manifests
 
         try:
@@ -2023,6 +2137,12 @@ async def run_build(
                     )
                 output_formatter.show_startup_message("Writing provenance manifests...")
                 git = get_git_info(course.course_root)
+                # Outputs this build did not write are hashed only when their
+                # size or mtime differs from what the previous build recorded.
+                inventory = OutputInventory.load(
+                    default_inventory_db_path(config.cache_db_path),
+                    [target.output_root for target in course.output_targets],
+                )
                 written = write_provenance_manifests(
                     course,
                     source_commit=git["commit"],
@@ -2031,7 +2151,10 @@ async def run_build(
                     spec_name=config.spec_file.name,
                     failed_topics=failed_topics,
                     skip_roots=_manifest_roots_to_skip(course, config),
+                    output_write_registry=output_write_registry,
+                    inventory=inventory,
                 )
+                inventory.save()
                 if written:
                     logger.info("Wrote %d provenance manifest(s)", len(written))
         except Exception as e:
@@ -34,8 +34,11 @@ from typing import TYPE_CHECKING
 
 from attrs import Factory, define, field, frozen
 
+from clm.core.output_inventory import KIND_DIR, KIND_FILE, KIND_OTHER
+
 if TYPE_CHECKING:
     from clm.core.image_registry import ImageRegistry
+    from clm.core.output_inventory import OutputInventory
     from clm.core.output_write_registry import OutputWriteRegistry
 
 logger = logging.getLogger(__name__)
@@ -152,16 +155,36 @@ def _matches_keep_pattern(rel_path: str, patterns: Iterable[str]) -> bool:
     return False
 
 
-def _has_nested_git(directory: Path) -> bool:
-    """Return True iff ``directory`` itself contains a ``.git`` entry.
+def _list_directory(directory: Path, inventory: OutputInventory | None) -> list[tuple[str, str]]:
+    """Return the ``(name, kind)`` entries of ``directory``. Raises OSError.
 
-    Treats both ``.git/`` directories and ``.git`` worktree files (used
-    for nested git worktrees) as nested-repo markers.
+    With an ``inventory``, a directory whose mtime matches the previous
+    build's listing is not read again — any entry added, removed or
+    renamed since would have changed that mtime.
     """
-    try:
-        return (directory / ".git").exists()
-    except OSError:
-        return False
+    if inventory is None:
+        return _scan_directory(directory)
+    mtime_ns = os.stat(directory).st_mtime_ns
+    listing = inventory.listing_if_unchanged(directory, mtime_ns)
+    if listing is not None:
+        return list(listing.entries)
+    entries = _scan_directory(directory)
+    inventory.record_listing(directory, mtime_ns, entries)
+    return entries
+
+
+def _scan_directory(directory: Path) -> list[tuple[str, str]]:
+    entries: list[tuple[str, str]] = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                kind = KIND_DIR
+            elif entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                kind = KIND_FILE
+            else:
+                kind = KIND_OTHER
+            entries.append((entry.name, kind))
+    return entries
 
 
 def sweep_stray_files(
@@ -173,6 +196,7 @@ def sweep_stray_files(
     dry_run: bool = False,
     skip_reason: str | None = None,
     unowned_roots: Iterable[Path] = (),
+    inventory: OutputInventory | None = None,
 ) -> SweepReport:
     """Walk each root and delete files not in the registries' tracked sets.
 
@@ -207,6 +231,10 @@ def sweep_stray_files(
             Otherwise the root is left untouched and listed in
             ``refused_roots``. Empty by default, so callers with no
             snapshot get the pre-gate behavior.
+        inventory: Optional :class:`~clm.core.output_inventory.OutputInventory`
+            holding the previous build's directory listings. Directories
+            whose mtime is unchanged are planned from it instead of being
+            listed again; the caller saves it afterwards.
     """
     if skip_reason is not None:
         return SweepReport(skipped=True, skip_reason=skip_reason, dry_run=dry_run)
@@ -238,6 +266,7 @@ def sweep_stray_files(
             expected,
             keep_patterns=tuple(keep_patterns),
             plan=plan,
+            inventory=inventory,
         )
 
         if root in unowned and not (plan.is_empty and not plan.scan_failed):
@@ -322,6 +351,7 @@ def _plan_directory(
     *,
     keep_patterns: tuple[str, ...],
     plan: _SweepPlan,
+    inventory: OutputInventory | None = None,
 ) -> bool:
     """Recursively plan the sweep of ``directory``. True iff it will empty.
 
@@ -330,19 +360,25 @@ def _plan_directory(
     plan its removal — appended after its children, so ``plan.dirs`` is
     in deepest-first order.
 
-    Subtrees containing a nested ``.git/`` are skipped entirely.
+    Subtrees containing a nested ``.git/`` (directory or worktree file)
+    are skipped entirely.
     """
     try:
-        entries = list(os.scandir(directory))
+        entries = _list_directory(directory, inventory)
     except OSError as exc:
         logger.warning("Sweep: cannot scan %s: %s", directory, exc)
         plan.scan_failed = True
         return False
 
+    if directory != root and any(name == ".git" for name, _ in entries):
+        logger.debug("Sweep: skipping nested git repo at %s", directory)
+        plan.skipped_subtrees.append(directory)
+        return False
+
     became_empty = True
 
-    for entry in entries:
-        entry_path = Path(entry.path)
+    for name, kind in entries:
+        entry_path = directory / name
         try:
             rel = entry_path.relative_to(root)
         except ValueError:
@@ -350,10 +386,9 @@ def _plan_directory(
             continue
         rel_posix = rel.as_posix()
 
-        is_dir = entry.is_dir(follow_symlinks=False)
-        is_file_or_symlink = entry.is_file(follow_symlinks=False) or entry.is_symlink()
+        is_dir = kind == KIND_DIR
 
-        if is_dir and entry.name == ".git":
+        if is_dir and name == ".git":
             # Top-level (relative to root) or nested .git directory: leave entirely alone.
             became_empty = False
             continue
@@ -364,17 +399,13 @@ def _plan_directory(
             continue
 
         if is_dir:
-            if _has_nested_git(entry_path):
-                logger.debug("Sweep: skipping nested git repo at %s", entry_path)
-                plan.skipped_subtrees.append(entry_path)
-                became_empty = False
-                continue
             child_empty = _plan_directory(
                 entry_path,
                 root,
                 expected,
                 keep_patterns=keep_patterns,
                 plan=plan,
+                inventory=inventory,
             )
             if child_empty:
                 plan.dirs.append(entry_path)
@@ -382,7 +413,7 @@ def _plan_directory(
                 became_empty = False
             continue
 
-        if is_file_or_symlink:
+        if kind == KIND_FILE:
             if entry_path in expected:
                 became_empty = False
                 continue
@@ -0,0 +1,241 @@
+"""``clm bench`` — built-in benchmark suite.
+
+Generates a synthetic course of configurable size in a throwaway work
+directory, runs the standard scenarios against it (see
+:data:`clm.bench.SCENARIOS`) and emits a machine-readable JSON report.
+With ``--baseline`` the report is compared against a stored one and the
+command exits non-zero on a regression, so CI can gate releases on it.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+from clm.bench.scenarios import SCENARIOS
+
+
+@click.command(name="bench")
+@click.option("--decks", type=click.IntRange(min=1), default=24, show_default=True)
+@click.option(
+    "--decks-per-module",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Decks per module (one spec section per module).",
+)
+@click.option(
+    "--code-cells",
+    type=click.IntRange(min=0),
+    default=4,
+    show_default=True,
+    help="Extra code cells per deck.",
+)
+@click.option(
+    "--diagrams",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Diagram sources per deck (alternating PlantUML / Draw.io).",
+)
+@click.option(
+    "--data-files",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Data files per deck (copied into the output as siblings).",
+)
+@click.option("--data-file-kb", type=click.IntRange(min=1), default=8, show_default=True)
+@click.option(
+    "--language",
+    "languages",
+    type=click.Choice(["de", "en"], case_sensitive=False),
+    multiple=True,
+    help="Output language(s) to build (repeatable; default: de and en).",
+)
+@click.option(
+    "--scenario",
+    "scenarios",
+    type=click.Choice(SCENARIOS),
+    multiple=True,
+    help="Run only these scenarios (repeatable; default: all).",
+)
+@click.option(
+    "--execute/--no-execute",
+    default=False,
+    help=(
+        "Execute the decks with the local Python kernel (HTML output). The "
+        "default builds with --no-html, so no kernel is started at all. "
+        "Synthetic decks are standard-library Python either way, so the "
+        "benchmark runs offline."
+    ),
+)
+@click.option(
+    "--render-diagrams",
+    is_flag=True,
+    help="Render diagram sources (needs PlantUML / Draw.io); default: --no-diagrams.",
+)
+@click.option(
+    "--workers",
+    type=click.Choice(["direct", "docker"], case_sensitive=False),
+    default="direct",
+    show_default=True,
+)
+@click.option(
+    "--repeat",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Iterations of the in-process scenarios (the median is reported).",
+)
+@click.option(
+    "--output",
+    "output_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write the JSON report to this file (default: stdout).",
+)
+@click.option(
+    "--baseline",
+    "baseline_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Compare against a stored report; exit 1 on a regression.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0.0),
+    default=0.20,
+    show_default=True,
+    help="Relative slowdown that counts as a regression.",
+)
+@click.option(
+    "--min-delta",
+    type=click.FloatRange(min=0.0),
+    default=0.05,
+    show_default=True,
+    help="Absolute slowdown (seconds) below which a scenario never regresses.",
+)
+@click.option(
+    "--workdir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Generate the course here instead of a temp directory (kept afterwards).",
+)
+@click.option("--keep", is_flag=True, help="Keep the temp work directory for inspection.")
+def bench_cmd(
+    decks: int,
+    decks_per_module: int,
+    code_cells: int,
+    diagrams: int,
+    data_files: int,
+    data_file_kb: int,
+    languages: tuple[str, ...],
+    scenarios: tuple[str, ...],
+    execute: bool,
+    render_diagrams: bool,
+    workers: str,
+    repeat: int,
+    output_file: Path | None,
+    baseline_file: Path | None,
+    threshold: float,
+    min_delta: float,
+    workdir: Path | None,
+    keep: bool,
+):
+    """Benchmark cold/warm builds, watch latency, monitor and search.
+
+    Generates a synthetic course, runs the standard scenarios against it with
+    isolated cache and jobs databases, and prints a JSON report. Progress goes
+    to stderr so stdout stays machine-readable.
+
+    \b
+    Examples:
+        clm bench --output bench.json
+        clm bench --decks 200 --scenario cold_build --scenario noop_build
+        clm bench --baseline bench-1.27.json --threshold 0.25
+    """
+    from clm.bench import (
+        BaselineError,
+        BenchOptions,
+        BenchRunner,
+        SyntheticCourseConfig,
+        compare_reports,
+        generate_course,
+        load_baseline,
+    )
+
+    try:
+        config = SyntheticCourseConfig(
+            decks=decks,
+            decks_per_module=decks_per_module,
+            code_cells=code_cells,
+            diagrams=diagrams,
+            data_files=data_files,
+            data_file_kb=data_file_kb,
+            languages=tuple(sorted({lang.lower() for lang in languages})) or ("de", "en"),
+        )
+    except ValueError as exc:
+        raise click.ClickException(str(exc)) from None
+    options = BenchOptions(
+        execute=execute, render_diagrams=render_diagrams, workers=workers.lower(), repeat=repeat
+    )
+
+    baseline = None
+    if baseline_file is not None:
+        try:
+            baseline = load_baseline(baseline_file)
+        except BaselineError as exc:
+            raise click.ClickException(str(exc)) from None
+
+    temp_workdir = workdir is None
+    root = Path(tempfile.mkdtemp(prefix="clm_bench_")) if workdir is None else workdir
+    root.mkdir(parents=True, exist_ok=True)
+
+    def progress(msg: str) -> None:
+        click.echo(f"[bench] {msg}", err=True)
+
+    try:
+        progress(f"generating {config.decks} decks in {root}")
+        course = generate_course(root / "course", config)
+        runner = BenchRunner(course, root, config, options, progress=progress)
+        report = runner.run(scenarios or SCENARIOS)
+    finally:
+        if temp_workdir and not keep:
+            shutil.rmtree(root, ignore_errors=True)
+        elif temp_workdir:
+            progress(f"kept {root}")
+
+    data = report.to_dict()
+    regressed = False
+    if baseline is not None:
+        try:
+            comparisons = compare_reports(data, baseline, threshold=threshold, min_delta=min_delta)
+        except BaselineError as exc:
+            raise click.ClickException(str(exc)) from None
+        data["comparison"] = {
+            "baseline_file": str(baseline_file),
+            "threshold": threshold,
+            "min_delta": min_delta,
+            "scenarios": {c.name: c.to_dict() for c in comparisons},
+        }
+        for c in comparisons:
+            marker = "REGRESSED" if c.regressed else "ok"
+            progress(f"{c.name}: {marker} {c.reason}")
+        regressed = any(c.regressed for c in comparisons)
+
+    text = json.dumps(data, indent=2)
+    if output_file is not None:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(text + "\n", encoding="utf-8")
+        progress(f"report written to {output_file}")
+    else:
+        click.echo(text)
+
+    if regressed or not report.ok:
+        sys.exit(1)
@@ -963,6 +963,12 @@ def build(
     effective_output = output_dir if output_dir is not None else default_output
 
     if is_snapshot:
+        from clm.snapshot import write_manifest
+
+        # Per-file sizes and hashes let a later --verify-against read only
+        # its own output tree. The manifest holds no timestamps, so it is
+        # as reproducible as the snapshot itself.
+        write_manifest(effective_output)
         # The build report already covers what was written; print a short
         # confirmation so scripts can grep for the snapshot location.
         click.echo(f"\nSnapshot saved to: {effective_output.resolve()}")
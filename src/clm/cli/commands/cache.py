@@ -22,7 +22,7 @@ from typing import Any
 
 import click
 
-from clm.infrastructure.database.executed_notebook_cache import PAYLOAD_FORMAT
+from clm.infrastructure.database.executed_notebook_cache import READABLE_PAYLOAD_FORMATS
 
 
 @click.group("cache")
@@ -98,7 +98,7 @@ def _collect_artifact(payload, op, cache_db: Path, jobs_db: Path) -> dict[str, A
             """
             SELECT created_at FROM executed_notebooks
             WHERE input_file = ? AND content_hash = ? AND language = ? AND prog_lang = ?
-              AND payload_format = ?
+              AND payload_format IN (?, ?)
             """,
             # Matching the reader's filter matters: a legacy pickle row is
             # unreadable and will be deleted on the next cache open, so
@@ -110,7 +110,7 @@ def _collect_artifact(payload, op, cache_db: Path, jobs_db: Path) -> dict[str, A
                 execution_hash,
                 payload.language,
                 payload.prog_lang,
-                PAYLOAD_FORMAT,
+                *READABLE_PAYLOAD_FORMATS,
             ),
         )
         issues = _query_one(
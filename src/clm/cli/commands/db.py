@@ -3,6 +3,8 @@
 This module provides commands for managing CLM databases.
 """
 
+import sys
+
 import click
 
 
@@ -46,6 +48,8 @@ def db_stats(ctx):
             click.echo(f"  Results Cache: {stats.get('results_cache_count', 0)} entries")
             click.echo(f"  Workers: {stats.get('workers_count', 0)} entries")
             click.echo(f"  Worker Events: {stats.get('worker_events_count', 0)} entries")
+            click.echo(f"  Archived Jobs: {stats.get('jobs_archive_count', 0)} entries")
+            click.echo(f"  Event Summaries: {stats.get('worker_event_summaries_count', 0)} entries")
     else:
         click.echo(f"\nJobs Database: {jobs_db_path} (not found)")
 
@@ -63,6 +67,10 @@ def db_stats(ctx):
         with ExecutedNotebookCache(cache_db_path) as nb_cache:
             nb_stats = nb_cache.get_stats()
             click.echo(f"  Executed Notebooks: {nb_stats.get('total_entries', 0)} entries")
+            click.echo(
+                f"    Output Blobs: {nb_stats.get('output_blobs', 0)} "
+                f"({nb_stats.get('stored_bytes', 0) / (1024 * 1024):.2f} MB stored)"
+            )
     else:
         click.echo(f"\nCache Database: {cache_db_path} (not found)")
 
@@ -123,6 +131,7 @@ def db_prune(
     from clm.infrastructure.config import get_config
     from clm.infrastructure.database.db_operations import DatabaseManager
     from clm.infrastructure.database.executed_notebook_cache import ExecutedNotebookCache
+    from clm.infrastructure.database.job_archive import JobArchiver
     from clm.infrastructure.database.job_queue import JobQueue
 
     cache_db_path = ctx.obj["CACHE_DB_PATH"]
@@ -165,12 +174,26 @@ def db_prune(
                 stats = jq.get_database_stats()
                 click.echo(f"  Would clean up from {stats.get('jobs_count', 0)} jobs")
             else:
+                if retention.archive_jobs_after_minutes is not None:
+                    archived = JobArchiver(
+                        jobs_db_path,
+                        min_age_minutes=retention.archive_jobs_after_minutes,
+                        max_batches_per_pass=sys.maxsize,
+                    ).run_once(jq)
+                    if archived["archived_jobs"] > 0:
+                        click.echo(f"  Archived {archived['archived_jobs']} finished jobs")
+                    if archived["rolled_up_events"] > 0:
+                        click.echo(
+                            f"  Rolled up {archived['rolled_up_events']} worker events "
+                            f"into session summaries"
+                        )
                 result = jq.cleanup_all(
                     completed_days=completed_days,
                     failed_days=failed_days,
                     cancelled_days=cancelled_days,
                     events_days=events_days,
                     cache_versions=cache_versions,
+                    archive_days=retention.archive_retention_days,
                 )
                 for key, count in result.items():
                     if count > 0:
@@ -208,6 +231,21 @@ def db_prune(
                 if deleted > 0:
                     click.echo(f"  Deleted {deleted} stale notebook cache entries")
                     total_deleted += deleted
+                max_mb = retention.executed_notebook_cache_max_mb
+                gc = nb_cache.collect_garbage(
+                    max_bytes=max_mb * 1024 * 1024 if max_mb is not None else None
+                )
+                if gc["evicted_entries"] > 0:
+                    click.echo(
+                        f"  Evicted {gc['evicted_entries']} notebook cache entries "
+                        f"over the {max_mb} MB budget"
+                    )
+                    total_deleted += gc["evicted_entries"]
+                if gc["deleted_blobs"] > 0:
+                    click.echo(
+                        f"  Deleted {gc['deleted_blobs']} unreferenced notebook output blobs"
+                    )
+                    total_deleted += gc["deleted_blobs"]
     else:
         click.echo(f"Cache database not found: {cache_db_path}")
 
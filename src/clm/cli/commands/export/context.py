@@ -375,6 +375,7 @@ async def summaries_by_hash(
     summaries: dict[str, str] = {}
     pending: list[tuple[str, str, str, bool, str]] = []  # (hash, title, content, has_ws, section)
 
+    extracted: list[tuple[_SectionUnit, _Notebook, str, str]] = []  # (unit, nb, content, hash)
     for unit in units:
         for topic in unit.topics:
             for nb in topic.notebooks:
@@ -383,23 +384,28 @@ async def summaries_by_hash(
                     if progress:
                         progress.on_cached(nb.title)
                     continue
-                h = content_hash(content)
-                if h in summaries:
-                    if progress:
-                        progress.on_cached(nb.title)
-                    continue
-                cached = (
-                    cache.get(h, AGENT_AUDIENCE, model, language, style)
-                    if cache and not no_cache
-                    else None
-                )
-                if cached is not None:
-                    summaries[h] = cached
-                    if progress:
-                        progress.on_cached(nb.title)
-                    continue
-                has_ws = notebook_contains_workshop(nb.path)
-                pending.append((h, nb.title, content, has_ws, unit.name))
+                extracted.append((unit, nb, content, content_hash(content)))
+
+    # Resolve every cached summary of the run in one batched lookup.
+    cached: dict[str, str] = {}
+    if cache and not no_cache:
+        hits = cache.get_many(
+            (h, AGENT_AUDIENCE, model, language, style) for _unit, _nb, _content, h in extracted
+        )
+        cached = {key[0]: summary for key, summary in hits.items()}
+
+    for unit, nb, content, h in extracted:
+        if h in summaries:
+            if progress:
+                progress.on_cached(nb.title)
+            continue
+        if h in cached:
+            summaries[h] = cached[h]
+            if progress:
+                progress.on_cached(nb.title)
+            continue
+        has_ws = notebook_contains_workshop(nb.path)
+        pending.append((h, nb.title, content, has_ws, unit.name))
 
     if not pending:
         return summaries
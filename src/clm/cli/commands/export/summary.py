@@ -591,13 +591,25 @@ async def generate_summaries(
         else:
             # Per-notebook summaries
             pending_tasks = []
+            extracted = []
             for nb in notebooks:
                 content = extract_notebook_content(nb.path, audience, language)
                 if not content:
                     if progress:
                         progress.on_cached(nb.title[language])
                     continue
+                extracted.append((nb, content))
+
+            # One batched cache lookup for the whole section.
+            cached_summaries: dict[str, str] = {}
+            if cache and not no_cache and not dry_run:
+                hits = cache.get_many(
+                    (content_hash(content), audience, model, language, style)
+                    for _nb, content in extracted
+                )
+                cached_summaries = {key[0]: summary for key, summary in hits.items()}
 
+            for nb, content in extracted:
                 title = nb.title[language]
 
                 if dry_run:
@@ -612,11 +624,7 @@ async def generate_summaries(
                     continue
 
                 h = content_hash(content)
-                cached_result = (
-                    cache.get(h, audience, model, language, style)
-                    if cache and not no_cache
-                    else None
-                )
+                cached_result = cached_summaries.get(h)
 
                 if cached_result:
                     if progress:
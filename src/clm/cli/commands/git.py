@@ -4,14 +4,19 @@ This module provides commands for managing git repositories in course output
 directories, enabling trainers to commit and push generated course content.
 """
 
+import contextvars
 import logging
 import os
 import shlex
 import shutil
 import subprocess
+import sys
 import tempfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextvars import ContextVar
 from pathlib import Path
+from typing import TypeVar
 
 import click
 
@@ -31,6 +36,18 @@ logger = logging.getLogger(__name__)
 # Context variable for dry-run mode
 _dry_run_mode: ContextVar[bool] = ContextVar("dry_run_mode", default=False)
 
+# Output of the repository pipeline running in this context, as
+# ``(message, err)`` pairs; ``None`` outside a parallel pipeline. See
+# :func:`_run_repo_pipelines`.
+_repo_output: ContextVar[list[tuple[str, bool]] | None] = ContextVar("repo_output", default=None)
+
+# Set while a repository pipeline runs on a worker thread, where git must not
+# prompt: concurrent prompts interleave on one terminal and the buffered
+# output hides what they ask for. See :func:`_run_repo_pipelines`.
+_prompt_free_mode: ContextVar[bool] = ContextVar("prompt_free_mode", default=False)
+
+_T = TypeVar("_T")
+
 #: Opt-in switch for token-authenticated HTTPS git transport (issue #341).
 TOKEN_AUTH_ENV_VAR = "CLM_GIT_TOKEN_AUTH"
 _TRUTHY = ("1", "true", "yes", "on")
@@ -166,6 +183,20 @@ class OutputRepo:
 # =============================================================================
 
 
+def _echo(message: str = "", *, err: bool = False) -> None:
+    """``click.echo``, or buffered when a parallel repo pipeline is running.
+
+    Every message of this module goes through here so that a pipeline on a
+    worker thread never interleaves its lines with another repository's;
+    :func:`_run_repo_pipelines` replays each buffer as one block.
+    """
+    buffer = _repo_output.get()
+    if buffer is None:
+        click.echo(message, err=err)
+    else:
+        buffer.append((message, err))
+
+
 def _format_command(cmd: list[str]) -> str:
     """Format a command list for display with proper shell quoting.
 
@@ -205,13 +236,15 @@ def _is_read_only_git(args: tuple[str, ...]) -> bool:
     return args[0] == "remote" and len(args) >= 2 and args[1] in ("get-url", "-v")
 
 
-def _read_only_dry_run_env() -> dict[str, str]:
-    """Environment for read-only git executed under dry-run.
+def _prompt_free_env() -> dict[str, str]:
+    """Environment for git that must fail rather than prompt.
 
     A preview must never block on interactive auth: ``ls-remote`` against a
     private/nonexistent HTTPS remote can pop a Git Credential Manager
     dialog or a terminal prompt (#686 review). Degrade to "remote not
-    reachable" instead — an acceptable answer for a dry run.
+    reachable" instead — an acceptable answer for a dry run. Pipelines run
+    in parallel (``--jobs``) use it too, so a missing credential fails that
+    repository instead of several prompts racing for one terminal.
     """
     env = os.environ.copy()
     env["GIT_TERMINAL_PROMPT"] = "0"
@@ -247,7 +280,7 @@ def run_git(repo_path: Path, *args: str) -> subprocess.CompletedProcess[str]:
 
     dry_run = _dry_run_mode.get()
     if dry_run and not _is_read_only_git(args):
-        click.echo(f"  [dry-run] Would run: {_format_command(cmd)}")
+        _echo(f"  [dry-run] Would run: {_format_command(cmd)}")
         return subprocess.CompletedProcess(
             args=cmd,
             returncode=0,
@@ -260,7 +293,7 @@ def run_git(repo_path: Path, *args: str) -> subprocess.CompletedProcess[str]:
         capture_output=True,
         text=True,
         check=False,
-        env=_read_only_dry_run_env() if dry_run else None,
+        env=_prompt_free_env() if dry_run or _prompt_free_mode.get() else None,
     )
 
 
@@ -281,7 +314,7 @@ def run_git_global(*args: str) -> subprocess.CompletedProcess[str]:
 
     dry_run = _dry_run_mode.get()
     if dry_run and not _is_read_only_git(args):
-        click.echo(f"  [dry-run] Would run: {_format_command(cmd)}")
+        _echo(f"  [dry-run] Would run: {_format_command(cmd)}")
         return subprocess.CompletedProcess(
             args=cmd,
             returncode=0,
@@ -294,7 +327,7 @@ def run_git_global(*args: str) -> subprocess.CompletedProcess[str]:
         capture_output=True,
         text=True,
         check=False,
-        env=_read_only_dry_run_env() if dry_run else None,
+        env=_prompt_free_env() if dry_run or _prompt_free_mode.get() else None,
     )
 
 
@@ -672,7 +705,7 @@ def _dedupe_shared_destinations(repos: list[OutputRepo]) -> list[OutputRepo]:
             continue
         kept.shared_refs.append(repo.target_name)
         if repo.remote_url and repo.remote_url != kept.remote_url:
-            click.echo(
+            _echo(
                 f"Note: channels {kept.target_name!r} and {repo.target_name!r} share "
                 f"the destination {kept.path} but derive different remote URLs; "
                 f"using the first ({kept.remote_url}). Set the repo's origin "
@@ -758,15 +791,15 @@ def commit_and_push_repo(
     if has_remote and not force_with_lease:
         behind, count = is_behind_remote(repo.path, branch)
         if behind:
-            click.echo(
+            _echo(
                 f"  Error: Remote 'origin/{branch}' is {count} commit(s) ahead",
                 err=True,
             )
             if remote_ahead_hint:
-                click.echo("", err=True)
-                click.echo("  To resolve:", err=True)
+                _echo("", err=True)
+                _echo("  To resolve:", err=True)
                 for line in remote_ahead_hint:
-                    click.echo(f"      {line}", err=True)
+                    _echo(f"      {line}", err=True)
             return False
 
     # Stage all changes (excluding the private build manifest).
@@ -779,9 +812,9 @@ def commit_and_push_repo(
             commit_args = ["commit", "--amend", "--no-edit"]
         result = run_git(repo.path, *commit_args)
         if result.returncode == 0:
-            click.echo(f"  Amended commit{': ' + message if message else ''}")
+            _echo(f"  Amended commit{': ' + message if message else ''}")
         else:
-            click.echo(f"  Error amending: {result.stderr.strip()}", err=True)
+            _echo(f"  Error amending: {result.stderr.strip()}", err=True)
             return False
     else:
         # Gate on the index (not the working tree) so a change that touches only
@@ -797,12 +830,12 @@ def commit_and_push_repo(
             assert message is not None
             result = run_git(repo.path, "commit", "-m", message)
             if result.returncode == 0:
-                click.echo(f"  Committed: {message}")
+                _echo(f"  Committed: {message}")
             else:
-                click.echo(f"  Error committing: {result.stderr.strip()}", err=True)
+                _echo(f"  Error committing: {result.stderr.strip()}", err=True)
                 return False
         else:
-            click.echo("  No changes to commit")
+            _echo("  No changes to commit")
 
     if has_remote:
         push_args = ["push"]
@@ -812,14 +845,14 @@ def commit_and_push_repo(
         result = run_git(repo.path, *push_args)
         if result.returncode == 0:
             if force_with_lease:
-                click.echo(f"  Force-pushed to origin/{branch}")
+                _echo(f"  Force-pushed to origin/{branch}")
             else:
-                click.echo(f"  Pushed to origin/{branch}")
+                _echo(f"  Pushed to origin/{branch}")
         else:
-            click.echo(f"  Error pushing: {result.stderr.strip()}", err=True)
+            _echo(f"  Error pushing: {result.stderr.strip()}", err=True)
             return False
     else:
-        click.echo("  Skipped push: No remote configured")
+        _echo("  Skipped push: No remote configured")
 
     return True
 
@@ -865,14 +898,14 @@ Thumbs.db
         if _dry_run_mode.get():
             # The one non-git mutation in this flow — the "[DRY RUN MODE]"
             # banner promised no changes (#686 review: this wrote for real).
-            click.echo(f"  [dry-run] Would create {gitignore_path}")
+            _echo(f"  [dry-run] Would create {gitignore_path}")
         else:
             gitignore_path.write_text(gitignore_content)
 
     # Initialize repo
     result = run_git(repo.path, "init")
     if result.returncode != 0:
-        click.echo(f"  Error: Failed to initialize repository: {result.stderr}", err=True)
+        _echo(f"  Error: Failed to initialize repository: {result.stderr}", err=True)
         return False
 
     # Create initial branch
@@ -881,15 +914,15 @@ Thumbs.db
     # Add remote if URL is available and remote exists
     if repo.remote_url and remote_exists(repo.remote_url):
         run_git(repo.path, "remote", "add", "origin", repo.remote_url)
-        click.echo(f"  Remote set to: {repo.remote_url}")
+        _echo(f"  Remote set to: {repo.remote_url}")
 
     # Initial commit with all existing files (never the private build manifest)
     _stage_all_excluding_sidecars(repo.path)
     result = run_git(repo.path, "commit", "-m", "Initial commit")
     if result.returncode == 0:
-        click.echo("  Created initial commit")
+        _echo("  Created initial commit")
     elif "nothing to commit" in result.stdout or "nothing to commit" in result.stderr:
-        click.echo("  No files to commit (empty directory)")
+        _echo("  No files to commit (empty directory)")
 
     return True
 
@@ -903,17 +936,17 @@ def init_repo_from_remote(repo: OutputRepo, branch: str) -> bool:
     Returns True on success.
     """
     if not repo.remote_url:
-        click.echo("  Error: No remote URL configured", err=True)
+        _echo("  Error: No remote URL configured", err=True)
         return False
 
-    click.echo(f"  Restoring from remote: {repo.remote_url}")
+    _echo(f"  Restoring from remote: {repo.remote_url}")
 
     if _dry_run_mode.get():
         # The clone below is stubbed but the shutil.move is real — running
         # on would feed the move stub state (a spurious hard error) or, if
         # the temp path ever existed, mutate the output dir under the
         # dry-run banner (#686 review). Preview and stop.
-        click.echo("  [dry-run] Would clone the remote and restore .git from it")
+        _echo("  [dry-run] Would clone the remote and restore .git from it")
         return True
 
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -922,7 +955,7 @@ def init_repo_from_remote(repo: OutputRepo, branch: str) -> bool:
         # Clone the remote
         result = run_git_global("clone", repo.remote_url, str(temp_path))
         if result.returncode != 0:
-            click.echo(f"  Error: Failed to clone remote: {result.stderr}", err=True)
+            _echo(f"  Error: Failed to clone remote: {result.stderr}", err=True)
             return False
 
         # Move .git to output directory
@@ -932,18 +965,18 @@ def init_repo_from_remote(repo: OutputRepo, branch: str) -> bool:
         try:
             shutil.move(str(source_git), str(target_git))
         except Exception as e:
-            click.echo(f"  Error: Failed to restore .git directory: {e}", err=True)
+            _echo(f"  Error: Failed to restore .git directory: {e}", err=True)
             return False
 
-    click.echo("  Restored git history from remote")
+    _echo("  Restored git history from remote")
 
     # Show status
     result = run_git(repo.path, "status", "--short")
     if result.stdout.strip():
         lines = result.stdout.strip().split("\n")
-        click.echo(f"  {len(lines)} file(s) differ from remote HEAD")
+        _echo(f"  {len(lines)} file(s) differ from remote HEAD")
     else:
-        click.echo("  Working directory matches remote HEAD")
+        _echo("  Working directory matches remote HEAD")
 
     return True
 
@@ -960,41 +993,138 @@ def _init_handle_existing_repo(repo: OutputRepo) -> None:
     Otherwise skip with an informative message.
     """
     if not repo.remote_url:
-        click.echo("  Already initialized (no remote configured)")
+        _echo("  Already initialized (no remote configured)")
         return
 
     if repo.has_remote():
-        click.echo("  Already initialized")
+        _echo("  Already initialized")
         return
 
     # Local repo exists but has no remote — check if remote is available
     if remote_exists(repo.remote_url):
         run_git(repo.path, "remote", "add", "origin", repo.remote_url)
-        click.echo(f"  Added remote: {repo.remote_url}")
+        _echo(f"  Added remote: {repo.remote_url}")
     else:
-        click.echo("  Already initialized (remote not yet created)")
-        click.echo(f"  Remote URL: {repo.remote_url}")
-        click.echo("  Run 'clm git init' again after creating the remote repository.")
+        _echo("  Already initialized (remote not yet created)")
+        _echo(f"  Remote URL: {repo.remote_url}")
+        _echo("  Run 'clm git init' again after creating the remote repository.")
 
 
 def _init_create_new_repo(repo: OutputRepo, branch: str) -> None:
     """Handle init for a repo that has no .git directory yet."""
     if not repo.remote_url:
-        click.echo("  Creating local-only repository...")
+        _echo("  Creating local-only repository...")
         init_repo_fresh(repo, branch)
     elif not remote_exists(repo.remote_url):
-        click.echo("  Creating local-only repository (remote not found)...")
+        _echo("  Creating local-only repository (remote not found)...")
         init_repo_fresh(repo, branch)
-        click.echo(f"  Remote URL: {repo.remote_url}")
-        click.echo("  Run 'clm git init' again after creating the remote repository.")
+        _echo(f"  Remote URL: {repo.remote_url}")
+        _echo("  Run 'clm git init' again after creating the remote repository.")
     elif not remote_has_commits(repo.remote_url):
-        click.echo("  Creating repository with empty remote...")
+        _echo("  Creating repository with empty remote...")
         init_repo_fresh(repo, branch)
     else:
         # Remote exists with commits — recovery mode
         init_repo_from_remote(repo, branch)
 
 
+# =============================================================================
+# Per-Repository Executor
+# =============================================================================
+
+#: Repositories processed at once when ``--jobs`` is not given.
+DEFAULT_GIT_JOBS = 8
+
+
+def _default_git_jobs() -> int:
+    """:data:`DEFAULT_GIT_JOBS`, or 1 when git may need to prompt on this terminal.
+
+    Parallel pipelines run git prompt-free, so a push that needs a password
+    would fail there. Interactive sessions without a configured credential
+    helper therefore keep the sequential, prompting behavior by default.
+    """
+    if not sys.stdin.isatty():
+        return DEFAULT_GIT_JOBS
+    try:
+        helpers = subprocess.run(
+            ["git", "config", "--get-all", "credential.helper"],
+            capture_output=True,
+            text=True,
+            check=False,
+        ).stdout
+    except OSError:
+        return 1
+    return DEFAULT_GIT_JOBS if helpers.strip() else 1
+
+
+def _run_repo_pipelines(
+    repos: Sequence[OutputRepo],
+    pipeline: Callable[[OutputRepo], _T],
+    *,
+    jobs: int | None,
+) -> list[_T]:
+    """Run ``pipeline`` for every repo, up to ``jobs`` at a time.
+
+    Most of a multi-repo ``clm git sync`` is spent waiting — on ``git add -A``
+    over a large tree, on push round trips — so independent repositories run
+    on a thread pool. Each pipeline's output is buffered and replayed as one
+    block, in ``repos`` order, as soon as it and every repo before it are
+    done: the console reads exactly like a sequential run. Entries that
+    resolve to the same working tree (already collapsed by
+    :func:`_dedupe_shared_destinations` for channel selections) still run one
+    after another on one worker. ``jobs=1`` — or a single repo — runs inline
+    and unbuffered, so interactive credential prompts appear where expected;
+    parallel pipelines run git prompt-free (see :func:`_prompt_free_env`).
+    Without ``jobs`` the default comes from :func:`_default_git_jobs`.
+
+    Results are returned in ``repos`` order. An exception from a pipeline is
+    re-raised after the output of the repos before it (and its own) is shown;
+    pipelines not yet started are cancelled.
+    """
+    if len(repos) <= 1:
+        return [pipeline(repo) for repo in repos]
+    workers = min(jobs or _default_git_jobs(), len(repos))
+    if workers <= 1:
+        return [pipeline(repo) for repo in repos]
+
+    groups: dict[Path, list[int]] = {}
+    for index, repo in enumerate(repos):
+        groups.setdefault(repo.path.resolve(), []).append(index)
+    buffers: list[list[tuple[str, bool]]] = [[] for _ in repos]
+    results: list[_T | None] = [None] * len(repos)
+    errors: list[BaseException | None] = [None] * len(repos)
+
+    def run_group(indices: list[int]) -> None:
+        _prompt_free_mode.set(True)
+        for index in indices:
+            _repo_output.set(buffers[index])
+            try:
+                results[index] = pipeline(repos[index])
+            except BaseException as exc:  # re-raised on the main thread
+                errors[index] = exc
+                return
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clm-git")
+    try:
+        # Each group runs in its own copy of the caller's context: it sees
+        # the dry-run flag, and its output buffer stays private to it.
+        futures: dict[int, Future[None]] = {}
+        for indices in groups.values():
+            future = pool.submit(contextvars.copy_context().run, run_group, indices)
+            for index in indices:
+                futures[index] = future
+        for index in range(len(repos)):
+            futures[index].result()
+            for message, err in buffers[index]:
+                click.echo(message, err=err)
+            error = errors[index]
+            if error is not None:
+                raise error
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return results  # type: ignore[return-value]
+
+
 # =============================================================================
 # Click Command Group
 # =============================================================================
@@ -1021,6 +1151,16 @@ _all_option = click.option(
     help="Act on every distributed output target AND every release-channel repo in one pass. "
     "Mutually exclusive with --target/--channel/--all-channels.",
 )
+_jobs_option = click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help=f"Repositories to process in parallel (default: up to {DEFAULT_GIT_JOBS}; 1 on "
+    "a terminal without a git credential helper). Output stays grouped per repository "
+    "in the usual order. Parallel runs never prompt for credentials; use 1 when git "
+    "needs to.",
+)
 
 
 @click.group(name="git")
@@ -1044,6 +1184,7 @@ def git_group():
 @_channel_option
 @_all_channels_option
 @_all_option
+@_jobs_option
 @click.option("--branch", default="master", help="Default branch name")
 @click.option("--dry-run", is_flag=True, help="Show what would be done without executing")
 def init(
@@ -1053,6 +1194,7 @@ def init(
     all_channels: bool,
     all_repos: bool,
     branch: str,
+    jobs: int | None,
     dry_run: bool,
 ):
     """Initialize git repositories in output directories.
@@ -1077,28 +1219,28 @@ def init(
     """
     _dry_run_mode.set(dry_run)
     if dry_run:
-        click.echo("[DRY RUN MODE - No changes will be made]")
-        click.echo()
+        _echo("[DRY RUN MODE - No changes will be made]")
+        _echo()
 
     repos = _select_repos(
         spec_file, target=target, channel=channel, all_channels=all_channels, all_repos=all_repos
     )
 
     if not repos:
-        click.echo("No output directories found.")
+        _echo("No output directories found.")
         return
 
-    click.echo(f"Initializing git repositories for {spec_file.name}...")
-    click.echo()
+    _echo(f"Initializing git repositories for {spec_file.name}...")
+    _echo()
 
-    for repo in repos:
-        click.echo(f"[{repo.display_name}] {repo.path}")
+    def init_one(repo: OutputRepo) -> None:
+        _echo(f"[{repo.display_name}] {repo.path}")
 
         # Check if directory exists
         if not repo.path.exists():
-            click.echo("  Skipped: Directory does not exist (run 'clm build' first)")
-            click.echo()
-            continue
+            _echo("  Skipped: Directory does not exist (run 'clm build' first)")
+            _echo()
+            return
 
         if repo.has_git:
             # Local repo already exists — check if we need to add a remote
@@ -1107,7 +1249,9 @@ def init(
             # No local repo — determine initialization mode
             _init_create_new_repo(repo, branch)
 
-        click.echo()
+        _echo()
+
+    _run_repo_pipelines(repos, init_one, jobs=jobs)
 
 
 @git_group.command()
@@ -1116,6 +1260,7 @@ def init(
 @_channel_option
 @_all_channels_option
 @_all_option
+@_jobs_option
 @click.option("--dry-run", is_flag=True, help="Show paths that would be checked")
 def status(
     spec_file: Path,
@@ -1123,6 +1268,7 @@ def status(
     channel: str | None,
     all_channels: bool,
     all_repos: bool,
+    jobs: int | None,
     dry_run: bool,
 ):
     """Show git status of output directories.
@@ -1142,64 +1288,66 @@ def status(
     """
     _dry_run_mode.set(dry_run)
     if dry_run:
-        click.echo("[DRY RUN MODE - Showing paths that would be checked]")
-        click.echo()
+        _echo("[DRY RUN MODE - Showing paths that would be checked]")
+        _echo()
 
     repos = _select_repos(
         spec_file, target=target, channel=channel, all_channels=all_channels, all_repos=all_repos
     )
 
     if not repos:
-        click.echo("No output directories found.")
+        _echo("No output directories found.")
         return
 
-    for repo in repos:
-        click.echo(f"[{repo.display_name}] {repo.path}")
+    def status_one(repo: OutputRepo) -> None:
+        _echo(f"[{repo.display_name}] {repo.path}")
 
         if not repo.path.exists():
-            click.echo("  Directory does not exist")
-            click.echo()
-            continue
+            _echo("  Directory does not exist")
+            _echo()
+            return
 
         if not repo.has_git:
-            click.echo("  No git repository (run 'clm git init')")
-            click.echo()
-            continue
+            _echo("  No git repository (run 'clm git init')")
+            _echo()
+            return
 
         # Show branch
         branch = get_current_branch(repo.path)
-        click.echo(f"  Branch: {branch}")
+        _echo(f"  Branch: {branch}")
 
         # Show remote
         has_remote = repo.has_remote()
         if has_remote:
             result = run_git(repo.path, "remote", "get-url", "origin")
-            click.echo(f"  Remote: {result.stdout.strip()}")
+            _echo(f"  Remote: {result.stdout.strip()}")
 
             # Show ahead/behind status
             ahead, behind = get_remote_status(repo.path, branch)
             if ahead == 0 and behind == 0:
-                click.echo("  Sync: Up to date with remote")
+                _echo("  Sync: Up to date with remote")
             else:
                 parts = []
                 if ahead > 0:
                     parts.append(f"{ahead} ahead")
                 if behind > 0:
                     parts.append(f"{behind} behind")
-                click.echo(f"  Sync: {', '.join(parts)}")
+                _echo(f"  Sync: {', '.join(parts)}")
         else:
-            click.echo("  Remote: (none)")
+            _echo("  Remote: (none)")
 
         # Show status
         result = run_git(repo.path, "status", "--short")
         if result.stdout.strip():
-            click.echo("  Changes:")
+            _echo("  Changes:")
             for line in result.stdout.strip().split("\n"):
-                click.echo(f"    {line}")
+                _echo(f"    {line}")
         else:
-            click.echo("  Clean (no uncommitted changes)")
+            _echo("  Clean (no uncommitted changes)")
+
+        _echo()
 
-        click.echo()
+    _run_repo_pipelines(repos, status_one, jobs=jobs)
 
 
 @git_group.command()
@@ -1210,6 +1358,7 @@ def status(
 @_channel_option
 @_all_channels_option
 @_all_option
+@_jobs_option
 @click.option("--dry-run", is_flag=True, help="Show what would be done without executing")
 def commit(
     spec_file: Path,
@@ -1219,6 +1368,7 @@ def commit(
     channel: str | None,
     all_channels: bool,
     all_repos: bool,
+    jobs: int | None,
     dry_run: bool,
 ):
     """Stage all changes and commit.
@@ -1243,24 +1393,24 @@ def commit(
 
     _dry_run_mode.set(dry_run)
     if dry_run:
-        click.echo("[DRY RUN MODE - No changes will be made]")
-        click.echo()
+        _echo("[DRY RUN MODE - No changes will be made]")
+        _echo()
 
     repos = _select_repos(
         spec_file, target=target, channel=channel, all_channels=all_channels, all_repos=all_repos
     )
 
     if not repos:
-        click.echo("No output directories found.")
+        _echo("No output directories found.")
         return
 
-    for repo in repos:
-        click.echo(f"[{repo.display_name}] {repo.path}")
+    def commit_one(repo: OutputRepo) -> None:
+        _echo(f"[{repo.display_name}] {repo.path}")
 
         if not repo.has_git:
-            click.echo("  Skipped: No git repository")
-            click.echo()
-            continue
+            _echo("  Skipped: No git repository")
+            _echo()
+            return
 
         # Stage all changes (excluding the private build manifest)
         _stage_all_excluding_sidecars(repo.path)
@@ -1274,15 +1424,15 @@ def commit(
         if not amend:
             if _dry_run_mode.get():
                 if has_uncommitted_changes(repo.path):
-                    click.echo("  [dry-run] Would stage and commit the changes above")
+                    _echo("  [dry-run] Would stage and commit the changes above")
                 else:
-                    click.echo("  Nothing to commit (working tree clean)")
-                    click.echo()
-                    continue
+                    _echo("  Nothing to commit (working tree clean)")
+                    _echo()
+                    return
             elif not has_staged_changes(repo.path):
-                click.echo("  Nothing to commit (working tree clean)")
-                click.echo()
-                continue
+                _echo("  Nothing to commit (working tree clean)")
+                _echo()
+                return
 
         # Build commit command
         if amend:
@@ -1297,13 +1447,15 @@ def commit(
         result = run_git(repo.path, *commit_args)
         if result.returncode == 0:
             if amend:
-                click.echo(f"  Amended commit{': ' + message if message else ''}")
+                _echo(f"  Amended commit{': ' + message if message else ''}")
             else:
-                click.echo(f"  Committed: {message}")
+                _echo(f"  Committed: {message}")
         else:
-            click.echo(f"  Error: {result.stderr.strip()}", err=True)
+            _echo(f"  Error: {result.stderr.strip()}", err=True)
+
+        _echo()
 
-        click.echo()
+    _run_repo_pipelines(repos, commit_one, jobs=jobs)
 
 
 @git_group.command()
@@ -1313,6 +1465,7 @@ def commit(
 @_channel_option
 @_all_channels_option
 @_all_option
+@_jobs_option
 @click.option("--dry-run", is_flag=True, help="Show what would be done without executing")
 def push(
     spec_file: Path,
@@ -1321,6 +1474,7 @@ def push(
     channel: str | None,
     all_channels: bool,
     all_repos: bool,
+    jobs: int | None,
     dry_run: bool,
 ):
     """Push commits to remote.
@@ -1342,29 +1496,29 @@ def push(
     """
     _dry_run_mode.set(dry_run)
     if dry_run:
-        click.echo("[DRY RUN MODE - No changes will be made]")
-        click.echo()
+        _echo("[DRY RUN MODE - No changes will be made]")
+        _echo()
 
     repos = _select_repos(
         spec_file, target=target, channel=channel, all_channels=all_channels, all_repos=all_repos
     )
 
     if not repos:
-        click.echo("No output directories found.")
+        _echo("No output directories found.")
         return
 
-    for repo in repos:
-        click.echo(f"[{repo.display_name}] {repo.path}")
+    def push_one(repo: OutputRepo) -> None:
+        _echo(f"[{repo.display_name}] {repo.path}")
 
         if not repo.has_git:
-            click.echo("  Skipped: No git repository")
-            click.echo()
-            continue
+            _echo("  Skipped: No git repository")
+            _echo()
+            return
 
         if not repo.has_remote():
-            click.echo("  Skipped: No remote configured")
-            click.echo()
-            continue
+            _echo("  Skipped: No remote configured")
+            _echo()
+            return
 
         # Get current branch
         branch = get_current_branch(repo.path)
@@ -1378,13 +1532,15 @@ def push(
         result = run_git(repo.path, *push_args)
         if result.returncode == 0:
             if force_with_lease:
-                click.echo(f"  Force-pushed to origin/{branch}")
+                _echo(f"  Force-pushed to origin/{branch}")
             else:
-                click.echo(f"  Pushed to origin/{branch}")
+                _echo(f"  Pushed to origin/{branch}")
         else:
-            click.echo(f"  Error: {result.stderr.strip()}", err=True)
+            _echo(f"  Error: {result.stderr.strip()}", err=True)
 
-        click.echo()
+        _echo()
+
+    _run_repo_pipelines(repos, push_one, jobs=jobs)
 
 
 @git_group.command()
@@ -1398,6 +1554,7 @@ def push(
 @_channel_option
 @_all_channels_option
 @_all_option
+@_jobs_option
 @click.option("--dry-run", is_flag=True, help="Show what would be done without executing")
 def sync(
     spec_file: Path,
@@ -1408,6 +1565,7 @@ def sync(
     channel: str | None,
     all_channels: bool,
     all_repos: bool,
+    jobs: int | None,
     dry_run: bool,
 ):
     """Commit and push in one operation.
@@ -1439,26 +1597,24 @@ def sync(
 
     _dry_run_mode.set(dry_run)
     if dry_run:
-        click.echo("[DRY RUN MODE - No changes will be made]")
-        click.echo()
+        _echo("[DRY RUN MODE - No changes will be made]")
+        _echo()
 
     repos = _select_repos(
         spec_file, target=target, channel=channel, all_channels=all_channels, all_repos=all_repos
     )
 
     if not repos:
-        click.echo("No output directories found.")
+        _echo("No output directories found.")
         return
 
-    errors_found = False
-
-    for repo in repos:
-        click.echo(f"[{repo.display_name}] {repo.path}")
+    def sync_one(repo: OutputRepo) -> bool:
+        _echo(f"[{repo.display_name}] {repo.path}")
 
         if not repo.has_git:
-            click.echo("  Skipped: No git repository")
-            click.echo()
-            continue
+            _echo("  Skipped: No git repository")
+            _echo()
+            return True
 
         # The remote-ahead recovery hint is command-specific; pass the
         # ``clm git`` recipe so the shared helper can print it verbatim.
@@ -1467,18 +1623,17 @@ def sync(
             f"clm build {spec_file}",
             f'clm git sync {spec_file} -m "{message}"',
         ]
-        if not commit_and_push_repo(
+        ok = commit_and_push_repo(
             repo,
             message,
             amend=amend,
             force_with_lease=force_with_lease,
             remote_ahead_hint=remote_ahead_hint,
-        ):
-            errors_found = True
-
-        click.echo()
+        )
+        _echo()
+        return ok
 
-    if errors_found:
+    if not all(_run_repo_pipelines(repos, sync_one, jobs=jobs)):
         raise SystemExit(1)
 
 
@@ -1488,6 +1643,7 @@ def sync(
 @_channel_option
 @_all_channels_option
 @_all_option
+@_jobs_option
 @click.option("--dry-run", is_flag=True, help="Show what would be done without executing")
 def reset(
     spec_file: Path,
@@ -1495,6 +1651,7 @@ def reset(
     channel: str | None,
     all_channels: bool,
     all_repos: bool,
+    jobs: int | None,
     dry_run: bool,
 ):
     """Reset local repos to remote tracking branch.
@@ -1520,50 +1677,52 @@ def reset(
     """
     _dry_run_mode.set(dry_run)
     if dry_run:
-        click.echo("[DRY RUN MODE - No changes will be made]")
-        click.echo()
+        _echo("[DRY RUN MODE - No changes will be made]")
+        _echo()
 
     repos = _select_repos(
         spec_file, target=target, channel=channel, all_channels=all_channels, all_repos=all_repos
     )
 
     if not repos:
-        click.echo("No output directories found.")
+        _echo("No output directories found.")
         return
 
-    for repo in repos:
-        click.echo(f"[{repo.display_name}] {repo.path}")
+    def reset_one(repo: OutputRepo) -> None:
+        _echo(f"[{repo.display_name}] {repo.path}")
 
         if not repo.has_git:
-            click.echo("  Skipped: No git repository")
-            click.echo()
-            continue
+            _echo("  Skipped: No git repository")
+            _echo()
+            return
 
         if not repo.has_remote():
-            click.echo("  Skipped: No remote configured")
-            click.echo()
-            continue
+            _echo("  Skipped: No remote configured")
+            _echo()
+            return
 
         branch = get_current_branch(repo.path)
 
         # Fetch
-        click.echo("  Fetching from origin...")
+        _echo("  Fetching from origin...")
         result = run_git(repo.path, "fetch", "origin")
         if result.returncode != 0:
-            click.echo(f"  Error fetching: {result.stderr.strip()}", err=True)
-            click.echo()
-            continue
+            _echo(f"  Error fetching: {result.stderr.strip()}", err=True)
+            _echo()
+            return
 
         # Reset
-        click.echo(f"  Resetting to origin/{branch}...")
+        _echo(f"  Resetting to origin/{branch}...")
         result = run_git(repo.path, "reset", "--hard", f"origin/{branch}")
         if result.returncode == 0:
-            click.echo("  Reset complete")
+            _echo("  Reset complete")
         else:
-            click.echo(f"  Error: {result.stderr.strip()}", err=True)
+            _echo(f"  Error: {result.stderr.strip()}", err=True)
+
+        _echo()
 
-        click.echo()
+    _run_repo_pipelines(repos, reset_one, jobs=jobs)
 
-    click.echo("Next steps:")
-    click.echo(f"  1. clm build {spec_file}")
-    click.echo(f'  2. clm git sync {spec_file} -m "<message>"')
+    _echo("Next steps:")
+    _echo(f"  1. clm build {spec_file}")
+    _echo(f'  2. clm git sync {spec_file} -m "<message>"')
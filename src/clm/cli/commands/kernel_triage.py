@@ -21,10 +21,21 @@ cache/jobs databases (every deck executes exactly once per language —
 within one build, kinds share the execution cache) and a throwaway output
 directory, while telemetry is pointed at the REAL telemetry database so
 triage runs extend the crash history.
+
+Large triage sets are split into *shards* (groups of topics) and each deck
+is executed several times (``--repetitions``) so a real flake can be told
+from a rare crash. Every (shard, repetition) pair is an independent triage
+build with its own throwaway databases — including its own telemetry
+database, so each run's events are attributable to that run — and the
+builds run concurrently, as many at once as the CPUs can hold (see
+:func:`_default_parallel_builds`). Their telemetry is merged into the real database
+afterwards, and the per-run outcomes into one report with a flake rate per
+deck.
 """
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
 import os
@@ -33,6 +44,8 @@ import subprocess
 import sys
 import tempfile
 import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -42,6 +55,10 @@ import click
 
 logger = logging.getLogger(__name__)
 
+# Notebook workers assumed per triage build when --notebook-workers is not
+# given (the spec's own count is only known inside the build).
+_WORKERS_PER_BUILD = 2
+
 # Outcome → recommendation, keyed by (deck is an evaluate="no" workaround).
 _RECOMMENDATIONS = {
     ("passed", True): 'workaround can be lifted — remove evaluate="no" from the topic',
@@ -69,6 +86,20 @@ class TriageDeck:
     outcome: str = ""  # set by the rerun: passed | flaky | failed | suppressed_failure
     details: str = ""
     recommendation: str = ""
+    runs: list[str] = field(default_factory=list)  # outcome of each repetition
+    flake_rate: float | None = None  # share of repetitions that were not a clean pass
+
+
+@dataclass
+class TriageRun:
+    """One triage build: a shard of the candidate topics, one repetition."""
+
+    shard: int
+    repetition: int
+    topic_ids: set[str]
+    build_dir: Path
+    status: str = ""
+    decks: list[TriageDeck] = field(default_factory=list)  # this run's outcomes
 
 
 def _norm(path: str | Path) -> str:
@@ -209,6 +240,7 @@ def _run_triage_build(
     build_dir: Path,
     telemetry_db: Path,
     *,
+    container_prefix: str | None = None,
     data_dir: Path | None,
     workers: str | None,
     notebook_workers: int | None,
@@ -216,7 +248,11 @@ def _run_triage_build(
     notebook_image: str | None,
     timeout: float,
 ) -> tuple[dict[str, Any] | None, int, str]:
-    """Run ``clm build`` on the triage spec; return (summary_json, rc, output)."""
+    """Run ``clm build`` on the triage spec; return (summary_json, rc, output).
+
+    ``container_prefix`` names the build's Docker worker containers, so
+    concurrent triage builds do not replace each other's containers.
+    """
     cmd = [
         sys.executable,
         "-m",
@@ -245,10 +281,15 @@ def _run_triage_build(
     if notebook_image is not None:
         cmd += ["--notebook-image", notebook_image]
 
+    env = None
+    if container_prefix is not None:
+        env = {**os.environ, "CLM_WORKER_MANAGEMENT__CONTAINER_NAME_PREFIX": container_prefix}
+
     logger.info("Running triage build: %s", " ".join(cmd))
     try:
         proc = subprocess.run(  # noqa: S603 — argv built from our own CLI inputs
             cmd,
+            env=env,
             capture_output=True,
             text=True,
             encoding="utf-8",
@@ -322,6 +363,167 @@ def _classify_rerun_outcomes(
         )
 
 
+def _shard_topics(decks: list[TriageDeck], shards: int) -> list[set[str]]:
+    """Split the candidates' topics into at most ``shards`` balanced groups.
+
+    Topics are the unit because a triage spec selects topics, not decks.
+    The largest topics are placed first, each on the shard with the fewest
+    decks so far.
+    """
+    counts = Counter(deck.topic_id for deck in decks)
+    groups: list[set[str]] = [set() for _ in range(max(1, min(shards, len(counts))))]
+    loads = [0] * len(groups)
+    for topic_id, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+        index = loads.index(min(loads))
+        groups[index].add(topic_id)
+        loads[index] += count
+    return groups
+
+
+def _execute_triage_run(
+    run: TriageRun,
+    spec_file: Path,
+    decks: list[TriageDeck],
+    build_options: dict[str, Any],
+) -> None:
+    """Run one triage build and classify its decks into ``run.decks``."""
+    from clm.infrastructure.database.execution_telemetry import ExecutionTelemetryStore
+
+    run.build_dir.mkdir(parents=True, exist_ok=True)
+    run_telemetry = ExecutionTelemetryStore(run.build_dir / "telemetry.db")
+    tag = f"{os.getpid()}-{run.shard}-{run.repetition}"
+    triage_spec = spec_file.parent / f".clm-triage-{tag}{spec_file.suffix}"
+    run_started = (datetime.now(timezone.utc) - timedelta(seconds=2)).strftime("%Y-%m-%dT%H:%M:%S")
+    try:
+        write_triage_spec(spec_file, run.topic_ids, triage_spec)
+        summary_json, returncode, output = _run_triage_build(
+            triage_spec,
+            run.build_dir,
+            run_telemetry.db_path,
+            container_prefix=f"clm-triage-{tag}",
+            **build_options,
+        )
+        if summary_json is None:
+            logger.error(
+                "Triage build %s (exit %s) produced no JSON summary. Output:\n%s",
+                tag,
+                returncode,
+                output[-4000:],
+            )
+        run.status = str(summary_json.get("status", "unknown")) if summary_json else "no-summary"
+        run.decks = [
+            dataclasses.replace(deck, history=[])
+            for deck in decks
+            if deck.topic_id in run.topic_ids
+        ]
+        _classify_rerun_outcomes(run.decks, summary_json, run_telemetry, run_started)
+    finally:
+        triage_spec.unlink(missing_ok=True)
+
+
+def _merge_run_outcomes(deck: TriageDeck, runs: list[TriageDeck]) -> None:
+    """Fold a deck's per-repetition outcomes into one outcome and flake rate.
+
+    All clean passes -> ``passed``; any pass mixed with anything else ->
+    ``flaky``; otherwise ``failed`` if any run failed outright, else
+    ``suppressed_failure``. With a single repetition this is exactly that
+    run's outcome.
+    """
+    deck.runs = [run.outcome for run in runs]
+    known = [run for run in runs if run.outcome != "unknown"]
+    outcomes = {run.outcome for run in known}
+    if not known:
+        deck.outcome = "unknown"
+    elif outcomes == {"passed"}:
+        deck.outcome = "passed"
+    elif outcomes & {"passed", "flaky"}:
+        deck.outcome = "flaky"
+    elif "failed" in outcomes:
+        deck.outcome = "failed"
+    else:
+        deck.outcome = "suppressed_failure"
+
+    unclean = sum(run.outcome != "passed" for run in known)
+    deck.flake_rate = unclean / len(known) if known else None
+    deck.details = next((run.details for run in runs if run.details), "")
+    if len(runs) > 1 and known:
+        tally = f"{unclean}/{len(known)} runs not clean"
+        deck.details = f"{tally} — {deck.details}" if deck.details else tally
+    deck.recommendation = _RECOMMENDATIONS.get(
+        (deck.outcome, deck.is_workaround),
+        "no recommendation (triage build did not complete)",
+    )
+
+
+def _default_parallel_builds(builds: int, notebook_workers: int | None) -> int:
+    """Triage builds to run at once when ``--parallel-builds`` is not given.
+
+    Every build starts its own notebook worker pool, so running all of them
+    at once oversubscribes the machine. Run as many as the CPUs hold at
+    ``notebook_workers`` per build (:data:`_WORKERS_PER_BUILD` when the spec
+    decides), and at least one.
+    """
+    per_build = notebook_workers or _WORKERS_PER_BUILD
+    return max(1, min(builds, (os.cpu_count() or 1) // per_build))
+
+
+def _run_sharded_triage(
+    spec_file: Path,
+    decks: list[TriageDeck],
+    telemetry_store,
+    work_dir: Path,
+    *,
+    shards: int,
+    repetitions: int,
+    parallel_builds: int,
+    build_options: dict[str, Any],
+) -> list[TriageRun]:
+    """Run every (shard, repetition) triage build concurrently and merge the results.
+
+    Each run's telemetry is imported into ``telemetry_store`` and each
+    deck's outcome is merged across its repetitions (see
+    :func:`_merge_run_outcomes`).
+    """
+    from clm.infrastructure.database.execution_telemetry import ExecutionTelemetryStore
+
+    runs = [
+        TriageRun(
+            shard=shard,
+            repetition=repetition,
+            topic_ids=topic_ids,
+            build_dir=work_dir / f"shard-{shard}-rep-{repetition}",
+        )
+        for shard, topic_ids in enumerate(_shard_topics(decks, shards))
+        for repetition in range(repetitions)
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, parallel_builds)) as pool:
+        futures = [
+            pool.submit(_execute_triage_run, run, spec_file, decks, build_options) for run in runs
+        ]
+        for future in futures:
+            future.result()
+
+    for run in runs:
+        run_events = ExecutionTelemetryStore(run.build_dir / "telemetry.db").events()
+        telemetry_store.import_events(list(reversed(run_events)))
+
+    per_deck: dict[str, list[TriageDeck]] = {}
+    for run in runs:
+        for run_deck in run.decks:
+            per_deck.setdefault(_norm(run_deck.path), []).append(run_deck)
+    for deck in decks:
+        _merge_run_outcomes(deck, per_deck.get(_norm(deck.path), []))
+    return runs
+
+
+def _overall_build_status(runs: list[TriageRun]) -> str:
+    """One status for all triage builds: the shared one, or a tally."""
+    counts = Counter(run.status for run in runs)
+    if len(counts) == 1:
+        return next(iter(counts))
+    return ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+
+
 def _print_history(deck: TriageDeck) -> None:
     for event in deck.history[:3]:
         cell = (
@@ -363,31 +565,29 @@ def _print_report(
     workarounds = [d for d in decks if d.is_workaround]
     flaky = [d for d in decks if not d.is_workaround]
 
-    click.echo(f'evaluate="no" workarounds ({len(workarounds)}):')
-    for deck in workarounds:
-        if reran:
-            mark = outcome_marks.get(deck.outcome, "?")
-            click.echo(f"  {mark} {deck.path} [{deck.topic_id}]: {deck.outcome}")
-            if deck.details:
-                click.echo(f"      {deck.details}")
-            click.echo(f"      -> {deck.recommendation}")
-        else:
+    def print_deck(deck: TriageDeck) -> None:
+        if not reran:
             click.echo(f"  - {deck.path} [{deck.topic_id}]")
             _print_history(deck)
+            return
+        mark = outcome_marks.get(deck.outcome, "?")
+        rate = ""
+        if len(deck.runs) > 1 and deck.flake_rate is not None:
+            rate = f" (flake rate {deck.flake_rate:.0%} over {len(deck.runs)} runs)"
+        click.echo(f"  {mark} {deck.path} [{deck.topic_id}]: {deck.outcome}{rate}")
+        if deck.details:
+            click.echo(f"      {deck.details}")
+        click.echo(f"      -> {deck.recommendation}")
+
+    click.echo(f'evaluate="no" workarounds ({len(workarounds)}):')
+    for deck in workarounds:
+        print_deck(deck)
     if not workarounds:
         click.echo("  (none)")
 
     click.echo(f"\nknown-flaky decks from telemetry ({len(flaky)}):")
     for deck in flaky:
-        if reran:
-            mark = outcome_marks.get(deck.outcome, "?")
-            click.echo(f"  {mark} {deck.path} [{deck.topic_id}]: {deck.outcome}")
-            if deck.details:
-                click.echo(f"      {deck.details}")
-            click.echo(f"      -> {deck.recommendation}")
-        else:
-            click.echo(f"  - {deck.path} [{deck.topic_id}]")
-            _print_history(deck)
+        print_deck(deck)
     if not flaky:
         click.echo("  (none)")
 
@@ -444,6 +644,28 @@ def _print_report(
     show_default=True,
     help="Timeout (seconds) for the triage build subprocess.",
 )
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Split the candidate topics across this many triage builds.",
+)
+@click.option(
+    "--repetitions",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Execute every deck this many times (one triage build per shard and repetition).",
+)
+@click.option(
+    "--parallel-builds",
+    type=click.IntRange(min=1),
+    help=(
+        "Triage builds to run at once. Default: all of them (shards x repetitions), "
+        "capped by the CPU count divided by the notebook workers per build."
+    ),
+)
 @click.option(
     "--keep-build-dir",
     is_flag=True,
@@ -462,6 +684,9 @@ def kernel_triage_cmd(
     max_workers: int | None,
     notebook_image: str | None,
     build_timeout: float,
+    shards: int,
+    repetitions: int,
+    parallel_builds: int | None,
     keep_build_dir: bool,
     as_json: bool,
 ):
@@ -474,10 +699,15 @@ def kernel_triage_cmd(
     recorded to the real database), and reports which workarounds can be
     lifted. Run it after every xeus-cpp/CppInterOp image bump.
 
+    With ``--shards`` and ``--repetitions`` the decks are spread over
+    several concurrent triage builds and executed repeatedly; the report
+    then gives each deck's flake rate across its runs.
+
     \b
     Examples:
         clm kernel-triage cpp-course.xml
         clm kernel-triage cpp-course.xml --workers docker --notebook-image full
+        clm kernel-triage cpp-course.xml --shards 4 --repetitions 5
         clm kernel-triage cpp-course.xml --report-only
         clm kernel-triage cpp-course.xml --json
     """
@@ -517,47 +747,54 @@ def kernel_triage_cmd(
         return
 
     build_status: str | None = None
+    runs: list[TriageRun] = []
     if not report_only:
         target_topic_ids = {deck.topic_id for deck in decks}
-        run_started = (datetime.now(timezone.utc) - timedelta(seconds=2)).strftime(
-            "%Y-%m-%dT%H:%M:%S"
-        )
-        build_dir = Path(tempfile.mkdtemp(prefix="clm-kernel-triage-"))
-        triage_spec = spec_file.parent / f".clm-triage-{os.getpid()}{spec_file.suffix}"
+        work_dir = Path(tempfile.mkdtemp(prefix="clm-kernel-triage-"))
+        build_options: dict[str, Any] = {
+            "data_dir": data_dir,
+            "workers": workers,
+            "notebook_workers": notebook_workers,
+            "max_workers": max_workers,
+            "notebook_image": notebook_image,
+            "timeout": build_timeout,
+        }
         try:
-            write_triage_spec(spec_file, target_topic_ids, triage_spec)
             if not as_json:
                 click.echo(
                     f"Re-executing {len(decks)} deck(s) from "
-                    f"{len(target_topic_ids)} topic(s) against the current kernel..."
+                    f"{len(target_topic_ids)} topic(s) against the current kernel "
+                    f"({min(shards, len(target_topic_ids))} shard(s) x "
+                    f"{repetitions} repetition(s))..."
                 )
-            summary_json, returncode, output = _run_triage_build(
-                triage_spec,
-                build_dir,
-                telemetry_db,
-                data_dir=data_dir,
-                workers=workers,
-                notebook_workers=notebook_workers,
-                max_workers=max_workers,
-                notebook_image=notebook_image,
-                timeout=build_timeout,
+            runs = _run_sharded_triage(
+                spec_file,
+                decks,
+                telemetry_store,
+                work_dir,
+                shards=shards,
+                repetitions=repetitions,
+                parallel_builds=parallel_builds
+                or _default_parallel_builds(shards * repetitions, notebook_workers),
+                build_options=build_options,
             )
-            if summary_json is None:
-                logger.error(
-                    "Triage build (exit %s) produced no JSON summary. Output:\n%s",
-                    returncode,
-                    output[-4000:],
-                )
-            build_status = summary_json.get("status") if summary_json else "no-summary"
-            _classify_rerun_outcomes(decks, summary_json, telemetry_store, run_started)
+            build_status = _overall_build_status(runs)
         finally:
-            triage_spec.unlink(missing_ok=True)
             if keep_build_dir:
-                click.echo(f"Triage build directory kept: {build_dir}", err=True)
+                click.echo(f"Triage build directory kept: {work_dir}", err=True)
             else:
-                shutil.rmtree(build_dir, ignore_errors=True)
+                shutil.rmtree(work_dir, ignore_errors=True)
 
     result["build_status"] = build_status
+    result["builds"] = [
+        {
+            "shard": run.shard,
+            "repetition": run.repetition,
+            "topics": sorted(run.topic_ids),
+            "status": run.status,
+        }
+        for run in runs
+    ]
     result["decks"] = [
         {
             "path": deck.path,
@@ -567,6 +804,8 @@ def kernel_triage_cmd(
             "outcome": deck.outcome,
             "details": deck.details,
             "recommendation": deck.recommendation,
+            "runs": deck.runs,
+            "flake_rate": deck.flake_rate,
         }
         for deck in decks
     ]
@@ -950,16 +950,16 @@ def _make_job_manager_for_root(root_dir: Path):
 
     Used by the CLI ``submit``/``jobs`` commands so they operate against
     the same state as the web dashboard. The returned manager loads any
-    persisted jobs from ``<root_dir>/.clm/jobs.json`` on construction.
+    persisted jobs from ``<root_dir>/.clm/jobs.jsonl`` on construction.
     """
     from clm.recordings.workflow.backends import make_backend
     from clm.recordings.workflow.event_bus import EventBus
     from clm.recordings.workflow.job_manager import JobManager
-    from clm.recordings.workflow.job_store import DEFAULT_JOBS_FILE, JsonFileJobStore
+    from clm.recordings.workflow.job_store import DEFAULT_JOURNAL_FILE, JournalJobStore
 
     config = _build_recordings_config()
     backend = make_backend(config, root_dir=root_dir)
-    store = JsonFileJobStore(root_dir / DEFAULT_JOBS_FILE)
+    store = JournalJobStore(root_dir / DEFAULT_JOURNAL_FILE)
     bus = EventBus()
     return JobManager(
         backend=backend,
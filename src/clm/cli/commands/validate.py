@@ -22,10 +22,12 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from clm.cli.commands.validate_slides import (
+    open_validation_cache,
     parse_checks,
     print_human_readable,
     raise_on_findings,
@@ -41,6 +43,9 @@ from clm.cli.commands.validate_spec import (
     validate_spec_cmd,
 )
 
+if TYPE_CHECKING:
+    from clm.slides.validation_engine import ValidationCache
+
 
 def _infer_kind(path: Path) -> str | None:
     """Return ``"spec"``, ``"slides"``, or ``None`` if ambiguous."""
@@ -161,6 +166,25 @@ def _slides_dir_for_spec(data_dir: Path | None, spec_file: Path) -> Path:
     default=None,
     help="For --shipping-only: directory of *.xml specs. Default: <course-root>/course-specs/.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=None,
+    help=(
+        "Slides-only: worker processes for directory / course validation. "
+        "Default (or 0): auto; 1 forces a serial run."
+    ),
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    help=(
+        "Slides-only: reuse results for decks unchanged since the last run "
+        "(per-user cache). Default: on."
+    ),
+)
 @click.pass_context
 def validate_cmd(
     ctx: click.Context,
@@ -177,6 +201,8 @@ def validate_cmd(
     summary: bool,
     shipping_only: bool,
     specs_dir: Path | None,
+    jobs: int | None = None,
+    use_cache: bool = True,
 ) -> None:
     """Validate a course spec file or slide files.
 
@@ -211,6 +237,8 @@ def validate_cmd(
             deep=deep,
             summary=summary,
             shipping_only=shipping_only,
+            jobs=jobs,
+            use_cache=use_cache,
         )
     else:  # slides
         if check_workdays:
@@ -228,6 +256,8 @@ def validate_cmd(
             summary=summary,
             shipping_only=shipping_only,
             specs_dir=specs_dir,
+            jobs=jobs,
+            use_cache=use_cache,
         )
 
 
@@ -245,6 +275,8 @@ def _validate_spec_path(
     deep: bool,
     summary: bool,
     shipping_only: bool,
+    jobs: int | None,
+    use_cache: bool,
 ) -> None:
     if quick:
         raise click.UsageError("--quick is slides-only; not valid with a spec.")
@@ -284,6 +316,8 @@ def _validate_spec_path(
         check_workdays=check_workdays,
         fail_on=fail_on,
         summary=summary,
+        jobs=jobs,
+        use_cache=use_cache,
     )
 
 
@@ -297,6 +331,8 @@ def _run_deep_spec(
     check_workdays: bool,
     fail_on: str | None,
     summary: bool,
+    jobs: int | None,
+    use_cache: bool,
 ) -> None:
     """Validate a spec's structure AND the content of every deck it pulls in."""
     from clm.core.course_spec import CourseSpecError
@@ -316,7 +352,10 @@ def _run_deep_spec(
     except CourseSpecError as e:
         raise click.ClickException(str(e)) from None
 
-    slides_result = validate_course(spec_file, slides_dir, checks=check_list)
+    with open_validation_cache(use_cache) as cache:
+        slides_result = validate_course(
+            spec_file, slides_dir, checks=check_list, jobs=jobs, cache=cache
+        )
 
     if as_json:
         payload: dict = {
@@ -357,6 +396,8 @@ def _validate_slides_path(
     summary: bool,
     shipping_only: bool,
     specs_dir: Path | None,
+    jobs: int | None,
+    use_cache: bool,
 ) -> None:
     if include_disabled:
         raise click.UsageError("--include-disabled is spec-only; not valid with --kind=slides.")
@@ -373,13 +414,16 @@ def _validate_slides_path(
             as_json=as_json,
             data_dir=data_dir,
             fail_on=fail_on,
+            jobs=jobs,
+            use_cache=use_cache,
         )
         return
 
     if quick:
         raise click.UsageError("--quick is not compatible with --summary / --shipping-only.")
 
-    result = _run_slides(path, checks, shipping_only, specs_dir)
+    with open_validation_cache(use_cache) as cache:
+        result = _run_slides(path, checks, shipping_only, specs_dir, jobs=jobs, cache=cache)
 
     if as_json:
         payload = _slides_result_to_dict(result)
@@ -401,6 +445,9 @@ def _run_slides(
     checks: str | None,
     shipping_only: bool,
     specs_dir: Path | None,
+    *,
+    jobs: int | None = None,
+    cache: ValidationCache | None = None,
 ):
     """Run slide validation, optionally scoped to the shipping set."""
     from clm.slides.validator import (
@@ -413,7 +460,7 @@ def _run_slides(
 
     if not shipping_only:
         if path.is_dir():
-            return validate_directory(path, checks=check_list)
+            return validate_directory(path, checks=check_list, jobs=jobs, cache=cache)
         return validate_file(path, checks=check_list)
 
     if not path.is_dir():
@@ -439,7 +486,7 @@ def _run_slides(
     # .cs / .cpp decks.
     base = path.resolve()
     kept = sorted(d for d in ship if d == base or base in d.parents)
-    return validate_files(kept, checks=check_list)
+    return validate_files(kept, checks=check_list, jobs=jobs, cache=cache)
 
 
 def _course_root_for_slides_path(path: Path) -> Path:
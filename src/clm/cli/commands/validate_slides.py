@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import json
+import logging
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import click
 
+from clm.slides.validation_engine import ValidationCache, default_cache_path
 from clm.slides.validator import (
     ALL_CHECKS,
     ALL_DETERMINISTIC_CHECKS,
@@ -18,6 +23,8 @@ from clm.slides.validator import (
     validate_quick,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @click.command("validate-slides")
 @click.argument(
@@ -69,6 +76,27 @@ from clm.slides.validator import (
         "without it, JSON mode always exits 0."
     ),
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=None,
+    help=(
+        "Worker processes for directory / course validation. Default (or 0): "
+        "parallel only when enough decks need checking to repay the start-up; "
+        "1 forces a serial run. Finding order is the same either way."
+    ),
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    help=(
+        "Reuse the results of decks (and split pairs) whose content — and "
+        "voiceover companions — are unchanged since the last run. The cache "
+        "lives in the per-user cache directory. Default: on."
+    ),
+)
 def validate_slides_cmd(
     path: Path,
     checks: str | None,
@@ -76,6 +104,8 @@ def validate_slides_cmd(
     as_json: bool,
     data_dir: Path | None,
     fail_on: str | None,
+    jobs: int | None = None,
+    use_cache: bool = True,
 ):
     """Validate slide files for format, tag, and pairing correctness.
 
@@ -91,6 +121,7 @@ def validate_slides_cmd(
         clm validate slides/topic/slides_intro.py --quick
         clm validate slides/topic/slides_intro.py --json
         clm validate slides/ --fail-on warning            # pre-commit gate
+        clm validate course-specs/python-basics.xml -j 8 --no-cache
     """
     if quick:
         if not path.is_file():
@@ -101,7 +132,15 @@ def validate_slides_cmd(
         # The per-deck `clm: voiceover-coverage` header marker (#178) applies
         # on the default run only; an explicit --checks list is honored
         # verbatim.
-        result = _dispatch_validation(path, check_list, data_dir, marker_opt_in=checks is None)
+        with open_validation_cache(use_cache) as cache:
+            result = _dispatch_validation(
+                path,
+                check_list,
+                data_dir,
+                marker_opt_in=checks is None,
+                jobs=jobs,
+                cache=cache,
+            )
 
     if as_json:
         click.echo(json.dumps(result_to_dict(result), indent=2))
@@ -131,6 +170,28 @@ def raise_on_findings(findings: list[Finding], fail_on: str | None, as_json: boo
         raise SystemExit(1)
 
 
+@contextmanager
+def open_validation_cache(enabled: bool) -> Iterator[ValidationCache | None]:
+    """Open the per-user validation result cache, or yield ``None``.
+
+    A cache that cannot be opened (read-only home, locked or corrupt file)
+    only costs speed, so it degrades to an uncached run with a log line.
+    """
+    if not enabled:
+        yield None
+        return
+    try:
+        cache = ValidationCache(default_cache_path())
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Validation cache unavailable, running uncached: %s", exc)
+        yield None
+        return
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
 def parse_checks(checks_str: str | None) -> list[str] | None:
     """Parse the --checks option into a list, or None for defaults."""
     if checks_str is None:
@@ -152,14 +213,25 @@ def _dispatch_validation(
     data_dir: Path | None,
     *,
     marker_opt_in: bool,
+    jobs: int | None = None,
+    cache: ValidationCache | None = None,
 ) -> ValidationResult:
     """Dispatch to the right validate_* function based on path type."""
     if path.is_file() and path.suffix in (".xml",):
         # Course spec file
         slides_dir = _resolve_slides_dir(data_dir, path)
-        return validate_course(path, slides_dir, checks=check_list, marker_opt_in=marker_opt_in)
+        return validate_course(
+            path,
+            slides_dir,
+            checks=check_list,
+            marker_opt_in=marker_opt_in,
+            jobs=jobs,
+            cache=cache,
+        )
     elif path.is_dir():
-        return validate_directory(path, checks=check_list, marker_opt_in=marker_opt_in)
+        return validate_directory(
+            path, checks=check_list, marker_opt_in=marker_opt_in, jobs=jobs, cache=cache
+        )
     elif path.is_file():
         return validate_file(path, checks=check_list, marker_opt_in=marker_opt_in)
     else:
@@ -8,6 +8,8 @@ from pathlib import Path
 
 import click
 
+from clm.cli.commands.shared import LOG_LEVELS
+
 
 @click.group(name="workers")
 def workers_group():
@@ -414,3 +416,130 @@ def workers_reap(ctx, jobs_db_path, dry_run, force, reap_all):
 
     job_queue.close()
     return 0
+
+
+@workers_group.command(name="daemon")
+@click.argument(
+    "spec-file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--data-dir",
+    "-d",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(exists=False, file_okay=False, dir_okay=True, path_type=Path),
+    help="Output directory of the builds to serve (as for 'clm build').",
+)
+@click.option(
+    "--workers",
+    type=click.Choice(["direct", "docker"], case_sensitive=False),
+    help="Worker execution mode (overrides config)",
+)
+@click.option("--notebook-workers", type=int, help="Number of notebook workers")
+@click.option("--plantuml-workers", type=int, help="Number of PlantUML workers")
+@click.option("--drawio-workers", type=int, help="Number of Draw.io workers")
+@click.option("--max-workers", type=int, help="Hard cap on effective worker count per type")
+@click.option("--notebook-image", type=str, help="Docker image for notebook workers")
+@click.option("--plantuml-image", type=str, help="Docker image for PlantUML workers")
+@click.option("--drawio-image", type=str, help="Docker image for Draw.io workers")
+@click.option(
+    "--idle-timeout",
+    type=float,
+    default=None,
+    help=(
+        "Stop after this many seconds without queued jobs or attaching "
+        "builds; 0 runs until stopped. Default: [worker_management] "
+        "daemon_idle_timeout (1800)."
+    ),
+)
+@click.option(
+    "--prewarm",
+    is_flag=True,
+    help="Have every worker start a kernel/JVM/Draw.io export once before taking jobs.",
+)
+@click.option(
+    "--log-level",
+    type=click.Choice(LOG_LEVELS, case_sensitive=False),
+    default=None,
+    help="Set the logging level.",
+)
+@click.pass_context
+def workers_daemon(
+    ctx,
+    spec_file,
+    data_dir,
+    output_dir,
+    workers,
+    notebook_workers,
+    plantuml_workers,
+    drawio_workers,
+    max_workers,
+    notebook_image,
+    plantuml_image,
+    drawio_image,
+    idle_timeout,
+    prewarm,
+    log_level,
+):
+    """Keep a warm worker pool running for successive builds.
+
+    Starts the workers a 'clm build' of SPEC_FILE would start and keeps them
+    running. A later 'clm build' with the same jobs database, output
+    directory and worker settings attaches to this pool instead of starting
+    its own, so it only submits jobs. A build whose settings differ (clm
+    version, execution mode, images, paths) starts its own workers as usual.
+
+    Stop the daemon with Ctrl+C or SIGTERM; it also stops on its own after
+    --idle-timeout seconds without work.
+
+    \b
+    Examples:
+        clm workers daemon course.xml
+        clm workers daemon course.xml --workers docker --prewarm
+        clm workers daemon course.xml --notebook-workers 4 --idle-timeout 0
+    """
+    import signal
+
+    from clm.build import BuildConfig, create_worker_daemon, resolve_log_level
+    from clm.cli.commands.shared import setup_logging
+    from clm.infrastructure.workers.daemon import WorkerDaemonError
+
+    setup_logging(resolve_log_level(log_level), console_logging=True)
+
+    config = BuildConfig(
+        spec_file=spec_file,
+        data_dir=data_dir,
+        output_dir=output_dir,
+        log_level=log_level,
+        cache_db_path=ctx.obj["CACHE_DB_PATH"],
+        jobs_db_path=ctx.obj["JOBS_DB_PATH"],
+        ignore_cache=False,
+        clear_cache=False,
+        watch=False,
+        print_correlation_ids=False,
+        workers=workers,
+        notebook_workers=notebook_workers,
+        plantuml_workers=plantuml_workers,
+        drawio_workers=drawio_workers,
+        max_workers=max_workers,
+        notebook_image=notebook_image,
+        plantuml_image=plantuml_image,
+        drawio_image=drawio_image,
+    )
+    daemon = create_worker_daemon(config, idle_timeout=idle_timeout, prewarm=prewarm)
+
+    def _handle_signal(signum, frame):
+        daemon.stop()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    click.echo(f"Worker daemon serving {config.jobs_db_path} (Ctrl+C to stop)")
+    try:
+        daemon.run()
+    except WorkerDaemonError as e:
+        raise click.ClickException(str(e)) from None
@@ -6,7 +6,7 @@ directories, enabling easy distribution of generated course content.
 
 import logging
 import os
-import zipfile
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path, PurePath
 
@@ -14,6 +14,7 @@ import click
 
 from clm.core.course_paths import resolve_course_paths
 from clm.core.course_spec import CourseSpec, CourseSpecError, validate_output_target_path
+from clm.infrastructure.utils.zip_engine import ZipSource, write_zip
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +23,21 @@ _EXCLUDED_DIRS = {".git", "__pycache__", ".mypy_cache", ".pytest_cache", ".ruff_
 _EXCLUDED_EXTENSIONS = {".pyc", ".pyo"}
 
 
-def zip_directory(source_dir: Path, archive_path: Path, *, dry_run: bool = False) -> Path:
+def zip_directory(
+    source_dir: Path,
+    archive_path: Path,
+    *,
+    dry_run: bool = False,
+    jobs: int | None = None,
+    reuse: bool = True,
+) -> Path:
     """Create a ZIP archive of a directory.
 
     Creates a deterministically-ordered ZIP archive with maximum compression.
     The archive contains a top-level directory matching the source directory name.
+    Members are compressed in parallel by :func:`write_zip`; already-compressed
+    formats are stored, and with ``reuse`` unchanged members are copied from the
+    archive being replaced instead of being compressed again.
 
     Based on Stefan Behnel's implementation from the legacy/v0.8.x branch.
 
@@ -34,6 +45,8 @@ def zip_directory(source_dir: Path, archive_path: Path, *, dry_run: bool = False
         source_dir: Directory to archive
         archive_path: Path where the ZIP file should be written
         dry_run: If True, report what would be done without creating the archive
+        jobs: Compression threads (default: chosen by the zip engine)
+        reuse: Reuse unchanged members of an existing archive at ``archive_path``
 
     Returns:
         Path to the created archive
@@ -45,31 +58,28 @@ def zip_directory(source_dir: Path, archive_path: Path, *, dry_run: bool = False
         click.echo(f"  [dry-run] Would create: {archive_path}")
         return archive_path
 
+    stats = write_zip(_archive_sources(source_dir), archive_path, jobs=jobs, reuse=reuse)
+    logger.info(
+        f"Created archive: {archive_path} ({stats.members} members: "
+        f"{stats.deflated} deflated, {stats.stored} stored, {stats.reused} reused)"
+    )
+    return archive_path
+
+
+def _archive_sources(source_dir: Path) -> Iterator[ZipSource]:
+    """Files under ``source_dir`` in archive order, minus the excluded ones."""
     archive_dir = PurePath(source_dir.name)
+    for dirpath, dirnames, filenames in os.walk(source_dir):
+        # Filter out excluded directories (modifying in-place affects os.walk traversal)
+        dirnames[:] = sorted(d for d in dirnames if d not in _EXCLUDED_DIRS)
 
-    archive_path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(
-        archive_path,
-        mode="w",
-        compression=zipfile.ZIP_DEFLATED,
-        compresslevel=9,
-    ) as zf:
-        for dirpath, dirnames, filenames in os.walk(source_dir):
-            # Filter out excluded directories (modifying in-place affects os.walk traversal)
-            dirnames[:] = sorted(d for d in dirnames if d not in _EXCLUDED_DIRS)
-
-            rel_dir = PurePath(dirpath).relative_to(source_dir)
-            archive_relpath = archive_dir / rel_dir
-
-            for filename in sorted(filenames):
-                if PurePath(filename).suffix in _EXCLUDED_EXTENSIONS:
-                    continue
-                file_path = Path(dirpath) / filename
-                arcname = str(archive_relpath / filename)
-                zf.write(file_path, arcname)
-
-    logger.info(f"Created archive: {archive_path}")
-    return archive_path
+        rel_dir = PurePath(dirpath).relative_to(source_dir)
+        archive_relpath = archive_dir / rel_dir
+
+        for filename in sorted(filenames):
+            if PurePath(filename).suffix in _EXCLUDED_EXTENSIONS:
+                continue
+            yield ZipSource(Path(dirpath) / filename, str(archive_relpath / filename))
 
 
 class OutputDirectory:
@@ -149,6 +159,17 @@ def _archive_name(directory: OutputDirectory) -> str:
     return f"{directory.path.name}_{directory.target_name}_{directory.language}.zip"
 
 
+def _split_jobs(jobs: int, archives: int) -> tuple[int, int]:
+    """Split a budget of ``jobs`` threads over ``archives`` archives.
+
+    Returns ``(concurrent archives, compression threads per archive)``, so
+    the archives written at once never run more than ``jobs`` compression
+    threads between them.
+    """
+    concurrent = max(1, min(jobs, archives))
+    return concurrent, max(1, jobs // concurrent)
+
+
 @click.group(name="zip")
 def zip_group():
     """Create and manage ZIP archives of course output."""
@@ -169,6 +190,19 @@ def zip_group():
     default=None,
     help="Directory where ZIP files are written (default: alongside each output directory).",
 )
+@click.option(
+    "--reuse/--no-reuse",
+    default=True,
+    help="Copy unchanged members from an existing archive instead of compressing "
+    "them again (default: reuse). The archive is identical either way.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Compression threads shared by all archives (default: CPU count).",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -178,6 +212,8 @@ def create_archives(
     spec_file: Path,
     target_filter: str | None,
     output_dir: Path | None,
+    reuse: bool,
+    jobs: int | None,
     dry_run: bool,
 ):
     """Create ZIP archives of course output directories.
@@ -215,12 +251,14 @@ def create_archives(
         click.echo("\n[dry-run] No archives created.")
         return
 
-    # Create archives in parallel
+    # Create archives in parallel, sharing one budget of compression threads
+    concurrent, jobs_per_archive = _split_jobs(jobs or os.cpu_count() or 1, len(tasks))
+
     def _create(task: tuple[Path, Path]) -> Path:
         source, archive = task
-        return zip_directory(source, archive)
+        return zip_directory(source, archive, jobs=jobs_per_archive, reuse=reuse)
 
-    with ThreadPoolExecutor() as executor:
+    with ThreadPoolExecutor(max_workers=concurrent) as executor:
         results = list(executor.map(_create, tasks))
 
     click.echo(f"\nCreated {len(results)} archive(s).")
@@ -47,6 +47,7 @@ _COMMANDS = "clm.cli.commands"
         # -------------------------------------------------------------
         "build": f"{_COMMANDS}.build:build",
         "kernel-triage": f"{_COMMANDS}.kernel_triage:kernel_triage_cmd",
+        "bench": f"{_COMMANDS}.bench:bench_cmd",
         "validate": f"{_COMMANDS}.validate:validate_cmd",
         "status": f"{_COMMANDS}.status:status",
         "monitor": f"{_COMMANDS}.monitor:monitor",
@@ -194,6 +195,7 @@ _COMPAT_EXPORTS: dict[str, tuple[str, str]] = {
     "_report_loading_issues": ("clm.build.engine", "_report_loading_issues"),
     "_is_ci_environment": (f"{_COMMANDS}.shared", "is_ci_environment"),
     "build": (f"{_COMMANDS}.build", "build"),
+    "bench_cmd": (f"{_COMMANDS}.bench", "bench_cmd"),
     "validate_cmd": (f"{_COMMANDS}.validate", "validate_cmd"),
     "status": (f"{_COMMANDS}.status", "status"),
     "monitor": (f"{_COMMANDS}.monitor", "monitor"),
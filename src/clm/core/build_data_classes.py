@@ -148,8 +148,8 @@ class OutputConflictInfo:
         output_path: Absolute output path that received conflicting writes.
         first_writer: Source path of the first writer (None if unknown).
         last_writer: Source path of the most recent writer (None if unknown).
-        first_hash: BLAKE2b-128 hash of the first writer's content.
-        last_hash: BLAKE2b-128 hash of the last writer's content.
+        first_hash: ``sha256:`` digest of the first writer's content.
+        last_hash: ``sha256:`` digest of the last writer's content.
         conflict_count: Number of additional writes after the first that
             produced differing content for this output path.
     """
@@ -0,0 +1,381 @@
+"""Opt-in whole-build trace export (``CLM_BUILD_TRACE``).
+
+:mod:`clm.core.build_profiling` answers *how much* time the host spends
+submitting and polling; this module answers *when* and *where*. It records
+one timeline across the host, the job queue and every worker and writes it
+as Chrome-trace JSON, which ``chrome://tracing`` and https://ui.perfetto.dev
+open directly:
+
+* host spans — ``spec load`` and one ``submission`` per job (job-cache probe,
+  payload serialization, INSERT);
+* queue spans — ``queued``, from the end of a job's submission until a
+  worker claimed it, drawn as an async track per job;
+* worker spans — ``claim``, then ``job`` with ``kernel start``, one
+  ``cell execution`` per cell, ``html export``, ``output write`` and
+  ``cache store`` nested inside it.
+
+Workers record into this module's process-wide :data:`tracer` just like the
+host does. After each job the worker drains its spans into the job result
+(``{"trace": {...}}``), which reaches the host through the jobs table for
+Direct workers and through the Worker API for Docker workers alike; the host
+then places them on a per-worker track. Timestamps are wall-clock
+microseconds, which the host and its containers share.
+
+Enable with ``CLM_BUILD_TRACE=1`` (writes ``clm-build-trace.json`` in the
+current directory) or ``CLM_BUILD_TRACE=<path>``. The trace and a
+critical-path summary are written at backend shutdown. When disabled, the
+call sites skip all timing and this module's methods early-return.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV_VAR = "CLM_BUILD_TRACE"
+DEFAULT_TRACE_FILENAME = "clm-build-trace.json"
+
+# Span names, shared by the recording call sites and the summary.
+SPEC_LOAD = "spec load"
+SUBMISSION = "submission"
+QUEUED = "queued"
+CLAIM = "claim"
+JOB = "job"
+KERNEL_START = "kernel start"
+CELL_EXECUTION = "cell execution"
+HTML_EXPORT = "html export"
+OUTPUT_WRITE = "output write"
+CACHE_STORE = "cache store"
+
+#: Worker stages reported in the summary, in pipeline order.
+WORKER_STAGES = (KERNEL_START, CELL_EXECUTION, HTML_EXPORT, OUTPUT_WRITE, CACHE_STORE)
+
+_HOST_PID = 1
+
+
+def trace_path_from_env() -> Path | None:
+    """Where ``CLM_BUILD_TRACE`` asks the trace to go; ``None`` when tracing is off."""
+    raw = os.environ.get(TRACE_ENV_VAR, "").strip()
+    if raw.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if raw.lower() in ("1", "true", "yes", "on"):
+        return Path(DEFAULT_TRACE_FILENAME)
+    return Path(raw)
+
+
+def now_us() -> int:
+    """Wall-clock time in microseconds (comparable across processes)."""
+    return time.time_ns() // 1000
+
+
+def _configure_stderr_handler() -> None:
+    """Route this module's records straight to stderr, as
+    :mod:`clm.core.build_profiling` does: the build sends INFO logging to a
+    file, and the summary of an opt-in trace must be visible. Idempotent.
+    """
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setLevel(logging.INFO)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class BuildTracer:
+    """Process-wide recorder of build trace spans.
+
+    Thread-safe: the host records submissions from the submit thread and
+    completions from the event loop; a worker records cell spans from the
+    executor thread that runs the kernel.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.enabled = path is not None
+        self._lock = threading.Lock()
+        if self.enabled:
+            _configure_stderr_handler()
+        self._events: list[dict[str, Any]] = []
+        self._threads: dict[int, tuple[int, str]] = {}
+        self._workers: dict[str, int] = {}
+        # Per-job timeline used by the summary: submitted/claimed/start/end/
+        # retired timestamps, the worker label and the summed stage durations.
+        self._jobs: dict[int, dict[str, Any]] = {}
+
+    # ------------------------------------------------------------ recording
+
+    @contextmanager
+    def span(self, name: str, cat: str, **args: Any) -> Iterator[None]:
+        """Record the body of the ``with`` block as a span."""
+        if not self.enabled:
+            yield
+            return
+        start = now_us()
+        try:
+            yield
+        finally:
+            self.add_span(name, cat, start, now_us(), **args)
+
+    def add_span(self, name: str, cat: str, start_us: int, end_us: int, **args: Any) -> None:
+        """Record a span that ran from *start_us* to *end_us* on this thread."""
+        if not self.enabled:
+            return
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": start_us,
+            "dur": max(0, end_us - start_us),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            event["pid"] = _HOST_PID
+            event["tid"] = self._thread_id_locked()
+            self._events.append(event)
+
+    def _thread_id_locked(self) -> int:
+        ident = threading.get_ident()
+        entry = self._threads.get(ident)
+        if entry is None:
+            entry = (len(self._threads) + 1, threading.current_thread().name)
+            self._threads[ident] = entry
+        return entry[0]
+
+    # --------------------------------------------------------- worker side
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Return and forget the spans recorded so far (worker side, per job)."""
+        if not self.enabled:
+            return []
+        with self._lock:
+            events, self._events = self._events, []
+        return [
+            {key: event[key] for key in ("name", "cat", "ts", "dur", "args") if key in event}
+            for event in events
+        ]
+
+    # ----------------------------------------------------------- host side
+
+    def job_submitted(self, job_id: int, at_us: int, **args: Any) -> None:
+        """Note that *job_id* entered the queue at *at_us*."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._jobs.setdefault(job_id, {}).update(submitted=at_us, args=args)
+
+    def add_job_trace(self, job_id: int, trace: dict[str, Any] | None) -> None:
+        """Place a worker's spans for *job_id* on that worker's track.
+
+        *trace* is the ``"trace"`` entry of the job result (``None`` when the
+        worker did not trace, e.g. a pool started without ``CLM_BUILD_TRACE``);
+        the job's retirement by the host is recorded either way.
+        """
+        if not self.enabled:
+            return
+        retired = now_us()
+        worker = (trace or {}).get("worker") or {}
+        spans = [span for span in (trace or {}).get("spans") or [] if isinstance(span, dict)]
+        label = "worker {} ({}, {})".format(
+            worker.get("worker_id", "?"),
+            worker.get("worker_type", "?"),
+            worker.get("execution_mode") or "direct",
+        )
+        with self._lock:
+            job = self._jobs.setdefault(job_id, {})
+            job["retired"] = retired
+            self._events.append(
+                {
+                    "name": "retired",
+                    "cat": "host",
+                    "ph": "i",
+                    "s": "t",
+                    "ts": retired,
+                    "pid": _HOST_PID,
+                    "tid": self._thread_id_locked(),
+                    "args": {"job_id": job_id},
+                }
+            )
+            if not spans:
+                return
+            pid = self._workers.setdefault(label, _HOST_PID + 1 + len(self._workers))
+            stages: dict[str, int] = {}
+            for span in spans:
+                event = dict(span, ph="X", pid=pid, tid=1)
+                event.setdefault("args", {})["job_id"] = job_id
+                self._events.append(event)
+                name = span.get("name")
+                if name == CLAIM:
+                    job["claimed"] = span["ts"] + span["dur"]
+                elif name == JOB:
+                    job["start"], job["end"] = span["ts"], span["ts"] + span["dur"]
+                elif name in WORKER_STAGES:
+                    stages[name] = stages.get(name, 0) + span["dur"]
+            job["worker"] = label
+            job["stages"] = stages
+            submitted = job.get("submitted")
+            picked_up = job.get("claimed", job.get("start"))
+            if submitted is not None and picked_up is not None:
+                common = {"name": QUEUED, "cat": "queue", "pid": _HOST_PID, "id": job_id}
+                self._events.append(dict(common, ph="b", ts=submitted, args=job.get("args", {})))
+                self._events.append(dict(common, ph="e", ts=max(submitted, picked_up)))
+
+    # -------------------------------------------------------------- export
+
+    def critical_path(self) -> dict[str, Any]:
+        """Summarize the build: its last job's path, stage totals, worker idle time.
+
+        The build ends when its last job is retired, so that job's timeline —
+        from build start through submission, queue wait and its worker stages
+        to the host noticing completion — is the critical path.
+        """
+        with self._lock:
+            events = [event for event in self._events if event.get("ph") in ("X", "i")]
+            jobs = {job_id: dict(job) for job_id, job in self._jobs.items()}
+        if not events:
+            return {}
+        start = min(event["ts"] for event in events)
+        end = max(event["ts"] + event.get("dur", 0) for event in events)
+        summary: dict[str, Any] = {"wall_s": _seconds(end - start)}
+
+        stage_totals: dict[str, int] = {}
+        for job in jobs.values():
+            for name, dur in (job.get("stages") or {}).items():
+                stage_totals[name] = stage_totals.get(name, 0) + dur
+        summary["stage_totals_s"] = {
+            name: _seconds(stage_totals[name]) for name in WORKER_STAGES if name in stage_totals
+        }
+
+        retired = {job_id: job for job_id, job in jobs.items() if "retired" in job}
+        if retired:
+            job_id, job = max(retired.items(), key=lambda item: item[1]["retired"])
+            marks = [("build start", start)]
+            marks += [
+                (label, job[key])
+                for label, key in (
+                    ("submitted", "submitted"),
+                    ("claimed", "claimed"),
+                    ("started", "start"),
+                    ("finished", "end"),
+                    ("retired", "retired"),
+                )
+                if key in job
+            ]
+            segments = {
+                f"{before} -> {after}": _seconds(max(0, t1 - t0))
+                for (before, t0), (after, t1) in zip(marks, marks[1:], strict=False)
+            }
+            summary["last_job"] = {
+                "job_id": job_id,
+                "input_file": (job.get("args") or {}).get("input_file", ""),
+                "worker": job.get("worker", ""),
+                "segments_s": segments,
+                "stages_s": {
+                    name: _seconds(dur) for name, dur in (job.get("stages") or {}).items()
+                },
+            }
+
+        workers: dict[str, dict[str, Any]] = {}
+        for job in jobs.values():
+            if "worker" in job and "start" in job:
+                info = workers.setdefault(job["worker"], {"jobs": 0, "busy": 0})
+                info["jobs"] += 1
+                info["busy"] += job["end"] - job["start"]
+        summary["workers"] = {
+            label: {
+                "jobs": info["jobs"],
+                "busy_s": _seconds(info["busy"]),
+                "idle_s": _seconds(max(0, end - start - info["busy"])),
+            }
+            for label, info in sorted(workers.items())
+        }
+        return summary
+
+    def summary_lines(self) -> list[str]:
+        summary = self.critical_path()
+        if not summary:
+            return ["[build-trace] no spans recorded"]
+        lines = [f"[build-trace] wall time {summary['wall_s']:.2f}s"]
+        last = summary.get("last_job")
+        if last:
+            lines.append(
+                f"[build-trace] critical path ends with job {last['job_id']} "
+                f"({last['input_file']}) on {last['worker'] or 'an untraced worker'}:"
+            )
+            lines += [
+                f"[build-trace]   {segment}: {seconds:.2f}s"
+                for segment, seconds in last["segments_s"].items()
+            ]
+            lines += [
+                f"[build-trace]     {stage}: {seconds:.2f}s"
+                for stage, seconds in last["stages_s"].items()
+            ]
+        totals = ", ".join(f"{k} {v:.2f}s" for k, v in summary["stage_totals_s"].items())
+        if totals:
+            lines.append(f"[build-trace] all jobs: {totals}")
+        lines += [
+            f"[build-trace] {label}: {info['jobs']} job(s), busy {info['busy_s']:.2f}s, "
+            f"idle {info['idle_s']:.2f}s"
+            for label, info in summary["workers"].items()
+        ]
+        return lines
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """The recorded spans as a Chrome-trace JSON object."""
+        with self._lock:
+            events = list(self._events)
+            threads = list(self._threads.values())
+            workers = dict(self._workers)
+        metadata: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": _HOST_PID, "args": {"name": "clm host"}}
+        ]
+        metadata += [
+            {"name": "thread_name", "ph": "M", "pid": _HOST_PID, "tid": tid, "args": {"name": n}}
+            for tid, n in threads
+        ]
+        metadata += [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": label}}
+            for label, pid in workers.items()
+        ]
+        return {
+            "traceEvents": metadata + sorted(events, key=lambda event: event["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"critical_path": self.critical_path()},
+        }
+
+    def export(self) -> None:
+        """Write the trace file and log the critical-path summary to stderr."""
+        if not self.enabled or self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as exc:
+            logger.warning("[build-trace] could not write %s: %s", self.path, exc)
+            return
+        for line in self.summary_lines():
+            logger.info(line)
+        logger.info("[build-trace] trace written to %s", self.path.resolve())
+
+
+def _seconds(us: int) -> float:
+    return round(us / 1_000_000, 3)
+
+
+# Process-wide singleton, configured once from the environment (which the
+# build subprocess and Direct workers inherit; Docker workers get it passed).
+tracer = BuildTracer(trace_path_from_env())
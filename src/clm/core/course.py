@@ -543,14 +543,15 @@ class Course(NotebookMixin):
         An implicit execution (see
         :class:`clm.core.execution_dependencies.ExecutionDependencyResolver`)
         exists only to populate the executed-notebook cache for the
-        ``completed``/``trainer``/``partial`` HTML that *was* requested. Its own
-        HTML has no consumer, so it is written here instead of into an output
-        target — issue #890, where a target restricted to ``completed`` HTML
-        received a full ``<target>/speaker/<Course-xx>/…/Html/Recording/…``
-        tree, speaker notes and voiceover included, in a directory the
-        stray-file sweep never walks. ``clm build`` removes this directory when
-        the build finishes, and again at the start of the next build so a killed
-        one self-heals.
+        ``completed``/``trainer``/``partial`` HTML that *was* requested. It runs
+        execute-only and writes nothing, but its job is keyed on an output path,
+        and that path points here instead of into an output target — issue
+        #890, where a target restricted to ``completed`` HTML received a full
+        ``<target>/speaker/<Course-xx>/…/Html/Recording/…`` tree, speaker notes
+        and voiceover included, in a directory the stray-file sweep never walks.
+        ``clm build`` removes this directory when the build finishes, and again
+        at the start of the next build, which clears trees that older versions
+        rendered here.
 
         Placement is boxed in on three sides and cannot satisfy all of them at
         once, so it resolves in priority order:
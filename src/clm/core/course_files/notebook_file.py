@@ -267,14 +267,19 @@ class NotebookFile(CourseFile):
             stage: Execution stage filter (None = all stages)
             target: OutputTarget for filtering outputs
             implicit_executions: Additional executions needed for cache
-                population. These run for real, but their output is an
-                intermediate written under ``Course.implicit_execution_root``
-                rather than into ``target_dir`` (issue #890).
+                population. They become execute-only operations: the kernel
+                runs and the executed notebook is cached, but no HTML is
+                rendered or written. Their job key lives under
+                ``Course.implicit_execution_root`` rather than ``target_dir``
+                (issue #890).
 
         Returns:
             Operation to execute for this file
         """
-        from clm.core.operations.process_notebook import ProcessNotebookOperation
+        from clm.core.operations.process_notebook import (
+            ExecuteNotebookOperation,
+            ProcessNotebookOperation,
+        )
 
         # Phase 6: a split source file (``.de.py`` / ``.en.py``) only
         # emits output for its tagged language. We narrow the course-level
@@ -336,18 +341,18 @@ class NotebookFile(CourseFile):
                     continue
                 if (lang, format_, kind) not in existing_keys:
                     # This run exists to populate the executed-notebook cache
-                    # for the HTML that *was* requested; its own output is an
-                    # intermediate, so it goes to the build-internal scratch
+                    # for the HTML that *was* requested, so it is execute-only:
+                    # the worker runs the kernel and caches the result but
+                    # renders and writes no HTML. Its output path is only the
+                    # job's key; it points into the build-internal scratch
                     # root rather than into ``target_dir`` (issue #890 — a
                     # target restricted to ``completed`` HTML used to receive a
                     # full ``speaker/…/Html/Recording/…`` tree, speaker notes
                     # and voiceover included, that no sweep ever removed).
                     #
                     # The path stays deterministic — same course, same
-                    # language/kind, same file every build — because the SQLite
-                    # job cache is keyed on the output path and the result
-                    # cache replays through it; a per-build path would turn
-                    # every rebuild into a fresh kernel run.
+                    # language/kind, same file every build — because the jobs
+                    # table and the build's bookkeeping are keyed on it.
                     logger.debug(
                         f"Adding implicit execution for ({lang}, {format_}, {kind}) "
                         f"to populate cache for notebook {self.path}"
@@ -363,7 +368,7 @@ class NotebookFile(CourseFile):
                         root_dir=self.course.implicit_execution_root,
                     )
                     operations.append(
-                        ProcessNotebookOperation(
+                        ExecuteNotebookOperation(
                             input_file=self,
                             output_file=(
                                 self.output_dir(spec.output_dir, lang)
@@ -379,8 +384,7 @@ class NotebookFile(CourseFile):
                             http_replay_mode=(
                                 self.course.http_replay_mode if self.http_replay else None
                             ),
-                            # Marks the run as a cache producer whose output
-                            # is an intermediate under
+                            # Marks the run as a cache producer keyed under
                             # ``Course.implicit_execution_root``.
                             is_implicit_execution=True,
                         )
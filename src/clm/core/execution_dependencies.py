@@ -4,9 +4,10 @@ This module handles the execution dependencies between different output types.
 For example, ``completed`` HTML reuses cached execution results from
 ``recording`` HTML (the cache producer). When a user requests only
 ``completed`` HTML, the system must still run ``recording`` HTML to populate
-the cache. That run is an intermediate: it happens once for the whole build
-and its HTML is written to ``Course.implicit_execution_root``, not into any
-output target (issue #890).
+the cache. That run is an intermediate: it happens once for the whole build,
+as an execute-only ``ExecuteNotebookOperation`` that renders and writes no
+HTML, and its job is keyed under ``Course.implicit_execution_root`` rather
+than any output target (issue #890).
 
 The abstraction makes these dependencies explicit and extensible. ``speaker``
 is the deprecated alias for ``recording`` and is normalized away during spec
@@ -122,9 +123,8 @@ class ExecutionDependencyResolver:
         When a user requests outputs that REUSE_CACHE but doesn't request
         the corresponding POPULATES_CACHE outputs, this method identifies
         which additional outputs must be executed to populate the cache.
-        Those runs write their result to the build-internal
-        ``Course.implicit_execution_root``, never into an output target
-        (issue #890).
+        Those runs are execute-only: they fill the execution cache and
+        write nothing, into an output target or elsewhere (issue #890).
 
         Args:
             requested_outputs: Set of (language, format, kind) tuples
@@ -21,6 +21,13 @@ from clm.core.messaging.base_classes import Payload, ProcessingError, Result
 # would silently keep emitting scaffolding-less partial HTML.
 CACHE_HASH_SCHEMA_VERSION = 4
 
+# Format tag that replaces ``format`` in the output metadata of an
+# execute-only payload (see ``NotebookPayload.execute_only``). It keeps the
+# execute-only result-cache entry apart from a real Recording HTML entry for
+# the same input and content: both carry ``kind="recording"`` and
+# ``format="html"``, but only the latter stores HTML.
+EXECUTE_ONLY_FORMAT_TAG = "executed"
+
 
 def notebook_metadata(kind, prog_lang, language, output_format) -> str:
     return f"{kind}:{prog_lang}:{language}:{output_format}"
@@ -43,11 +50,14 @@ def notebook_metadata_tags_from_payload(
     the host always sets these required fields — but keep result and cache
     bookkeeping robust against a malformed payload.
     """
+    output_format = payload_data.get("format", "notebook")
+    if payload_data.get("execute_only", False):
+        output_format = EXECUTE_ONLY_FORMAT_TAG
     return notebook_metadata_tags(
         payload_data.get("kind", "participant"),
         payload_data.get("prog_lang", "python"),
         payload_data.get("language", "en"),
-        payload_data.get("format", "notebook"),
+        output_format,
     )
 
 
@@ -131,6 +141,14 @@ class NotebookPayload(Payload):
     # rewrite via ``rewrite_cross_references`` and needs no knowledge of
     # other notebooks' output names.
     cross_references: dict[str, str] = {}
+    # If True, the worker only executes the notebook and stores it in the
+    # executed-notebook cache under ``execution_cache_hash()``; no HTML is
+    # exported and nothing is written to ``output_file``, which only serves
+    # as the job's key. Set by ``ExecuteNotebookOperation`` for the implicit
+    # Recording runs that warm the cache for Completed/Trainer/Partial HTML.
+    # The result-cache entry is a stub under its own output metadata (see
+    # ``EXECUTE_ONLY_FORMAT_TAG``), so incremental rebuilds still skip it.
+    execute_only: bool = False
 
     # The backend relies on having a data property
     @property
@@ -210,7 +228,8 @@ class NotebookPayload(Payload):
         return hashlib.sha256(hash_data).hexdigest()
 
     def output_metadata(self) -> str:
-        return notebook_metadata(self.kind, self.prog_lang, self.language, self.format)
+        output_format = EXECUTE_ONLY_FORMAT_TAG if self.execute_only else self.format
+        return notebook_metadata(self.kind, self.prog_lang, self.language, output_format)
 
 
 class NotebookResult(Result):
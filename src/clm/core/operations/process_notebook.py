@@ -5,7 +5,7 @@ from functools import cache
 from importlib.resources import files as package_files
 from importlib.resources.abc import Traversable
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from attrs import frozen
 
@@ -211,12 +211,17 @@ class ProcessNotebookOperation(Operation):
     http_replay_mode: str | None = None
     # True when this operation exists only to populate the executed-notebook
     # cache for HTML that *was* requested (see
-    # ``clm.core.execution_dependencies``). The run is a real one — the
-    # notebook is executed and the result written — but its output is an
-    # intermediate and is routed to ``Course.implicit_execution_root``
-    # instead of an output target (issue #890).
+    # ``clm.core.execution_dependencies``). Such runs are built as
+    # ``ExecuteNotebookOperation``: the notebook is executed and cached, and
+    # ``output_file`` — under ``Course.implicit_execution_root`` instead of
+    # an output target (issue #890) — is only the job's key.
     is_implicit_execution: bool = False
 
+    # Whether the worker should only execute the notebook into the
+    # executed-notebook cache instead of rendering ``format``. Overridden by
+    # ``ExecuteNotebookOperation``; a class constant, not an attrs field.
+    execute_only: ClassVar[bool] = False
+
     async def execute(self, backend, *args, **kwargs) -> Any:
         file_path = self.input_file.relative_path
         try:
@@ -478,6 +483,7 @@ class ProcessNotebookOperation(Operation):
             author=author,
             organization=organization,
             cross_references=self.compute_cross_references(data),
+            execute_only=self.execute_only,
         )
         await note_correlation_id_dependency(correlation_id, payload)
         if profiler.enabled:
@@ -487,3 +493,33 @@ class ProcessNotebookOperation(Operation):
     @property
     def service_name(self) -> str:
         return "notebook-processor"
+
+
+@frozen
+class ExecuteNotebookOperation(ProcessNotebookOperation):
+    """Execute a notebook only to populate the executed-notebook cache.
+
+    Used for the implicit Recording HTML runs that
+    ``clm.core.execution_dependencies`` adds when a build requests
+    Completed/Trainer/Partial HTML but no Recording HTML. The worker runs the
+    kernel and stores the executed notebook under the payload's
+    ``execution_cache_hash()``, but exports no HTML and writes nothing:
+    ``output_file`` is kept only as the job's deterministic key. The payload
+    is otherwise identical to Recording's, including the merged voiceover
+    companion, because the execution-cache key folds in the notebook text
+    and must match what the consumers compute.
+    """
+
+    execute_only: ClassVar[bool] = True
+
+    async def execute(self, backend, *args, **kwargs) -> Any:
+        file_path = self.input_file.relative_path
+        try:
+            logger.info(f"Executing notebook '{file_path}' for the execution cache")
+            payload = await self.payload(getattr(backend, "build_reporter", None))
+            await backend.execute_operation(self, payload)
+        except Exception as e:
+            op = "'ExecuteNotebookOperation'"
+            logger.error(f"Error while executing {op} for '{file_path}': {e}")
+            logger.debug(f"Error traceback for '{file_path}'", exc_info=e)
+            raise
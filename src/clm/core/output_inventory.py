@@ -0,0 +1,268 @@
+"""Persisted inventory of the previous build's output trees.
+
+The end-of-build steps that look at the whole output tree — the provenance
+manifest (:mod:`clm.core.provenance_manifest`) and the stray-file sweep
+(:mod:`clm.build.output_sweep`) — used to re-read it from scratch on every
+build: the manifest hashed every output file, the sweep listed every output
+directory. Files written or verified this build already have their digest in
+the :class:`~clm.core.output_write_registry.OutputWriteRegistry`; this
+inventory covers the rest with what the previous build saw:
+
+* **files** — ``(size, mtime_ns, digest)`` of outputs the manifest had to hash
+  itself. A file whose size and mtime still match is not read again.
+* **directories** — the entry names and kinds of each directory the sweep
+  listed, with the directory's mtime. Adding, removing or renaming an entry
+  changes that mtime, so a directory whose mtime still matches is not listed
+  again.
+
+Both are plain caches validated by a ``stat``: a mismatch, a missing row or
+an unreadable database only means the file is hashed or the directory
+listed, exactly as without the inventory. Entries whose mtime falls within
+:data:`_RACY_MARGIN_NS` of the moment they are recorded are not stored,
+since a change in the same timestamp tick (2 s on FAT) would go unnoticed.
+
+The inventory lives in ``clm_output_inventory.db`` next to the cache
+database and is keyed by absolute path, so several courses can share it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+from attrs import frozen
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INVENTORY_DB_NAME = "clm_output_inventory.db"
+
+# Entry kinds of a directory listing.
+KIND_FILE = "f"
+"""A regular file or a symlink (the sweep treats both as files)."""
+KIND_DIR = "d"
+KIND_OTHER = "o"
+
+_RACY_MARGIN_NS = 2_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS output_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS output_dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    entries TEXT NOT NULL
+);
+"""
+
+
+def default_inventory_db_path(cache_db_path: Path) -> Path:
+    """Resolve the default inventory database path next to the cache db."""
+    return cache_db_path.parent / DEFAULT_INVENTORY_DB_NAME
+
+
+@frozen
+class FileRecord:
+    """What the inventory knows about one output file."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+@frozen
+class DirListing:
+    """The entries of one output directory at a given directory mtime."""
+
+    mtime_ns: int
+    entries: tuple[tuple[str, str], ...]
+    """``(name, kind)`` pairs; kinds are :data:`KIND_FILE`, :data:`KIND_DIR`
+    and :data:`KIND_OTHER`."""
+
+
+class OutputInventory:
+    """The inventory rows under a set of output roots, loaded into memory.
+
+    Obtain instances with :meth:`load`, consult and update them during one
+    end-of-build step, then :meth:`save`. Rows under the loaded roots that
+    the step never touched are dropped on save — they describe files and
+    directories that no longer exist, or that the step no longer needs. A
+    table the step did not consult at all (the manifest never lists
+    directories, the sweep never hashes files) is left as it is.
+    """
+
+    def __init__(self, db_path: Path | None, roots: Iterable[Path] = ()) -> None:
+        self.db_path = db_path
+        self.roots = tuple(dict.fromkeys(roots))
+        self._files: dict[str, FileRecord] = {}
+        self._dirs: dict[str, DirListing] = {}
+        self._touched_files: set[str] = set()
+        self._touched_dirs: set[str] = set()
+        self._dirty_files: dict[str, FileRecord] = {}
+        self._dirty_dirs: dict[str, DirListing] = {}
+        self._dropped_files: set[str] = set()
+        self._dropped_dirs: set[str] = set()
+
+    @classmethod
+    def load(cls, db_path: Path, roots: Iterable[Path]) -> OutputInventory:
+        """Read the rows under *roots* from *db_path* (empty when unreadable)."""
+        inventory = cls(db_path, roots)
+        if not db_path.exists():
+            return inventory
+        try:
+            conn = sqlite3.connect(db_path, timeout=30.0)
+            try:
+                conn.executescript(_SCHEMA)
+                for root in inventory.roots:
+                    for path, size, mtime_ns, digest in conn.execute(
+                        "SELECT path, size, mtime_ns, digest FROM output_files " + _UNDER,
+                        _under_params(root),
+                    ):
+                        inventory._files[path] = FileRecord(size, mtime_ns, digest)
+                    for path, mtime_ns, entries in conn.execute(
+                        "SELECT path, mtime_ns, entries FROM output_dirs " + _UNDER,
+                        _under_params(root),
+                    ):
+                        inventory._dirs[path] = DirListing(
+                            mtime_ns, tuple((name, kind) for name, kind in json.loads(entries))
+                        )
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError, ValueError, TypeError) as exc:
+            logger.debug("Ignoring unreadable output inventory %s: %s", db_path, exc)
+            inventory._files.clear()
+            inventory._dirs.clear()
+        return inventory
+
+    # -------------------------------------------------------------- files
+
+    def digest_if_unchanged(self, path: Path, st: os.stat_result) -> str | None:
+        """The recorded digest of *path*, if its size and mtime still match *st*."""
+        key = str(path)
+        self._touched_files.add(key)
+        record = self._files.get(key)
+        if record is None or (record.size, record.mtime_ns) != (st.st_size, st.st_mtime_ns):
+            return None
+        return record.digest
+
+    def record_file(self, path: Path, st: os.stat_result, digest: str) -> None:
+        """Remember *digest* for *path* as of the stat result *st*."""
+        key = str(path)
+        self._touched_files.add(key)
+        if _is_racy(st.st_mtime_ns):
+            self._files.pop(key, None)
+            self._dirty_files.pop(key, None)
+            self._dropped_files.add(key)
+            return
+        record = FileRecord(st.st_size, st.st_mtime_ns, digest)
+        self._dropped_files.discard(key)
+        if self._files.get(key) != record:
+            self._files[key] = record
+            self._dirty_files[key] = record
+
+    # -------------------------------------------------------- directories
+
+    def listing_if_unchanged(self, directory: Path, mtime_ns: int) -> DirListing | None:
+        """The recorded listing of *directory*, if its mtime is still *mtime_ns*."""
+        key = str(directory)
+        self._touched_dirs.add(key)
+        listing = self._dirs.get(key)
+        if listing is None or listing.mtime_ns != mtime_ns:
+            return None
+        return listing
+
+    def record_listing(
+        self, directory: Path, mtime_ns: int, entries: Iterable[tuple[str, str]]
+    ) -> None:
+        """Remember the *entries* of *directory* as of its mtime *mtime_ns*."""
+        key = str(directory)
+        self._touched_dirs.add(key)
+        if _is_racy(mtime_ns):
+            self._dirs.pop(key, None)
+            self._dirty_dirs.pop(key, None)
+            self._dropped_dirs.add(key)
+            return
+        listing = DirListing(mtime_ns, tuple(entries))
+        self._dropped_dirs.discard(key)
+        if self._dirs.get(key) != listing:
+            self._dirs[key] = listing
+            self._dirty_dirs[key] = listing
+
+    # ---------------------------------------------------------- persisting
+
+    def save(self) -> None:
+        """Write the changed rows and drop the untouched ones. Never raises."""
+        if self.db_path is None:
+            return
+        stale_files = _untouched(self._files, self._touched_files)
+        stale_dirs = _untouched(self._dirs, self._touched_dirs)
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                with conn:
+                    # A row re-recorded as racy must not outlive its old value.
+                    conn.executemany(
+                        "DELETE FROM output_files WHERE path = ?",
+                        [(key,) for key in [*self._dropped_files, *stale_files]],
+                    )
+                    conn.executemany(
+                        "DELETE FROM output_dirs WHERE path = ?",
+                        [(key,) for key in [*self._dropped_dirs, *stale_dirs]],
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO output_files (path, size, mtime_ns, digest) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(k, r.size, r.mtime_ns, r.digest) for k, r in self._dirty_files.items()],
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO output_dirs (path, mtime_ns, entries) "
+                        "VALUES (?, ?, ?)",
+                        [
+                            (k, listing.mtime_ns, json.dumps(listing.entries))
+                            for k, listing in self._dirty_dirs.items()
+                        ],
+                    )
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Could not save output inventory %s: %s", self.db_path, exc)
+            return
+        for key in stale_files:
+            del self._files[key]
+        for key in stale_dirs:
+            del self._dirs[key]
+        self._dirty_files.clear()
+        self._dirty_dirs.clear()
+        self._dropped_files.clear()
+        self._dropped_dirs.clear()
+
+
+# Rows at or below a root: the root itself, or paths starting with root + sep
+# (a range scan on the primary key; the upper bound is the next separator).
+_UNDER = "WHERE path = ? OR (path > ? AND path < ?)"
+
+
+def _under_params(root: Path) -> tuple[str, str, str]:
+    base = str(root)
+    return base, base + os.sep, base + chr(ord(os.sep) + 1)
+
+
+def _untouched(rows: Mapping[str, object], touched: set[str]) -> list[str]:
+    if not touched:
+        return []
+    return [key for key in rows if key not in touched]
+
+
+def _is_racy(mtime_ns: int) -> bool:
+    return mtime_ns > time.time_ns() - _RACY_MARGIN_NS
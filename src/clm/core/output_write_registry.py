@@ -14,6 +14,12 @@ the call sites (the backend's copy hook and the notebook-output writer)
 which call :meth:`OutputWriteRegistry.record_write` and act on the
 returned :class:`WriteOutcome`.
 
+The registry is also the build's source of truth for output digests: it
+hashes in the provenance manifest's ``sha256:<hex>`` format, so
+:func:`clm.core.provenance_manifest.build_provenance_manifest` takes the
+digest of every file written or verified this build from
+:meth:`OutputWriteRegistry.digest_for` instead of reading it back.
+
 Image paths (anything under an ``img/`` segment) *are* recorded here: only
 this registry compares content at the output destination, so leaving images
 out made a static ``img/X.png`` and a ``pu/X.pu`` rendering to the same
@@ -40,7 +46,6 @@ logger = logging.getLogger(__name__)
 DEFAULT_HASH_LIMIT_MB: Final[int] = 50
 _ENV_HASH_LIMIT_MB: Final[str] = "CLM_OUTPUT_DEDUP_HASH_LIMIT_MB"
 
-_HASH_DIGEST_SIZE: Final[int] = 16
 _HASH_READ_CHUNK: Final[int] = 64 * 1024
 
 
@@ -76,15 +81,15 @@ def _resolve_hash_limit_bytes() -> int:
 
 
 def _hash_bytes(data: bytes) -> str:
-    return hashlib.blake2b(data, digest_size=_HASH_DIGEST_SIZE).hexdigest()
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
 
 
 def _hash_file(path: Path) -> str:
-    digest = hashlib.blake2b(digest_size=_HASH_DIGEST_SIZE)
+    digest = hashlib.sha256()
     with path.open("rb") as fh:
         for chunk in iter(lambda: fh.read(_HASH_READ_CHUNK), b""):
             digest.update(chunk)
-    return digest.hexdigest()
+    return f"sha256:{digest.hexdigest()}"
 
 
 def is_image_path(source_path: Path) -> bool:
@@ -160,8 +165,8 @@ class OutputWriteRegistry:
     The registry is keyed by absolute output path. For each path it records
     the content hash, the source of the first writer, and counts of subsequent
     identical (``dedup_count``) and differing (``conflict_count``) writes.
-    Hashing is BLAKE2b-128, chosen for speed; the rare hash collision is not
-    a correctness concern (the cost is a false-dedup-skip).
+    Hashing is SHA-256, the provenance manifest's digest, so each output is
+    read once per build for dedup, skip and manifest purposes together.
 
     Files larger than :data:`DEFAULT_HASH_LIMIT_MB` (configurable via the
     ``CLM_OUTPUT_DEDUP_HASH_LIMIT_MB`` environment variable) bypass hashing.
@@ -266,6 +271,7 @@ class OutputWriteRegistry:
         *,
         content: bytes | None = None,
         content_source: Path | None = None,
+        content_hash: str | None = None,
     ) -> bool:
         """Return ``True`` iff ``output_path`` exists and already contains
         the supplied content.
@@ -281,6 +287,9 @@ class OutputWriteRegistry:
         :meth:`record_write`.
 
         Exactly one of ``content`` or ``content_source`` must be supplied.
+        ``content_hash`` is the content's digest when the caller already has
+        it (the :meth:`record_write` entry's ``content_hash``); the content
+        is then not hashed a second time.
         """
         if not output_path.is_absolute():
             raise ValueError(f"output_path must be absolute: {output_path}")
@@ -299,7 +308,7 @@ class OutputWriteRegistry:
             return False
 
         dest_hash = _hash_file(output_path)
-        source_hash = (
+        source_hash = content_hash or (
             _hash_bytes(content) if content is not None else _hash_file(content_source)  # type: ignore[arg-type]
         )
         return dest_hash == source_hash
@@ -307,6 +316,18 @@ class OutputWriteRegistry:
     def get(self, output_path: Path) -> OutputWriteEntry | None:
         return self._entries.get(output_path)
 
+    def digest_for(self, output_path: Path) -> str | None:
+        """The ``sha256:`` digest of the bytes this build left at *output_path*.
+
+        ``None`` when the path was not recorded, was over the hash limit, or
+        saw conflicting writes (the surviving bytes are then race-dependent,
+        so only reading the file tells which writer won).
+        """
+        entry = self._entries.get(output_path)
+        if entry is None or entry.is_large_file or entry.conflict_count:
+            return None
+        return entry.content_hash or None
+
     @property
     def entries(self) -> dict[Path, OutputWriteEntry]:
         """Snapshot of all recorded entries (copy; safe to mutate)."""
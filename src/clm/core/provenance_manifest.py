@@ -34,6 +34,7 @@ import hashlib
 import json
 import logging
 import os
+import stat
 from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -53,7 +54,9 @@ from clm.core.utils.path_utils import (
 
 if TYPE_CHECKING:
     from clm.core.course import Course
+    from clm.core.output_inventory import OutputInventory
     from clm.core.output_target import OutputTarget
+    from clm.core.output_write_registry import OutputWriteRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -306,6 +309,8 @@ def build_provenance_manifest(
     built_at: str,
     spec_name: str | None = None,
     failed_topics: frozenset[str] | set[str] | None = None,
+    output_write_registry: OutputWriteRegistry | None = None,
+    inventory: OutputInventory | None = None,
 ) -> dict[str, Any]:
     """Build the manifest dict for a single output *target*.
 
@@ -313,6 +318,14 @@ def build_provenance_manifest(
     Entries are sorted by path so the manifest is deterministic and diffs
     cleanly across builds.
 
+    Files this build wrote or verified take their digest from
+    *output_write_registry* (:meth:`~OutputWriteRegistry.digest_for`) and
+    are not read; they are only checked to still exist, since a file written
+    early in the build may have been removed since. The rest are stat'ed;
+    with an *inventory*, one whose size and mtime match the previous build's
+    record reuses that digest, and only the remainder is hashed (and
+    recorded for next time).
+
     *failed_topics* (issue #295) names topics whose build jobs errored. Their
     entries are **excluded** — the on-disk files may be stale or partially
     written, so the manifest must not claim clean provenance over them — and
@@ -321,45 +334,62 @@ def build_provenance_manifest(
     every cleanly-built one.
     """
     failed = frozenset(failed_topics or ())
-    # First pass: enumerate + de-dup + existence-check, collecting the (entry,
-    # path) pairs. Hashing — the dominant cost, one full read per output file —
-    # is deferred to a parallel pass below so the disk reads overlap instead of
-    # running back-to-back (thousands of files, gigabytes, on every build).
-    pending: list[tuple[dict[str, Any], Path]] = []
+    # First pass: enumerate + de-dup + existence-check, collecting the entries.
+    # A digest already known (registry, unchanged inventory record) is filled
+    # in directly; hashing — the dominant cost, one full read per output
+    # file — is deferred to a parallel pass below so the disk reads overlap
+    # instead of running back-to-back (thousands of files, gigabytes).
+    files: list[dict[str, Any]] = []
+    pending: list[tuple[dict[str, Any], Path, os.stat_result]] = []
     seen: set[str] = set()
     for out_path, record in enumerate_expected_outputs(course, target):
         try:
             rel = out_path.relative_to(target.output_root).as_posix()
         except ValueError:
             continue
-        if rel in seen or not out_path.is_file():
-            continue
-        if record["topic_id"] in failed:
+        if rel in seen or record["topic_id"] in failed:
             continue
+        digest = None
+        if output_write_registry is not None:
+            digest = output_write_registry.digest_for(out_path)
+            if digest is not None and not out_path.is_file():
+                continue
+        st: os.stat_result | None = None
+        if digest is None:
+            try:
+                st = out_path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            if inventory is not None:
+                digest = inventory.digest_if_unchanged(out_path, st)
         seen.add(rel)
-        pending.append(
-            (
-                {
-                    "path": rel,
-                    "section_id": record["section_id"],
-                    "topic_id": record["topic_id"],
-                    "kind": record["kind"],
-                    "format": record["format"],
-                    "language": record["language"],
-                },
-                out_path,
-            )
-        )
-
-    # Second pass: hash every file concurrently. Hashing releases the GIL
-    # during file reads and large ``update`` calls, so a thread pool overlaps
-    # the I/O-bound work across cores. Results are matched back by index, so
-    # the deterministic final sort is unaffected.
-    files: list[dict[str, Any]] = [entry for entry, _ in pending]
+        entry: dict[str, Any] = {
+            "path": rel,
+            "section_id": record["section_id"],
+            "topic_id": record["topic_id"],
+            "kind": record["kind"],
+            "format": record["format"],
+            "language": record["language"],
+        }
+        files.append(entry)
+        if digest is not None:
+            entry["content_hash"] = digest
+        else:
+            assert st is not None
+            pending.append((entry, out_path, st))
+
+    # Second pass: hash the remaining files concurrently. Hashing releases the
+    # GIL during file reads and large ``update`` calls, so a thread pool
+    # overlaps the I/O-bound work across cores. Results are matched back by
+    # index, so the deterministic final sort is unaffected.
     if pending:
-        hashes = _hash_paths_parallel([path for _, path in pending])
-        for entry, digest in zip(files, hashes, strict=True):
+        hashes = _hash_paths_parallel([path for _, path, _ in pending])
+        for (entry, path, st), digest in zip(pending, hashes, strict=True):
             entry["content_hash"] = digest
+            if inventory is not None:
+                inventory.record_file(path, st, digest)
     files.sort(key=lambda r: r["path"])
     return {
         "version": MANIFEST_VERSION,
@@ -383,6 +413,8 @@ def write_provenance_manifests(
     spec_name: str | None = None,
     failed_topics: frozenset[str] | set[str] | None = None,
     skip_roots: Iterable[Path] = (),
+    output_write_registry: OutputWriteRegistry | None = None,
+    inventory: OutputInventory | None = None,
 ) -> list[Path]:
     """Write one ``.clm-manifest.json`` per built output target.
 
@@ -395,6 +427,10 @@ def write_provenance_manifests(
     lack of ownership evidence (finding S11, #798): the manifest is that
     evidence, so writing it after a refusal would hand the next build
     permission to delete exactly what this one declined to touch.
+
+    *output_write_registry* and *inventory* supply digests that need no
+    read; see :func:`build_provenance_manifest`. Saving the inventory is
+    the caller's job.
     """
     skipped = set(skip_roots)
     written: list[Path] = []
@@ -418,6 +454,8 @@ def write_provenance_manifests(
             built_at=built_at,
             spec_name=spec_name,
             failed_topics=failed_topics,
+            output_write_registry=output_write_registry,
+            inventory=inventory,
         )
         manifest_path = out_root / MANIFEST_FILENAME
         manifest_path.write_text(
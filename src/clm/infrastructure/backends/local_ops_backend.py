@@ -153,7 +153,9 @@ class LocalOpsBackend(Backend, ABC):
             # content (typically from a prior build), avoid the copy so
             # mtime is preserved and git's stat-cache remains valid.
             if self.output_write_registry.is_destination_identical(
-                abs_output, content_source=copy_data.input_path
+                abs_output,
+                content_source=copy_data.input_path,
+                content_hash=write_result.entry.content_hash,
             ):
                 logger.debug(f"Hash-aware skip: {abs_output} already has identical content")
                 return
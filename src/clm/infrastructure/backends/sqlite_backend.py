@@ -8,6 +8,7 @@ import asyncio
 import json
 import logging
 import queue
+import sqlite3
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -16,9 +17,11 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from attrs import define, field
 
+from clm.core import build_trace
 from clm.core.backend import JobsPendingTimeoutError
 from clm.core.build_profiling import now as profiler_now
 from clm.core.build_profiling import profiler
+from clm.core.build_trace import tracer
 from clm.core.messaging.base_classes import Payload
 from clm.core.operation import Operation
 from clm.core.output_write_registry import (
@@ -47,6 +50,15 @@ logger = logging.getLogger(__name__)
 SUBMISSION_CONCURRENCY = 8
 
 
+def _is_execute_only(payload: Payload) -> bool:
+    """Whether *payload* only warms the executed-notebook cache.
+
+    Such jobs (``NotebookPayload.execute_only``) produce no output file; their
+    result-cache entry is a stub keyed under its own output metadata.
+    """
+    return bool(getattr(payload, "execute_only", False))
+
+
 @define
 class SqliteBackend(LocalOpsBackend):
     """SQLite-based backend for job queue orchestration.
@@ -137,6 +149,12 @@ class SqliteBackend(LocalOpsBackend):
     # in memory at once. Created lazily on the event loop.
     _submission_semaphore: "asyncio.Semaphore | None" = field(init=False, default=None)
 
+    # Background archival of finished jobs and old worker events from past
+    # sessions (see job_archive). Runs for the lifetime of the backend so the
+    # hot jobs tables stay bounded without a manual vacuum; stopped in
+    # shutdown before the build-end cleanup.
+    _job_archiver: Any = field(init=False, default=None)
+
     def __attrs_post_init__(self):
         """Initialize SQLite database and job queue."""
         # Database should already be initialized, but ensure it exists
@@ -171,6 +189,26 @@ class SqliteBackend(LocalOpsBackend):
 
         # Perform session-start cleanup if configured
         self._perform_session_start_cleanup()
+        self._start_job_archiver()
+
+    def _start_job_archiver(self) -> None:
+        """Start background archival of past sessions' jobs, if configured."""
+        from clm.infrastructure.config import get_config
+        from clm.infrastructure.database.job_archive import JobArchiver
+
+        retention_config = get_config().retention
+        if retention_config.archive_jobs_after_minutes is None:
+            return
+        try:
+            self._job_archiver = JobArchiver(
+                self.db_path,
+                current_session_id=self.worker_session_id,
+                min_age_minutes=retention_config.archive_jobs_after_minutes,
+            )
+            self._job_archiver.start()
+        except Exception as e:
+            logger.debug(f"Could not start job archiver: {e}")
+            self._job_archiver = None
 
     async def execute_operation(self, operation: Operation, payload: Payload) -> None:
         """Submit a job to the SQLite queue (timing wrapper).
@@ -258,6 +296,14 @@ class SqliteBackend(LocalOpsBackend):
                         f"Database cache hit for {payload.input_file} -> {payload.output_file} "
                         f"(incremental mode: skipping write)"
                     )
+                elif _is_execute_only(payload):
+                    # The stored result is a stub: the execution it stands
+                    # for lives in ``executed_notebooks`` (checked by
+                    # ``_can_replay_from_cache``), and there is no file.
+                    logger.info(
+                        f"Database cache hit for execute-only {payload.input_file} "
+                        f"(execution cache is warm, skipping worker execution)"
+                    )
                 else:
                     logger.info(
                         f"Database cache hit for {payload.input_file} -> {payload.output_file} "
@@ -311,7 +357,9 @@ class SqliteBackend(LocalOpsBackend):
                         # avoid the write so mtime is preserved and git's
                         # stat-cache stays valid.
                         if self.output_write_registry.is_destination_identical(
-                            output_file, content=content_bytes
+                            output_file,
+                            content=content_bytes,
+                            content_hash=write_result.entry.content_hash,
                         ):
                             logger.debug(
                                 f"Hash-aware skip: {output_file} already has identical content"
@@ -379,6 +427,7 @@ class SqliteBackend(LocalOpsBackend):
         _offload_t0 = profiler_now() if profiler.enabled else 0.0
 
         async def _submit_and_track() -> tuple[str, int | None]:
+            submit_started_us = build_trace.now_us() if tracer.enabled else 0
             outcome_, job_id_ = await asyncio.get_running_loop().run_in_executor(
                 self._ensure_submit_executor(),
                 self._submit_job_blocking,
@@ -399,7 +448,23 @@ class SqliteBackend(LocalOpsBackend):
                     "input_file": str(payload.input_file),
                     "output_file": str(payload.output_file),
                     "correlation_id": getattr(payload, "correlation_id", None),
+                    "execute_only": _is_execute_only(payload),
                 }
+            if tracer.enabled:
+                submitted_us = build_trace.now_us()
+                tracer.add_span(
+                    build_trace.SUBMISSION,
+                    "host",
+                    submit_started_us,
+                    submitted_us,
+                    job_id=job_id_,
+                    outcome=outcome_,
+                    input_file=str(payload.input_file),
+                )
+                if job_id_ is not None:
+                    tracer.job_submitted(
+                        job_id_, submitted_us, job_type=job_type, input_file=str(payload.input_file)
+                    )
             return outcome_, job_id_
 
         # shield() lets the submit+register run to completion even if the caller
@@ -527,7 +592,9 @@ class SqliteBackend(LocalOpsBackend):
         # SQLite job cache: a stored result whose output is already on disk
         # needs no worker run. Same --ignore-cache gate as the DB cache above,
         # plus the issue #579 warmup override that forces a run past the cache.
-        if not self.ignore_db and not force_execution:
+        # Execute-only jobs leave no output on disk, so the probe could never
+        # hit; their skip comes from the result cache above.
+        if not self.ignore_db and not force_execution and not _is_execute_only(payload):
             cached = self.job_queue.check_cache(str(payload.output_file), payload.content_hash())
             if cached:
                 logger.debug(f"SQLite cache hit for {payload.output_file}")
@@ -604,7 +671,9 @@ class SqliteBackend(LocalOpsBackend):
         at ``executed_notebooks`` and returns ``False`` when the entry is
         missing, telling the caller to skip the cache replay and submit
         the worker job. Recording then executes normally and repopulates
-        the execution cache so Stage 4 hits it.
+        the execution cache so Stage 4 hits it. Execute-only payloads (the
+        implicit Recording runs) carry the same kind and format and are gated
+        the same way — for them the warm execution cache is the whole point.
 
         All other payload types (non-Recording, non-notebook, non-HTML)
         return ``True`` unconditionally — the existing fast path is
@@ -849,6 +918,8 @@ class SqliteBackend(LocalOpsBackend):
 
                     # Extract and report any warnings from the job result
                     self._extract_and_report_job_warnings(job_id, job_info)
+                    if tracer.enabled:
+                        self._record_job_trace(job_id, None)
 
                     # Report file completed to build reporter (for verbose mode output)
                     if self.build_reporter:
@@ -902,6 +973,11 @@ class SqliteBackend(LocalOpsBackend):
                             # drained before this wait returns, so the cache is
                             # fully populated for callers that read it afterwards.
                             self._enqueue_result_cache(job_id, dict(job_info), output_path)
+                        elif job_info.get("execute_only"):
+                            # Nothing was written and nothing is registered;
+                            # the stub entry is what lets the next build skip
+                            # the job (see ``_persist_result_to_cache``).
+                            self._enqueue_result_cache(job_id, dict(job_info), output_path)
 
                 elif status == "failed":
                     # Get job payload for error categorization and storage
@@ -921,6 +997,10 @@ class SqliteBackend(LocalOpsBackend):
                         error_info = json.loads(error) if error else {}
                     except (json.JSONDecodeError, TypeError):
                         error_info = {}
+                    if tracer.enabled:
+                        self._record_job_trace(
+                            job_id, error_info if isinstance(error_info, dict) else {}
+                        )
                     failure_telemetry = error_info.get("execution_telemetry")
                     if isinstance(failure_telemetry, dict):
                         self._persist_execution_telemetry(
@@ -1177,9 +1257,16 @@ class SqliteBackend(LocalOpsBackend):
             self._submit_executor.shutdown(wait=True)
             self._submit_executor = None
 
+        if self._job_archiver is not None:
+            self._job_archiver.stop()
+
         # Perform build-end cleanup if configured
         self._perform_build_end_cleanup()
 
+        # Write the build trace now that every job has been retired (no-op
+        # unless CLM_BUILD_TRACE is set).
+        tracer.export()
+
         # Close job queue connection to avoid ResourceWarning about unclosed database
         if self.job_queue:
             self.job_queue.close()
@@ -1244,7 +1331,12 @@ class SqliteBackend(LocalOpsBackend):
                     cancelled_days=retention_config.cancelled_jobs_retention_days,
                     events_days=retention_config.worker_events_retention_days,
                     cache_versions=retention_config.cache_versions_to_keep,
+                    archive_days=retention_config.archive_retention_days,
                 )
+                if self._job_archiver is not None:
+                    # One more bounded pass on this thread's connection picks
+                    # up whatever the background thread had not reached.
+                    self._job_archiver.run_once(self.job_queue)
 
                 total_jobs_cleaned = sum(jobs_cleanup.values())
                 if total_jobs_cleaned > 0:
@@ -1279,6 +1371,10 @@ class SqliteBackend(LocalOpsBackend):
                                 f"Build end: Cleaned up {nb_cleaned} stale executed "
                                 f"notebook cache entries"
                             )
+                        max_mb = retention_config.executed_notebook_cache_max_mb
+                        nb_cache.collect_garbage(
+                            max_bytes=max_mb * 1024 * 1024 if max_mb is not None else None
+                        )
                 except Exception as e:
                     logger.debug(f"Could not clean executed notebook cache: {e}")
 
@@ -1677,7 +1773,11 @@ class SqliteBackend(LocalOpsBackend):
             result_obj: Result | None = None
 
             if job_type == "notebook":
-                result_text = output_path.read_text(encoding="utf-8")
+                # An execute-only job's product is its executed_notebooks
+                # entry; the result stored here is an empty stub.
+                result_text = (
+                    "" if job_info.get("execute_only") else output_path.read_text(encoding="utf-8")
+                )
                 result_obj = NotebookResult(
                     correlation_id=correlation_id,
                     output_file=str(job_info["output_file"]),
@@ -1786,6 +1886,26 @@ class SqliteBackend(LocalOpsBackend):
             )
         )
 
+    def _record_job_trace(self, job_id: int, result_data: dict | None) -> None:
+        """Hand the worker's build-trace spans for *job_id* to the tracer.
+
+        Workers ship their spans in the job result (completed jobs) or the
+        structured error JSON (failed jobs); pass the parsed error as
+        *result_data*, or None to read the result column.
+        """
+        if result_data is None and self.job_queue is not None:
+            try:
+                row = (
+                    self.job_queue._get_conn()
+                    .execute("SELECT result FROM jobs WHERE id = ?", (job_id,))
+                    .fetchone()
+                )
+                result_data = json.loads(row[0]) if row and row[0] else {}
+            except (sqlite3.Error, json.JSONDecodeError) as e:
+                logger.debug(f"Could not read build trace of job {job_id}: {e}")
+        trace = result_data.get("trace") if isinstance(result_data, dict) else None
+        tracer.add_job_trace(job_id, trace if isinstance(trace, dict) else None)
+
     def _extract_and_report_job_warnings(self, job_id: int, job_info: dict) -> None:
         """Extract warnings from completed job and report/store them.
 
@@ -263,6 +263,33 @@ class RetentionConfig(BaseModel):
         description="Days to keep worker lifecycle events (audit log)",
     )
 
+    # Job archival - keeps the hot jobs/worker_events tables small
+    archive_jobs_after_minutes: int | None = Field(
+        default=60,
+        ge=1,
+        description=(
+            "Minutes after a job finishes before it may move to jobs_archive (without "
+            "payload) once its session has ended; old worker events are rolled up into "
+            "per-session summaries on the same schedule (None = no archival)"
+        ),
+    )
+
+    archive_retention_days: int | None = Field(
+        default=90,
+        ge=1,
+        description="Days to keep archived jobs and event summaries (None = indefinite)",
+    )
+
+    # Executed-notebook cache size budget
+    executed_notebook_cache_max_mb: int | None = Field(
+        default=None,
+        ge=1,
+        description=(
+            "Upper bound in MB for executed-notebook cache payloads; the oldest "
+            "entries are evicted at cleanup when it is exceeded (None = unbounded)"
+        ),
+    )
+
     # Automatic cleanup triggers
     auto_cleanup_on_build_end: bool = Field(
         default=True,
@@ -513,6 +540,16 @@ class WorkersManagementConfig(BaseModel):
         "None = use default bridge for better host.docker.internal on Windows/WSL2",
     )
 
+    container_name_prefix: str = Field(
+        default="clm",
+        description=(
+            "Prefix of Docker worker container names "
+            "(``<prefix>-<type>-worker-<n>``). A build removes an existing "
+            "container of the same name before starting a worker, so builds "
+            "running concurrently on one Docker host need distinct prefixes."
+        ),
+    )
+
     # Worker startup
     startup_timeout: int = Field(
         default=30,
@@ -528,6 +565,72 @@ class WorkersManagementConfig(BaseModel):
         description="Number of workers to start in parallel",
     )
 
+    docker_standby_containers: int = Field(
+        default=1,
+        ge=0,
+        le=8,
+        description=(
+            "Standby containers kept parked per Docker worker configuration: "
+            "started ahead of time up to the point where the worker has "
+            "finished its imports, then handed a worker identity when the "
+            "pool scales up or replaces a crashed worker. 0 disables standby "
+            "containers."
+        ),
+    )
+
+    # Queue-depth autoscaling
+    autoscale: bool = Field(
+        default=False,
+        description=(
+            "Rebalance the build's worker pools by queue depth: start extra "
+            "workers of a job type with a backlog and drain idle workers of "
+            "types with nothing queued, within ``autoscale_budget`` and the "
+            "host's available memory. See "
+            "``clm.infrastructure.workers.autoscaler``."
+        ),
+    )
+
+    autoscale_budget: int | None = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description=(
+            "Total number of workers the autoscaler may run across all "
+            "types. ``None`` keeps the sum of the per-type counts the pool "
+            "starts with, so capacity moves between types without growing "
+            "the pool."
+        ),
+    )
+
+    autoscale_interval: float = Field(
+        default=2.0,
+        ge=0.5,
+        le=60.0,
+        description="Seconds between autoscaling decisions",
+    )
+
+    # Persistent worker daemon (``clm workers daemon``)
+    attach_daemon: bool = Field(
+        default=True,
+        description=(
+            "Let ``clm build`` attach to a running ``clm workers daemon`` "
+            "for the same jobs database when its workers are compatible "
+            "(same clm version, execution modes, worker images and paths) "
+            "instead of starting and stopping its own pool. See "
+            "``clm.infrastructure.workers.daemon``."
+        ),
+    )
+
+    daemon_idle_timeout: float = Field(
+        default=1800.0,
+        ge=0,
+        description=(
+            "Seconds a ``clm workers daemon`` keeps its pool alive with no "
+            "queued or running job and no attaching build. 0 keeps it "
+            "running until it is stopped."
+        ),
+    )
+
     # Build completion waiting (issue #851)
     job_stall_timeout: float = Field(
         default=1200.0,
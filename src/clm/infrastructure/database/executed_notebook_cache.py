@@ -18,12 +18,26 @@ which made every read a deserialization sink for bytes the Worker API had
 accepted from the network. Rows written by those older versions carry
 ``payload_format='pickle'`` and are deleted on first open — see
 :meth:`ExecutedNotebookCache._init_table`.
+
+Rich outputs (plots, large tables, long streams) are stored once per content
+in ``executed_notebook_outputs``: zlib-compressed blobs keyed by the SHA-256
+of their canonical JSON. The ``executed_notebooks`` row then holds only a
+compressed skeleton that references them (``payload_format`` =
+:data:`SPLIT_PAYLOAD_FORMAT`). DE and EN executions of the same deck, and
+consecutive revisions of it, mostly produce the same images, so those bytes
+are kept once instead of once per row. :meth:`ExecutedNotebookCache.get_raw`
+reassembles the exact bytes that were stored — a split is only kept when the
+reassembly is verified byte-identical at store time, otherwise the row is
+written as plain nbformat JSON.
 """
 
+import hashlib
+import json
 import logging
 import sqlite3
+import zlib
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from clm.infrastructure.database.journal_mode import configure_connection
 from clm.infrastructure.notebook_serialization import (
@@ -41,6 +55,21 @@ logger = logging.getLogger(__name__)
 #: Anything else is from a version that stored pickles and is unreadable here.
 PAYLOAD_FORMAT = "nbformat-json"
 
+#: ``payload_format`` of rows whose rich outputs live in
+#: ``executed_notebook_outputs``; ``executed_notebook`` then holds the
+#: zlib-compressed skeleton. Older clm versions filter on
+#: :data:`PAYLOAD_FORMAT` and so simply see these rows as misses.
+SPLIT_PAYLOAD_FORMAT = "nbformat-json+output-blobs"
+
+#: Every ``payload_format`` this version can read back.
+READABLE_PAYLOAD_FORMATS = (PAYLOAD_FORMAT, SPLIT_PAYLOAD_FORMAT)
+
+# Output values whose canonical JSON is smaller than this stay inline in the
+# skeleton: a blob row plus a reference costs more than it could save.
+_MIN_OUTPUT_BLOB_BYTES = 1024
+
+_ZLIB_LEVEL = 6
+
 # Value for ``PRAGMA user_version`` marking that the legacy-payload migration
 # (the full-scan DELETE below) has already run for this database file.
 # 0/absent = unmigrated (may contain pickle-era rows); 1 = JSON-only.
@@ -51,6 +80,87 @@ PAYLOAD_FORMAT = "nbformat-json"
 _USER_VERSION_JSON_ONLY = 1
 
 
+def _canonical_json(value: Any) -> bytes:
+    """Compact, key-sorted JSON: the bytes output blobs are hashed over."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def _nbformat_json(notebook: Any) -> bytes:
+    """Serialize a notebook dict exactly the way ``nbformat.writes`` does for v4."""
+    return json.dumps(
+        notebook, sort_keys=True, indent=1, separators=(",", ": "), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _split_payload(payload: bytes) -> tuple[bytes, dict[str, bytes]] | None:
+    """Split large output values out of an nbformat JSON payload.
+
+    Returns ``(compressed skeleton, {digest: canonical JSON})``, or None when
+    there is nothing worth splitting or the split would not reproduce
+    ``payload`` byte for byte. References are kept out of band as
+    ``[cell, output, field, mime, digest]`` so no value inside the notebook
+    can be mistaken for one.
+    """
+    try:
+        notebook = json.loads(payload)
+        cells = notebook.get("cells") or []
+    except (ValueError, AttributeError):
+        return None
+
+    refs: list[list[Any]] = []
+    blobs: dict[str, bytes] = {}
+    for cell_index, cell in enumerate(cells):
+        for output_index, output in enumerate(cell.get("outputs") or []):
+            data = output.get("data")
+            if isinstance(data, dict):
+                for mime in sorted(data):
+                    raw = _canonical_json(data[mime])
+                    if len(raw) >= _MIN_OUTPUT_BLOB_BYTES:
+                        digest = hashlib.sha256(raw).hexdigest()
+                        blobs[digest] = raw
+                        refs.append([cell_index, output_index, "data", mime, digest])
+                        data[mime] = None
+            if output.get("output_type") == "stream" and "text" in output:
+                raw = _canonical_json(output["text"])
+                if len(raw) >= _MIN_OUTPUT_BLOB_BYTES:
+                    digest = hashlib.sha256(raw).hexdigest()
+                    blobs[digest] = raw
+                    refs.append([cell_index, output_index, "text", None, digest])
+                    output["text"] = None
+
+    if not refs:
+        return None
+    skeleton = zlib.compress(_canonical_json({"notebook": notebook, "refs": refs}), _ZLIB_LEVEL)
+    try:
+        if _join_payload(skeleton, blobs) != payload:
+            return None
+    except (zlib.error, ValueError, LookupError, TypeError):
+        return None
+    return skeleton, blobs
+
+
+def _join_payload(skeleton: bytes, blobs: dict[str, bytes]) -> bytes:
+    """Reassemble the nbformat JSON bytes from a skeleton and its output blobs.
+
+    Raises:
+        KeyError: A referenced blob is missing from ``blobs``.
+        zlib.error, ValueError: The skeleton is damaged.
+    """
+    document = json.loads(zlib.decompress(skeleton))
+    notebook = document["notebook"]
+    cells = notebook["cells"]
+    for cell_index, output_index, field, mime, digest in document["refs"]:
+        output = cells[cell_index]["outputs"][output_index]
+        value = json.loads(blobs[digest])
+        if field == "data":
+            output["data"][mime] = value
+        else:
+            output[field] = value
+    return _nbformat_json(notebook)
+
+
 class ExecutedNotebookCache:
     """Manages caching of executed notebooks for reuse across HTML variants.
 
@@ -129,6 +239,25 @@ class ExecutedNotebookCache:
             CREATE INDEX IF NOT EXISTS idx_executed_notebooks_lookup
             ON executed_notebooks(input_file, content_hash, language, prog_lang)
         """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS executed_notebook_outputs (
+                digest TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                raw_size INTEGER NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS executed_notebook_output_refs (
+                notebook_id INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                PRIMARY KEY (notebook_id, digest)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_executed_notebook_output_refs_digest
+            ON executed_notebook_output_refs(digest)
+        """)
 
         columns = {row[1] for row in cursor.execute("PRAGMA table_info(executed_notebooks)")}
         if "payload_format" not in columns:
@@ -142,8 +271,8 @@ class ExecutedNotebookCache:
         (user_version,) = cursor.execute("PRAGMA user_version").fetchone()
         if user_version < _USER_VERSION_JSON_ONLY:
             cursor.execute(
-                "DELETE FROM executed_notebooks WHERE payload_format != ?",
-                (PAYLOAD_FORMAT,),
+                "DELETE FROM executed_notebooks WHERE payload_format NOT IN (?, ?)",
+                READABLE_PAYLOAD_FORMATS,
             )
             if cursor.rowcount > 0:
                 logger.info(
@@ -220,7 +349,9 @@ class ExecutedNotebookCache:
 
         Returns:
             The stored nbformat JSON bytes (as written by :meth:`store`), or
-            None if not found.
+            None if not found. Rows whose outputs were split into blobs are
+            reassembled to the identical bytes; a row whose skeleton is
+            damaged or whose blobs have been collected reads as a miss.
         """
         if not self.conn:
             logger.warning("ExecutedNotebookCache not initialized (use with statement)")
@@ -229,18 +360,38 @@ class ExecutedNotebookCache:
         cursor = self.conn.cursor()
         cursor.execute(
             """
-            SELECT executed_notebook FROM executed_notebooks
+            SELECT id, executed_notebook, payload_format FROM executed_notebooks
             WHERE input_file = ? AND content_hash = ? AND language = ? AND prog_lang = ?
-              AND payload_format = ?
+              AND payload_format IN (?, ?)
             ORDER BY created_at DESC
             LIMIT 1
             """,
-            (str(input_file), content_hash, language, prog_lang, PAYLOAD_FORMAT),
+            (str(input_file), content_hash, language, prog_lang, *READABLE_PAYLOAD_FORMATS),
         )
         row = cursor.fetchone()
-        if row:
-            return bytes(row[0])
-        return None
+        if not row:
+            return None
+        notebook_id, stored, payload_format = row
+        if payload_format == PAYLOAD_FORMAT:
+            return bytes(stored)
+
+        cursor.execute(
+            """
+            SELECT o.digest, o.data FROM executed_notebook_output_refs r
+            JOIN executed_notebook_outputs o ON o.digest = r.digest
+            WHERE r.notebook_id = ?
+            """,
+            (notebook_id,),
+        )
+        try:
+            blobs = {digest: zlib.decompress(data) for digest, data in cursor.fetchall()}
+            return _join_payload(bytes(stored), blobs)
+        except (zlib.error, ValueError, LookupError, TypeError) as e:
+            logger.warning(
+                f"Cached executed notebook for {input_file} ({language}, {prog_lang}) "
+                f"could not be reassembled from its output blobs; treating as a miss: {e!r}"
+            )
+            return None
 
     def store(
         self,
@@ -277,25 +428,112 @@ class ExecutedNotebookCache:
             )
             return
 
+        split = _split_payload(payload)
+        blobs: dict[str, bytes]
+        if split is None:
+            stored, payload_format, blobs = payload, PAYLOAD_FORMAT, {}
+        else:
+            stored, blobs = split
+            payload_format = SPLIT_PAYLOAD_FORMAT
+
+        key = (str(input_file), content_hash, language, prog_lang)
         cursor = self.conn.cursor()
+        # REPLACE gives the row a new id, so drop the old row's references
+        # first and collect the blobs only it was holding afterwards.
+        cursor.execute(
+            """
+            SELECT id FROM executed_notebooks
+            WHERE input_file = ? AND content_hash = ? AND language = ? AND prog_lang = ?
+            """,
+            key,
+        )
+        replaced_ids = [row[0] for row in cursor.fetchall()]
+        replaced_digests: set[str] = set()
+        for replaced_id in replaced_ids:
+            cursor.execute(
+                "SELECT digest FROM executed_notebook_output_refs WHERE notebook_id = ?",
+                (replaced_id,),
+            )
+            replaced_digests.update(row[0] for row in cursor.fetchall())
+            cursor.execute(
+                "DELETE FROM executed_notebook_output_refs WHERE notebook_id = ?",
+                (replaced_id,),
+            )
+
+        # Only compress what is not stored yet — for the second language of
+        # a deck that is usually nothing but the text outputs.
+        known: set[str] = set()
+        if blobs:
+            placeholders = ",".join("?" * len(blobs))
+            cursor.execute(
+                f"SELECT digest FROM executed_notebook_outputs WHERE digest IN ({placeholders})",
+                list(blobs),
+            )
+            known = {row[0] for row in cursor.fetchall()}
+        cursor.executemany(
+            """
+            INSERT OR IGNORE INTO executed_notebook_outputs (digest, data, raw_size)
+            VALUES (?, ?, ?)
+            """,
+            [
+                (digest, zlib.compress(raw, _ZLIB_LEVEL), len(raw))
+                for digest, raw in blobs.items()
+                if digest not in known
+            ],
+        )
         cursor.execute(
             """
             INSERT OR REPLACE INTO executed_notebooks
             (input_file, content_hash, language, prog_lang, executed_notebook, payload_format)
             VALUES (?, ?, ?, ?, ?, ?)
             """,
-            (
-                str(input_file),
-                content_hash,
-                language,
-                prog_lang,
-                payload,
-                PAYLOAD_FORMAT,
-            ),
+            (*key, stored, payload_format),
+        )
+        notebook_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO executed_notebook_output_refs (notebook_id, digest) VALUES (?, ?)",
+            [(notebook_id, digest) for digest in blobs],
         )
+        self._delete_unreferenced_blobs(cursor, replaced_digests - blobs.keys())
         self.conn.commit()
         logger.debug(f"Cached executed notebook: {input_file} ({language}, {prog_lang})")
 
+    @staticmethod
+    def _delete_unreferenced_blobs(cursor: sqlite3.Cursor, digests: set[str]) -> int:
+        """Delete those of ``digests`` that no notebook references any more."""
+        if not digests:
+            return 0
+        placeholders = ",".join("?" * len(digests))
+        cursor.execute(
+            f"""
+            DELETE FROM executed_notebook_outputs
+            WHERE digest IN ({placeholders})
+              AND digest NOT IN (SELECT digest FROM executed_notebook_output_refs)
+            """,
+            list(digests),
+        )
+        return cursor.rowcount
+
+    @staticmethod
+    def _sweep_orphans(cursor: sqlite3.Cursor) -> int:
+        """Drop references of deleted notebooks, then the blobs nobody references.
+
+        Returns the number of output blobs deleted.
+        """
+        cursor.execute(
+            """
+            DELETE FROM executed_notebook_output_refs
+            WHERE notebook_id NOT IN (SELECT id FROM executed_notebooks)
+            """
+        )
+        cursor.execute(
+            """
+            DELETE FROM executed_notebook_outputs
+            WHERE digest NOT IN (SELECT digest FROM executed_notebook_output_refs)
+            """
+        )
+        return cursor.rowcount
+
     def clear(self, input_file: str | None = None) -> int:
         """Clear cached entries.
 
@@ -319,6 +557,7 @@ class ExecutedNotebookCache:
         else:
             cursor.execute("DELETE FROM executed_notebooks")
         deleted = cursor.rowcount
+        self._sweep_orphans(cursor)
         self.conn.commit()
         logger.debug(f"Cleared {deleted} cached executed notebooks")
         return deleted
@@ -331,9 +570,17 @@ class ExecutedNotebookCache:
             - total_entries: Total number of cached entries
             - by_language: Count by language
             - by_prog_lang: Count by programming language
+            - output_blobs: Number of deduplicated output blobs
+            - stored_bytes: Bytes held by notebook rows and output blobs
         """
         if not self.conn:
-            return {"total_entries": 0, "by_language": {}, "by_prog_lang": {}}
+            return {
+                "total_entries": 0,
+                "by_language": {},
+                "by_prog_lang": {},
+                "output_blobs": 0,
+                "stored_bytes": 0,
+            }
 
         cursor = self.conn.cursor()
 
@@ -346,10 +593,103 @@ class ExecutedNotebookCache:
         cursor.execute("SELECT prog_lang, COUNT(*) FROM executed_notebooks GROUP BY prog_lang")
         by_prog_lang = dict(cursor.fetchall())
 
+        cursor.execute("SELECT COUNT(*) FROM executed_notebook_outputs")
+        output_blobs = cursor.fetchone()[0]
+
         return {
             "total_entries": total,
             "by_language": by_language,
             "by_prog_lang": by_prog_lang,
+            "output_blobs": output_blobs,
+            "stored_bytes": self._stored_bytes(cursor),
+        }
+
+    @staticmethod
+    def _stored_bytes(cursor: sqlite3.Cursor) -> int:
+        """Payload bytes held by notebook rows plus output blobs."""
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COALESCE(SUM(LENGTH(executed_notebook)), 0) FROM executed_notebooks)
+                + (SELECT COALESCE(SUM(LENGTH(data)), 0) FROM executed_notebook_outputs)
+            """
+        )
+        return int(cursor.fetchone()[0])
+
+    def collect_garbage(self, max_bytes: int | None = None) -> dict[str, int]:
+        """Delete unreferenced output blobs and enforce a size budget.
+
+        Blobs are shared between notebooks, so deleting a notebook row does
+        not free its outputs on its own; this sweeps the ones nothing refers
+        to any more. With ``max_bytes``, the oldest entries are then evicted
+        until the stored payloads (skeletons plus blobs) fit. The file only
+        shrinks on disk after :meth:`vacuum`.
+
+        Args:
+            max_bytes: Upper bound for the stored payload bytes, or None to
+                only sweep unreferenced blobs.
+
+        Returns:
+            ``{"evicted_entries": ..., "deleted_blobs": ..., "stored_bytes": ...}``
+            where ``stored_bytes`` is the size after collection.
+        """
+        if not self.conn:
+            logger.warning("ExecutedNotebookCache not initialized (use with statement)")
+            return {"evicted_entries": 0, "deleted_blobs": 0, "stored_bytes": 0}
+
+        cursor = self.conn.cursor()
+        deleted_blobs = self._sweep_orphans(cursor)
+        stored_bytes = self._stored_bytes(cursor)
+        evicted = 0
+
+        while max_bytes is not None and stored_bytes > max_bytes:
+            cursor.execute(
+                """
+                SELECT id, LENGTH(executed_notebook) FROM executed_notebooks
+                ORDER BY created_at ASC, id ASC
+                LIMIT 1
+                """
+            )
+            row = cursor.fetchone()
+            if row is None:
+                break
+            notebook_id, skeleton_size = row
+            cursor.execute(
+                "SELECT digest FROM executed_notebook_output_refs WHERE notebook_id = ?",
+                (notebook_id,),
+            )
+            digests = {r[0] for r in cursor.fetchall()}
+            cursor.execute("DELETE FROM executed_notebooks WHERE id = ?", (notebook_id,))
+            cursor.execute(
+                "DELETE FROM executed_notebook_output_refs WHERE notebook_id = ?",
+                (notebook_id,),
+            )
+            freed = 0
+            if digests:
+                placeholders = ",".join("?" * len(digests))
+                cursor.execute(
+                    f"""
+                    SELECT COALESCE(SUM(LENGTH(data)), 0) FROM executed_notebook_outputs
+                    WHERE digest IN ({placeholders})
+                      AND digest NOT IN (SELECT digest FROM executed_notebook_output_refs)
+                    """,
+                    list(digests),
+                )
+                freed = int(cursor.fetchone()[0])
+                deleted_blobs += self._delete_unreferenced_blobs(cursor, digests)
+            stored_bytes -= int(skeleton_size or 0) + freed
+            evicted += 1
+
+        self.conn.commit()
+        if evicted or deleted_blobs:
+            logger.info(
+                f"Executed notebook cache GC: evicted {evicted} entries, "
+                f"deleted {deleted_blobs} output blobs ({stored_bytes} bytes remain)"
+            )
+        return {
+            "evicted_entries": evicted,
+            "deleted_blobs": deleted_blobs,
+            "stored_bytes": stored_bytes,
         }
 
     def prune_old_entries(self, days: int = 30) -> int:
@@ -374,6 +714,7 @@ class ExecutedNotebookCache:
             (days,),
         )
         deleted = cursor.rowcount
+        self._sweep_orphans(cursor)
         self.conn.commit()
 
         if deleted > 0:
@@ -431,6 +772,7 @@ class ExecutedNotebookCache:
             )
 
         deleted = cursor.rowcount
+        self._sweep_orphans(cursor)
         self.conn.commit()
 
         if deleted > 0:
@@ -476,6 +818,7 @@ class ExecutedNotebookCache:
             missing_paths,
         )
         deleted = cursor.rowcount
+        self._sweep_orphans(cursor)
         self.conn.commit()
         if deleted > 0:
             logger.info(
@@ -153,6 +153,53 @@ class ExecutionTelemetryStore:
             # Telemetry must never fail a build.
             logger.warning("Could not record execution telemetry for %s: %s", event.input_file, exc)
 
+    def import_events(self, events: list[TelemetryEvent]) -> int:
+        """Copy events recorded elsewhere into this database, keeping ``created_at``.
+
+        ``clm kernel-triage`` gives each concurrent triage build its own
+        telemetry database and merges them here afterwards.
+
+        Returns:
+            The number of events imported.
+        """
+        if not events:
+            return 0
+        conn = self._connect()
+        try:
+            conn.executemany(
+                """
+                INSERT INTO execution_telemetry (
+                    input_file, prog_lang, language, content_hash,
+                    worker_image_identity, outcome, classification,
+                    attempts, failure_type, failing_cell_index,
+                    error_message, attempts_json, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                          COALESCE(?, STRFTIME('%Y-%m-%dT%H:%M:%fZ', 'now')))
+                """,
+                [
+                    (
+                        event.input_file,
+                        event.prog_lang,
+                        event.language,
+                        event.content_hash,
+                        event.worker_image_identity,
+                        event.outcome,
+                        event.classification,
+                        event.attempts,
+                        event.failure_type,
+                        event.failing_cell_index,
+                        event.error_message[:2000],
+                        json.dumps(event.attempts_detail),
+                        event.created_at or None,
+                    )
+                    for event in events
+                ],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return len(events)
+
     @staticmethod
     def _row_to_event(row: tuple) -> TelemetryEvent:
         try:
@@ -0,0 +1,145 @@
+"""Background archival that keeps the hot tables of ``clm_jobs.db`` small.
+
+Every build adds thousands of ``jobs`` rows (each carrying its JSON payload)
+and a stream of ``worker_events``. Claim queries, ``get_job_statuses_batch``,
+monitor listings and the dead-worker scans all slow down as those tables grow
+over weeks of watch-mode and CI use. :class:`JobArchiver` drains them
+incrementally: finished jobs of past sessions move to ``jobs_archive`` without
+payloads, old events are rolled up into ``worker_event_summaries``, and
+heartbeat rows of dead workers are dropped. See
+:meth:`JobQueue.archive_finished_jobs` for what qualifies.
+
+Each pass is a series of small batches, one short write transaction each, so
+archival never holds the jobs-DB write lock long enough to stall workers
+claiming jobs.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+from clm.infrastructure.database.job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+
+class JobArchiver:
+    """Incrementally archive finished jobs and roll up old worker events.
+
+    Usage:
+        archiver = JobArchiver(db_path, current_session_id=session_id)
+        archiver.start()        # background passes every ``interval`` seconds
+        ...
+        archiver.stop()
+
+    ``run_once`` performs a single bounded pass and can be called directly
+    (build-end cleanup does so to finish the backlog).
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        current_session_id: str | None = None,
+        min_age_minutes: int = 60,
+        batch_size: int = 500,
+        max_batches_per_pass: int = 20,
+        interval: float = 30.0,
+    ):
+        """Initialize the archiver.
+
+        Args:
+            db_path: Path to the jobs database.
+            current_session_id: Session of the running build; its jobs and
+                events are never archived.
+            min_age_minutes: Minimum time since a job finished (or an event
+                was logged) before it is archived.
+            batch_size: Rows moved per transaction.
+            max_batches_per_pass: Upper bound on batches per table in one
+                :meth:`run_once`, so a huge backlog is spread over passes.
+            interval: Seconds between background passes.
+        """
+        self.db_path = db_path
+        self.current_session_id = current_session_id
+        self.min_age_minutes = min_age_minutes
+        self.batch_size = batch_size
+        self.max_batches_per_pass = max_batches_per_pass
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self, job_queue: JobQueue | None = None) -> dict[str, int]:
+        """Run one archival pass.
+
+        A direct call always runs to completion, even after :meth:`stop` —
+        the build-end pass runs once the background thread is gone.
+
+        Args:
+            job_queue: Queue to use; a private one is opened (and closed)
+                when omitted. Pass one only from the thread that owns it.
+
+        Returns:
+            Counts of archived jobs, rolled-up events and deleted heartbeats.
+        """
+        if job_queue is None:
+            with JobQueue(self.db_path) as jq:
+                return self._run_pass(jq, stop_event=None)
+        return self._run_pass(job_queue, stop_event=None)
+
+    def _run_pass(
+        self, job_queue: JobQueue, *, stop_event: threading.Event | None
+    ) -> dict[str, int]:
+        """One archival pass; *stop_event*, when given, cuts it short between batches."""
+        result = {"archived_jobs": 0, "rolled_up_events": 0, "stale_heartbeats": 0}
+        for _ in range(self.max_batches_per_pass):
+            if stop_event is not None and stop_event.is_set():
+                break
+            moved = job_queue.archive_finished_jobs(
+                self.current_session_id, self.min_age_minutes, self.batch_size
+            )
+            result["archived_jobs"] += moved
+            if moved < self.batch_size:
+                break
+        for _ in range(self.max_batches_per_pass):
+            if stop_event is not None and stop_event.is_set():
+                break
+            rolled = job_queue.roll_up_worker_events(
+                self.current_session_id, self.min_age_minutes, self.batch_size
+            )
+            result["rolled_up_events"] += rolled
+            if rolled < self.batch_size:
+                break
+        result["stale_heartbeats"] = job_queue.clear_stale_heartbeats()
+
+        if any(result.values()):
+            logger.info(f"Job archival pass: {result}")
+        return result
+
+    def start(self) -> None:
+        """Start background passes on a daemon thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="JobArchiver", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the background thread, letting an in-flight batch finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        # The thread owns its JobQueue: SQLite connections are per-thread.
+        with JobQueue(self.db_path) as job_queue:
+            while not self._stop_event.is_set():
+                try:
+                    self._run_pass(job_queue, stop_event=self._stop_event)
+                except Exception as e:
+                    # Archival is housekeeping; a locked DB or a transient
+                    # error must never disturb the build. Retry next pass.
+                    logger.debug(f"Job archival pass failed: {e}")
+                self._stop_event.wait(self.interval)
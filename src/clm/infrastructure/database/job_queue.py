@@ -933,6 +933,203 @@ class JobQueue:
             logger.info(f"Deleted {deleted} old worker events (older than {days} days)")
         return deleted
 
+    def live_session_ids(self) -> set[str]:
+        """Return the build sessions that still have a non-dead worker row.
+
+        Their jobs and events may still be read by the owning build (status
+        batches, monitor listings), so archival leaves them alone.
+        """
+        conn = self._get_conn()
+        cursor = conn.execute(
+            "SELECT DISTINCT session_id FROM workers "
+            "WHERE status != 'dead' AND session_id IS NOT NULL"
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+    def _archivable_session_filter(
+        self, current_session_id: str | None
+    ) -> tuple[str, tuple[str, ...]]:
+        """SQL clause (and params) excluding the current and all live sessions."""
+        excluded = self.live_session_ids()
+        if current_session_id is not None:
+            excluded.add(current_session_id)
+        if not excluded:
+            return "", ()
+        placeholders = ",".join("?" * len(excluded))
+        return f"AND (session_id IS NULL OR session_id NOT IN ({placeholders}))", tuple(excluded)
+
+    def archive_finished_jobs(
+        self,
+        current_session_id: str | None = None,
+        min_age_minutes: int = 60,
+        batch_size: int = 500,
+    ) -> int:
+        """Move one batch of finished jobs from ``jobs`` into ``jobs_archive``.
+
+        Completed and cancelled jobs of sessions that are neither
+        ``current_session_id`` nor live (see :meth:`live_session_ids`) are
+        copied without their payload, result and traceback, then deleted from
+        ``jobs``. Failed jobs stay in place under the failed-jobs retention,
+        since their tracebacks are what ``clm status`` shows. Jobs that
+        finished less than ``min_age_minutes`` ago are left for the recent-
+        activity views, which look back an hour.
+
+        Each call is one short ``BEGIN IMMEDIATE`` transaction touching at
+        most ``batch_size`` rows, so it can run in the background without
+        holding the write lock against claiming workers. Call it until it
+        returns 0 to drain the backlog.
+
+        Returns:
+            Number of jobs archived.
+        """
+        session_clause, session_params = self._archivable_session_filter(current_session_id)
+        conn = self._get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                f"""
+                SELECT id FROM jobs
+                WHERE status IN ('completed', 'cancelled')
+                  AND COALESCE(completed_at, cancelled_at, created_at)
+                      < datetime('now', '-' || ? || ' minutes')
+                  {session_clause}
+                ORDER BY id
+                LIMIT ?
+                """,
+                (min_age_minutes, *session_params, batch_size),
+            )
+            job_ids = [row[0] for row in cursor.fetchall()]
+            if not job_ids:
+                conn.rollback()
+                return 0
+
+            placeholders = ",".join("?" * len(job_ids))
+            conn.execute(
+                f"""
+                INSERT OR REPLACE INTO jobs_archive (
+                    id, job_type, status, input_file, output_file, content_hash,
+                    correlation_id, session_id, execution_mode, worker_id, attempts,
+                    created_at, started_at, completed_at, cancelled_at
+                )
+                SELECT
+                    id, job_type, status, input_file, output_file, content_hash,
+                    correlation_id, session_id, execution_mode, worker_id, attempts,
+                    created_at, started_at, completed_at, cancelled_at
+                FROM jobs WHERE id IN ({placeholders})
+                """,
+                job_ids,
+            )
+            conn.execute(f"DELETE FROM jobs WHERE id IN ({placeholders})", job_ids)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        logger.debug(f"Archived {len(job_ids)} finished jobs")
+        return len(job_ids)
+
+    def roll_up_worker_events(
+        self,
+        current_session_id: str | None = None,
+        min_age_minutes: int = 60,
+        batch_size: int = 2000,
+    ) -> int:
+        """Fold one batch of old worker events into ``worker_event_summaries``.
+
+        Events of sessions that are neither current nor live become per-session
+        counts by worker type and event type, with the first and last
+        timestamp, and are then deleted. Like :meth:`archive_finished_jobs`
+        this is one bounded transaction per call.
+
+        Returns:
+            Number of events rolled up.
+        """
+        session_clause, session_params = self._archivable_session_filter(current_session_id)
+        conn = self._get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                f"""
+                SELECT id FROM worker_events
+                WHERE created_at < datetime('now', '-' || ? || ' minutes')
+                  {session_clause}
+                ORDER BY id
+                LIMIT ?
+                """,
+                (min_age_minutes, *session_params, batch_size),
+            )
+            event_ids = [row[0] for row in cursor.fetchall()]
+            if not event_ids:
+                conn.rollback()
+                return 0
+
+            placeholders = ",".join("?" * len(event_ids))
+            conn.execute(
+                f"""
+                INSERT INTO worker_event_summaries (
+                    session_id, worker_type, event_type, event_count, first_at, last_at
+                )
+                SELECT
+                    COALESCE(session_id, ''), worker_type, event_type,
+                    COUNT(*), MIN(created_at), MAX(created_at)
+                FROM worker_events WHERE id IN ({placeholders})
+                GROUP BY COALESCE(session_id, ''), worker_type, event_type
+                ON CONFLICT (session_id, worker_type, event_type) DO UPDATE SET
+                    event_count = event_count + excluded.event_count,
+                    first_at = MIN(first_at, excluded.first_at),
+                    last_at = MAX(last_at, excluded.last_at)
+                """,
+                event_ids,
+            )
+            conn.execute(f"DELETE FROM worker_events WHERE id IN ({placeholders})", event_ids)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        logger.debug(f"Rolled up {len(event_ids)} worker events")
+        return len(event_ids)
+
+    def clear_stale_heartbeats(self) -> int:
+        """Delete ``worker_heartbeats`` rows of dead or deregistered workers.
+
+        Returns:
+            Number of heartbeat rows deleted.
+        """
+        conn = self._get_conn()
+        cursor = conn.execute(
+            """
+            DELETE FROM worker_heartbeats
+            WHERE worker_id NOT IN (SELECT id FROM workers WHERE status != 'dead')
+            """
+        )
+        return cursor.rowcount
+
+    def clear_old_archive(self, days: int | None) -> int:
+        """Delete archived jobs and event summaries older than ``days``.
+
+        Args:
+            days: Days to keep archive rows (None = keep indefinitely)
+
+        Returns:
+            Number of archive rows deleted.
+        """
+        if days is None:
+            return 0
+        conn = self._get_conn()
+        deleted = conn.execute(
+            "DELETE FROM jobs_archive WHERE archived_at < datetime('now', '-' || ? || ' days')",
+            (days,),
+        ).rowcount
+        deleted += conn.execute(
+            "DELETE FROM worker_event_summaries "
+            "WHERE last_at < datetime('now', '-' || ? || ' days')",
+            (days,),
+        ).rowcount
+        if deleted > 0:
+            logger.info(f"Deleted {deleted} archive rows (older than {days} days)")
+        return deleted
+
     def clear_orphaned_cache_entries(self) -> int:
         """Delete cache entries that reference non-existent output files.
 
@@ -1069,6 +1266,7 @@ class JobQueue:
         cancelled_days: int | None = 1,
         events_days: int = 30,
         cache_versions: int | None = None,
+        archive_days: int | None = None,
     ) -> dict[str, int]:
         """Perform comprehensive cleanup of old entries.
 
@@ -1080,6 +1278,8 @@ class JobQueue:
             cache_versions: Number of ``results_cache`` versions to keep per
                 output file (None = skip the results-cache sweep, keeping the
                 pre-#580 behaviour for callers that do not opt in)
+            archive_days: Days to keep ``jobs_archive`` rows and worker event
+                summaries (None = keep indefinitely)
 
         Returns:
             Dictionary with counts of deleted entries by type
@@ -1090,6 +1290,7 @@ class JobQueue:
             "cancelled_jobs": self.clear_old_jobs_by_status("cancelled", cancelled_days),
             "worker_events": self.clear_old_worker_events(events_days),
             "hung_jobs_reset": self.reset_hung_jobs(),
+            "archive_rows": self.clear_old_archive(archive_days),
         }
         if cache_versions is not None:
             result["cache_versions"] = self.prune_old_cache_versions(cache_versions)
@@ -1112,7 +1313,14 @@ class JobQueue:
         stats: dict[str, Any] = {}
 
         # Get row counts for each table
-        tables = ["jobs", "results_cache", "workers", "worker_events"]
+        tables = [
+            "jobs",
+            "results_cache",
+            "workers",
+            "worker_events",
+            "jobs_archive",
+            "worker_event_summaries",
+        ]
         for table in tables:
             try:
                 cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")  # noqa: S608
@@ -10,7 +10,7 @@ from pathlib import Path
 
 from clm.infrastructure.database.journal_mode import configure_connection
 
-DATABASE_VERSION = 11
+DATABASE_VERSION = 12
 
 SCHEMA_SQL = """
 -- Jobs table (replaces message queue)
@@ -181,6 +181,46 @@ CREATE TABLE IF NOT EXISTS worker_heartbeats (
 );
 
 CREATE INDEX IF NOT EXISTS idx_worker_heartbeats_job ON worker_heartbeats(job_id);
+
+-- Job archive (v12): compact records of finished jobs moved out of ``jobs``
+-- by JobQueue.archive_finished_jobs. No payload, result or traceback — the
+-- hot table stays small for claim queries, status batches and monitor
+-- listings, while per-job history (what ran, where, when, how long) is kept.
+CREATE TABLE IF NOT EXISTS jobs_archive (
+    id INTEGER PRIMARY KEY,  -- the original jobs.id
+    job_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    input_file TEXT NOT NULL,
+    output_file TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    correlation_id TEXT,
+    session_id TEXT,
+    execution_mode TEXT,
+    worker_id INTEGER,
+    attempts INTEGER,
+    created_at TIMESTAMP,
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    cancelled_at TIMESTAMP,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_archive_session ON jobs_archive(session_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_archive_archived_at ON jobs_archive(archived_at);
+
+-- Worker event summaries (v12): worker_events of finished sessions rolled up
+-- to one row per (session, worker type, event type) by
+-- JobQueue.roll_up_worker_events. session_id '' collects legacy events that
+-- carry no session.
+CREATE TABLE IF NOT EXISTS worker_event_summaries (
+    session_id TEXT NOT NULL,
+    worker_type TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_count INTEGER NOT NULL,
+    first_at TIMESTAMP,
+    last_at TIMESTAMP,
+    PRIMARY KEY (session_id, worker_type, event_type)
+);
 """
 
 
@@ -467,3 +507,10 @@ def migrate_database(conn: sqlite3.Connection, from_version: int, to_version: in
                 raise
         conn.execute("INSERT OR IGNORE INTO schema_version (version) VALUES (11)")
         conn.commit()
+
+    # Migration from v11 to v12: archive tables for finished jobs and rolled-up
+    # worker events. Both are created IF NOT EXISTS by SCHEMA_SQL, which
+    # init_database runs before migrating, so this records the version bump.
+    if from_version < 12 <= to_version:
+        conn.execute("INSERT OR IGNORE INTO schema_version (version) VALUES (12)")
+        conn.commit()
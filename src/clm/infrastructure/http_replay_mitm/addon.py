@@ -259,6 +259,9 @@ class ClmReplayAddon:
         # reads ``clm_trace_dir``; off entirely unless the build sets
         # CLM_HTTP_REPLAY_TRACE=1 and the manager forwards the directory.
         self._trace: _TraceLike = _DISABLED_TRACE
+        # Parsed-cassette index, opened in running() from
+        # ``clm_cassette_index``; None parses every canonical's YAML.
+        self._index: Any = None
 
     def load(self, loader) -> None:
         loader.add_option(
@@ -296,6 +299,13 @@ class ClmReplayAddon:
             "the addon writes per-flow proxy events to proxy-<pid>.jsonl there. "
             "Empty disables tracing.",
         )
+        loader.add_option(
+            name="clm_cassette_index",
+            typespec=str,
+            default="",
+            help="Parsed-cassette index (SQLite) canonical cassettes are loaded "
+            "from when their bytes were seen before. Empty parses the YAML.",
+        )
 
     def running(self) -> None:
         if cf is None:
@@ -323,6 +333,9 @@ class ClmReplayAddon:
         # of truth for cassette secret-filtering (pinned by a constants test).
         self._request_filter = cf.build_request_filter(ignore_hosts=ignore_hosts)
         self._response_filter = cf.build_response_filter()
+        index_path = getattr(ctx.options, "clm_cassette_index", "") or ""
+        if index_path:
+            self._index = cf.CassetteIndex(Path(index_path))
 
         # ``once``/``refresh`` strictness is resolved per target in
         # ``_modes_for`` (``once`` depends on whether the target cassette
@@ -363,6 +376,8 @@ class ClmReplayAddon:
         # (every trace line is already flushed, so a missed close — e.g. a
         # Windows CTRL_BREAK that skips this hook — loses nothing).
         self._trace.close()
+        if self._index is not None:
+            self._index.close()
 
     def request(self, flow: http.HTTPFlow) -> None:
         if cf is None:
@@ -552,7 +567,7 @@ class ClmReplayAddon:
         if overwrite or not existed:
             return
         try:
-            interactions = cf.load_interactions(target.canonical)
+            interactions = cf.load_interactions(target.canonical, self._index)
         except Exception as exc:  # noqa: BLE001 — defensive
             logger.warning(
                 "Failed to load cassette %s (%s: %s); starting empty",
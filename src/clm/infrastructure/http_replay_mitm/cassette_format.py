@@ -46,15 +46,18 @@ from pathlib import Path
 # the CLM venv, bare path import inside the mitmdump interpreter (the addon
 # already put this directory on sys.path in that case, but be self-reliant).
 try:  # CLM venv
+    from clm.infrastructure.http_replay_mitm import cassette_index as ci
     from clm.infrastructure.http_replay_mitm import vcr_format as vf
 except ImportError:  # mitmdump interpreter — import the sibling by path
     sys.path.insert(0, str(Path(__file__).parent))
+    import cassette_index as ci  # type: ignore[import-not-found, no-redef]
     import vcr_format as vf  # type: ignore[import-not-found, no-redef]
 
 # Re-exported names: consumers (the addon, merge, doctor, strip script,
 # tests) treat cassette_format as the format's facade.
 Request = vf.Request
 decode_response = vf.decode_response
+CassetteIndex = ci.CassetteIndex
 
 # ---------------------------------------------------------------------------
 # Secret/telemetry filtering + matching parity (issue #165, P3)
@@ -711,14 +714,19 @@ def serialize_interactions(interactions: Iterable[Interaction]) -> str:
     return payload
 
 
-def load_interactions(path: Path) -> list[Interaction]:
+def load_interactions(path: Path, index: CassetteIndex | None = None) -> list[Interaction]:
     """Load a vcrpy YAML cassette into ``(Request, response-dict)`` pairs.
 
-    Returns an empty list when the cassette does not exist.
+    Returns an empty list when the cassette does not exist. With an
+    *index*, a cassette whose bytes were seen before is decoded from the
+    index instead of parsed (see :mod:`cassette_index`).
     """
     path = Path(path)
     if not path.exists():
         return []
+    if index is not None:
+        cassette = ci.read_cassette(path, index)
+        return list(zip(cassette.requests, cassette.responses, strict=False))
     requests, responses = vf.load_cassette(path)
     return list(zip(requests, responses, strict=False))
 
@@ -0,0 +1,344 @@
+"""Parsed-cassette index: load a cassette without parsing its YAML.
+
+LLM-heavy decks carry multi-megabyte cassettes with hundreds of
+interactions, and every replay start-up and every post-build merge used to
+parse the whole canonical YAML again. This module keeps the parsed
+interactions of each cassette in one SQLite file (a per-user cache, never
+inside a course repository), keyed by the **sha256 of the cassette's
+bytes**. A lookup reads and hashes the file — cheap next to a YAML parse —
+and decodes the stored interactions; any edit, checkout or merge changes
+the hash, so a stale entry can never be served. The YAML stays the source
+of truth: a miss parses it exactly as before and stores the result.
+
+Entries written by the merge additionally record that the cassette bytes
+are the serializer's own output. For those, an append-only merge splices
+the YAML of the new interactions onto the existing text
+(:func:`append_serialized`) instead of re-dumping every interaction — the
+result is byte-identical to a full re-serialization, which is what keeps
+no-op rebuilds byte-stable.
+
+Like :mod:`cassette_format`, this module is pure (PyYAML + stdlib) and
+importable both as a CLM submodule and by bare path inside the isolated
+``mitmdump`` interpreter; so is the size-bounded store it builds on
+(:mod:`clm.infrastructure.utils.sqlite_lru_store`). Nothing here may raise into replay: an index that
+cannot be opened, read or written degrades to parsing the YAML.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+try:  # CLM venv
+    from clm.infrastructure.http_replay_mitm import vcr_format as vf
+    from clm.infrastructure.utils.sqlite_lru_store import SqliteLruStore
+except ImportError:  # mitmdump interpreter — import the siblings by path
+    sys.path.insert(0, str(Path(__file__).parent))
+    sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+    import vcr_format as vf  # type: ignore[import-not-found, no-redef]
+    from sqlite_lru_store import SqliteLruStore  # type: ignore[import-not-found, no-redef]
+
+logger = logging.getLogger(__name__)
+
+#: Default bound on the summed entry sizes of one index.
+DEFAULT_MAX_BYTES = 256 << 20
+
+# Prefix of every stored entry; bump it when the encoding changes so old
+# entries read as misses instead of decoding into the wrong shape.
+_ENTRY_MAGIC = b"CIX1"
+
+# The document frame yaml.dump puts around the interaction list: mapping
+# keys are sorted, so ``interactions`` opens the document and ``version``
+# closes it.
+_YAML_HEAD = "interactions:\n"
+_YAML_TAIL = f"version: {vf.CASSETTE_FORMAT_VERSION}\n"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cassettes (
+    digest TEXT PRIMARY KEY,
+    canonical INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cassettes_accessed ON cassettes(accessed_at);
+"""
+
+
+class _Unindexable(ValueError):
+    """A parsed cassette holds a value the entry encoding cannot represent."""
+
+
+def cassette_digest(data: bytes) -> str:
+    """Index key of a cassette: the sha256 of its bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Entry encoding
+# ---------------------------------------------------------------------------
+# JSON with two tags, because parsed cassettes carry ``bytes`` (response
+# bodies, request bodies) that JSON cannot: ``{"$u": text}`` is bytes that
+# decode as UTF-8 — the common case, kept readable and free of base64
+# inflation — and ``{"$b": base64}`` is any other bytes. A dict that itself
+# has a ``$``-prefixed key is wrapped as ``{"$d": {...}}`` so it can never be
+# mistaken for a tag. Anything else JSON cannot carry exactly (a timestamp a
+# hand-written cassette let the safe loader resolve, a non-string key) makes
+# the cassette unindexable; it is then simply parsed every time.
+
+
+def _pack(value: object) -> object:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, bytes):
+        try:
+            return {"$u": value.decode("utf-8")}
+        except UnicodeDecodeError:
+            return {"$b": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, list):
+        return [_pack(item) for item in value]
+    if isinstance(value, dict):
+        packed = {}
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise _Unindexable(f"non-string key {key!r}")
+            packed[key] = _pack(item)
+        if any(key.startswith("$") for key in packed):
+            return {"$d": packed}
+        return packed
+    raise _Unindexable(f"unsupported value type {type(value).__name__}")
+
+
+def _unpack(value: object) -> object:
+    if isinstance(value, list):
+        return [_unpack(item) for item in value]
+    if isinstance(value, dict):
+        if len(value) == 1:
+            ((tag, inner),) = value.items()
+            if tag == "$u":
+                return inner.encode("utf-8")
+            if tag == "$b":
+                return base64.b64decode(inner)
+            if tag == "$d":
+                return {key: _unpack(item) for key, item in inner.items()}
+        return {key: _unpack(item) for key, item in value.items()}
+    return value
+
+
+def encode_interactions(requests: list, responses: list) -> bytes | None:
+    """Encode parsed interactions as an index entry; ``None`` if unindexable.
+
+    Must run **before** the interactions are serialized:
+    :func:`vcr_format.serialize_cassette` turns response bodies into ``str``
+    in place, and the entry has to hold what a YAML load would return.
+    """
+    try:
+        records = [
+            {
+                "method": request.method,
+                "uri": request.uri,
+                "body": _pack(request.body),
+                "headers": _pack(dict(request.headers.items())),
+                "response": _pack(response),
+            }
+            for request, response in zip(requests, responses, strict=False)
+        ]
+        text = json.dumps(records, ensure_ascii=False, separators=(",", ":"))
+    except (_Unindexable, RecursionError, AttributeError, TypeError, ValueError) as exc:
+        logger.debug("Cassette not indexable (%s: %s)", type(exc).__name__, exc)
+        return None
+    # ``surrogatepass``: a lone surrogate survives a YAML load, and must
+    # survive the round trip too.
+    return _ENTRY_MAGIC + text.encode("utf-8", "surrogatepass")
+
+
+def decode_interactions(entry: bytes) -> tuple[list[vf.Request], list[dict]]:
+    """Inverse of :func:`encode_interactions`."""
+    if not entry.startswith(_ENTRY_MAGIC):
+        raise ValueError("unknown cassette index entry format")
+    records = json.loads(entry[len(_ENTRY_MAGIC) :].decode("utf-8", "surrogatepass"))
+    requests = []
+    responses: list[Any] = []
+    for record in records:
+        requests.append(
+            vf.Request(
+                record["method"],
+                record["uri"],
+                _unpack(record["body"]),
+                _unpack(record["headers"]),
+            )
+        )
+        responses.append(_unpack(record["response"]))
+    return requests, responses
+
+
+# ---------------------------------------------------------------------------
+# The index
+# ---------------------------------------------------------------------------
+
+
+class CassetteIndex(SqliteLruStore):
+    """SQLite store of encoded cassette entries, keyed by cassette digest.
+
+    Safe to share between threads and between processes (the host merge
+    and the replay proxy open the same file). Size-bounded: once the
+    entries exceed ``max_bytes`` the least recently used ones are evicted —
+    every merge leaves its predecessor's entry behind, so without a bound
+    the file would only grow. Nothing is created on disk until the first
+    :meth:`put`.
+    """
+
+    TABLE = "cassettes"
+    KEY_COLUMNS = ("digest",)
+    SCHEMA = _SCHEMA
+
+    def __init__(self, path: Path, *, max_bytes: int | None = DEFAULT_MAX_BYTES):
+        super().__init__(path, max_bytes=max_bytes)
+
+    def get(self, digest: str) -> tuple[bytes, bool] | None:
+        """``(entry, canonical)`` stored for *digest*, or ``None``."""
+        try:
+            with self._lock:
+                conn = self._connect(create=False)
+                if conn is None:
+                    return None
+                row = conn.execute(
+                    "SELECT body, canonical FROM cassettes WHERE digest = ?", (digest,)
+                ).fetchone()
+                if row is None:
+                    return None
+                with conn:
+                    conn.execute(
+                        "UPDATE cassettes SET accessed_at = ? WHERE digest = ?",
+                        (time.time(), digest),
+                    )
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("Cassette index lookup failed (%s: %s)", type(exc).__name__, exc)
+            return None
+        return bytes(row[0]), bool(row[1])
+
+    def put(self, digest: str, entry: bytes, *, canonical: bool = False) -> None:
+        """Store *entry* for *digest*.
+
+        *canonical* records that the cassette bytes are exactly what
+        :func:`vcr_format.serialize_cassette` produces for the entry, which
+        is what makes an :func:`append_serialized` splice safe.
+        """
+        try:
+            with self._lock:
+                conn = self._connect(create=True)
+                with conn:
+                    self._upsert_locked(
+                        conn,
+                        (digest,),
+                        {"canonical": int(canonical), "accessed_at": time.time(), "body": entry},
+                        len(entry),
+                    )
+        except (OSError, sqlite3.Error) as exc:
+            logger.debug("Cassette index write failed (%s: %s)", type(exc).__name__, exc)
+
+
+# ---------------------------------------------------------------------------
+# Loading and appending through the index
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class IndexedCassette:
+    """A cassette loaded through the index.
+
+    ``canonical`` is true when the file is known to be the serializer's own
+    output for ``requests``/``responses`` (see :meth:`CassetteIndex.put`).
+    """
+
+    data: bytes
+    digest: str
+    requests: list[vf.Request]
+    responses: list[dict]
+    canonical: bool = False
+    from_index: bool = False
+
+    @cached_property
+    def text(self) -> str:
+        """The cassette text as :func:`vcr_format.load_cassette` reads it."""
+        return _decode_text(self.data)
+
+
+def _decode_text(data: bytes) -> str:
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as err:
+        raise vf.CassetteDecodeError("Can't read cassette, encoding is broken") from err
+    # ``read_text`` translates newlines; keep load_cassette's view.
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_cassette(path: Path | str, index: CassetteIndex | None) -> IndexedCassette:
+    """Load *path*, from *index* when it holds the file's digest.
+
+    Raises exactly what :func:`vcr_format.load_cassette` raises for a
+    missing or undecodable file, or a cassette whose YAML does not parse.
+    A miss parses the YAML and stores the result in *index*; a hit does not
+    even decode the file's text (see :attr:`IndexedCassette.text`).
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise vf.CassetteNotFoundError(str(path))
+    data = path.read_bytes()
+    digest = cassette_digest(data)
+
+    if index is not None:
+        hit = index.get(digest)
+        if hit is not None:
+            entry, canonical = hit
+            try:
+                requests, responses = decode_interactions(entry)
+            except (ValueError, KeyError, TypeError) as exc:
+                logger.debug("Ignoring bad cassette index entry (%s: %s)", type(exc).__name__, exc)
+            else:
+                return IndexedCassette(data, digest, requests, responses, canonical, True)
+
+    cassette = IndexedCassette(data, digest, [], [])
+    cassette.requests, cassette.responses = vf.deserialize_cassette(cassette.text)
+    if index is not None:
+        encoded = encode_interactions(cassette.requests, cassette.responses)
+        if encoded is not None:
+            index.put(digest, encoded)
+    return cassette
+
+
+def append_serialized(text: str, requests: list, responses: list) -> str | None:
+    """*text* with the given interactions appended, as serialized YAML.
+
+    *text* must be the serializer's own output (an index entry with
+    ``canonical`` set); the result is then byte-identical to serializing
+    the old and new interactions together. Returns ``None`` when that
+    cannot be guaranteed — an unexpected document frame, or anchors in the
+    appended part (PyYAML numbers anchors per document, so a spliced
+    ``&id001`` could collide) — and the caller re-serializes instead.
+
+    Like :func:`vcr_format.serialize_cassette`, this converts the response
+    bodies of the appended interactions to ``str`` in place.
+    """
+    if not requests:
+        return text
+    if text == f"interactions: []\n{_YAML_TAIL}":
+        return None
+    if not (text.startswith(_YAML_HEAD) and text.endswith(_YAML_TAIL)):
+        return None
+    addition = vf.serialize_cassette({"requests": requests, "responses": responses})
+    if not (addition.startswith(_YAML_HEAD) and addition.endswith(_YAML_TAIL)):
+        return None
+    appended = addition[len(_YAML_HEAD) :]
+    if "&id" in appended:
+        return None
+    return text[: -len(_YAML_TAIL)] + appended
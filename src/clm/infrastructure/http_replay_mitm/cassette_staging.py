@@ -15,6 +15,7 @@ from pathlib import Path
 from clm.core.http_replay_trace import get_writer
 from clm.infrastructure.http_replay_mitm.http_replay_cassette import (
     CassettePaths,
+    default_cassette_index,
     merge_staging_into_canonical,
     write_completion_marker,
 )
@@ -85,6 +86,7 @@ def merge_mitmproxy_cassette_staging(
                 # orphan sweep keeps the deduped fold (preserve_sequence
                 # defaults to False there).
                 preserve_sequence=True,
+                index=default_cassette_index(),
             )
         except Exception as exc:  # noqa: BLE001 — never mask the build result
             logger.warning(
@@ -161,6 +163,7 @@ def sweep_orphan_cassette_staging_files(canonical_paths: Iterable[Path]) -> int:
             merged = merge_staging_into_canonical(
                 CassettePaths(canonical=canonical, staging=synthetic),
                 sweep_orphans=True,
+                index=default_cassette_index(),
             )
         except Exception as exc:  # noqa: BLE001 — defensive
             logger.warning(
@@ -24,10 +24,15 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from clm.infrastructure.http_replay_mitm.cassette_index import CassetteIndex
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +50,40 @@ _COMPLETION_MARKER_SUFFIX = ".completed"
 _COMPLETION_MARKER_SCHEMA = 1
 _MERGE_LOCK_TIMEOUT_SECONDS = 300.0
 
+#: Environment variable overriding :func:`default_index_path`.
+INDEX_PATH_ENV_VAR = "CLM_HTTP_REPLAY_INDEX"
+
+# Open indexes by path; merges run per canonical and share one connection.
+_indexes: dict[Path, CassetteIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def default_index_path() -> Path:
+    """Per-user location of the parsed-cassette index (outside every course repository).
+
+    ``$CLM_HTTP_REPLAY_INDEX`` overrides it (the test suite points it at a
+    per-worker temp file).
+    """
+    import platformdirs
+
+    env = os.environ.get(INDEX_PATH_ENV_VAR)
+    if env:
+        return Path(env)
+
+    return Path(platformdirs.user_cache_dir("clm")) / "http-replay-index.sqlite"
+
+
+def default_cassette_index() -> CassetteIndex:
+    """The process-wide index at :func:`default_index_path`."""
+    from clm.infrastructure.http_replay_mitm.cassette_index import CassetteIndex
+
+    path = default_index_path()
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = CassetteIndex(path)
+        return index
+
 
 @dataclass(frozen=True)
 class CassettePaths:
@@ -80,6 +119,7 @@ def merge_staging_into_canonical(
     sweep_orphans: bool = False,
     overwrite_existing: bool = False,
     preserve_sequence: bool = False,
+    index: CassetteIndex | None = None,
 ) -> int:
     """Merge per-worker staging files into the canonical cassette.
 
@@ -103,6 +143,14 @@ def merge_staging_into_canonical(
     other by request fingerprint (:func:`_dedup_key`). The merged
     cassette is written atomically via :func:`os.replace`.
 
+    With an *index* (see
+    :mod:`~clm.infrastructure.http_replay_mitm.cassette_index`) the
+    canonical is read from the index instead of re-parsed, and a merge that
+    only appends splices the new interactions' YAML onto the canonical text
+    rather than re-serializing every interaction. The bytes written are the
+    same either way. The merged result is stored in the index, so the next
+    replay start-up and the next merge skip the YAML parse too.
+
     Args:
         paths: Canonical + this worker's staging location. The ``staging``
             field is only relevant for naming; the merge globs every
@@ -136,6 +184,8 @@ def merge_staging_into_canonical(
             *is* the complete recording and replaces canonical wholesale;
             otherwise (new-episodes) the staging sequence is appended after the
             existing canonical entries.
+        index: Parsed-cassette index to read canonical from and to record
+            the merged cassette in; ``None`` parses the YAML every time.
 
     Returns:
         Number of staging files folded into the canonical (markered
@@ -148,6 +198,12 @@ def merge_staging_into_canonical(
     # without requiring the [replay] install.
     from filelock import FileLock, Timeout
 
+    from clm.infrastructure.http_replay_mitm.cassette_index import (
+        append_serialized,
+        cassette_digest,
+        encode_interactions,
+        read_cassette,
+    )
     from clm.infrastructure.http_replay_mitm.vcr_format import (
         load_cassette,
         serialize_cassette,
@@ -206,14 +262,31 @@ def merge_staging_into_canonical(
 
             canonical_requests: list = []
             canonical_responses: list = []
+            # The canonical's text, when it is known to be the serializer's
+            # own output for the loaded interactions — only then may new
+            # interactions be spliced onto it (see ``append_serialized``).
+            canonical_text: str | None = None
             if canonical.exists():
                 try:
-                    canonical_requests, canonical_responses = load_cassette(canonical)
+                    loaded = read_cassette(canonical, index)
                 except Exception as exc:  # noqa: BLE001 — defensive
                     logger.warning(
                         f"Could not load existing canonical cassette '{canonical}' "
                         f"before merge ({type(exc).__name__}: {exc}); treating as empty."
                     )
+                else:
+                    canonical_requests = loaded.requests
+                    canonical_responses = loaded.responses
+                    if loaded.canonical:
+                        canonical_text = loaded.text
+                    _trace(
+                        "cassette.merge.canonical_loaded",
+                        {
+                            "canonical": str(canonical),
+                            "from_index": loaded.from_index,
+                            "interactions": len(canonical_requests),
+                        },
+                    )
 
             # ``preserve_sequence`` (mitmproxy transport) keeps every distinct
             # (request, response) interaction in recorded order, deduping only
@@ -388,10 +461,31 @@ def merge_staging_into_canonical(
             # orphans must not touch canonical — discarding does not
             # change its content.
             if markered:
-                payload = serialize_cassette(
-                    {"requests": merged_requests, "responses": merged_responses}
+                # Encoded before serializing: the serializer turns response
+                # bodies into ``str`` in place, and the index entry must hold
+                # what a YAML load returns.
+                entry = (
+                    encode_interactions(merged_requests, merged_responses)
+                    if index is not None
+                    else None
                 )
-                atomic_write_text(canonical, payload)
+                payload = None
+                # Append-only folds keep canonical as the merged prefix.
+                if canonical_text is not None and not overwrite_existing:
+                    n_existing = len(canonical_requests)
+                    payload = append_serialized(
+                        canonical_text,
+                        merged_requests[n_existing:],
+                        merged_responses[n_existing:],
+                    )
+                if payload is None:
+                    payload = serialize_cassette(
+                        {"requests": merged_requests, "responses": merged_responses}
+                    )
+                if payload != canonical_text:
+                    atomic_write_text(canonical, payload)
+                if index is not None and entry is not None:
+                    index.put(cassette_digest(payload.encode("utf-8")), entry, canonical=True)
 
             for staging_path in markered:
                 _delete_quietly(staging_path)
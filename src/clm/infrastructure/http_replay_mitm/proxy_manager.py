@@ -122,6 +122,7 @@ class MitmproxyManager:
         extra_args: list[str] | None = None,
         ignore_hosts: tuple[str, ...] | list[str] = (),
         trace_dir: Path | None = None,
+        index_path: Path | None = None,
     ) -> None:
         self.cassette_path = Path(cassette_path)
         self.mode = mode
@@ -132,6 +133,10 @@ class MitmproxyManager:
         # ``scripts/analyze_http_replay_trace.py`` can cross-reference the
         # worker socket stream against the proxy's interception decisions.
         self.trace_dir = Path(trace_dir) if trace_dir is not None else None
+        # Parsed-cassette index (``cassette_index``): the addon loads each
+        # canonical cassette from it instead of parsing the YAML when the
+        # file's bytes were seen before. ``None`` always parses.
+        self.index_path = Path(index_path) if index_path is not None else None
         self.listen_port: int | None = None  # set on start
         # mitmproxy stores its CA + config under ``confdir`` — including the
         # CA **private key**. The build passes a per-user directory
@@ -297,6 +302,8 @@ class MitmproxyManager:
             cmd.extend(["--set", f"confdir={self.confdir}"])
         if self.trace_dir is not None:
             cmd.extend(["--set", f"clm_trace_dir={self.trace_dir}"])
+        if self.index_path is not None:
+            cmd.extend(["--set", f"clm_cassette_index={self.index_path}"])
         cmd.extend(self.extra_args)
 
         env = os.environ.copy()
@@ -1,8 +1,27 @@
-"""SQLite-based cache for LLM summaries."""
-
+"""SQLite-based cache for LLM summaries, titles, translations and coverage verdicts.
+
+All four caches live in one SQLite file (``clm-llm.sqlite``), each in its own
+table. Instances opened on the same file share a single process-wide
+connection (:class:`_CacheConnection`) in WAL mode, so a run that opens several
+caches — or opens and closes one per deck — does not pay for a connection
+and a schema check each time. ``put`` only stages the row: pending rows are
+committed together after :data:`WRITE_FLUSH_INTERVAL` seconds, once
+:data:`MAX_PENDING_WRITES` have accumulated, when the last instance on the
+file is closed, or at interpreter exit. Staged rows are visible to ``get`` and
+``get_many`` immediately. ``get_many`` resolves a whole run's keys in a few
+queries instead of one lookup per cell or notebook.
+"""
+
+from __future__ import annotations
+
+import atexit
 import functools
 import logging
 import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -14,19 +33,231 @@ logger = logging.getLogger(__name__)
 # canonical home.
 CACHE_DB_NAME = "clm-llm.sqlite"
 
+# Seconds a staged ``put`` may wait before it is committed.
+WRITE_FLUSH_INTERVAL = 1.0
+# Staged rows (across all tables of one file) that force an immediate commit.
+MAX_PENDING_WRITES = 256
+# Keys per batched ``get_many`` query; keeps the statement well below SQLite's
+# host-parameter limit even for the four-column coverage key.
+_GET_MANY_CHUNK = 200
 
-class SummaryCache:
-    """Cache LLM summaries keyed by (content_hash, audience, model, language, style)."""
+
+class _CacheConnection:
+    """The process-wide connection to one LLM cache file.
+
+    Obtained with :meth:`acquire` and returned with :meth:`release`; the
+    connection is closed (after committing staged rows) when the last user
+    releases it. All access goes through an internal lock, so caches may be
+    shared with worker threads.
+    """
+
+    _open: dict[str, _CacheConnection] = {}
+    _open_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.RLock()
+        # table -> {key tuple: value tuple}, plus the INSERT used to flush it.
+        self._pending: dict[str, dict[tuple, tuple]] = {}
+        self._insert_sql: dict[str, str] = {}
+        self._pending_count = 0
+        self._timer: threading.Timer | None = None
+        self._refs = 0
+        self._closed = False
+
+    @classmethod
+    def acquire(cls, db_path: Path) -> _CacheConnection:
+        path = str(Path(db_path).resolve())
+        with cls._open_lock:
+            connection = cls._open.get(path)
+            if connection is None:
+                connection = cls(path)
+                cls._open[path] = connection
+            connection._refs += 1
+            return connection
+
+    def release(self) -> None:
+        with self._open_lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            self._open.pop(self.path, None)
+        with self._lock:
+            self._flush_locked()
+            self._closed = True
+            self._conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run schema changes or deletes after committing staged rows."""
+        with self._lock:
+            self._flush_locked()
+            with self._conn:
+                yield self._conn
+
+    def query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def put(
+        self,
+        table: str,
+        key_columns: tuple[str, ...],
+        value_columns: tuple[str, ...],
+        key: tuple,
+        values: tuple,
+    ) -> None:
+        """Stage one ``INSERT OR REPLACE``; it is committed by the next flush."""
+        with self._lock:
+            if table not in self._insert_sql:
+                columns = (*key_columns, *value_columns)
+                self._insert_sql[table] = (
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})"
+                )
+            rows = self._pending.setdefault(table, {})
+            if key not in rows:
+                self._pending_count += 1
+            rows[key] = values
+            if self._pending_count >= MAX_PENDING_WRITES:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(WRITE_FLUSH_INTERVAL, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def get_many(
+        self,
+        table: str,
+        key_columns: tuple[str, ...],
+        value_columns: tuple[str, ...],
+        keys: Iterable[tuple],
+    ) -> dict[tuple, tuple]:
+        """Return ``{key: values}`` for every key present (staged or stored)."""
+        wanted = list(dict.fromkeys(keys))
+        width = len(key_columns)
+        row_params = "(" + ", ".join("?" * width) + ")"
+        select = (
+            f"SELECT {', '.join((*key_columns, *value_columns))} FROM {table} "
+            f"WHERE ({', '.join(key_columns)}) IN (VALUES "
+        )
+        found: dict[tuple, tuple] = {}
+        with self._lock:
+            staged = self._pending.get(table, {})
+            missing = [key for key in wanted if key not in staged]
+            for key in wanted:
+                if key in staged:
+                    found[key] = staged[key]
+            for start in range(0, len(missing), _GET_MANY_CHUNK):
+                chunk = missing[start : start + _GET_MANY_CHUNK]
+                sql = select + ", ".join([row_params] * len(chunk)) + ")"
+                params = [part for key in chunk for part in key]
+                for row in self._conn.execute(sql, params):
+                    found[tuple(row[:width])] = tuple(row[width:])
+        return found
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._closed or not self._pending_count:
+            return
+        with self._conn:
+            for table, rows in self._pending.items():
+                self._conn.executemany(
+                    self._insert_sql[table], [(*key, *values) for key, values in rows.items()]
+                )
+        self._pending.clear()
+        self._pending_count = 0
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._open_lock:
+            connections = list(cls._open.values())
+        for connection in connections:
+            try:
+                connection.flush()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not commit LLM cache writes to {connection.path}: {e}")
+
+
+atexit.register(_CacheConnection.flush_all)
+
+
+class _CacheTable(ABC):
+    """Base for one table of the shared LLM cache file.
+
+    Subclasses name the table and its key/value columns, create or migrate
+    the table in ``_migrate``, and expose typed ``get``/``get_many``/``put``
+    wrappers around :meth:`_get_rows` and :meth:`_put_row`.
+    """
+
+    TABLE: str
+    KEY_COLUMNS: tuple[str, ...]
+    VALUE_COLUMNS: tuple[str, ...]
 
     def __init__(self, db_path: Path):
         self.db_path = db_path
-        self._conn = sqlite3.connect(str(db_path))
-        self._migrate()
+        self._connection: _CacheConnection | None = _CacheConnection.acquire(db_path)
+        try:
+            self._migrate()
+        except Exception:
+            self._db.release()
+            raise
+
+    @property
+    def _db(self) -> _CacheConnection:
+        if self._connection is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed cache.")
+        return self._connection
+
+    @abstractmethod
+    def _migrate(self) -> None:
+        """Create the table, or bring an existing one up to date."""
+
+    def _columns(self) -> set[str]:
+        return {row[1] for row in self._db.query(f"PRAGMA table_info({self.TABLE})")}
+
+    def _get_rows(self, keys: Iterable[tuple]) -> dict[tuple, tuple]:
+        return self._db.get_many(self.TABLE, self.KEY_COLUMNS, self.VALUE_COLUMNS, keys)
+
+    def _put_row(self, key: tuple, values: tuple) -> None:
+        self._db.put(self.TABLE, self.KEY_COLUMNS, self.VALUE_COLUMNS, key, values)
+
+    def _invalidate_prompt_version(self, prompt_version: str) -> int:
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE prompt_version!=?", (prompt_version,)
+            )
+        return cursor.rowcount
+
+    def flush(self) -> None:
+        """Commit staged writes now instead of waiting for the timer."""
+        self._db.flush()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.release()
+            self._connection = None
+
+
+class SummaryCache(_CacheTable):
+    """Cache LLM summaries keyed by (content_hash, audience, model, language, style)."""
+
+    TABLE = "summaries"
+    KEY_COLUMNS = ("content_hash", "audience", "model", "language", "style")
+    VALUE_COLUMNS = ("summary",)
 
     def _migrate(self):
         """Create or migrate the summaries table."""
-        cursor = self._conn.execute("PRAGMA table_info(summaries)")
-        columns = {row[1] for row in cursor.fetchall()}
+        columns = self._columns()
 
         if not columns:
             # Fresh database
@@ -34,33 +265,32 @@ class SummaryCache:
         elif "language" not in columns:
             # Very old table without language — rebuild with both language and style
             logger.info("Migrating summary cache to include language and style columns")
-            self._conn.execute("ALTER TABLE summaries RENAME TO summaries_old")
-            self._create_current_table()
-            self._conn.execute(
-                """INSERT OR IGNORE INTO summaries
-                   (content_hash, audience, model, language, style, summary, created_at)
-                   SELECT content_hash, audience, model, 'en', 'prose', summary, created_at
-                   FROM summaries_old"""
-            )
-            self._conn.execute("DROP TABLE summaries_old")
-            self._conn.commit()
+            with self._db.transaction() as conn:
+                conn.execute("ALTER TABLE summaries RENAME TO summaries_old")
+                self._create_current_table(conn)
+                conn.execute(
+                    """INSERT OR IGNORE INTO summaries
+                       (content_hash, audience, model, language, style, summary, created_at)
+                       SELECT content_hash, audience, model, 'en', 'prose', summary, created_at
+                       FROM summaries_old"""
+                )
+                conn.execute("DROP TABLE summaries_old")
         elif "style" not in columns:
             # Has language but no style — add style column
             logger.info("Migrating summary cache to include style column")
-            self._conn.execute("ALTER TABLE summaries RENAME TO summaries_old")
-            self._create_current_table()
-            self._conn.execute(
-                """INSERT OR IGNORE INTO summaries
-                   (content_hash, audience, model, language, style, summary, created_at)
-                   SELECT content_hash, audience, model, language, 'prose', summary, created_at
-                   FROM summaries_old"""
-            )
-            self._conn.execute("DROP TABLE summaries_old")
-            self._conn.commit()
+            with self._db.transaction() as conn:
+                conn.execute("ALTER TABLE summaries RENAME TO summaries_old")
+                self._create_current_table(conn)
+                conn.execute(
+                    """INSERT OR IGNORE INTO summaries
+                       (content_hash, audience, model, language, style, summary, created_at)
+                       SELECT content_hash, audience, model, language, 'prose', summary, created_at
+                       FROM summaries_old"""
+                )
+                conn.execute("DROP TABLE summaries_old")
 
-    def _create_current_table(self):
-        self._conn.execute(
-            """CREATE TABLE summaries (
+    def _create_current_table(self, conn: sqlite3.Connection | None = None):
+        sql = """CREATE TABLE summaries (
                 content_hash TEXT NOT NULL,
                 audience TEXT NOT NULL,
                 model TEXT NOT NULL,
@@ -70,8 +300,11 @@ class SummaryCache:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 PRIMARY KEY (content_hash, audience, model, language, style)
             )"""
-        )
-        self._conn.commit()
+        if conn is not None:
+            conn.execute(sql)
+            return
+        with self._db.transaction() as conn:
+            conn.execute(sql)
 
     def get(
         self,
@@ -81,13 +314,19 @@ class SummaryCache:
         language: str = "en",
         style: str = "prose",
     ) -> str | None:
-        row = self._conn.execute(
-            "SELECT summary FROM summaries "
-            "WHERE content_hash=? AND audience=? AND model=? AND language=? AND style=?",
-            (content_hash, audience, model, language, style),
-        ).fetchone()
+        key = (content_hash, audience, model, language, style)
+        row = self._get_rows([key]).get(key)
         return row[0] if row else None
 
+    def get_many(
+        self, keys: Iterable[tuple[str, str, str, str, str]]
+    ) -> dict[tuple[str, str, str, str, str], str]:
+        """Look up many ``(content_hash, audience, model, language, style)`` keys.
+
+        Returns only the hits, keyed like the input.
+        """
+        return {key: row[0] for key, row in self._get_rows(keys).items()}
+
     def put(
         self,
         content_hash: str,
@@ -97,19 +336,10 @@ class SummaryCache:
         language: str = "en",
         style: str = "prose",
     ):
-        self._conn.execute(
-            """INSERT OR REPLACE INTO summaries
-               (content_hash, audience, model, language, style, summary)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (content_hash, audience, model, language, style, summary),
-        )
-        self._conn.commit()
-
-    def close(self):
-        self._conn.close()
+        self._put_row((content_hash, audience, model, language, style), (summary,))
 
 
-class TitleSuggestionCache:
+class TitleSuggestionCache(_CacheTable):
     """Cache LLM-suggested slide titles keyed by ``(content_hash, prompt_version, lang)``.
 
     Used by ``clm slides assign-ids --llm-suggest`` to avoid re-querying
@@ -119,35 +349,33 @@ class TitleSuggestionCache:
     handover) but lives in its own table.
     """
 
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self._conn = sqlite3.connect(str(db_path))
-        self._migrate()
+    TABLE = "title_suggestions"
+    KEY_COLUMNS = ("content_hash", "prompt_version", "lang")
+    VALUE_COLUMNS = ("suggested_title",)
 
     def _migrate(self) -> None:
-        cursor = self._conn.execute("PRAGMA table_info(title_suggestions)")
-        columns = {row[1] for row in cursor.fetchall()}
-        if not columns:
-            self._conn.execute(
-                """CREATE TABLE title_suggestions (
-                    content_hash    TEXT NOT NULL,
-                    prompt_version  TEXT NOT NULL,
-                    lang            TEXT NOT NULL,
-                    suggested_title TEXT NOT NULL,
-                    created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (content_hash, prompt_version, lang)
-                )"""
-            )
-            self._conn.commit()
+        if not self._columns():
+            with self._db.transaction() as conn:
+                conn.execute(
+                    """CREATE TABLE title_suggestions (
+                        content_hash    TEXT NOT NULL,
+                        prompt_version  TEXT NOT NULL,
+                        lang            TEXT NOT NULL,
+                        suggested_title TEXT NOT NULL,
+                        created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (content_hash, prompt_version, lang)
+                    )"""
+                )
 
     def get(self, content_hash: str, prompt_version: str, lang: str = "en") -> str | None:
-        row = self._conn.execute(
-            "SELECT suggested_title FROM title_suggestions "
-            "WHERE content_hash=? AND prompt_version=? AND lang=?",
-            (content_hash, prompt_version, lang),
-        ).fetchone()
+        key = (content_hash, prompt_version, lang)
+        row = self._get_rows([key]).get(key)
         return row[0] if row else None
 
+    def get_many(self, keys: Iterable[tuple[str, str, str]]) -> dict[tuple[str, str, str], str]:
+        """Look up many ``(content_hash, prompt_version, lang)`` keys; hits only."""
+        return {key: row[0] for key, row in self._get_rows(keys).items()}
+
     def put(
         self,
         content_hash: str,
@@ -155,28 +383,14 @@ class TitleSuggestionCache:
         suggested_title: str,
         lang: str = "en",
     ) -> None:
-        self._conn.execute(
-            """INSERT OR REPLACE INTO title_suggestions
-               (content_hash, prompt_version, lang, suggested_title)
-               VALUES (?, ?, ?, ?)""",
-            (content_hash, prompt_version, lang, suggested_title),
-        )
-        self._conn.commit()
+        self._put_row((content_hash, prompt_version, lang), (suggested_title,))
 
     def invalidate_prompt_version(self, prompt_version: str) -> int:
         """Delete entries whose prompt version no longer matches."""
-        cursor = self._conn.execute(
-            "DELETE FROM title_suggestions WHERE prompt_version!=?",
-            (prompt_version,),
-        )
-        self._conn.commit()
-        return cursor.rowcount
-
-    def close(self) -> None:
-        self._conn.close()
+        return self._invalidate_prompt_version(prompt_version)
 
 
-class TranslationCache:
+class TranslationCache(_CacheTable):
     """Cache translated cell bodies for ``clm slides translate`` (Issue #232).
 
     Keyed by ``(content_hash, prompt_version, source_lang, target_lang, role)``:
@@ -191,28 +405,25 @@ class TranslationCache:
     caches but lives in its own table.
     """
 
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self._conn = sqlite3.connect(str(db_path))
-        self._migrate()
+    TABLE = "translations"
+    KEY_COLUMNS = ("content_hash", "prompt_version", "source_lang", "target_lang", "role")
+    VALUE_COLUMNS = ("translation",)
 
     def _migrate(self) -> None:
-        cursor = self._conn.execute("PRAGMA table_info(translations)")
-        columns = {row[1] for row in cursor.fetchall()}
-        if not columns:
-            self._conn.execute(
-                """CREATE TABLE translations (
-                    content_hash   TEXT NOT NULL,
-                    prompt_version TEXT NOT NULL,
-                    source_lang    TEXT NOT NULL,
-                    target_lang    TEXT NOT NULL,
-                    role           TEXT NOT NULL,
-                    translation    TEXT NOT NULL,
-                    created_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (content_hash, prompt_version, source_lang, target_lang, role)
-                )"""
-            )
-            self._conn.commit()
+        if not self._columns():
+            with self._db.transaction() as conn:
+                conn.execute(
+                    """CREATE TABLE translations (
+                        content_hash   TEXT NOT NULL,
+                        prompt_version TEXT NOT NULL,
+                        source_lang    TEXT NOT NULL,
+                        target_lang    TEXT NOT NULL,
+                        role           TEXT NOT NULL,
+                        translation    TEXT NOT NULL,
+                        created_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (content_hash, prompt_version, source_lang, target_lang, role)
+                    )"""
+                )
 
     def get(
         self,
@@ -222,13 +433,17 @@ class TranslationCache:
         target_lang: str,
         role: str,
     ) -> str | None:
-        row = self._conn.execute(
-            "SELECT translation FROM translations WHERE content_hash=? AND prompt_version=? "
-            "AND source_lang=? AND target_lang=? AND role=?",
-            (content_hash, prompt_version, source_lang, target_lang, role),
-        ).fetchone()
+        key = (content_hash, prompt_version, source_lang, target_lang, role)
+        row = self._get_rows([key]).get(key)
         return row[0] if row else None
 
+    def get_many(
+        self, keys: Iterable[tuple[str, str, str, str, str]]
+    ) -> dict[tuple[str, str, str, str, str], str]:
+        """Look up many ``(content_hash, prompt_version, source_lang, target_lang,
+        role)`` keys; hits only."""
+        return {key: row[0] for key, row in self._get_rows(keys).items()}
+
     def put(
         self,
         content_hash: str,
@@ -238,28 +453,16 @@ class TranslationCache:
         role: str,
         translation: str,
     ) -> None:
-        self._conn.execute(
-            """INSERT OR REPLACE INTO translations
-               (content_hash, prompt_version, source_lang, target_lang, role, translation)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (content_hash, prompt_version, source_lang, target_lang, role, translation),
+        self._put_row(
+            (content_hash, prompt_version, source_lang, target_lang, role), (translation,)
         )
-        self._conn.commit()
 
     def invalidate_prompt_version(self, prompt_version: str) -> int:
         """Delete entries whose prompt version no longer matches."""
-        cursor = self._conn.execute(
-            "DELETE FROM translations WHERE prompt_version!=?",
-            (prompt_version,),
-        )
-        self._conn.commit()
-        return cursor.rowcount
-
-    def close(self) -> None:
-        self._conn.close()
+        return self._invalidate_prompt_version(prompt_version)
 
 
-class CoverageCache:
+class CoverageCache(_CacheTable):
     """Cache LLM voiceover-coverage verdicts.
 
     Keyed by ``(slide_hash, voiceover_hash, prompt_version, lang)`` per
@@ -272,28 +475,25 @@ class CoverageCache:
     ``clm-llm.sqlite``) but lives in its own table.
     """
 
-    def __init__(self, db_path: Path):
-        self.db_path = db_path
-        self._conn = sqlite3.connect(str(db_path))
-        self._migrate()
+    TABLE = "coverage"
+    KEY_COLUMNS = ("slide_hash", "voiceover_hash", "prompt_version", "lang")
+    VALUE_COLUMNS = ("verdict", "gap_details")
 
     def _migrate(self) -> None:
-        cursor = self._conn.execute("PRAGMA table_info(coverage)")
-        columns = {row[1] for row in cursor.fetchall()}
-        if not columns:
-            self._conn.execute(
-                """CREATE TABLE coverage (
-                    slide_hash      TEXT NOT NULL,
-                    voiceover_hash  TEXT NOT NULL,
-                    prompt_version  TEXT NOT NULL,
-                    lang            TEXT NOT NULL,
-                    verdict         TEXT NOT NULL,
-                    gap_details     TEXT,
-                    checked_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (slide_hash, voiceover_hash, prompt_version, lang)
-                )"""
-            )
-            self._conn.commit()
+        if not self._columns():
+            with self._db.transaction() as conn:
+                conn.execute(
+                    """CREATE TABLE coverage (
+                        slide_hash      TEXT NOT NULL,
+                        voiceover_hash  TEXT NOT NULL,
+                        prompt_version  TEXT NOT NULL,
+                        lang            TEXT NOT NULL,
+                        verdict         TEXT NOT NULL,
+                        gap_details     TEXT,
+                        checked_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (slide_hash, voiceover_hash, prompt_version, lang)
+                    )"""
+                )
 
     def get(
         self,
@@ -303,15 +503,21 @@ class CoverageCache:
         lang: str,
     ) -> tuple[str, str | None] | None:
         """Return ``(verdict, gap_details_json)`` or ``None`` on a miss."""
-        row = self._conn.execute(
-            "SELECT verdict, gap_details FROM coverage "
-            "WHERE slide_hash=? AND voiceover_hash=? AND prompt_version=? AND lang=?",
-            (slide_hash, voiceover_hash, prompt_version, lang),
-        ).fetchone()
+        key = (slide_hash, voiceover_hash, prompt_version, lang)
+        row = self._get_rows([key]).get(key)
         if row is None:
             return None
         return (row[0], row[1])
 
+    def get_many(
+        self, keys: Iterable[tuple[str, str, str, str]]
+    ) -> dict[tuple[str, str, str, str], tuple[str, str | None]]:
+        """Look up many ``(slide_hash, voiceover_hash, prompt_version, lang)`` keys.
+
+        Returns ``{key: (verdict, gap_details_json)}`` for the hits only.
+        """
+        return {key: (row[0], row[1]) for key, row in self._get_rows(keys).items()}
+
     def put(
         self,
         slide_hash: str,
@@ -321,22 +527,11 @@ class CoverageCache:
         verdict: str,
         gap_details: str | None,
     ) -> None:
-        self._conn.execute(
-            """INSERT OR REPLACE INTO coverage
-               (slide_hash, voiceover_hash, prompt_version, lang, verdict, gap_details)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (slide_hash, voiceover_hash, prompt_version, lang, verdict, gap_details),
-        )
-        self._conn.commit()
+        self._put_row((slide_hash, voiceover_hash, prompt_version, lang), (verdict, gap_details))
 
     def invalidate_prompt_version(self, prompt_version: str) -> int:
         """Delete entries whose prompt version no longer matches."""
-        cursor = self._conn.execute(
-            "DELETE FROM coverage WHERE prompt_version!=?",
-            (prompt_version,),
-        )
-        self._conn.commit()
-        return cursor.rowcount
+        return self._invalidate_prompt_version(prompt_version)
 
     def iter_entries(self) -> list[tuple[str, str, str, str, str, str | None, str]]:
         """Return every cached entry for ``coverage --dump``.
@@ -345,16 +540,14 @@ class CoverageCache:
         verdict, gap_details, checked_at)`` ordered by check time so the
         most recent verdicts surface first.
         """
-        rows = self._conn.execute(
+        self._db.flush()
+        rows = self._db.query(
             "SELECT slide_hash, voiceover_hash, prompt_version, lang, "
             "verdict, gap_details, checked_at "
             "FROM coverage ORDER BY checked_at DESC, slide_hash"
-        ).fetchall()
+        )
         return [(r[0], r[1], r[2], r[3], r[4], r[5], r[6]) for r in rows]
 
-    def close(self) -> None:
-        self._conn.close()
-
 
 @dataclass(frozen=True)
 class CacheDirResolution:
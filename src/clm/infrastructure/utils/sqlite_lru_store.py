@@ -0,0 +1,127 @@
+"""Size-bounded, least-recently-used store in one SQLite file.
+
+Shared plumbing of the on-disk caches that keep their entries as rows of a
+single table (:mod:`clm.voiceover.artifact_store`,
+:mod:`clm.infrastructure.http_replay_mitm.cassette_index`): one lazily
+opened connection per store guarded by a lock, a ``size`` and an
+``accessed_at`` column per row, and eviction of the least recently accessed
+rows once the summed sizes exceed ``max_bytes``. Subclasses own their
+schema and queries.
+
+The summed size is kept as a running total, read from the table once and
+then adjusted by each write, so a put costs a primary-key lookup instead of
+a full-table ``SUM``. Other processes sharing the file make it drift; it is
+re-read whenever it crosses the bound, before anything is deleted.
+
+Stdlib only: the cassette index imports this module by path inside the
+isolated ``mitmdump`` interpreter.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import ClassVar, Literal, overload
+
+
+class SqliteLruStore:
+    """Base class of a size-bounded SQLite store.
+
+    Subclasses set :attr:`TABLE`, :attr:`KEY_COLUMNS` and :attr:`SCHEMA` (which
+    must create ``TABLE`` with the key columns, ``size`` and ``accessed_at``)
+    and call :meth:`_connect` and :meth:`_upsert_locked` while holding
+    ``self._lock``. Nothing is created on disk until the first write.
+    """
+
+    TABLE: ClassVar[str]
+    KEY_COLUMNS: ClassVar[tuple[str, ...]]
+    SCHEMA: ClassVar[str]
+
+    def __init__(self, path: Path, *, max_bytes: int | None):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._total: int | None = None
+
+    def close(self) -> None:
+        """Close the connection; the next access reopens it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._total = None
+
+    @overload
+    def _connect(self, *, create: Literal[True]) -> sqlite3.Connection: ...
+
+    @overload
+    def _connect(self, *, create: bool) -> sqlite3.Connection | None: ...
+
+    def _connect(self, *, create: bool) -> sqlite3.Connection | None:
+        """The open connection, or None when the file is missing and not *create*."""
+        if self._conn is None:
+            if not create and not self.path.exists():
+                return None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _upsert_locked(
+        self,
+        conn: sqlite3.Connection,
+        key: tuple[object, ...],
+        values: dict[str, object],
+        size: int,
+    ) -> int:
+        """Insert or replace the row of *key*, then evict down to the bound.
+
+        *values* holds the non-key columns other than ``size``. The new row
+        itself is never evicted. Returns the number of rows evicted; call
+        inside the caller's transaction.
+        """
+        match = " AND ".join(f"{column} = ?" for column in self.KEY_COLUMNS)
+        previous = conn.execute(f"SELECT size FROM {self.TABLE} WHERE {match}", key).fetchone()
+        columns = (*self.KEY_COLUMNS, "size", *values)
+        conn.execute(
+            f"INSERT OR REPLACE INTO {self.TABLE} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})",
+            (*key, size, *values.values()),
+        )
+        if self._total is not None:
+            self._total += size - (previous[0] if previous else 0)
+        return self._evict_locked(conn, keep=key)
+
+    def _evict_locked(self, conn: sqlite3.Connection, *, keep: tuple[object, ...]) -> int:
+        if self.max_bytes is None:
+            return 0
+        if self._total is not None and self._total <= self.max_bytes:
+            return 0
+        # First write, or over the bound: read the exact figure, since other
+        # processes may have written to or evicted from the same file.
+        (total,) = conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}").fetchone()
+        victims = []
+        if total > self.max_bytes:
+            key_list = ", ".join(self.KEY_COLUMNS)
+            for *row_key, size in conn.execute(
+                f"SELECT {key_list}, size FROM {self.TABLE} ORDER BY accessed_at"
+            ):
+                if total <= self.max_bytes:
+                    break
+                if tuple(row_key) == keep:
+                    continue
+                victims.append(tuple(row_key))
+                total -= size
+            match = " AND ".join(f"{column} = ?" for column in self.KEY_COLUMNS)
+            conn.executemany(f"DELETE FROM {self.TABLE} WHERE {match}", victims)
+        self._total = total
+        return len(victims)
+
+    def _forget_total_locked(self) -> None:
+        """Re-read the summed size on the next write (after bulk deletes)."""
+        self._total = None
@@ -0,0 +1,252 @@
+"""Queue-depth driven rebalancing of a build's worker pools.
+
+``WorkerPoolManager.start_pools`` starts a fixed number of workers per type
+for the whole build, but the demand per type is anything but fixed: while
+notebooks execute, the plantuml/drawio workers sit idle; early in a build
+the diagram queue may be the long one. With ``[worker_management]
+autoscale`` enabled the pool manager runs an :class:`AutoscaleController`
+next to its health monitor. Every tick it reads, per job type, the number of
+pending jobs in ``clm_jobs.db`` and the states of the pool's own workers,
+plus how many more workers the host's available RAM can take (see
+:func:`~clm.infrastructure.workers.pool_size_cap.available_worker_headroom`),
+and decides which workers to start and which idle ones to drain.
+
+Rules
+-----
+
+* **Global budget.** The pool never holds more than ``budget`` live workers
+  (default: the sum of the configured per-type counts), and no single type
+  grows beyond ``max_per_type`` (the budget clamped by the same CPU/RAM/
+  operator caps :func:`compute_pool_size_cap` applies at pool start).
+* **Floor.** A type keeps at least ``min_per_type`` workers (default 1): the
+  build refuses to submit jobs of a type with no workers at all.
+* **Hysteresis.** A type must look *starved* (a backlog of more than
+  ``backlog_per_worker`` jobs per live worker and no idle worker) for
+  ``scale_up_ticks`` consecutive ticks before it grows, and *surplus* (no
+  pending jobs, idle workers) for ``scale_down_ticks`` ticks before it
+  shrinks. After acting on a type it sits out ``cooldown_ticks`` ticks.
+* **Rebalancing.** When the budget is exhausted, a starved type takes its
+  workers from types that have had no backlog for ``scale_up_ticks`` ticks —
+  that is the Stage 3 case of idle diagram workers handing capacity to the
+  notebook queue.
+* **Memory.** Scale-ups never exceed the available-RAM headroom plus the
+  workers drained in the same tick.
+
+The controller only *decides*; it is pure and synchronous so the rules are
+testable without starting a single process. Applying a decision — starting
+workers through the pool's executor and draining idle ones without racing a
+job claim — is :class:`~clm.infrastructure.workers.pool_manager.WorkerPoolManager`'s
+job.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from clm.infrastructure.workers.pool_size_cap import compute_pool_size_cap
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AutoscalePolicy:
+    """Limits and hysteresis settings for :class:`AutoscaleController`.
+
+    Attributes:
+        budget: Maximum number of live workers across all managed types.
+        max_per_type: Maximum number of live workers of any one type.
+        min_per_type: Workers a type keeps even when it has nothing to do.
+        backlog_per_worker: Pending jobs per live worker a type tolerates
+            before it counts as starved.
+        scale_up_ticks: Consecutive starved ticks before a type grows.
+        scale_down_ticks: Consecutive surplus ticks before a type shrinks.
+        cooldown_ticks: Ticks a type sits out after it was scaled.
+        max_step: Most workers started or drained for one type in one tick.
+    """
+
+    budget: int
+    max_per_type: int
+    min_per_type: int = 1
+    backlog_per_worker: int = 2
+    scale_up_ticks: int = 2
+    scale_down_ticks: int = 5
+    cooldown_ticks: int = 2
+    max_step: int = 2
+
+    @classmethod
+    def for_counts(
+        cls,
+        counts: Iterable[int],
+        *,
+        budget: int | None = None,
+        explicit_cap: int | None = None,
+    ) -> AutoscalePolicy:
+        """Derive a policy from the per-type worker counts a pool starts with.
+
+        Args:
+            counts: Configured worker count per managed type.
+            budget: Total worker budget; ``None`` keeps the configured total,
+                so autoscaling moves capacity between types without growing
+                the pool.
+            explicit_cap: Operator cap (``--max-workers``); ``None`` reads
+                ``CLM_MAX_WORKERS`` like :func:`compute_pool_size_cap`.
+        """
+        total = budget if budget is not None else sum(c for c in counts if c > 0)
+        total = max(1, total)
+        per_type = compute_pool_size_cap(total, explicit_cap=explicit_cap).effective
+        return cls(budget=total, max_per_type=per_type)
+
+
+@dataclass(frozen=True)
+class TypeLoad:
+    """What the controller sees of one worker type in one tick.
+
+    Attributes:
+        pending: Claimable pending jobs of this type.
+        workers: Live workers of this type owned by the pool (starting,
+            idle or busy).
+        idle: How many of those are idle.
+    """
+
+    pending: int
+    workers: int
+    idle: int
+
+
+@dataclass(frozen=True)
+class ScaleDecision:
+    """Workers to start and to drain, per type. Empty dicts mean "hold"."""
+
+    start: dict[str, int] = field(default_factory=dict)
+    drain: dict[str, int] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.start or self.drain)
+
+
+class AutoscaleController:
+    """Hysteresis state plus the per-tick scaling decision.
+
+    One controller serves one pool; call :meth:`decide` once per tick with
+    a fresh view of every managed type.
+    """
+
+    def __init__(self, policy: AutoscalePolicy) -> None:
+        self.policy = policy
+        self._starved_ticks: dict[str, int] = {}
+        self._surplus_ticks: dict[str, int] = {}
+        self._cooldown: dict[str, int] = {}
+
+    def _is_starved(self, load: TypeLoad) -> bool:
+        return load.idle == 0 and load.pending > self.policy.backlog_per_worker * load.workers
+
+    def _update_counters(self, loads: Mapping[str, TypeLoad]) -> None:
+        for worker_type, load in loads.items():
+            starved = self._is_starved(load)
+            surplus = load.pending == 0 and load.idle > 0
+            self._starved_ticks[worker_type] = (
+                self._starved_ticks.get(worker_type, 0) + 1 if starved else 0
+            )
+            self._surplus_ticks[worker_type] = (
+                self._surplus_ticks.get(worker_type, 0) + 1 if surplus else 0
+            )
+
+    def _drainable(self, load: TypeLoad, already: int) -> int:
+        """Idle workers of a type that may go without breaching the floor."""
+        return max(0, min(load.idle, load.workers - self.policy.min_per_type) - already)
+
+    def decide(self, loads: Mapping[str, TypeLoad], memory_headroom: int) -> ScaleDecision:
+        """Decide this tick's scaling actions.
+
+        Args:
+            loads: Current load of every managed worker type.
+            memory_headroom: Additional workers the host's available RAM
+                can take right now.
+
+        Returns:
+            The workers to start and drain per type.
+        """
+        policy = self.policy
+        self._update_counters(loads)
+
+        start: dict[str, int] = {}
+        drain: dict[str, int] = {}
+        total = sum(load.workers for load in loads.values())
+        headroom = memory_headroom
+
+        # Most backed-up type first, so a tight budget goes where it helps most.
+        starved = sorted(
+            (
+                t
+                for t, load in loads.items()
+                if self._starved_ticks[t] >= policy.scale_up_ticks
+                and self._cooldown.get(t, 0) == 0
+                and load.workers < policy.max_per_type
+            ),
+            key=lambda t: loads[t].pending / max(1, loads[t].workers),
+            reverse=True,
+        )
+        for worker_type in starved:
+            load = loads[worker_type]
+            wanted = min(
+                policy.max_step,
+                policy.max_per_type - load.workers,
+                math.ceil(load.pending / policy.backlog_per_worker) - load.workers,
+            )
+            if wanted <= 0:
+                continue
+
+            room = policy.budget - total
+            taken: dict[str, int] = {}
+            if room < wanted:
+                # Take capacity from types that have had nothing queued for a while.
+                for donor, other in loads.items():
+                    if (
+                        donor == worker_type
+                        or donor in start
+                        or self._surplus_ticks[donor] < policy.scale_up_ticks
+                    ):
+                        continue
+                    need = wanted - room - sum(taken.values())
+                    take = min(need, self._drainable(other, drain.get(donor, 0)))
+                    if take > 0:
+                        taken[donor] = take
+                    if room + sum(taken.values()) >= wanted:
+                        break
+            freed = sum(taken.values())
+
+            count = min(wanted, max(0, room) + freed, max(0, headroom) + freed)
+            if count <= 0:
+                continue
+            for donor, take in taken.items():
+                drain[donor] = drain.get(donor, 0) + take
+            start[worker_type] = count
+            total += count - freed
+            headroom -= max(0, count - freed)
+
+        for worker_type, load in loads.items():
+            if worker_type in start or self._cooldown.get(worker_type, 0) > 0:
+                continue
+            if self._surplus_ticks[worker_type] < policy.scale_down_ticks:
+                continue
+            extra = min(policy.max_step, self._drainable(load, drain.get(worker_type, 0)))
+            if extra > 0:
+                drain[worker_type] = drain.get(worker_type, 0) + extra
+
+        for worker_type, ticks in self._cooldown.items():
+            self._cooldown[worker_type] = max(0, ticks - 1)
+        for worker_type in (*start, *drain):
+            self._cooldown[worker_type] = policy.cooldown_ticks
+            self._starved_ticks[worker_type] = 0
+            self._surplus_ticks[worker_type] = 0
+
+        decision = ScaleDecision(start=start, drain=drain)
+        if decision:
+            logger.info(
+                f"Autoscale: start {start or '-'}, drain {drain or '-'} "
+                f"(budget {policy.budget}, memory headroom {memory_headroom})"
+            )
+        return decision
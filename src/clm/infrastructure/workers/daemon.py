@@ -0,0 +1,342 @@
+"""Persistent worker daemon reused across successive builds.
+
+Every ``clm build`` normally starts its own worker pool and tears it down at
+the end. Importing nbconvert/jupytext, starting kernels and JVMs, or starting
+Docker containers costs 10-60 s per build, which dominates quick iterative
+builds of a small change. ``clm workers daemon`` keeps one warm pool alive
+instead:
+
+* The daemon runs a regular :class:`WorkerLifecycleManager` pool (health
+  monitor, optional autoscaler) under its own session id, replaces workers
+  the monitor marks dead, and optionally asks every worker to
+  :meth:`~clm.infrastructure.workers.worker_base.Worker.prewarm` (start and
+  discard a kernel, JVM or Draw.io export) before taking jobs.
+* It publishes a :class:`DaemonState` next to the jobs database
+  (``<jobs db>.daemon.json``), refreshed every tick as a heartbeat.
+* ``clm build`` calls :func:`find_attachable_daemon`. When a live daemon's
+  :func:`daemon_fingerprint` matches the build's — same clm version,
+  execution modes, worker images and the paths the workers were started
+  with — the build adopts the daemon's session id, so its jobs are stamped
+  for the daemon's workers (issue #620), and starts no workers of its own.
+* Attaching touches a lease file; the daemon exits after ``idle_timeout``
+  seconds with no queued or running job in its session and no lease touch.
+
+The daemon's workers are tagged build-owned (``MANAGED_BY_BUILD``) by the
+daemon's session: a build that did *not* attach must not count them as
+reusable, since they would never claim its differently-stamped jobs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from clm.infrastructure.config import WorkersManagementConfig
+    from clm.infrastructure.workers.worker_executor import WorkerConfig
+
+logger = logging.getLogger(__name__)
+
+#: A daemon whose state file was not refreshed for this long is treated as
+#: gone (crashed, or suspended with the laptop) even if its pid still exists.
+DAEMON_HEARTBEAT_STALE_SECONDS = 30.0
+
+
+class WorkerDaemonError(RuntimeError):
+    """The worker daemon cannot start (e.g. one already serves the jobs DB)."""
+
+
+def daemon_state_path(jobs_db_path: Path) -> Path:
+    """Where the daemon serving ``jobs_db_path`` publishes its state."""
+    jobs_db_path = Path(jobs_db_path).absolute()
+    return jobs_db_path.with_name(jobs_db_path.name + ".daemon.json")
+
+
+def daemon_lease_path(jobs_db_path: Path) -> Path:
+    """File whose mtime attaching builds bump to keep the daemon alive."""
+    jobs_db_path = Path(jobs_db_path).absolute()
+    return jobs_db_path.with_name(jobs_db_path.name + ".daemon.lease")
+
+
+def _path_key(path: Path | None) -> str:
+    return str(Path(path).resolve()) if path is not None else ""
+
+
+def daemon_fingerprint(
+    worker_configs: list[WorkerConfig],
+    *,
+    workspace_path: Path,
+    data_dir: Path | None,
+    cache_db_path: Path | None,
+    notebook_kernel_python: str = "",
+) -> dict[str, Any]:
+    """Everything a build's workers must agree on to be interchangeable.
+
+    Worker *counts* are deliberately left out — a daemon with two notebook
+    workers serves a build configured for four just fine. Per type, the
+    identity is the same string the cache keys use
+    (:func:`~clm.infrastructure.workers.image_identity.worker_image_identity_for`),
+    so a daemon is compatible exactly when its outputs would be cached under
+    the same keys.
+    """
+    from clm import __version__
+    from clm.infrastructure.workers.image_identity import worker_image_identity_for
+
+    return {
+        "clm_version": __version__,
+        "workspace_path": _path_key(workspace_path),
+        "data_dir": _path_key(data_dir),
+        "cache_db_path": _path_key(cache_db_path),
+        "notebook_kernel_python": notebook_kernel_python,
+        "workers": {
+            c.worker_type: worker_image_identity_for(c.execution_mode, c.image, c.worker_type)
+            for c in worker_configs
+            if c.count > 0
+        },
+    }
+
+
+def fingerprint_mismatch(daemon: dict[str, Any], build: dict[str, Any]) -> str | None:
+    """Why a build with fingerprint ``build`` cannot use the daemon, or ``None``."""
+    for key in ("clm_version", "workspace_path", "data_dir", "cache_db_path"):
+        if daemon.get(key) != build.get(key):
+            return f"{key} differs (daemon: {daemon.get(key)!r}, build: {build.get(key)!r})"
+    daemon_workers = daemon.get("workers", {})
+    for worker_type, identity in build.get("workers", {}).items():
+        if worker_type not in daemon_workers:
+            return f"daemon runs no {worker_type} workers"
+        if daemon_workers[worker_type] != identity:
+            return (
+                f"{worker_type} workers differ "
+                f"(daemon: {daemon_workers[worker_type]}, build: {identity})"
+            )
+    if "notebook" in build.get("workers", {}) and daemon.get("notebook_kernel_python") != build.get(
+        "notebook_kernel_python"
+    ):
+        return "notebook kernel interpreter differs"
+    return None
+
+
+@dataclass
+class DaemonState:
+    """What a running daemon publishes for attaching builds."""
+
+    pid: int
+    session_id: str
+    started_at: str
+    heartbeat: float
+    idle_timeout: float
+    fingerprint: dict[str, Any] = field(default_factory=dict)
+    workers: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def read(cls, path: Path) -> DaemonState | None:
+        """Load a state file; ``None`` if it is missing or unreadable."""
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            return cls(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable worker daemon state {path}: {e}")
+            return None
+
+    def write(self, path: Path) -> None:
+        """Replace the state file atomically, so readers never see half of it."""
+        tmp_path = Path(path).with_name(Path(path).name + f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def is_alive(self, now: float | None = None) -> bool:
+        """Whether the publishing process exists and refreshed the state recently."""
+        import psutil  # type: ignore[import-untyped]
+
+        now = time.time() if now is None else now
+        if now - self.heartbeat > DAEMON_HEARTBEAT_STALE_SECONDS:
+            return False
+        try:
+            return bool(psutil.pid_exists(self.pid))
+        except Exception:
+            return False
+
+
+def find_attachable_daemon(jobs_db_path: Path, fingerprint: dict[str, Any]) -> DaemonState | None:
+    """The live, compatible daemon serving ``jobs_db_path``, if there is one.
+
+    Attaching touches the daemon's lease file, so a daemon about to idle out
+    keeps its pool for the build that just found it.
+    """
+    state = DaemonState.read(daemon_state_path(jobs_db_path))
+    if state is None:
+        return None
+    if not state.is_alive():
+        logger.info(f"Ignoring stale worker daemon state (pid {state.pid})")
+        return None
+    reason = fingerprint_mismatch(state.fingerprint, fingerprint)
+    if reason is not None:
+        logger.info(f"Not attaching to worker daemon (pid {state.pid}): {reason}")
+        return None
+    try:
+        daemon_lease_path(jobs_db_path).touch()
+    except OSError as e:
+        logger.debug(f"Could not touch worker daemon lease: {e}")
+    return state
+
+
+class WorkerDaemon:
+    """A long-lived worker pool that successive builds attach to.
+
+    ``run`` blocks until :meth:`stop` is called (e.g. from a signal handler)
+    or the pool has been idle for ``idle_timeout`` seconds.
+    """
+
+    def __init__(
+        self,
+        config: WorkersManagementConfig,
+        *,
+        jobs_db_path: Path,
+        workspace_path: Path,
+        cache_db_path: Path | None = None,
+        data_dir: Path | None = None,
+        notebook_kernel_python: str = "",
+        idle_timeout: float | None = None,
+        prewarm: bool = False,
+        check_interval: float = 5.0,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            config: Worker management configuration (counts, modes, images)
+            jobs_db_path: Path to the job queue database builds will use
+            workspace_path: Output directory the workers write to
+            cache_db_path: Path to executed notebook cache database
+            data_dir: Course data directory (mounted into Docker workers)
+            notebook_kernel_python: Direct-mode notebook kernel interpreter
+            idle_timeout: Seconds without work before exiting; ``None``
+                uses ``config.daemon_idle_timeout``, 0 never exits
+            prewarm: Ask every worker to warm its kernel/JVM before polling
+            check_interval: Seconds between heartbeat/health/idle checks
+        """
+        # The daemon owns its pool outright: never borrow other workers
+        # (they would not claim this session's jobs), always stop its own.
+        self.config = config.model_copy(update={"reuse_workers": False, "auto_stop": True})
+        self.jobs_db_path = Path(jobs_db_path).absolute()
+        self.workspace_path = Path(workspace_path).absolute()
+        self.cache_db_path = cache_db_path
+        self.data_dir = data_dir
+        self.notebook_kernel_python = notebook_kernel_python
+        self.idle_timeout = config.daemon_idle_timeout if idle_timeout is None else idle_timeout
+        self.prewarm = prewarm
+        self.check_interval = check_interval
+        self.session_id = f"daemon-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.state_path = daemon_state_path(self.jobs_db_path)
+        self.lease_path = daemon_lease_path(self.jobs_db_path)
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to shut the pool down and return."""
+        self._stop_event.set()
+
+    def _last_activity(self, job_queue, since: float) -> float:
+        """Most recent sign of use: a queued/running job, a lease touch, or ``since``."""
+        conn = job_queue._get_conn()
+        row = conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE session_id = ? "
+            "AND status IN ('pending', 'processing')",
+            (self.session_id,),
+        ).fetchone()
+        if row and row[0]:
+            return time.time()
+        try:
+            since = max(since, self.lease_path.stat().st_mtime)
+        except OSError:
+            pass
+        return since
+
+    def run(self) -> None:
+        """Start the pool, serve builds until stopped or idle, then stop it."""
+        from clm.infrastructure.database.schema import init_database
+        from clm.infrastructure.workers.lifecycle_manager import WorkerLifecycleManager
+        from clm.infrastructure.workers.worker_base import PREWARM_ENV_VAR
+
+        existing = DaemonState.read(self.state_path)
+        if existing is not None and existing.pid != os.getpid() and existing.is_alive():
+            raise WorkerDaemonError(
+                f"A worker daemon (pid {existing.pid}) already serves {self.jobs_db_path}"
+            )
+
+        init_database(self.jobs_db_path)
+        if self.prewarm:
+            # Direct workers inherit it; the Docker executor forwards it.
+            os.environ[PREWARM_ENV_VAR] = "1"
+
+        worker_configs = self.config.get_all_worker_configs()
+        fingerprint = daemon_fingerprint(
+            worker_configs,
+            workspace_path=self.workspace_path,
+            data_dir=self.data_dir,
+            cache_db_path=self.cache_db_path,
+            notebook_kernel_python=self.notebook_kernel_python,
+        )
+
+        lifecycle = WorkerLifecycleManager(
+            config=self.config,
+            db_path=self.jobs_db_path,
+            workspace_path=self.workspace_path,
+            session_id=self.session_id,
+            cache_db_path=self.cache_db_path,
+            data_dir=self.data_dir,
+            notebook_kernel_python=self.notebook_kernel_python,
+        )
+        workers = []
+        try:
+            workers = lifecycle.start_managed_workers()
+            pool = lifecycle.pool_manager
+            if pool is None:
+                raise WorkerDaemonError("No workers configured for the worker daemon")
+
+            state = DaemonState(
+                pid=os.getpid(),
+                session_id=self.session_id,
+                started_at=datetime.now().isoformat(),
+                heartbeat=time.time(),
+                idle_timeout=self.idle_timeout,
+                fingerprint=fingerprint,
+                workers={c.worker_type: c.count for c in worker_configs if c.count > 0},
+            )
+            state.write(self.state_path)
+            logger.info(
+                f"Worker daemon {self.session_id} serving {self.jobs_db_path} "
+                f"with {len(workers)} worker(s)"
+            )
+
+            last_activity = time.time()
+            while not self._stop_event.wait(self.check_interval):
+                pool.replace_dead_workers()
+                state.heartbeat = time.time()
+                state.write(self.state_path)
+
+                last_activity = self._last_activity(pool.job_queue, last_activity)
+                if self.idle_timeout and time.time() - last_activity > self.idle_timeout:
+                    logger.info(f"Worker daemon idle for {self.idle_timeout:.0f}s, stopping")
+                    break
+        finally:
+            current = DaemonState.read(self.state_path)
+            if current is not None and current.pid == os.getpid():
+                self.state_path.unlink(missing_ok=True)
+            try:
+                if workers:
+                    lifecycle.stop_managed_workers(workers)
+                elif lifecycle.pool_manager is not None:
+                    # Startup failed part-way: stop whatever did come up.
+                    lifecycle.pool_manager.stop_pools()
+            finally:
+                lifecycle.close()
+            logger.info("Worker daemon stopped")
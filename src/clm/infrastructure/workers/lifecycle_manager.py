@@ -9,6 +9,7 @@ from typing import Any
 from pydantic import BaseModel
 
 from clm.infrastructure.config import WorkersManagementConfig
+from clm.infrastructure.workers.autoscaler import AutoscalePolicy
 from clm.infrastructure.workers.discovery import WorkerDiscovery
 from clm.infrastructure.workers.event_logger import WorkerEventLogger
 from clm.infrastructure.workers.pool_manager import WorkerPoolManager
@@ -226,6 +227,8 @@ class WorkerLifecycleManager:
             notebook_kernel_python=self.notebook_kernel_python,
             session_id=self.session_id,
             workers_shareable=not self.config.auto_stop,
+            docker_standby=self.config.docker_standby_containers,
+            container_name_prefix=self.config.container_name_prefix,
         )
 
         # Update discovery to use pool_manager's executors for accurate health checks
@@ -245,6 +248,16 @@ class WorkerLifecycleManager:
         # this session's workers and is stopped/joined by stop_pools().
         self.pool_manager.start_monitoring()
 
+        if self.config.autoscale:
+            self.pool_manager.start_autoscaling(
+                AutoscalePolicy.for_counts(
+                    (c.count for c in worker_configs),
+                    budget=self.config.autoscale_budget,
+                    explicit_cap=self.config.max_workers_cap,
+                ),
+                check_interval=self.config.autoscale_interval,
+            )
+
         # Collect worker info for tracking
         self.managed_workers = self._collect_worker_info()
 
@@ -21,10 +21,17 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from clm.infrastructure.database.job_queue import JobQueue
+from clm.infrastructure.workers.autoscaler import (
+    AutoscaleController,
+    AutoscalePolicy,
+    ScaleDecision,
+    TypeLoad,
+)
 from clm.infrastructure.workers.discovery import (
     MANAGED_BY_BUILD,
     MANAGED_BY_PERSISTENT,
 )
+from clm.infrastructure.workers.pool_size_cap import available_worker_headroom
 from clm.infrastructure.workers.worker_executor import (
     DirectWorkerExecutor,
     DockerWorkerExecutor,
@@ -128,6 +135,8 @@ class WorkerPoolManager:
         notebook_kernel_python: str = "",
         session_id: str | None = None,
         workers_shareable: bool = False,
+        docker_standby: int = 0,
+        container_name_prefix: str = "clm",
     ):
         """Initialize worker pool manager.
 
@@ -153,6 +162,10 @@ class WorkerPoolManager:
                 after the owning build exits (auto_stop=false) and may be
                 reused by other builds; False (default) marks them
                 build-owned, never reusable by another session.
+            docker_standby: Standby containers to keep parked per Docker
+                worker configuration once the pools are up; scale-ups and
+                crash replacements are started from them instead of cold.
+            container_name_prefix: Prefix of Docker worker container names.
         """
         self.db_path = db_path
         self.workspace_path = workspace_path
@@ -164,6 +177,8 @@ class WorkerPoolManager:
         self.notebook_kernel_python = notebook_kernel_python
         self.session_id = session_id
         self.workers_shareable = workers_shareable
+        self.docker_standby = docker_standby
+        self.container_name_prefix = container_name_prefix
 
         # Determine max startup concurrency. The former env-only
         # CLM_MAX_WORKER_STARTUP_CONCURRENCY knob duplicated the existing
@@ -188,6 +203,14 @@ class WorkerPoolManager:
         # join time out and the daemon thread linger up to one interval).
         self._monitor_stop_event = threading.Event()
 
+        # Queue-depth autoscaler (opt-in, see start_autoscaling). Once it runs,
+        # self.workers is mutated from its thread, so every access that may
+        # overlap it goes through _workers_lock.
+        self.autoscale_thread: threading.Thread | None = None
+        self._autoscale_stop_event = threading.Event()
+        self._workers_lock = threading.Lock()
+        self._next_worker_index: dict[str, int] = {}
+
         # Worker API server for Docker communication (started when needed)
         self._api_server: WorkerApiServer | None = None
 
@@ -233,6 +256,7 @@ class WorkerPoolManager:
                     data_dir=self.data_dir,
                     network_name=self.network_name,
                     log_level=self.log_level,
+                    name_prefix=self.container_name_prefix,
                 )
             elif mode == "direct":
                 self.executors[mode] = DirectWorkerExecutor(
@@ -589,6 +613,7 @@ class WorkerPoolManager:
         tasks = []
         for config in self.worker_configs:
             self.workers[config.worker_type] = []
+            self._next_worker_index[config.worker_type] = max(0, config.count)
             for i in range(config.count):
                 tasks.append((config, i))
 
@@ -631,7 +656,8 @@ class WorkerPoolManager:
                     worker_info = future.result()
                     if worker_info:
                         started_workers.append(worker_info)
-                        self.workers[config.worker_type].append(worker_info)
+                        with self._workers_lock:
+                            self.workers[config.worker_type].append(worker_info)
                         logger.info(
                             f"✓ Started {config.worker_type}-{i} ({completed}/{total_workers})"
                         )
@@ -664,6 +690,28 @@ class WorkerPoolManager:
         if failed_workers:
             logger.error(f"Failed to start {len(failed_workers)} worker(s): {failed_workers}")
 
+        self._fill_docker_standby()
+
+    def _fill_docker_standby(self) -> None:
+        """Park standby containers for each Docker configuration in the background.
+
+        The regular workers are started first so the standby set never
+        delays the build's own pool.
+        """
+        if self.docker_standby <= 0:
+            return
+        executor = self.executors.get("docker")
+        if not isinstance(executor, DockerWorkerExecutor):
+            return
+        for config in self.worker_configs:
+            if config.execution_mode == "docker":
+                threading.Thread(
+                    target=executor.fill_standby,
+                    args=(config.worker_type, config, self.docker_standby),
+                    name=f"DockerStandbyFill-{config.worker_type}",
+                    daemon=True,
+                ).start()
+
     def _pre_register_worker(self, worker_type: str, execution_mode: str) -> tuple[int, str]:
         """Pre-register a worker in the database before starting the subprocess.
 
@@ -1028,6 +1076,247 @@ class WorkerPoolManager:
 
         logger.info("Health monitor stopped")
 
+    def start_autoscaling(self, policy: AutoscalePolicy, check_interval: float = 2.0):
+        """Rebalance worker counts by queue depth in a background thread.
+
+        Every ``check_interval`` seconds the pool's per-type load is fed to
+        an :class:`AutoscaleController`, which starts workers for starved
+        types and drains idle ones within ``policy``'s budget. See
+        :mod:`clm.infrastructure.workers.autoscaler` for the rules. Stopped
+        and joined by :meth:`stop_pools`.
+
+        Args:
+            policy: Budget and hysteresis settings
+            check_interval: Time between scaling decisions (seconds)
+        """
+        if self.autoscale_thread and self.autoscale_thread.is_alive():
+            logger.warning("Autoscaler already running")
+            return
+
+        self._autoscale_stop_event.clear()
+        self.autoscale_thread = threading.Thread(
+            target=self._autoscale_loop,
+            args=(AutoscaleController(policy), check_interval),
+            daemon=True,
+        )
+        self.autoscale_thread.start()
+        logger.info(
+            f"Started worker autoscaler (budget: {policy.budget}, "
+            f"max per type: {policy.max_per_type}, interval: {check_interval}s)"
+        )
+
+    def _autoscale_loop(self, controller: AutoscaleController, check_interval: float):
+        """Feed the controller one load snapshot per tick and apply its decision."""
+        while self.running and not self._autoscale_stop_event.is_set():
+            try:
+                loads = self._read_type_loads()
+                if loads:
+                    decision = controller.decide(loads, available_worker_headroom())
+                    if decision:
+                        self._apply_scale_decision(decision)
+            except Exception as e:
+                logger.error(f"Autoscaler error: {e}", exc_info=True)
+            self._autoscale_stop_event.wait(check_interval)
+        logger.info("Worker autoscaler stopped")
+
+    def _worker_statuses(self) -> dict[int, str]:
+        """Current ``workers.status`` of this pool's own workers, by row id."""
+        with self._workers_lock:
+            ids = [info["db_worker_id"] for infos in self.workers.values() for info in infos]
+        if not ids:
+            return {}
+        conn = self.job_queue._get_conn()
+        placeholders = ", ".join("?" * len(ids))
+        rows = conn.execute(
+            f"SELECT id, status FROM workers WHERE id IN ({placeholders})",  # noqa: S608 — placeholders only
+            ids,
+        ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def _read_type_loads(self) -> dict[str, TypeLoad]:
+        """Pending jobs and live/idle own workers for every managed type.
+
+        Pending jobs are counted the way this pool's workers would claim
+        them: same job type, untagged or tagged with the type's execution
+        mode, and (when the pool has a session) untagged or stamped with
+        this session — a concurrent build's queue must not make this pool
+        grow.
+        """
+        configs = {c.worker_type: c for c in self.worker_configs if c.count > 0}
+        if not configs:
+            return {}
+
+        conditions = ["status = 'pending'", "attempts < max_attempts"]
+        params: list[Any] = []
+        if self.session_id is not None:
+            conditions.append("(session_id IS NULL OR session_id = ?)")
+            params.append(self.session_id)
+        conn = self.job_queue._get_conn()
+        rows = conn.execute(
+            "SELECT job_type, execution_mode, COUNT(*) FROM jobs "  # noqa: S608 — literal predicates
+            f"WHERE {' AND '.join(conditions)} GROUP BY job_type, execution_mode",
+            params,
+        ).fetchall()
+        pending = dict.fromkeys(configs, 0)
+        for job_type, execution_mode, count in rows:
+            config = configs.get(job_type)
+            if config is None:
+                continue
+            if execution_mode is None or execution_mode == config.execution_mode:
+                pending[job_type] += count
+
+        statuses = self._worker_statuses()
+        loads: dict[str, TypeLoad] = {}
+        with self._workers_lock:
+            for worker_type in configs:
+                states = [
+                    statuses.get(info["db_worker_id"]) for info in self.workers.get(worker_type, [])
+                ]
+                loads[worker_type] = TypeLoad(
+                    pending=pending[worker_type],
+                    workers=sum(1 for s in states if s in ("created", "idle", "busy")),
+                    idle=sum(1 for s in states if s == "idle"),
+                )
+        return loads
+
+    def _apply_scale_decision(self, decision: ScaleDecision) -> None:
+        """Drain, then start, the workers an autoscaler decision names."""
+        statuses = self._worker_statuses()
+        for worker_type, count in decision.drain.items():
+            with self._workers_lock:
+                # Newest idle workers first: the oldest have warmed caches.
+                candidates = [
+                    info
+                    for info in reversed(self.workers.get(worker_type, []))
+                    if statuses.get(info["db_worker_id"]) == "idle"
+                ]
+            drained = 0
+            for info in candidates:
+                if drained >= count:
+                    break
+                if self._drain_worker(info):
+                    drained += 1
+            if drained:
+                logger.info(f"Autoscaler drained {drained} idle {worker_type} worker(s)")
+
+        configs = {c.worker_type: c for c in self.worker_configs}
+        for worker_type, count in decision.start.items():
+            config = configs[worker_type]
+            for _ in range(count):
+                if not self.running or self._autoscale_stop_event.is_set():
+                    return
+                index = self._next_worker_index.get(worker_type, 0)
+                self._next_worker_index[worker_type] = index + 1
+                worker_info = self._start_worker(config, index)
+                if worker_info is None:
+                    break
+                with self._workers_lock:
+                    self.workers.setdefault(worker_type, []).append(worker_info)
+                logger.info(f"Autoscaler started {worker_type}-{index}")
+
+    def _drain_worker(self, worker_info: dict) -> bool:
+        """Retire one idle worker without racing a job claim.
+
+        The worker row is deleted only while the worker is idle *and* holds
+        no processing job, in one statement. ``get_next_job`` claims under
+        ``BEGIN IMMEDIATE`` and hands nothing to a worker whose row is gone,
+        so either the claim wins (the delete matches nothing and the worker
+        keeps its job) or the delete wins (the worker can no longer claim
+        and is stopped here). Returns ``True`` if the worker was drained.
+        """
+        db_worker_id = worker_info["db_worker_id"]
+        conn = self.job_queue._get_conn()
+        cursor = conn.execute(
+            """
+            DELETE FROM workers
+            WHERE id = ? AND status = 'idle'
+              AND NOT EXISTS (
+                  SELECT 1 FROM jobs WHERE worker_id = ? AND status = 'processing'
+              )
+            """,
+            (db_worker_id, db_worker_id),
+        )
+        if cursor.rowcount != 1:
+            return False
+
+        try:
+            worker_info["executor"].stop_worker(worker_info["executor_id"])
+        except Exception as e:
+            # The row is gone, so the worker exits on its own at its next
+            # heartbeat (issue #853); stopping it here only makes that prompt.
+            logger.warning(f"Error stopping drained worker {db_worker_id}: {e}")
+        with self._workers_lock:
+            for infos in self.workers.values():
+                if worker_info in infos:
+                    infos.remove(worker_info)
+        return True
+
+    def replace_dead_workers(self) -> int:
+        """Restart every pool worker the health monitor gave up on.
+
+        A build's pool lives as long as the build, so a worker marked
+        ``dead`` (or whose row vanished) is only ever requeued around. A
+        long-lived pool — ``clm workers daemon`` — would shrink worker by
+        worker instead, so it calls this each tick: the dead worker's
+        process or container is stopped, its row deleted, and a fresh worker
+        of the same configuration started in its place.
+
+        Returns:
+            The number of workers started.
+        """
+        statuses = self._worker_statuses()
+        with self._workers_lock:
+            dead = [
+                info
+                for infos in self.workers.values()
+                for info in infos
+                if statuses.get(info["db_worker_id"], "dead") == "dead"
+            ]
+
+        replaced = 0
+        for info in dead:
+            if not self.running:
+                break
+            if self._replace_worker(info):
+                replaced += 1
+        return replaced
+
+    def _replace_worker(self, info: dict) -> bool:
+        """Stop a pool worker, delete its row and start a fresh one in its place.
+
+        The replacement gets the next free index of its type; for Docker it
+        is handed a standby container when one is parked.
+
+        Returns:
+            True if the replacement started.
+        """
+        config = info["config"]
+        try:
+            info["executor"].stop_worker(info["executor_id"])
+        except Exception as e:
+            logger.debug(f"Error stopping worker {info['db_worker_id']}: {e}")
+        self.job_queue._get_conn().execute(
+            "DELETE FROM workers WHERE id = ?", (info["db_worker_id"],)
+        )
+        with self._workers_lock:
+            infos = self.workers.get(config.worker_type, [])
+            if info in infos:
+                infos.remove(info)
+            index = self._next_worker_index.get(config.worker_type, 0)
+            self._next_worker_index[config.worker_type] = index + 1
+
+        worker_info = self._start_worker(config, index)
+        if worker_info is None:
+            logger.error(f"Could not replace {config.worker_type} worker {info['db_worker_id']}")
+            return False
+        with self._workers_lock:
+            self.workers.setdefault(config.worker_type, []).append(worker_info)
+        logger.info(
+            f"Replaced {config.worker_type} worker {info['db_worker_id']} "
+            f"with {config.worker_type}-{index}"
+        )
+        return True
+
     # Grace period for cleanup_stale_workers (issue #853): a direct worker row
     # whose most recent heartbeat is younger than this belongs to a LIVE
     # process and must not be deleted, even when no executor of the cleaning
@@ -1127,46 +1416,81 @@ class WorkerPoolManager:
         """
         logger.info(f"Restarting worker {worker_id} ({worker_type})")
 
+        with self._workers_lock:
+            info = next(
+                (
+                    info
+                    for info in self.workers.get(worker_type, [])
+                    if info["db_worker_id"] == worker_id
+                ),
+                None,
+            )
+        if info is None:
+            logger.warning(f"Worker {worker_id} ({container_id[:12]}) is not in this pool")
+            return
+
         try:
-            # Stop and remove old container
-            import docker
-            import docker.errors
+            self._replace_worker(info)
+        except Exception as e:
+            logger.error(f"Error restarting worker {worker_id}: {e}", exc_info=True)
 
-            assert self.docker_client is not None
-            try:
-                container = self.docker_client.containers.get(container_id)
-                container.stop(timeout=5)
-                container.remove()
-            except docker.errors.NotFound:
-                # Container already removed - that's fine
-                logger.debug(f"Container {container_id[:12]} not found (already removed)")
-            except docker.errors.APIError as e:
-                # Docker daemon issue - log but continue
-                logger.warning(f"Docker API error stopping container {container_id[:12]}: {e}")
-            except Exception as e:
-                # Unexpected error - log with details
-                logger.error(
-                    f"Unexpected error stopping container {container_id[:12]}: {e}", exc_info=True
-                )
+    def time_to_first_claim(self) -> dict[int, float | None]:
+        """Seconds each pool worker took to claim its first job.
 
-            # Delete old worker from database (it will be replaced by a new one)
-            conn = self.job_queue._get_conn()
-            conn.execute("DELETE FROM workers WHERE id = ?", (worker_id,))
-            conn.commit()
+        Measured per worker from the later of its row creation (the moment
+        the pool asked for it) and the job's creation to the job's
+        ``started_at``: the start-up latency a waiting job actually saw —
+        container or process start, imports, activation and the first poll.
+        Timestamps are stored to the second, so is the result.
 
-            # Find the worker config and restart
-            for config in self.worker_configs:
-                if config.worker_type == worker_type:
-                    # Start new worker
-                    worker_info = self._start_worker(config, 0)
-                    if worker_info:
-                        logger.info(f"Successfully restarted worker for {worker_type}")
-                    else:
-                        logger.error(f"Failed to restart worker for {worker_type}")
-                    break
+        Returns:
+            Mapping of worker ID to seconds, ``None`` for workers that have
+            not claimed a job.
+        """
+        with self._workers_lock:
+            worker_ids = [info["db_worker_id"] for infos in self.workers.values() for info in infos]
+        if not worker_ids:
+            return {}
+        placeholders = ",".join("?" * len(worker_ids))
+        rows = (
+            self.job_queue._get_conn()
+            .execute(
+                f"""
+                SELECT w.id, (
+                    SELECT (julianday(j.started_at) - julianday(MAX(j.created_at, w.started_at)))
+                           * 86400
+                    FROM jobs j
+                    WHERE j.worker_id = w.id AND j.started_at IS NOT NULL
+                    ORDER BY j.started_at, j.id
+                    LIMIT 1
+                )
+                FROM workers w
+                WHERE w.id IN ({placeholders})
+                """,
+                worker_ids,
+            )
+            .fetchall()
+        )
+        return {
+            worker_id: None if seconds is None else max(0.0, seconds) for worker_id, seconds in rows
+        }
 
+    def _log_time_to_first_claim(self) -> None:
+        try:
+            latencies = self.time_to_first_claim()
         except Exception as e:
-            logger.error(f"Error restarting worker {worker_id}: {e}", exc_info=True)
+            logger.debug(f"Could not measure time to first claim: {e}")
+            return
+        with self._workers_lock:
+            pools = {worker_type: list(infos) for worker_type, infos in self.workers.items()}
+        for worker_type, infos in pools.items():
+            parts = [
+                f"{info['db_worker_id']}={latencies[info['db_worker_id']]:.0f}s"
+                for info in infos
+                if latencies.get(info["db_worker_id"]) is not None
+            ]
+            if parts:
+                logger.info(f"Time to first claim ({worker_type} workers): {', '.join(parts)}")
 
     def stop_pools(self):
         """Stop all worker pools gracefully."""
@@ -1178,17 +1502,26 @@ class WorkerPoolManager:
         # below completes promptly instead of timing out against a sleep
         # that outlasts it.
         self._monitor_stop_event.set()
+        self._autoscale_stop_event.set()
 
         # Disable atexit cleanup since we're doing graceful shutdown
         _atexit_cleanup_disabled = True
 
-        # Wait for monitor thread to stop
+        # Wait for monitor and autoscaler threads to stop
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=5)
+        if self.autoscale_thread and self.autoscale_thread.is_alive():
+            self.autoscale_thread.join(timeout=5)
+
+        # Worker rows are deleted below; report start-up latency while the
+        # rows still exist.
+        self._log_time_to_first_claim()
 
         # Stop all workers
         total_stopped = 0
-        for worker_type, workers in self.workers.items():
+        with self._workers_lock:
+            pools = {worker_type: list(workers) for worker_type, workers in self.workers.items()}
+        for worker_type, workers in pools.items():
             logger.info(f"Stopping {len(workers)} {worker_type} workers")
 
             for worker_info in workers:
@@ -1234,6 +1567,9 @@ class WorkerPoolManager:
         """
         self.running = False
         self._monitor_stop_event.set()
+        autoscale_stop_event = getattr(self, "_autoscale_stop_event", None)
+        if autoscale_stop_event is not None:
+            autoscale_stop_event.set()
 
         # Don't wait for monitor thread - we're exiting anyway
 
@@ -229,3 +229,23 @@ def compute_pool_size_cap(requested: int, *, explicit_cap: int | None = None) ->
         explicit_cap=effective_explicit,
         was_clamped=effective < requested,
     )
+
+
+def available_worker_headroom() -> int:
+    """How many more workers the host's *available* RAM can take right now.
+
+    The pool-start cap above deliberately uses *total* RAM so it stays
+    deterministic. The autoscaler (:mod:`clm.infrastructure.workers.autoscaler`)
+    instead asks, mid-build, whether starting one more worker is safe — that
+    is a question about what is free at this instant, so it divides
+    ``psutil.virtual_memory().available`` by the same per-worker budget.
+
+    Returns ``0`` if psutil fails: an autoscaler that cannot see memory must
+    not grow the pool.
+    """
+    try:
+        available_bytes = int(psutil.virtual_memory().available)
+    except Exception as exc:
+        logger.warning(f"psutil.virtual_memory() failed: {exc}; no worker headroom")
+        return 0
+    return max(0, math.floor(available_bytes / (1024**3) / _MEM_GB_PER_WORKER))
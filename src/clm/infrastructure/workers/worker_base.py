@@ -26,6 +26,8 @@ from datetime import datetime
 from pathlib import Path, PurePosixPath, PureWindowsPath
 from typing import TYPE_CHECKING
 
+from clm.core import build_trace
+from clm.core.build_trace import tracer
 from clm.core.messaging.base_classes import ProcessingWarning
 from clm.infrastructure.database.job_queue import Job, JobQueue
 
@@ -46,6 +48,20 @@ CONTAINER_SOURCE = "/source"  # Source data directory (read-only)
 # would poll an empty queue forever (see ``resolve_jobs_db_path``).
 JOBS_DB_PATH_ENV_VAR = "CLM_JOBS_DB_PATH"
 
+# Set by ``clm workers daemon --prewarm`` (and passed into Docker workers):
+# a worker that sees it runs :meth:`Worker.prewarm` once before it starts
+# polling, so the first job of the next build does not pay for a cold kernel
+# or JVM.
+PREWARM_ENV_VAR = "CLM_WORKER_PREWARM"
+
+# Set on standby Docker containers (see ``DockerWorkerExecutor.fill_standby``):
+# the container starts without CLM_WORKER_ID, finishes its imports and then
+# parks in :meth:`Worker.wait_for_standby_assignment` until the executor drops
+# an assignment file naming the pre-registered worker row it should activate.
+# The value is the longest wait in seconds before the container gives up.
+STANDBY_ENV_VAR = "CLM_WORKER_STANDBY"
+STANDBY_ASSIGNMENT_PATH = "/tmp/clm-worker-assignment.json"
+
 
 def resolve_jobs_db_path() -> Path | None:
     """Return the jobs-DB path this worker process was launched with.
@@ -104,6 +120,7 @@ def parse_worker_args(worker_type: str, argv: list[str] | None = None) -> None:
             f"  {JOBS_DB_PATH_ENV_VAR}   jobs database to poll (direct mode; required)\n"
             "  CLM_API_URL        worker REST API base URL (Docker mode alternative)\n"
             "  CLM_WORKER_ID      pre-registered worker row to activate (optional)\n"
+            f"  {STANDBY_ENV_VAR} park until assigned a worker row (Docker standby)\n"
             "  WORKSPACE_PATH     output workspace root\n"
             "  LOG_LEVEL          worker log level (default: INFO)\n"
         ),
@@ -627,19 +644,48 @@ class Worker(ABC):
         """Clear warnings for the current job."""
         self._current_job_warnings = []
 
-    def _get_job_result_json(self) -> str | None:
+    def _get_job_result_json(self, trace: dict | None = None) -> str | None:
         """Get job result as JSON string for storing in database.
 
+        Args:
+            trace: The job's build-trace spans (see :meth:`_take_job_trace`)
+
         Returns:
-            JSON string with warnings, or None if no warnings
+            JSON string with warnings and trace, or None if there are neither
+        """
+        result_data: dict = {}
+        if self._current_job_warnings:
+            result_data["warnings"] = [w.model_dump() for w in self._current_job_warnings]
+        if trace:
+            result_data["trace"] = trace
+        return json.dumps(result_data) if result_data else None
+
+    def _take_job_trace(self, job: Job, started_us: int) -> dict | None:
+        """Close the job's build-trace span and drain its spans for the host.
+
+        Returns None unless ``CLM_BUILD_TRACE`` is set. The spans travel in
+        the job result (or error) JSON, so they reach the host the same way
+        for Direct workers and for Docker workers via the Worker API.
         """
-        if not self._current_job_warnings:
+        if not tracer.enabled:
             return None
-
-        result_data = {
-            "warnings": [w.model_dump() for w in self._current_job_warnings],
+        tracer.add_span(
+            build_trace.JOB,
+            "worker",
+            started_us,
+            build_trace.now_us(),
+            job_type=job.job_type,
+            input_file=job.input_file,
+        )
+        return {
+            "worker": {
+                "worker_id": self.worker_id,
+                "worker_type": self.worker_type,
+                "execution_mode": self.execution_mode,
+                "pid": os.getpid(),
+            },
+            "spans": tracer.drain(),
         }
-        return json.dumps(result_data)
 
     def _log_event(self, event_type: str, message: str, metadata: dict | None = None):
         """Log a worker lifecycle event to the database.
@@ -728,6 +774,31 @@ class Worker(ABC):
             logger.debug(f"Worker {self.worker_id}: Closing job queue connection")
             self.job_queue.close()
 
+    def prewarm(self) -> None:
+        """Warm expensive per-process state before the first job.
+
+        Called once from :meth:`run` when :data:`PREWARM_ENV_VAR` is set.
+        The default does nothing; subclasses start and discard a kernel, a
+        JVM, etc., so the OS caches and lazily-initialized libraries are hot
+        when real work arrives.
+        """
+        return
+
+    def _prewarm_if_requested(self) -> None:
+        """Run :meth:`prewarm` if requested; a failed warm-up never stops the worker."""
+        if os.environ.get(PREWARM_ENV_VAR, "").strip().lower() not in ("1", "true", "yes"):
+            return
+        start = time.monotonic()
+        try:
+            self.prewarm()
+        except Exception as e:
+            logger.warning(f"Worker {self.worker_id} ({self.worker_type}) prewarm failed: {e}")
+            return
+        logger.info(
+            f"Worker {self.worker_id} ({self.worker_type}) prewarmed in "
+            f"{time.monotonic() - start:.1f}s"
+        )
+
     def run(self):
         """Main worker loop.
 
@@ -741,6 +812,8 @@ class Worker(ABC):
             f"Worker {self.worker_id} ({self.worker_type}) starting (parent PID: {self.parent_pid})"
         )
 
+        self._prewarm_if_requested()
+
         # Log worker ready event
         self._log_event(
             "worker_ready",
@@ -761,6 +834,7 @@ class Worker(ABC):
                 # Get next job (claiming only jobs untagged or tagged with
                 # this worker's execution mode, so e.g. a Direct worker never
                 # takes a job that needs the Docker image's toolchain)
+                claim_started_us = build_trace.now_us() if tracer.enabled else 0
                 job = self.job_queue.get_next_job(
                     self.worker_type, self.worker_id, execution_mode=self.execution_mode
                 )
@@ -783,6 +857,10 @@ class Worker(ABC):
                 self._clear_job_warnings()
 
                 start_time = time.time()
+                job_started_us = build_trace.now_us() if tracer.enabled else 0
+                tracer.add_span(
+                    build_trace.CLAIM, "worker", claim_started_us, job_started_us, job_id=job.id
+                )
 
                 try:
                     # Process job with timeout enforcement
@@ -799,7 +877,9 @@ class Worker(ABC):
                         )
 
                     # Mark job as completed (with warnings if any)
-                    result_json = self._get_job_result_json()
+                    result_json = self._get_job_result_json(
+                        self._take_job_trace(job, job_started_us) if tracer.enabled else None
+                    )
                     self.job_queue.update_job_status(job.id, "completed", result=result_json)
 
                     if self._current_job_warnings:
@@ -861,6 +941,8 @@ class Worker(ABC):
                     nb_telemetry = getattr(e, "execution_telemetry", None)
                     if isinstance(nb_telemetry, dict):
                         error_info["execution_telemetry"] = nb_telemetry
+                    if tracer.enabled:
+                        error_info["trace"] = self._take_job_trace(job, job_started_us)
 
                     # Add error categorization for better monitoring integration
                     try:
@@ -1218,6 +1300,47 @@ class Worker(ABC):
         finally:
             client.close()
 
+    @staticmethod
+    def wait_for_standby_assignment(
+        assignment_path: Path = Path(STANDBY_ASSIGNMENT_PATH),
+        poll_interval: float = 0.05,
+    ) -> str:
+        """Park a standby worker until it is assigned a worker row.
+
+        The executor writes ``{"worker_id": N}`` to ``assignment_path`` when
+        it takes the container out of the standby set. The file may be read
+        while it is still being written, so unparseable content is retried.
+
+        Args:
+            assignment_path: File the assignment is delivered in
+            poll_interval: Seconds between checks
+
+        Returns:
+            The assigned worker ID, as CLM_WORKER_ID would carry it
+
+        Raises:
+            SystemExit: If no assignment arrives within the wait given by
+                the standby environment variable
+        """
+        try:
+            max_wait = float(os.getenv(STANDBY_ENV_VAR, ""))
+        except ValueError:
+            max_wait = 3600.0
+        logger.info(f"Standby worker waiting for assignment (up to {max_wait:.0f}s)")
+
+        deadline = time.monotonic() + max_wait
+        while time.monotonic() < deadline:
+            try:
+                data = json.loads(assignment_path.read_text(encoding="utf-8"))
+                worker_id = str(int(data["worker_id"]))
+            except (OSError, ValueError, KeyError, TypeError):
+                time.sleep(poll_interval)
+                continue
+            logger.info(f"Standby worker assigned worker ID {worker_id}")
+            return worker_id
+
+        raise SystemExit(f"Standby worker was not assigned a worker ID within {max_wait:.0f}s")
+
     @staticmethod
     def get_or_register_worker(
         db_path: Path | None,
@@ -1242,8 +1365,11 @@ class Worker(ABC):
         Raises:
             ValueError: If neither db_path nor api_url is provided
         """
-        # Check for pre-assigned worker ID
+        # Check for pre-assigned worker ID; a standby container receives it
+        # later, once the pool hands it a worker row.
         pre_assigned_id = os.getenv("CLM_WORKER_ID")
+        if pre_assigned_id is None and os.getenv(STANDBY_ENV_VAR):
+            pre_assigned_id = Worker.wait_for_standby_assignment()
 
         if pre_assigned_id is not None:
             worker_id = int(pre_assigned_id)
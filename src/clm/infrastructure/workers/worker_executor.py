@@ -5,23 +5,33 @@ in different modes (Docker containers or direct processes).
 """
 
 import importlib.util
+import io
+import json
 import logging
 import os
 import signal
 import subprocess
 import sys
+import tarfile
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any, cast
 
 import psutil  # type: ignore[import-untyped]
 
+from clm.core.build_trace import TRACE_ENV_VAR, trace_path_from_env
 from clm.infrastructure.api.binding import DOCKER_HOST_ALIAS
 from clm.infrastructure.workers.windows_job_object import WorkerJobObject
-from clm.infrastructure.workers.worker_base import JOBS_DB_PATH_ENV_VAR
+from clm.infrastructure.workers.worker_base import (
+    JOBS_DB_PATH_ENV_VAR,
+    PREWARM_ENV_VAR,
+    STANDBY_ASSIGNMENT_PATH,
+    STANDBY_ENV_VAR,
+)
 
 # Note: docker package is optional - may not be installed
 # Type annotations use string literals to avoid import errors
@@ -384,6 +394,7 @@ class DockerWorkerExecutor(WorkerExecutor):
         data_dir: Path | None = None,
         network_name: str | None = None,
         log_level: str = "INFO",
+        name_prefix: str = "clm",
     ):
         """Initialize Docker executor.
 
@@ -395,6 +406,9 @@ class DockerWorkerExecutor(WorkerExecutor):
             network_name: Docker network name (None = use default bridge for better
                 host.docker.internal support on Windows/WSL2)
             log_level: Logging level for workers
+            name_prefix: Prefix of container names. A container with the
+                same name is removed before a worker starts, so builds
+                sharing a Docker host concurrently need distinct prefixes.
         """
         self.docker_client = docker_client
         self.db_path = db_path
@@ -402,8 +416,18 @@ class DockerWorkerExecutor(WorkerExecutor):
         self.data_dir = data_dir
         self.network_name = network_name
         self.log_level = log_level
+        self.name_prefix = name_prefix
         self.containers: dict[str, Any] = {}  # Container objects when docker is installed
 
+        # Standby containers (see fill_standby), keyed by what makes two
+        # containers interchangeable: worker type, image and memory limit.
+        self.standby_max_wait = 3600.0
+        self._standby: dict[tuple[str, str, str], list[Any]] = {}
+        self._standby_targets: dict[tuple[str, str, str], int] = {}
+        self._standby_starting: dict[tuple[str, str, str], int] = {}
+        self._standby_lock = threading.Lock()
+        self._standby_closed = False
+
     def start_worker(
         self,
         worker_type: str,
@@ -411,11 +435,16 @@ class DockerWorkerExecutor(WorkerExecutor):
         config: WorkerConfig,
         db_worker_id: int | None = None,
     ) -> str | None:
-        """Start a worker in a Docker container."""
+        """Start a worker in a Docker container.
+
+        A pre-registered worker is handed a standby container when one is
+        parked for this configuration; otherwise a container is started
+        cold.
+        """
         import docker
         import docker.errors  # type: ignore[import-not-found]
 
-        container_name = f"clm-{worker_type}-worker-{index}"
+        container_name = f"{self.name_prefix}-{worker_type}-worker-{index}"
 
         # Checked here, not in ``__init__``: a Direct-mode build still
         # *constructs* this executor (the lifecycle manager builds one
@@ -427,6 +456,13 @@ class DockerWorkerExecutor(WorkerExecutor):
         if self.data_dir:
             _refuse_whole_volume_mount(self.data_dir, label="data directory (course sources)")
 
+        if db_worker_id is not None:
+            container_id = self._start_from_standby(
+                worker_type, container_name, config, db_worker_id
+            )
+            if container_id is not None:
+                return container_id
+
         try:
             # Check if container already exists
             try:
@@ -437,170 +473,362 @@ class DockerWorkerExecutor(WorkerExecutor):
             except docker.errors.NotFound:
                 pass
 
-            # Workers communicate via REST API instead of direct SQLite access
-            # This solves the SQLite WAL mode issues on Windows Docker
-            from clm.infrastructure.api.server import get_worker_api_endpoint
-
-            # Ask the running server where it is, rather than rebuilding the URL
-            # from the default port: the port is chosen at bind time (pinned via
-            # CLM_WORKER_API_PORT, OS-assigned under `0`, or moved off a taken
-            # default), so a hardcoded port would point containers at whatever
-            # else happens to be listening — or at nothing.
-            endpoint = get_worker_api_endpoint()
-            if endpoint is None:
-                raise RuntimeError(
-                    "Cannot start a Docker worker: the Worker API server is not running, "
-                    "so there is no port to point the container at and no token to give "
-                    "it. Every Worker API route requires one; a container without it "
-                    "would be rejected with 401."
-                )
-            api_url, api_token = endpoint
-
-            # Build volume mounts
-            volumes = {
-                str(self.workspace_path.absolute()): {"bind": "/workspace", "mode": "rw"},
-            }
-
-            # Build environment variables
-            environment = {
-                "WORKER_TYPE": worker_type,
-                "CLM_API_URL": api_url,  # Use REST API instead of direct SQLite
-                "CLM_API_TOKEN": api_token,  # Bearer token for every API route
-                "CLM_HOST_WORKSPACE": str(
-                    self.workspace_path.absolute()
-                ),  # For output path conversion
-                "LOG_LEVEL": self.log_level,
-                "PYTHONUNBUFFERED": "1",  # Enable immediate log output
-                # Config-resolved Jupyter settings for the notebook worker
-                # (Phase 4). Behavioural (not host-path) settings, so they apply
-                # inside the container too.
-                **_notebook_worker_jupyter_env(),
-            }
-
-            # Pass pre-assigned worker ID if provided (enables pre-registration)
-            if db_worker_id is not None:
-                environment["CLM_WORKER_ID"] = str(db_worker_id)
-
-            # Mount the source directory when provided. Read-write only for
-            # the workers that render diagrams *into* the source tree;
-            # the notebook worker — which executes course-authored code and
-            # writes its output to /workspace — gets it read-only (finding
-            # S10, #798).
-            if self.data_dir:
-                source_mode = "rw" if worker_type in _SOURCE_WRITING_WORKER_TYPES else "ro"
-                volumes[str(self.data_dir.absolute())] = {"bind": "/source", "mode": source_mode}
-                environment["CLM_HOST_DATA_DIR"] = str(self.data_dir.absolute())
-
-            # Forensic HTTP-replay trace harness. When the host activated
-            # tracing (CLM_HTTP_REPLAY_TRACE=1), bind-mount the trace
-            # directory at the same path inside the container so the
-            # absolute path embedded in NotebookPayload.http_replay_trace_dir
-            # is valid for the kernel, and pass through the trace env vars
-            # the bootstrap reads.
-            trace_inv_host = os.environ.get("CLM_HTTP_REPLAY_TRACE_INVOCATION_DIR", "").strip()
-            if os.environ.get("CLM_HTTP_REPLAY_TRACE", "").strip() and trace_inv_host:
-                from pathlib import Path as _TracePath
-
-                _trace_path = _TracePath(trace_inv_host).resolve()
-                _trace_path.mkdir(parents=True, exist_ok=True)
-                volumes[str(_trace_path)] = {"bind": str(_trace_path), "mode": "rw"}
-                environment["CLM_HTTP_REPLAY_TRACE"] = os.environ["CLM_HTTP_REPLAY_TRACE"]
-                environment["CLM_HTTP_REPLAY_TRACE_INVOCATION_DIR"] = str(_trace_path)
-                for _k in (
-                    "CLM_HTTP_REPLAY_TRACE_DIR",
-                    "CLM_HTTP_REPLAY_TRACE_VERBOSE",
-                    "CLM_HTTP_REPLAY_TRACE_MAX_BODY_BYTES",
-                ):
-                    _v = os.environ.get(_k, "")
-                    if _v:
-                        environment[_k] = _v
-
-            # Out-of-process mitmproxy HTTP-replay transport (issue #165 P4):
-            # route the container's LLM traffic through the host proxy via
-            # host.docker.internal and trust its CA, while keeping worker<->API
-            # traffic off the proxy. Only the notebook worker makes the LLM
-            # traffic the proxy intercepts, so we inject solely for it — diagram
-            # converters (plantuml/drawio) get no needless proxy env or CA mount.
-            # No-op unless the host activated the transport
-            # (CLM_HTTP_REPLAY_TRANSPORT=mitmproxy).
-            mitm_env, mitm_mount = (
-                _mitmproxy_docker_env(dict(os.environ)) if worker_type == "notebook" else ({}, None)
+            run_kwargs = self._container_run_kwargs(
+                worker_type, container_name, config, db_worker_id
             )
-            if mitm_env:
-                environment.update(mitm_env)
-                logger.debug(
-                    "mitmproxy transport: container proxy=%s NO_PROXY=%s CA=%s",
-                    environment.get("HTTPS_PROXY"),
-                    environment.get("NO_PROXY"),
-                    environment.get("SSL_CERT_FILE", "NOT MOUNTED"),
-                )
-            if mitm_mount is not None:
-                host_ca, container_ca = mitm_mount
-                volumes[host_ca] = {"bind": container_ca, "mode": "ro"}
+            container = self.docker_client.containers.run(**run_kwargs)
 
-            log_mounts = f"  Workspace: {self.workspace_path.absolute()} -> /workspace (rw)"
-            if self.data_dir:
-                log_mounts += f"\n  Source: {self.data_dir.absolute()} -> /source ({source_mode})"
-            else:
-                log_mounts += "\n  Source: NOT MOUNTED (data_dir not set)"
+            container_id = cast(str, container.id)
+            logger.info(f"Started container: {container_name} ({container_id[:12]})")
 
-            # Log environment variables for debugging
-            env_vars = (
-                f"  CLM_HOST_WORKSPACE: {environment.get('CLM_HOST_WORKSPACE', 'NOT SET')}\n"
-                f"  CLM_HOST_DATA_DIR: {environment.get('CLM_HOST_DATA_DIR', 'NOT SET')}"
-            )
+            # Store container reference using container ID as worker_id
+            self.containers[container_id] = container
+            return container_id
 
-            logger.debug(
-                f"Starting container {container_name}:\n"
-                f"Mounts:\n{log_mounts}\n"
-                f"Environment:\n{env_vars}\n"
-                f"API URL: {api_url}"
-            )
+        except Exception as e:
+            logger.error(f"Failed to start worker {container_name}: {e}", exc_info=True)
+            return None
 
-            # On Linux, host.docker.internal doesn't work by default.
-            # We need to add it as an extra host pointing to the host gateway.
-            # This is equivalent to: docker run --add-host=host.docker.internal:host-gateway
-            extra_hosts = {"host.docker.internal": "host-gateway"}
-
-            # Build container run kwargs - only include network if explicitly specified
-            # Using the default bridge network provides better host.docker.internal
-            # support on Windows with Docker Desktop (WSL2 backend)
-            run_kwargs: dict[str, Any] = {
-                "image": config.image,
-                "name": container_name,
-                "detach": True,
-                "remove": False,
-                "mem_limit": config.memory_limit,
-                "volumes": volumes,
-                "environment": environment,
-                "extra_hosts": extra_hosts,
-            }
+    @staticmethod
+    def _standby_key(worker_type: str, config: WorkerConfig) -> tuple[str, str, str]:
+        return (worker_type, config.image or "", config.memory_limit)
 
-            # Run as the host user where bind mounts keep host ownership
-            # (native Linux); elsewhere the image's non-root USER stands.
-            container_user = _container_user()
-            if container_user is not None:
-                run_kwargs["user"] = container_user
+    def fill_standby(self, worker_type: str, config: WorkerConfig, count: int) -> int:
+        """Keep ``count`` standby containers parked for this configuration.
 
-            if self.network_name:
-                run_kwargs["network"] = self.network_name
-                logger.debug(f"Using custom Docker network: {self.network_name}")
-            else:
-                logger.debug("Using default Docker bridge network for better host connectivity")
+        A standby container is created and started ahead of time without a
+        worker identity: the worker process finishes its imports and then
+        waits for an assignment (see ``Worker.wait_for_standby_assignment``).
+        :meth:`start_worker` hands these out to pre-registered workers, so a
+        scale-up or a crash replacement skips container creation, image
+        start-up and Python imports. Every container taken from the set is
+        replaced in the background.
+
+        Args:
+            worker_type: Worker type the containers run
+            config: Configuration whose image and memory limit they use
+            count: Number of containers to keep parked; 0 stops refilling
 
+        Returns:
+            The number of containers started by this call
+        """
+        key = self._standby_key(worker_type, config)
+        with self._standby_lock:
+            if self._standby_closed:
+                return 0
+            self._standby_targets[key] = count
+            starting = self._standby_starting.get(key, 0)
+            missing = max(0, count - len(self._standby.get(key, [])) - starting)
+            self._standby_starting[key] = starting + missing
+
+        started = 0
+        for remaining in range(missing, 0, -1):
+            container = self._start_standby_container(worker_type, config)
+            with self._standby_lock:
+                self._standby_starting[key] -= 1
+                keep = container is not None and not self._standby_closed
+                if keep:
+                    self._standby.setdefault(key, []).append(container)
+                    started += 1
+                else:
+                    # A failed start or cleanup(): release the other reservations.
+                    self._standby_starting[key] -= remaining - 1
+            if not keep:
+                if container is not None:
+                    self._discard_standby(container)
+                break
+        return started
+
+    def standby_count(self, worker_type: str, config: WorkerConfig) -> int:
+        """Number of standby containers currently parked for this configuration."""
+        with self._standby_lock:
+            return len(self._standby.get(self._standby_key(worker_type, config), []))
+
+    def _start_standby_container(self, worker_type: str, config: WorkerConfig) -> Any | None:
+        container_name = f"{self.name_prefix}-{worker_type}-standby-{uuid.uuid4().hex[:8]}"
+        try:
+            run_kwargs = self._container_run_kwargs(
+                worker_type, container_name, config, None, standby=True
+            )
             container = self.docker_client.containers.run(**run_kwargs)
+        except Exception as e:
+            logger.warning(f"Failed to start standby container {container_name}: {e}")
+            return None
+        logger.info(f"Started standby container: {container_name} ({container.id[:12]})")
+        return container
+
+    def _take_standby(self, worker_type: str, config: WorkerConfig) -> Any | None:
+        """Pop a running standby container, discarding any that have exited."""
+        key = self._standby_key(worker_type, config)
+        while True:
+            with self._standby_lock:
+                parked = self._standby.get(key)
+                if not parked:
+                    return None
+                container = parked.pop(0)
+            try:
+                container.reload()
+                if container.status == "running":
+                    return container
+            except Exception as e:
+                logger.debug(f"Standby container {container.id[:12]} is gone: {e}")
+            self._discard_standby(container)
 
-            container_id = cast(str, container.id)
-            logger.info(f"Started container: {container_name} ({container_id[:12]})")
+    def _start_from_standby(
+        self,
+        worker_type: str,
+        container_name: str,
+        config: WorkerConfig,
+        db_worker_id: int,
+    ) -> str | None:
+        """Assign a standby container to ``db_worker_id``; None if none is usable."""
+        import docker.errors
 
-            # Store container reference using container ID as worker_id
-            self.containers[container_id] = container
-            return container_id
+        container = self._take_standby(worker_type, config)
+        if container is None:
+            return None
 
+        try:
+            self._write_assignment(container, db_worker_id)
         except Exception as e:
-            logger.error(f"Failed to start worker {container_name}: {e}", exc_info=True)
+            logger.warning(f"Could not assign standby container {container.id[:12]}: {e}")
+            self._discard_standby(container)
             return None
 
+        # The name is cosmetic (``docker ps``, logs); the container ID is what
+        # the pool tracks, so a failed rename does not fail the start.
+        try:
+            try:
+                existing = self.docker_client.containers.get(container_name)
+                logger.warning(f"Container {container_name} already exists, removing...")
+                existing.stop(timeout=5)
+                existing.remove()
+            except docker.errors.NotFound:
+                pass
+            container.rename(container_name)
+        except Exception as e:
+            logger.debug(f"Could not rename standby container to {container_name}: {e}")
+
+        container_id = cast(str, container.id)
+        self.containers[container_id] = container
+        logger.info(
+            f"Assigned standby container {container_id[:12]} to worker {db_worker_id} "
+            f"({container_name})"
+        )
+        threading.Thread(
+            target=self._replenish_standby,
+            args=(worker_type, config),
+            name="DockerStandbyRefill",
+            daemon=True,
+        ).start()
+        return container_id
+
+    @staticmethod
+    def _write_assignment(container: Any, db_worker_id: int) -> None:
+        """Deliver the worker ID to a parked container as a one-file tar."""
+        path = PurePosixPath(STANDBY_ASSIGNMENT_PATH)
+        payload = json.dumps({"worker_id": db_worker_id}).encode("utf-8")
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            info = tarfile.TarInfo(path.name)
+            info.size = len(payload)
+            info.mode = 0o644
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(payload))
+        if not container.put_archive(str(path.parent), buffer.getvalue()):
+            raise RuntimeError(f"put_archive to {path.parent} was rejected")
+
+    def _replenish_standby(self, worker_type: str, config: WorkerConfig) -> None:
+        key = self._standby_key(worker_type, config)
+        with self._standby_lock:
+            target = self._standby_targets.get(key, 0)
+        if target > 0:
+            self.fill_standby(worker_type, config, target)
+
+    def _discard_standby(self, container: Any) -> None:
+        try:
+            container.remove(force=True)
+        except Exception as e:
+            logger.debug(f"Error removing standby container: {e}")
+
+    def _container_run_kwargs(
+        self,
+        worker_type: str,
+        container_name: str,
+        config: WorkerConfig,
+        db_worker_id: int | None,
+        *,
+        standby: bool = False,
+    ) -> dict[str, Any]:
+        """Build the ``containers.run`` arguments for a worker container.
+
+        ``standby=True`` builds a standby container: it is started without
+        ``CLM_WORKER_ID`` and parks until it is assigned one.
+        """
+        # Workers communicate via REST API instead of direct SQLite access
+        # This solves the SQLite WAL mode issues on Windows Docker
+        from clm.infrastructure.api.server import get_worker_api_endpoint
+
+        # Ask the running server where it is, rather than rebuilding the URL
+        # from the default port: the port is chosen at bind time (pinned via
+        # CLM_WORKER_API_PORT, OS-assigned under `0`, or moved off a taken
+        # default), so a hardcoded port would point containers at whatever
+        # else happens to be listening — or at nothing.
+        endpoint = get_worker_api_endpoint()
+        if endpoint is None:
+            raise RuntimeError(
+                "Cannot start a Docker worker: the Worker API server is not running, "
+                "so there is no port to point the container at and no token to give "
+                "it. Every Worker API route requires one; a container without it "
+                "would be rejected with 401."
+            )
+        api_url, api_token = endpoint
+
+        # Build volume mounts
+        volumes = {
+            str(self.workspace_path.absolute()): {"bind": "/workspace", "mode": "rw"},
+        }
+
+        # Build environment variables
+        environment = {
+            "WORKER_TYPE": worker_type,
+            "CLM_API_URL": api_url,  # Use REST API instead of direct SQLite
+            "CLM_API_TOKEN": api_token,  # Bearer token for every API route
+            "CLM_HOST_WORKSPACE": str(self.workspace_path.absolute()),  # For output path conversion
+            "LOG_LEVEL": self.log_level,
+            "PYTHONUNBUFFERED": "1",  # Enable immediate log output
+            # Config-resolved Jupyter settings for the notebook worker
+            # (Phase 4). Behavioural (not host-path) settings, so they apply
+            # inside the container too.
+            **_notebook_worker_jupyter_env(),
+        }
+
+        # Pass pre-assigned worker ID if provided (enables pre-registration).
+        # A standby container has none yet; it waits for an assignment file.
+        if db_worker_id is not None:
+            environment["CLM_WORKER_ID"] = str(db_worker_id)
+        elif standby:
+            environment[STANDBY_ENV_VAR] = str(self.standby_max_wait)
+
+        # Direct workers inherit the daemon's prewarm request through
+        # os.environ; containers only see what is passed explicitly.
+        if os.environ.get(PREWARM_ENV_VAR):
+            environment[PREWARM_ENV_VAR] = os.environ[PREWARM_ENV_VAR]
+
+        # Build tracing: containers record their spans when the host traces.
+        # Only the switch is passed — the host alone writes the trace file.
+        if trace_path_from_env() is not None:
+            environment[TRACE_ENV_VAR] = "1"
+
+        # Mount the source directory when provided. Read-write only for
+        # the workers that render diagrams *into* the source tree;
+        # the notebook worker — which executes course-authored code and
+        # writes its output to /workspace — gets it read-only (finding
+        # S10, #798).
+        if self.data_dir:
+            source_mode = "rw" if worker_type in _SOURCE_WRITING_WORKER_TYPES else "ro"
+            volumes[str(self.data_dir.absolute())] = {"bind": "/source", "mode": source_mode}
+            environment["CLM_HOST_DATA_DIR"] = str(self.data_dir.absolute())
+
+        # Forensic HTTP-replay trace harness. When the host activated
+        # tracing (CLM_HTTP_REPLAY_TRACE=1), bind-mount the trace
+        # directory at the same path inside the container so the
+        # absolute path embedded in NotebookPayload.http_replay_trace_dir
+        # is valid for the kernel, and pass through the trace env vars
+        # the bootstrap reads.
+        trace_inv_host = os.environ.get("CLM_HTTP_REPLAY_TRACE_INVOCATION_DIR", "").strip()
+        if os.environ.get("CLM_HTTP_REPLAY_TRACE", "").strip() and trace_inv_host:
+            from pathlib import Path as _TracePath
+
+            _trace_path = _TracePath(trace_inv_host).resolve()
+            _trace_path.mkdir(parents=True, exist_ok=True)
+            volumes[str(_trace_path)] = {"bind": str(_trace_path), "mode": "rw"}
+            environment["CLM_HTTP_REPLAY_TRACE"] = os.environ["CLM_HTTP_REPLAY_TRACE"]
+            environment["CLM_HTTP_REPLAY_TRACE_INVOCATION_DIR"] = str(_trace_path)
+            for _k in (
+                "CLM_HTTP_REPLAY_TRACE_DIR",
+                "CLM_HTTP_REPLAY_TRACE_VERBOSE",
+                "CLM_HTTP_REPLAY_TRACE_MAX_BODY_BYTES",
+            ):
+                _v = os.environ.get(_k, "")
+                if _v:
+                    environment[_k] = _v
+
+        # Out-of-process mitmproxy HTTP-replay transport (issue #165 P4):
+        # route the container's LLM traffic through the host proxy via
+        # host.docker.internal and trust its CA, while keeping worker<->API
+        # traffic off the proxy. Only the notebook worker makes the LLM
+        # traffic the proxy intercepts, so we inject solely for it — diagram
+        # converters (plantuml/drawio) get no needless proxy env or CA mount.
+        # No-op unless the host activated the transport
+        # (CLM_HTTP_REPLAY_TRANSPORT=mitmproxy).
+        mitm_env, mitm_mount = (
+            _mitmproxy_docker_env(dict(os.environ)) if worker_type == "notebook" else ({}, None)
+        )
+        if mitm_env:
+            environment.update(mitm_env)
+            logger.debug(
+                "mitmproxy transport: container proxy=%s NO_PROXY=%s CA=%s",
+                environment.get("HTTPS_PROXY"),
+                environment.get("NO_PROXY"),
+                environment.get("SSL_CERT_FILE", "NOT MOUNTED"),
+            )
+        if mitm_mount is not None:
+            host_ca, container_ca = mitm_mount
+            volumes[host_ca] = {"bind": container_ca, "mode": "ro"}
+
+        log_mounts = f"  Workspace: {self.workspace_path.absolute()} -> /workspace (rw)"
+        if self.data_dir:
+            log_mounts += f"\n  Source: {self.data_dir.absolute()} -> /source ({source_mode})"
+        else:
+            log_mounts += "\n  Source: NOT MOUNTED (data_dir not set)"
+
+        # Log environment variables for debugging
+        env_vars = (
+            f"  CLM_HOST_WORKSPACE: {environment.get('CLM_HOST_WORKSPACE', 'NOT SET')}\n"
+            f"  CLM_HOST_DATA_DIR: {environment.get('CLM_HOST_DATA_DIR', 'NOT SET')}"
+        )
+
+        logger.debug(
+            f"Starting container {container_name}:\n"
+            f"Mounts:\n{log_mounts}\n"
+            f"Environment:\n{env_vars}\n"
+            f"API URL: {api_url}"
+        )
+
+        # On Linux, host.docker.internal doesn't work by default.
+        # We need to add it as an extra host pointing to the host gateway.
+        # This is equivalent to: docker run --add-host=host.docker.internal:host-gateway
+        extra_hosts = {"host.docker.internal": "host-gateway"}
+
+        # Build container run kwargs - only include network if explicitly specified
+        # Using the default bridge network provides better host.docker.internal
+        # support on Windows with Docker Desktop (WSL2 backend)
+        run_kwargs: dict[str, Any] = {
+            "image": config.image,
+            "name": container_name,
+            "detach": True,
+            "remove": False,
+            "mem_limit": config.memory_limit,
+            "volumes": volumes,
+            "environment": environment,
+            "extra_hosts": extra_hosts,
+        }
+
+        # Run as the host user where bind mounts keep host ownership
+        # (native Linux); elsewhere the image's non-root USER stands.
+        container_user = _container_user()
+        if container_user is not None:
+            run_kwargs["user"] = container_user
+
+        if self.network_name:
+            run_kwargs["network"] = self.network_name
+            logger.debug(f"Using custom Docker network: {self.network_name}")
+        else:
+            logger.debug("Using default Docker bridge network for better host connectivity")
+
+        return run_kwargs
+
     def stop_worker(self, worker_id: str) -> bool:
         """Stop a Docker container worker."""
         import docker
@@ -716,12 +944,21 @@ class DockerWorkerExecutor(WorkerExecutor):
             return None
 
     def cleanup(self) -> None:
-        """Stop and remove all managed containers."""
+        """Stop and remove all managed containers, including standby ones."""
         logger.info(f"Cleaning up {len(self.containers)} Docker workers")
 
         for worker_id in list(self.containers.keys()):
             self.stop_worker(worker_id)
 
+        with self._standby_lock:
+            self._standby_closed = True
+            parked = [c for containers in self._standby.values() for c in containers]
+            self._standby.clear()
+        if parked:
+            logger.info(f"Removing {len(parked)} standby containers")
+        for container in parked:
+            self._discard_standby(container)
+
 
 class DirectWorkerExecutor(WorkerExecutor):
     """Executor for running workers as direct processes."""
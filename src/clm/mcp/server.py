@@ -429,7 +429,7 @@ def create_server(data_dir: Path) -> FastMCP:
     ) -> str:
         """Transcribe a video via the artifact cache and return a summary.
 
-        Reads the shared voiceover cache's ``transcripts/`` first;
+        Reads the shared voiceover cache's transcripts first;
         computes + caches on miss.  Returns a JSON summary (segment
         count, duration, first/last segment) — not the full transcript,
         to keep MCP round-trips small.  For the full transcript, call
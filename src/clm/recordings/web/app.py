@@ -138,7 +138,7 @@ def create_app(
     from clm.recordings.workflow.directories import ensure_root
     from clm.recordings.workflow.event_bus import EventBus
     from clm.recordings.workflow.job_manager import JOB_EVENT_TOPIC, JobManager
-    from clm.recordings.workflow.job_store import DEFAULT_JOBS_FILE, JsonFileJobStore
+    from clm.recordings.workflow.job_store import DEFAULT_JOURNAL_FILE, JournalJobStore
     from clm.recordings.workflow.jobs import ProcessingJob
     from clm.recordings.workflow.obs import ObsClient
     from clm.recordings.workflow.session import ArmedDeck, RecordingSession
@@ -259,7 +259,7 @@ def create_app(
     # session because the session's on_path_rename callback forwards
     # cascade renames into the job manager (keeps in-flight jobs pointing
     # at the renamed stem after the multi-part cascade fires).
-    job_store = JsonFileJobStore(recordings_root / DEFAULT_JOBS_FILE)
+    job_store = JournalJobStore(recordings_root / DEFAULT_JOURNAL_FILE)
     event_bus = EventBus()
 
     backend_config = RecordingsConfig(
@@ -3,12 +3,28 @@
 Jobs outlive the process — an Auphonic production can take 30 minutes,
 and a crash in the middle must not lose the job reference so the poller
 can pick it up on restart. This module provides a :class:`JobStore`
-Protocol plus a :class:`JsonFileJobStore` implementation that writes all
-jobs to a single JSON file under ``<recordings-root>/.clm/jobs.json``.
+Protocol and two implementations:
 
-Atomic writes: each save serializes the full job list to a temp file in
-the same directory and then renames it over the target. This guarantees
-that readers never see a half-written file even on abrupt shutdown.
+* :class:`JournalJobStore` — the default. An append-only JSON Lines journal
+  under ``<recordings-root>/.clm/jobs.jsonl``: each save or delete appends
+  one record, so an update costs the same however many jobs the store
+  holds. The journal is compacted (rewritten atomically with one record per
+  live job) once superseded records dominate it.
+* :class:`JsonFileJobStore` — the original single JSON file
+  (``.clm/jobs.json``), rewritten atomically on every save. A journal store
+  migrates an existing file of this kind on first open.
+
+Atomic writes: full rewrites serialize to a temp file in the same
+directory and then rename it over the target, so readers never see a
+half-written file even on abrupt shutdown. A journal append cut short by a
+crash leaves at most one torn last line, which is discarded on the next
+open.
+
+Sharing: the CLI and the web dashboard open the same journal. Each append
+opens the file afresh and every journal access holds a lock file next to
+it (``jobs.jsonl.lock``), so a compaction by one process neither strands
+the other's appends on the replaced file nor rewrites the journal from a
+stale in-memory view.
 """
 
 from __future__ import annotations
@@ -17,15 +33,27 @@ import json
 import os
 import threading
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
 from loguru import logger
 
 from clm.recordings.workflow.jobs import ProcessingJob
 
-#: Default location of the job store, relative to the recordings root.
+if TYPE_CHECKING:
+    from filelock import FileLock
+
+#: Location of the legacy single-file job store, relative to the recordings root.
 DEFAULT_JOBS_FILE = Path(".clm/jobs.json")
 
+#: Default location of the job journal, relative to the recordings root.
+DEFAULT_JOURNAL_FILE = Path(".clm/jobs.jsonl")
+
+#: The journal is never compacted while it holds fewer records than this.
+COMPACT_MIN_RECORDS = 1000
+
+#: ... and only once it holds this many records per live job.
+COMPACT_RATIO = 4
+
 
 class JobStore(Protocol):
     """Persistence interface for jobs.
@@ -132,3 +160,170 @@ class JsonFileJobStore:
                 except OSError:
                     pass
             raise
+
+
+class JournalJobStore:
+    """Store jobs in an append-only JSON Lines journal.
+
+    Every :meth:`save` appends ``{"op": "save", "job": ...}`` and every
+    :meth:`delete` appends ``{"op": "delete", "id": ...}``; the journal is
+    replayed on construction and held in memory thereafter. Progress
+    updates from the poller therefore cost one short write each instead of
+    re-serializing every job.
+
+    Once the journal holds at least :data:`COMPACT_MIN_RECORDS` records and
+    :data:`COMPACT_RATIO` times as many records as live jobs, it is
+    rewritten atomically with one record per job. Compaction first re-reads
+    the journal, so records appended by another process sharing it are kept.
+
+    Args:
+        path: Path to the journal. Parent directory is created if missing.
+        legacy_path: A :class:`JsonFileJobStore` file to migrate from when
+            the journal does not exist yet; defaults to *path* with a
+            ``.json`` suffix. After migration it is renamed to
+            ``<name>.migrated`` so it is not imported twice.
+    """
+
+    def __init__(self, path: Path, *, legacy_path: Path | None = None) -> None:
+        # filelock comes with the [recordings] extra; importing here keeps
+        # the module importable for the Protocol and the legacy store.
+        from filelock import FileLock
+
+        self._path = path
+        self._legacy_path = legacy_path if legacy_path is not None else path.with_suffix(".json")
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(str(path.with_name(path.name + ".lock")))
+        self._jobs: dict[str, ProcessingJob] = {}
+        self._records = 0
+        if self._path.exists() or self._legacy_path.exists():
+            with self._locked():
+                if self._path.exists():
+                    try:
+                        data = self._path.read_bytes()
+                    except OSError as exc:
+                        logger.warning(
+                            "Could not read job journal at {}: {}. Starting empty.", self._path, exc
+                        )
+                    else:
+                        self._replay(data)
+                else:
+                    self._migrate()
+
+    # ------------------------------------------------------------------
+    # Protocol surface
+    # ------------------------------------------------------------------
+
+    def load_all(self) -> list[ProcessingJob]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def save(self, job: ProcessingJob) -> None:
+        with self._lock:
+            self._jobs[job.id] = job
+            self._append({"op": "save", "job": job.model_dump(mode="json")})
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            if job_id in self._jobs:
+                del self._jobs[job_id]
+                self._append({"op": "delete", "id": job_id})
+
+    # ------------------------------------------------------------------
+    # Disk IO (caller must hold self._lock and, except for _locked,
+    # the lock returned by _locked)
+    # ------------------------------------------------------------------
+
+    def _locked(self) -> FileLock:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        return self._file_lock
+
+    def _replay(self, data: bytes) -> None:
+        good_end = 0
+        offset = 0
+        for line in data.splitlines(keepends=True):
+            offset += len(line)
+            if not line.endswith(b"\n"):
+                # A torn final append from a crash; dropped below.
+                break
+            good_end = offset
+            if not line.strip():
+                continue
+            self._records += 1
+            try:
+                self._apply(json.loads(line))
+            except Exception as exc:
+                logger.warning("Skipping invalid record in {}: {}", self._path, exc)
+
+        if good_end < len(data):
+            logger.warning(
+                "Discarding {} bytes of incomplete trailing record in {}",
+                len(data) - good_end,
+                self._path,
+            )
+            with self._path.open("r+b") as f:
+                f.truncate(good_end)
+
+    def _apply(self, record: dict) -> None:
+        op = record.get("op")
+        if op == "save":
+            job = ProcessingJob.model_validate(record["job"])
+            self._jobs[job.id] = job
+        elif op == "delete":
+            self._jobs.pop(record["id"], None)
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    def _migrate(self) -> None:
+        legacy = JsonFileJobStore(self._legacy_path)
+        for job in legacy.load_all():
+            self._jobs[job.id] = job
+        self._compact()
+        migrated = self._legacy_path.with_name(self._legacy_path.name + ".migrated")
+        try:
+            os.replace(self._legacy_path, migrated)
+        except OSError as exc:
+            logger.warning("Could not rename migrated job store {}: {}", self._legacy_path, exc)
+        logger.info("Migrated {} job(s) from {} to {}", len(self._jobs), migrated, self._path)
+
+    def _append(self, record: dict) -> None:
+        with self._locked():
+            # Opened per append: a handle kept across a compaction (ours or
+            # another process's) would point at the replaced file.
+            with self._path.open("ab") as f:
+                f.write(_encode(record))
+            self._records += 1
+            if self._records >= max(COMPACT_MIN_RECORDS, COMPACT_RATIO * len(self._jobs)):
+                try:
+                    self._compact()
+                except OSError as exc:
+                    # The journal is intact; compaction is retried on a later append.
+                    logger.warning("Could not compact job journal {}: {}", self._path, exc)
+
+    def _compact(self) -> None:
+        if self._path.exists():
+            # Fold in records appended by other processes since our last read.
+            data = self._path.read_bytes()
+            self._jobs.clear()
+            self._records = 0
+            self._replay(data)
+        serialized = b"".join(
+            _encode({"op": "save", "job": job.model_dump(mode="json")})
+            for job in self._jobs.values()
+        )
+
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        try:
+            tmp.write_bytes(serialized)
+            os.replace(tmp, self._path)
+        except OSError:
+            if tmp.exists():
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+            raise
+        self._records = len(self._jobs)
+
+
+def _encode(record: dict) -> bytes:
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
@@ -356,6 +356,7 @@ def check_coverage_for_text(
     file_str = str(file_path)
 
     prompt_version = _prompt_version(options.judge)
+    cached_verdicts = _prefetch_verdicts(pairs, prompt_version, options.cache)
 
     for pair in pairs:
         result.pairs_total += 1
@@ -402,6 +403,7 @@ def check_coverage_for_text(
             pair=pair,
             options=options,
             result=result,
+            cached_verdicts=cached_verdicts,
         )
         if verdict is None:
             result.pairs_skipped += 1
@@ -438,6 +440,36 @@ def _prompt_version(judge: CoverageJudge | None) -> str:
     return getattr(judge, "prompt_version", "v1")
 
 
+def _prefetch_verdicts(
+    pairs: list[CoveragePair],
+    prompt_version: str,
+    cache: CoverageCache | None,
+) -> dict[tuple[str, str, str, str], tuple[str, str | None]]:
+    """Load the cached verdicts of every judgeable pair in one batched lookup.
+
+    Mirrors the skip rules of :func:`check_coverage_for_text`: pairs without
+    bullets or without voiceover text never reach the cache.
+    """
+    if cache is None:
+        return {}
+    keys = []
+    for pair in pairs:
+        if not extract_bullets(pair.slide_cell.content):
+            continue
+        voiceover_text = _narrative_text(pair.narrative_cells)
+        if not voiceover_text.strip():
+            continue
+        keys.append(
+            (
+                _content_hash(pair.slide_cell.content),
+                _content_hash(voiceover_text),
+                prompt_version,
+                pair.lang,
+            )
+        )
+    return cache.get_many(keys)
+
+
 def _lookup_or_judge(
     *,
     slide_hash: str,
@@ -448,12 +480,14 @@ def _lookup_or_judge(
     pair: CoveragePair,
     options: CoverageOptions,
     result: CoverageResult,
+    cached_verdicts: dict[tuple[str, str, str, str], tuple[str, str | None]],
 ) -> CoverageVerdict | None:
     from clm.infrastructure.llm.ollama_client import CoverageVerdict, OllamaError
 
     cache = options.cache
+    key = (slide_hash, voiceover_hash, prompt_version, pair.lang)
     if cache is not None:
-        cached = cache.get(slide_hash, voiceover_hash, prompt_version, pair.lang)
+        cached = cached_verdicts.get(key)
         if cached is not None:
             result.cache_hits += 1
             verdict_str, gap_details = cached
@@ -486,14 +520,9 @@ def _lookup_or_judge(
 
     result.llm_calls += 1
     if cache is not None and not options.report_only:
-        cache.put(
-            slide_hash,
-            voiceover_hash,
-            prompt_version,
-            pair.lang,
-            verdict.verdict,
-            verdict.to_json(),
-        )
+        gap_details = verdict.to_json()
+        cache.put(*key, verdict.verdict, gap_details)
+        cached_verdicts[key] = (verdict.verdict, gap_details)
     return verdict
 
 
@@ -0,0 +1,284 @@
+"""Long-lived ``git cat-file`` sessions for the historical-text readers.
+
+:mod:`clm.slides.git_text` used to fork one ``git show`` per blob and one
+``git rev-parse`` per ref, and ``slides sync`` / the doc ledger / voiceover
+revision scoring call it in loops over decks and refs — on a full course the
+reports spent most of their wall time spawning git. This module keeps, per
+repository root, one ``git cat-file --batch`` process (blob contents) and one
+``git cat-file --batch-check`` process (ref resolution) alive and multiplexes
+every read through them.
+
+On top of the pipes sits a small in-process LRU. Entries are keyed by the
+*resolved* object id, never by a spelled ref: ``HEAD`` moves with every
+commit, so each lookup first resolves the ref (one cheap round trip on the
+already-running ``--batch-check`` session) and the cache only ever answers
+for the immutable ``(object, path)`` it resolved to. ``git log`` output — the
+rename walk and the recent-change list, which ``cat-file`` cannot answer — is
+memoized the same way, keyed by the ``HEAD`` commit it was computed at.
+
+Everything degrades like the subprocess helpers did: a dead or missing git
+yields ``None``. A session whose process died (or whose protocol stream got
+out of step) is restarted once and the request retried.
+"""
+
+from __future__ import annotations
+
+import atexit
+import subprocess
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TypeVar
+
+__all__ = [
+    "CatFileSession",
+    "GitObjectReader",
+    "close_readers",
+    "git_capture",
+    "object_reader",
+    "repo_location",
+]
+
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+
+#: Entries kept by each reader's blob-text and log-output LRUs.
+LRU_SIZE = 256
+
+
+def git_capture(cwd: Path, *args: str) -> str | None:
+    """``git <args>`` run in ``cwd`` — stdout, or ``None`` on any failure.
+
+    ``errors="replace"``: a historical blob that is not valid UTF-8 (a legacy
+    latin-1 commit) must degrade to replacement characters — which then fail
+    any fingerprint match and are skipped — never raise ``UnicodeDecodeError``
+    out of a read helper. Strict decoding crashed the #773 recovery walk on
+    the first such commit inside its window (on POSIX the decode happens in
+    the main thread), and would equally have crashed ``--since REF`` aimed at
+    one.
+    """
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=str(cwd),
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            check=False,
+        )
+    except (FileNotFoundError, OSError):
+        return None
+    if completed.returncode != 0:
+        return None
+    return completed.stdout
+
+
+def _decode(data: bytes) -> str:
+    """Decode a blob exactly as ``git_capture`` (text mode) would have.
+
+    Text-mode pipes apply universal newlines, so ``\\r\\n`` and lone ``\\r``
+    read as ``\\n`` — keep that, or a CRLF deck would fingerprint differently
+    through the batch reader than through ``git show``.
+    """
+    text = data.decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class CatFileSession:
+    """One ``git cat-file --batch`` / ``--batch-check`` process.
+
+    Not thread-safe on its own; :class:`GitObjectReader` serializes access.
+    """
+
+    def __init__(self, root: Path, *, contents: bool):
+        self.root = root
+        self.contents = contents
+        self._proc: subprocess.Popen[bytes] | None = None
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        mode = "--batch" if self.contents else "--batch-check"
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", mode],
+            cwd=str(self.root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        return self._proc
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+        finally:
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+    def query(self, spec: str) -> tuple[str, bytes | None] | None:
+        """Look up ``spec``; ``(object_id, contents-or-None)`` or ``None`` if absent.
+
+        ``contents`` is ``None`` for a ``--batch-check`` session. A broken
+        pipe restarts the process and retries once; a second failure (or no
+        git at all) answers ``None``.
+        """
+        if "\n" in spec:
+            return None  # the line protocol cannot carry it
+        for attempt in (1, 2):
+            try:
+                return self._query_once(spec)
+            except (OSError, ValueError) as exc:
+                self.close()
+                if attempt == 2 or isinstance(exc, FileNotFoundError):
+                    return None
+        return None  # pragma: no cover - loop always returns
+
+    def _query_once(self, spec: str) -> tuple[str, bytes | None] | None:
+        proc = self._proc if self._proc is not None and self._proc.poll() is None else None
+        if proc is None:
+            self.close()
+            proc = self._start()
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write(spec.encode("utf-8") + b"\n")
+        proc.stdin.flush()
+        header = proc.stdout.readline()
+        if not header.endswith(b"\n"):
+            raise ValueError("git cat-file exited")
+        if header.endswith((b" missing\n", b" ambiguous\n")):
+            return None
+        fields = header.split()
+        if len(fields) != 3:
+            # Unknown reply (e.g. a symlink-loop notice): the stream position
+            # is no longer trustworthy, so start over on the next request.
+            raise ValueError(f"unexpected cat-file reply: {header!r}")
+        object_id, _kind, size_text = fields
+        if not self.contents:
+            return object_id.decode("ascii"), None
+        size = int(size_text)
+        data = proc.stdout.read(size + 1)  # the blob plus its trailing LF
+        if len(data) != size + 1:
+            raise ValueError("git cat-file exited mid-object")
+        return object_id.decode("ascii"), data[:-1]
+
+
+class GitObjectReader:
+    """Thread-safe, cached object access for one repository root."""
+
+    def __init__(self, root: Path, *, lru_size: int = LRU_SIZE):
+        self.root = root
+        self._lock = threading.Lock()
+        self._batch = CatFileSession(root, contents=True)
+        self._check = CatFileSession(root, contents=False)
+        self._lru_size = lru_size
+        self._texts: OrderedDict[tuple[str, str], str | None] = OrderedDict()
+        self._logs: OrderedDict[tuple[str, tuple[str, ...]], str | None] = OrderedDict()
+
+    def close(self) -> None:
+        with self._lock:
+            self._batch.close()
+            self._check.close()
+
+    def resolve(self, rev: str) -> str | None:
+        """The object id ``rev`` names (any revision syntax), or ``None``."""
+        with self._lock:
+            found = self._check.query(rev)
+        return found[0] if found else None
+
+    def text(self, ref: str, root_rel: str) -> str | None:
+        """Text of repo-root-relative ``root_rel`` at ``ref``, or ``None``."""
+        object_id = self.resolve(ref)
+        if object_id is None:
+            return None
+        key = (object_id, root_rel)
+        with self._lock:
+            if key in self._texts:
+                self._texts.move_to_end(key)
+                return self._texts[key]
+            found = self._batch.query(f"{object_id}:{root_rel}")
+            text = _decode(found[1]) if found and found[1] is not None else None
+            self._remember(self._texts, key, text)
+        return text
+
+    def log(self, *args: str) -> str | None:
+        """``git log <args>`` run at the root, memoized per ``HEAD`` commit.
+
+        Not cached when ``HEAD`` does not resolve (an unborn branch), so the
+        first commit is seen immediately.
+        """
+        head = self.resolve("HEAD")
+        if head is None:
+            return git_capture(self.root, "log", *args)
+        key = (head, args)
+        with self._lock:
+            if key in self._logs:
+                self._logs.move_to_end(key)
+                return self._logs[key]
+        out = git_capture(self.root, "log", *args)
+        with self._lock:
+            self._remember(self._logs, key, out)
+        return out
+
+    def _remember(self, lru: OrderedDict[_K, _T], key: _K, value: _T) -> None:
+        lru[key] = value
+        lru.move_to_end(key)
+        while len(lru) > self._lru_size:
+            lru.popitem(last=False)
+
+
+_registry_lock = threading.Lock()
+_readers: dict[Path, GitObjectReader] = {}
+# Directory -> (toplevel, prefix). Only successful lookups are kept: a
+# directory outside any repository may become one (``git init``) later.
+_locations: dict[Path, tuple[Path, str]] = {}
+
+
+def repo_location(directory: Path) -> tuple[Path, str] | None:
+    """``(repo root, prefix of directory within it)`` — or ``None`` outside git.
+
+    The prefix is what ``git`` resolves a ``./name`` path against (``""`` at
+    the root, otherwise ``"sub/dir/"``), so ``prefix + name`` is the
+    repo-root-relative name of a file in ``directory``.
+    """
+    key = directory.absolute()
+    with _registry_lock:
+        cached = _locations.get(key)
+    if cached is not None:
+        return cached
+    out = git_capture(directory, "rev-parse", "--show-toplevel", "--show-prefix")
+    if out is None:
+        return None
+    lines = out.split("\n")
+    if len(lines) < 2 or not lines[0]:
+        return None
+    location = (Path(lines[0]), lines[1])
+    with _registry_lock:
+        _locations[key] = location
+    return location
+
+
+def object_reader(root: Path) -> GitObjectReader:
+    """The shared :class:`GitObjectReader` for repository ``root``."""
+    with _registry_lock:
+        reader = _readers.get(root)
+        if reader is None:
+            reader = _readers[root] = GitObjectReader(root)
+        return reader
+
+
+def close_readers() -> None:
+    """Stop every session and forget cached locations (tests, long-lived servers)."""
+    with _registry_lock:
+        readers = list(_readers.values())
+        _readers.clear()
+        _locations.clear()
+    for reader in readers:
+        reader.close()
+
+
+atexit.register(close_readers)
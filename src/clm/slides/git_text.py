@@ -6,45 +6,28 @@ bundle_texts_at_ref``) because the keep-components need them: the structural
 verify's no-drop check reads each half at ``HEAD``, and ``sync report
 --since REF`` reads the whole ≤4-file bundle at a forensic ref. Everything
 here is read-only and degrades to ``None`` when git is unavailable, the ref
-does not resolve, or the file is untracked there.
+does not resolve, or the file is untracked there. Reads go through the
+per-repository ``git cat-file`` sessions of :mod:`clm.slides.git_cat_file`,
+so a loop over decks and refs no longer spawns a git process per blob.
 """
 
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
 
 from clm.core.voiceover_companions import COMPANION_SUBDIR, companion_name
+from clm.slides.git_cat_file import GitObjectReader, object_reader, repo_location
 
 __all__ = ["bundle_texts_at_ref", "git_ref_text", "recent_change_refs", "resolve_commit"]
 
 
-def _git_capture(cwd: Path, *args: str) -> str | None:
-    """``git <args>`` run in ``cwd`` — stdout, or ``None`` on any failure.
-
-    ``errors="replace"``: a historical blob that is not valid UTF-8 (a legacy
-    latin-1 commit) must degrade to replacement characters — which then fail
-    any fingerprint match and are skipped — never raise ``UnicodeDecodeError``
-    out of a read helper. Strict decoding crashed the #773 recovery walk on
-    the first such commit inside its window (on POSIX the decode happens in
-    the main thread), and would equally have crashed ``--since REF`` aimed at
-    one.
-    """
-    try:
-        completed = subprocess.run(
-            ["git", *args],
-            cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            check=False,
-        )
-    except (FileNotFoundError, OSError):
-        return None
-    if completed.returncode != 0:
+def _reader_for(directory: Path) -> tuple[GitObjectReader, str] | None:
+    """The shared reader for ``directory``'s repo and the directory's prefix in it."""
+    location = repo_location(directory)
+    if location is None:
         return None
-    return completed.stdout
+    root, prefix = location
+    return object_reader(root), prefix
 
 
 def _git_historical_paths(path: Path, ref: str) -> list[str]:
@@ -53,15 +36,17 @@ def _git_historical_paths(path: Path, ref: str) -> list[str]:
     Follows git rename detection (``git log --follow -M``) so a deck that was
     renamed (or whose content git tracks across a rename) can be located at an
     arbitrary ``ref`` even though its *current* name did not exist there. Each
-    returned name is repo-root-relative (``git show <ref>:<name>`` addresses it
+    returned name is repo-root-relative (``<ref>:<name>`` addresses it
     directly). Empty when git is unavailable or the file has no tracked history.
     ``ref`` is accepted for symmetry but does not constrain the walk — the caller
     tries every historical name at ``ref`` and keeps the one that resolves (at any
     given commit the file exists under exactly one of them).
     """
-    out = _git_capture(
-        path.parent, "log", "--follow", "-M", "--name-only", "--format=", "--", path.name
-    )
+    found = _reader_for(path.parent)
+    if found is None:
+        return []
+    reader, prefix = found
+    out = reader.log("--follow", "-M", "--name-only", "--format=", "--", prefix + path.name)
     if out is None:
         return []
     names: list[str] = []
@@ -76,8 +61,8 @@ def git_ref_text(path: Path, ref: str = "HEAD") -> str | None:
     """The text of ``path`` at git ``ref`` (default ``HEAD``), or ``None``.
 
     ``None`` when git is unavailable, the file is untracked at ``ref`` (even after
-    following renames), the ref does not resolve, or ``git show`` fails. ``ref`` may
-    be any revision spec (``HEAD~1``, a commit SHA, ``origin/master``, …).
+    following renames), or the ref does not resolve. ``ref`` may be any revision
+    spec (``HEAD~1``, a commit SHA, ``origin/master``, …).
 
     Issue #2: a deck renamed since ``ref`` does not exist there under its *current*
     name, which used to degrade silently to "no baseline". We first try the
@@ -86,24 +71,28 @@ def git_ref_text(path: Path, ref: str = "HEAD") -> str | None:
     committed text. A topic *split* (one file becoming several) is not a git rename
     and is not recovered here.
     """
-    text = _git_capture(path.parent, "show", f"{ref}:./{path.name}")
+    found = _reader_for(path.parent)
+    if found is None:
+        return None
+    reader, prefix = found
+    text = reader.text(ref, prefix + path.name)
     if text is not None:
         return text
     for root_rel in _git_historical_paths(path, ref):
-        text = _git_capture(path.parent, "show", f"{ref}:{root_rel}")
+        text = reader.text(ref, root_rel)
         if text is not None:
             return text
     return None
 
 
 def _repo_root(path: Path) -> Path | None:
-    out = _git_capture(path if path.is_dir() else path.parent, "rev-parse", "--show-toplevel")
-    return Path(out.strip()) if out else None
+    location = repo_location(path if path.is_dir() else path.parent)
+    return location[0] if location else None
 
 
 def _text_at_ref(root: Path, path: Path, ref: str) -> str | None:
     rel = path.resolve().relative_to(root.resolve()).as_posix()
-    return _git_capture(root, "show", f"{ref}:{rel}")
+    return object_reader(root).text(ref, rel)
 
 
 def recent_change_refs(de_path: Path, en_path: Path, *, cap: int) -> list[str]:
@@ -138,7 +127,7 @@ def recent_change_refs(de_path: Path, en_path: Path, *, cap: int) -> list[str]:
         # or subst'd course dirs). `git log --` with no pathspec would silently
         # widen to whole-repo history — degrade instead.
         return []
-    out = _git_capture(root, "log", f"-{cap}", "--format=%H", "--", *paths)
+    out = object_reader(root).log(f"-{cap}", "--format=%H", "--", *paths)
     return out.split() if out else []
 
 
@@ -152,8 +141,7 @@ def resolve_commit(path: Path, ref: str) -> str | None:
     root = _repo_root(path)
     if root is None:
         return None
-    out = _git_capture(root, "rev-parse", "--verify", f"{ref}^{{commit}}")
-    return out.strip() if out else None
+    return object_reader(root).resolve(f"{ref}^{{commit}}")
 
 
 def bundle_texts_at_ref(
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
@@ -431,3 +432,28 @@ class CachingSlideTranslator:
         # failure), so the cache never stores a bad translation.
         self.cache.put(content_hash, version, source_lang, target_lang, role, result)
         return result
+
+    def lookup_many(
+        self,
+        requests: Iterable[tuple[str, str]],
+        *,
+        source_lang: str,
+        target_lang: str,
+    ) -> dict[tuple[str, str], str]:
+        """Return the cached translations of many ``(source_body, role)`` pairs.
+
+        One batched cache query; misses are simply absent. The deck engine calls
+        this before dispatching the misses through :meth:`translate`.
+        """
+        version = self.prompt_version
+        keys = {
+            (
+                hashlib.sha256(source_body.encode("utf-8")).hexdigest(),
+                version,
+                source_lang,
+                target_lang,
+                role,
+            ): (source_body, role)
+            for source_body, role in requests
+        }
+        return {keys[key]: hit for key, hit in self.cache.get_many(keys).items()}
@@ -25,6 +25,14 @@ invariant :mod:`clm.slides.split` rests on — so a malformed twin can never
 reach disk. The engine is all-or-nothing: it returns a complete target text or
 raises :class:`TranslateDeckError`; it never half-writes.
 
+Translation is planned before the deck is assembled: every distinct
+``(body, role)`` the deck needs is collected first, so a body that occurs in
+several cells is translated once. A translator that exposes ``lookup_many``
+(the caching wrapper) resolves its cached entries in one batch. The remaining
+requests run on a small thread pool bounded by ``max_concurrent``, and the
+deck is then rebuilt in source order. The output does not depend on the
+concurrency: the same translations land in the same cells.
+
 This module touches neither the network nor the filesystem. File resolution,
 provider/key wiring, id minting, the watermark seal, the voiceover companion
 and result caching are later phases.
@@ -33,6 +41,8 @@ and result caching are later phases.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Literal
 
@@ -62,8 +72,15 @@ _HEADER_MACRO_RE = {"de": split._HEADER_DE_RE, "en": split._HEADER_EN_RE}
 _HEADER_IMPORT_RE = {"de": split._HEADER_DE_IMPORT_RE, "en": split._HEADER_EN_IMPORT_RE}
 
 
+# Translator calls in flight at once for one deck; matches the default
+# ``max_concurrent`` of the summary client's semaphore.
+DEFAULT_MAX_CONCURRENT_TRANSLATIONS = 5
+
 CellKind = Literal["translated", "copied", "header", "import"]
 
+# One translator call: the exact source body and the translation role.
+_Request = tuple[str, str]
+
 
 class TranslateDeckError(Exception):
     """Raised when the other-language half cannot be produced.
@@ -115,13 +132,16 @@ def translate_deck_text(
     target_lang: str,
     translator: SlideTranslator,
     comment_token: str = "#",
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_TRANSLATIONS,
 ) -> TranslateDeckResult:
     """Translate a single-language split half into its other-language twin.
 
     ``source_text`` is the verbatim content of a ``*.<source_lang><ext>`` split
     half. Returns the text of the matching ``*.<target_lang><ext>`` half plus a
     per-cell report. ``comment_token`` is the source language's line-comment
-    token (``"#"`` python/rust, ``"//"`` cpp/csharp/java/typescript). Raises
+    token (``"#"`` python/rust, ``"//"`` cpp/csharp/java/typescript).
+    ``max_concurrent`` bounds the translator calls in flight; ``1`` translates
+    sequentially and stops at the first failure. Raises
     :class:`TranslateDeckError` if a cell cannot be translated or the generated
     pair does not round-trip.
     """
@@ -134,6 +154,13 @@ def translate_deck_text(
         raise TranslateDeckError(f"source and target language are both {source_lang!r}")
 
     preamble, source_cells = split_cells(source_text, comment_token)
+    translations = _translate_requests(
+        _plan_translations(source_cells, source_lang),
+        source_lang,
+        target_lang,
+        translator,
+        max_concurrent,
+    )
 
     target_cells: list[RawCell] = []
     report: list[CellTranslation] = []
@@ -145,7 +172,7 @@ def translate_deck_text(
         #    only the title argument. Structural — never run through the cell
         #    body translator.
         if meta.is_j2 and _HEADER_MACRO_RE[source_lang].search(cell.header):
-            target_cells.append(_rewrite_header_macro(cell, source_lang, target_lang, translator))
+            target_cells.append(_rewrite_header_macro(cell, source_lang, target_lang, translations))
             report.append(CellTranslation(index, "header", None, meta.slide_id, meta.lang))
             continue
 
@@ -160,9 +187,7 @@ def translate_deck_text(
         #    has role_of() == None but must still be translated.
         if meta.lang == source_lang:
             role = _translation_role(meta)
-            target_cells.append(
-                _translate_localized_cell(cell, source_lang, target_lang, role, translator)
-            )
+            target_cells.append(_translate_localized_cell(cell, target_lang, role, translations))
             report.append(CellTranslation(index, "translated", role, meta.slide_id, meta.lang))
             continue
 
@@ -192,32 +217,92 @@ def _translation_role(meta: CellMetadata) -> str:
     return role_of(meta) or "markdown"
 
 
+def _plan_translations(source_cells: Sequence[RawCell], source_lang: str) -> list[_Request]:
+    """Collect every distinct translator call the deck needs, in first-use order.
+
+    Mirrors the cell dispatch of :func:`translate_deck_text`: the title of a
+    header macro (role ``"title"``, skipped when empty) and the body of every
+    localized cell. Identical requests collapse into one.
+    """
+    requests: dict[_Request, None] = {}
+    for cell in source_cells:
+        meta = cell.metadata
+        if meta.is_j2:
+            match = _HEADER_MACRO_RE[source_lang].search(cell.header)
+            if match is not None:
+                if match.group(2).strip():
+                    requests[(match.group(2), "title")] = None
+                continue
+            if _HEADER_IMPORT_RE[source_lang].match(cell.header):
+                continue
+        if meta.lang == source_lang:
+            requests[(cell.body.rstrip("\n"), _translation_role(meta))] = None
+    return list(requests)
+
+
+def _translate_requests(
+    requests: list[_Request],
+    source_lang: str,
+    target_lang: str,
+    translator: SlideTranslator,
+    max_concurrent: int,
+) -> dict[_Request, str | TranslationError]:
+    """Run the planned translator calls, concurrently when allowed.
+
+    Returns each request's translation, or the :class:`TranslationError` it
+    raised; the caller turns the first failure in deck order into a
+    :class:`TranslateDeckError`. A sequential run stops at the first failure,
+    so the requests after it are absent from the result.
+    """
+    results: dict[_Request, str | TranslationError] = {}
+    lookup_many = getattr(translator, "lookup_many", None)
+    if lookup_many is not None and requests:
+        results.update(lookup_many(requests, source_lang=source_lang, target_lang=target_lang))
+    missing = [request for request in requests if request not in results]
+
+    def translate(request: _Request) -> str | TranslationError:
+        source_body, role = request
+        try:
+            return translator.translate(
+                source_body=source_body,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                role=role,
+            )
+        except TranslationError as exc:
+            return exc
+
+    if max_concurrent <= 1 or len(missing) <= 1:
+        for request in missing:
+            results[request] = translate(request)
+            if isinstance(results[request], TranslationError):
+                break
+        return results
+
+    workers = min(max_concurrent, len(missing))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="slide-translate") as pool:
+        results.update(zip(missing, pool.map(translate, missing), strict=True))
+    return results
+
+
 def _translate_localized_cell(
     cell: RawCell,
-    source_lang: str,
     target_lang: str,
     role: str,
-    translator: SlideTranslator,
+    translations: dict[_Request, str | TranslationError],
 ) -> RawCell:
     """Build the target-language twin of a localized ``cell``.
 
-    Translates the body, swaps the language attribute, and re-appends the
-    source cell's trailing blank lines so the target half keeps the same
-    inter-cell spacing.
+    Takes the planned translation of the body, swaps the language attribute,
+    and re-appends the source cell's trailing blank lines so the target half
+    keeps the same inter-cell spacing.
     """
-    source_body = cell.body.rstrip("\n")
-    try:
-        translated = translator.translate(
-            source_body=source_body,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            role=role,
-        )
-    except TranslationError as exc:
+    translated = translations[(cell.body.rstrip("\n"), role)]
+    if isinstance(translated, TranslationError):
         sid = cell.metadata.slide_id or "<no id>"
         raise TranslateDeckError(
-            f"could not translate cell {sid!r} (line {cell.line_number}): {exc}"
-        ) from exc
+            f"could not translate cell {sid!r} (line {cell.line_number}): {translated}"
+        ) from translated
 
     twin = build_twin_cell(cell, target_lang, translated)
     blanks = _trailing_blanks(cell)
@@ -230,7 +315,7 @@ def _rewrite_header_macro(
     cell: RawCell,
     source_lang: str,
     target_lang: str,
-    translator: SlideTranslator,
+    translations: dict[_Request, str | TranslationError],
 ) -> RawCell:
     """Rewrite a ``header_<src>("Title")`` macro to ``header_<tgt>("…")``.
 
@@ -245,20 +330,16 @@ def _rewrite_header_macro(
 
     translated_title = title
     if title.strip():
-        try:
-            # role="title": a dedicated bare-phrase prompt. Using "markdown" here
-            # makes the model add a stray "# " and skip translation (the title is
-            # not a percent-format cell body). See sync_translate._TITLE_SYSTEM_PROMPT.
-            translated_title = translator.translate(
-                source_body=title,
-                source_lang=source_lang,
-                target_lang=target_lang,
-                role="title",
-            ).strip()
-        except TranslationError as exc:
+        # role="title": a dedicated bare-phrase prompt. Using "markdown" here
+        # makes the model add a stray "# " and skip translation (the title is
+        # not a percent-format cell body). See sync_translate._TITLE_SYSTEM_PROMPT.
+        translated = translations[(title, "title")]
+        if isinstance(translated, TranslationError):
             raise TranslateDeckError(
-                f"could not translate the deck title {title!r} (line {cell.line_number}): {exc}"
-            ) from exc
+                f"could not translate the deck title {title!r} "
+                f"(line {cell.line_number}): {translated}"
+            ) from translated
+        translated_title = translated.strip()
 
     target_macro = f"header_{target_lang}"
     new_header = _HEADER_MACRO_RE[source_lang].sub(
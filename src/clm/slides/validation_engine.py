@@ -0,0 +1,329 @@
+"""Parallel, cached execution of the slide validator.
+
+:func:`clm.slides.validator.validate_files` and
+:func:`~clm.slides.validator.validate_course` delegate their per-file pass
+and their once-per-split-pair parity pass here. Two independent speedups,
+both invisible in the result:
+
+* **Process pool** — cache misses are validated in a
+  :class:`~concurrent.futures.ProcessPoolExecutor` (parsing and the checks
+  are pure-Python CPU work, so threads would not help). Results are
+  collected *by input index*, so finding order is exactly the serial order
+  no matter which worker finishes first.
+* **Persistent result cache** — a small SQLite file keyed per deck (and per
+  split pair) by a fingerprint over the validator version, the effective
+  check set, the path as given, and the content of every file the checks
+  read: the deck itself and its voiceover companion(s); for a pair, both
+  halves and both companions. Editing one half of a split deck therefore
+  invalidates that half and the pair entry — the twin's per-file entry
+  stays warm.
+
+Bump :data:`VALIDATOR_VERSION` whenever a check changes what it reports;
+every cached result is then recomputed on the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, TypeVar
+
+from clm.core.voiceover_companions import companion_locations
+from clm.slides.validator import (
+    Finding,
+    ReviewMaterial,
+    ValidationResult,
+    check_split_pair,
+    validate_file,
+)
+
+logger = logging.getLogger(__name__)
+
+#: Version of the validator's *output*. Part of every cache fingerprint.
+VALIDATOR_VERSION = 1
+
+#: Below this many cache misses the pool's start-up cost outweighs the gain.
+PARALLEL_THRESHOLD = 16
+
+#: Environment variable overriding :func:`default_cache_path`.
+CACHE_PATH_ENV_VAR = "CLM_VALIDATION_CACHE"
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def default_cache_path() -> Path:
+    """Per-user cache location (outside every course repository).
+
+    ``$CLM_VALIDATION_CACHE`` overrides it (the test suite points it at a
+    per-worker temp file).
+    """
+    import platformdirs
+
+    env = os.environ.get(CACHE_PATH_ENV_VAR)
+    if env:
+        return Path(env)
+
+    return Path(platformdirs.user_cache_dir("clm")) / "validation-cache.db"
+
+
+def resolve_jobs(jobs: int | None, pending: int) -> int:
+    """Effective worker count: ``None``/``0`` means auto (parallel only when worth it)."""
+    if jobs is not None and jobs > 0:
+        return min(jobs, max(1, pending))
+    if pending < PARALLEL_THRESHOLD:
+        return 1
+    return min(os.cpu_count() or 1, pending)
+
+
+class ValidationCache:
+    """SQLite store of serialized per-deck and per-pair validation results.
+
+    Rows are keyed by ``(scope, path)`` — one live entry per deck, replaced
+    when its fingerprint changes — so the file stays proportional to the
+    number of decks, not to the number of edits.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS validation_results (
+                scope TEXT NOT NULL,
+                path TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (scope, path)
+            )"""
+        )
+        self._conn.commit()
+
+    def get_many(self, scope: str, keys: Sequence[tuple[str, str]]) -> dict[str, Any]:
+        """Return ``{path: payload}`` for every ``(path, fingerprint)`` that is current."""
+        if not keys:
+            return {}
+        wanted = dict(keys)
+        hits: dict[str, Any] = {}
+        rows = self._conn.execute(
+            "SELECT path, fingerprint, payload FROM validation_results WHERE scope = ?",
+            (scope,),
+        )
+        for path, fingerprint, payload in rows:
+            if wanted.get(path) == fingerprint:
+                hits[path] = json.loads(payload)
+        return hits
+
+    def put_many(self, scope: str, rows: Sequence[tuple[str, str, Any]]) -> None:
+        if not rows:
+            return
+        now = time.time()
+        self._conn.executemany(
+            """INSERT OR REPLACE INTO validation_results
+               (scope, path, fingerprint, payload, updated_at) VALUES (?, ?, ?, ?, ?)""",
+            [(scope, path, fp, json.dumps(payload), now) for path, fp, payload in rows],
+        )
+        self._conn.commit()
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM validation_results")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> ValidationCache:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+
+def _hash_inputs(hasher: Any, path: Path) -> None:
+    """Feed ``path`` and every companion the checks consult into ``hasher``."""
+    try:
+        hasher.update(path.read_bytes())
+    except OSError:
+        hasher.update(b"\0missing")
+    for companion in companion_locations(path):
+        hasher.update(b"\0companion\0" + str(companion).encode())
+        try:
+            hasher.update(companion.read_bytes())
+        except OSError:
+            hasher.update(b"\0missing")
+
+
+def _check_signature(checks: list[str] | None, marker_opt_in: bool | None) -> str:
+    check_part = ",".join(sorted(checks)) if checks else "<default>"
+    return f"v{VALIDATOR_VERSION}|{check_part}|marker={marker_opt_in}"
+
+
+def file_fingerprint(path: Path, checks: list[str] | None, marker_opt_in: bool | None) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(f"file|{_check_signature(checks, marker_opt_in)}|{path}\0".encode())
+    _hash_inputs(hasher, path)
+    return hasher.hexdigest()
+
+
+def pair_fingerprint(de_path: Path, en_path: Path) -> str:
+    hasher = hashlib.sha256()
+    hasher.update(f"pair|v{VALIDATOR_VERSION}|{de_path}|{en_path}\0".encode())
+    _hash_inputs(hasher, de_path)
+    _hash_inputs(hasher, en_path)
+    return hasher.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# (De)serialization
+# ---------------------------------------------------------------------------
+
+
+def _result_to_payload(result: ValidationResult) -> dict[str, Any]:
+    return {
+        "findings": [asdict(f) for f in result.findings],
+        "review_material": asdict(result.review_material)
+        if result.review_material is not None
+        else None,
+    }
+
+
+def _result_from_payload(payload: dict[str, Any]) -> ValidationResult:
+    review = payload.get("review_material")
+    return ValidationResult(
+        files_checked=1,
+        findings=[Finding(**f) for f in payload["findings"]],
+        review_material=ReviewMaterial(**review) if review is not None else None,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Pool tasks (top-level so they pickle under the spawn start method)
+# ---------------------------------------------------------------------------
+
+
+def _file_task(args: tuple[Path, list[str] | None, bool | None]) -> dict[str, Any]:
+    path, checks, marker_opt_in = args
+    result = validate_file(
+        path, checks=checks, cross_file_parity=False, marker_opt_in=marker_opt_in
+    )
+    return _result_to_payload(result)
+
+
+def _pair_task(args: tuple[Path, Path]) -> list[dict[str, Any]]:
+    return [asdict(f) for f in check_split_pair(*args)]
+
+
+def _run_ordered(fn: Callable[[_T], _R], items: list[_T], jobs: int) -> list[_R]:
+    """Map ``fn`` over ``items`` preserving input order, in a pool if ``jobs > 1``."""
+    if jobs <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    chunksize = max(1, len(items) // (jobs * 4))
+    # Spawn, not fork: the CLI may already run threads (logging, the
+    # monitor), and a forked child inheriting a held lock deadlocks.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
+
+
+# ---------------------------------------------------------------------------
+# Public entry points
+# ---------------------------------------------------------------------------
+
+
+def run_file_checks(
+    slide_files: Sequence[Path],
+    checks: list[str] | None,
+    marker_opt_in: bool | None,
+    *,
+    jobs: int | None = None,
+    cache: ValidationCache | None = None,
+) -> list[ValidationResult]:
+    """Validate each file (without cross-file parity); results in input order."""
+    files = list(slide_files)
+    payloads: list[dict[str, Any] | None] = [None] * len(files)
+    fingerprints: list[str] = []
+    if cache is not None:
+        fingerprints = [file_fingerprint(p, checks, marker_opt_in) for p in files]
+        hits = cache.get_many(
+            "file", [(str(p.absolute()), fp) for p, fp in zip(files, fingerprints, strict=True)]
+        )
+        for i, p in enumerate(files):
+            payloads[i] = hits.get(str(p.absolute()))
+
+    missing = [i for i, payload in enumerate(payloads) if payload is None]
+    effective_jobs = resolve_jobs(jobs, len(missing))
+    logger.debug(
+        "slide validation: %d file(s), %d cached, %d job(s)",
+        len(files),
+        len(files) - len(missing),
+        effective_jobs,
+    )
+    computed = _run_ordered(
+        _file_task, [(files[i], checks, marker_opt_in) for i in missing], effective_jobs
+    )
+    for i, payload in zip(missing, computed, strict=True):
+        payloads[i] = payload
+    if cache is not None:
+        cache.put_many(
+            "file",
+            [
+                (str(files[i].absolute()), fingerprints[i], payload)
+                for i, payload in zip(missing, computed, strict=True)
+            ],
+        )
+    return [_result_from_payload(p) for p in payloads if p is not None]
+
+
+def run_pair_checks(
+    pairs: Sequence[tuple[Path, Path]],
+    *,
+    jobs: int | None = None,
+    cache: ValidationCache | None = None,
+) -> list[list[Finding]]:
+    """Run the split-pair parity suite for every pair; one finding list per pair."""
+    pair_list = list(pairs)
+    results: list[list[dict[str, Any]] | None] = [None] * len(pair_list)
+    fingerprints: list[str] = []
+    if cache is not None:
+        fingerprints = [pair_fingerprint(de, en) for de, en in pair_list]
+        hits = cache.get_many(
+            "pair",
+            [
+                (str(de.absolute()), fp)
+                for (de, _en), fp in zip(pair_list, fingerprints, strict=True)
+            ],
+        )
+        for i, (de, _en) in enumerate(pair_list):
+            results[i] = hits.get(str(de.absolute()))
+
+    missing = [i for i, r in enumerate(results) if r is None]
+    computed = _run_ordered(
+        _pair_task, [pair_list[i] for i in missing], resolve_jobs(jobs, len(missing))
+    )
+    for i, findings in zip(missing, computed, strict=True):
+        results[i] = findings
+    if cache is not None:
+        cache.put_many(
+            "pair",
+            [
+                (str(pair_list[i][0].absolute()), fingerprints[i], findings)
+                for i, findings in zip(missing, computed, strict=True)
+            ],
+        )
+    return [[Finding(**f) for f in findings or []] for findings in results]
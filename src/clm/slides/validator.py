@@ -14,6 +14,7 @@ import re
 import tokenize
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from clm.core.deck_markers import has_header_marker
 from clm.core.slide_text.pairing import (
@@ -49,6 +50,9 @@ from clm.workers.notebook.cpp_code_analysis import (
     classify_source,
 )
 
+if TYPE_CHECKING:
+    from clm.slides.validation_engine import ValidationCache
+
 # ---------------------------------------------------------------------------
 # Result types
 # ---------------------------------------------------------------------------
@@ -1929,6 +1933,23 @@ def _check_companion_for_slide_resolves(path: Path) -> list[Finding]:
     return findings
 
 
+def check_split_pair(de_path: Path, en_path: Path) -> list[Finding]:
+    """Run the full cross-file pair suite on one split pair.
+
+    Shared-cell byte parity, the shared-cell German-text check (#772),
+    tag-set parity, and the #162 detectives (slide_id parity, companion
+    for_slide parity) — the checks a directory/course run executes once
+    per pair rather than once per half.
+    """
+    findings: list[Finding] = []
+    findings.extend(_check_shared_cell_parity(de_path, en_path))
+    findings.extend(_check_split_untranslated_text(de_path, en_path))
+    findings.extend(_check_split_tag_parity(de_path, en_path))
+    findings.extend(_check_split_slide_id_parity(de_path, en_path))
+    findings.extend(_check_split_companion_for_slide_parity(de_path, en_path))
+    return findings
+
+
 def _slide_files_to_split_pairs(slide_files: list[Path]) -> list[tuple[Path, Path]]:
     """Return every detected ``(de_path, en_path)`` pair in ``slide_files``.
 
@@ -2469,11 +2490,7 @@ def validate_file(
         if cross_file_parity and is_split:
             pair = split_twin_pair(path)
             if pair is not None:
-                findings.extend(_check_shared_cell_parity(*pair))
-                findings.extend(_check_split_untranslated_text(*pair))
-                findings.extend(_check_split_tag_parity(*pair))
-                findings.extend(_check_split_slide_id_parity(*pair))
-                findings.extend(_check_split_companion_for_slide_parity(*pair))
+                findings.extend(check_split_pair(*pair))
     if "code_export" in check_set and path.suffix == ".cpp":
         # Structural invariants of the compilable C++ project export (#331).
         # C++-only: the classifier heuristics are C++-specific, and other
@@ -2560,6 +2577,8 @@ def validate_directory(
     checks: list[str] | None = None,
     *,
     marker_opt_in: bool | None = None,
+    jobs: int | None = None,
+    cache: ValidationCache | None = None,
 ) -> ValidationResult:
     """Validate all slide files at or under ``path``.
 
@@ -2576,9 +2595,15 @@ def validate_directory(
             ``voiceover`` coverage check (issue #176) unless a deck opts in
             via the ``clm: voiceover-coverage`` header marker (#178).
         marker_opt_in: Passed to :func:`validate_file` (#178).
+        jobs: Passed to :func:`validate_files`.
+        cache: Passed to :func:`validate_files`.
     """
     return validate_files(
-        find_slide_files_recursive(path), checks=checks, marker_opt_in=marker_opt_in
+        find_slide_files_recursive(path),
+        checks=checks,
+        marker_opt_in=marker_opt_in,
+        jobs=jobs,
+        cache=cache,
     )
 
 
@@ -2587,6 +2612,8 @@ def validate_files(
     checks: list[str] | None = None,
     *,
     marker_opt_in: bool | None = None,
+    jobs: int | None = None,
+    cache: ValidationCache | None = None,
 ) -> ValidationResult:
     """Validate an explicit list of slide files (same logic as a directory walk).
 
@@ -2603,19 +2630,25 @@ def validate_files(
             ``voiceover`` coverage check (issue #176) unless a deck opts in
             via the ``clm: voiceover-coverage`` header marker (#178).
         marker_opt_in: Passed to :func:`validate_file` (#178).
+        jobs: Worker processes for the per-file and per-pair passes. ``None``
+            (the default) parallelizes only when enough files need checking
+            to repay the pool start-up; ``1`` forces a serial run. Finding
+            order is the serial order either way.
+        cache: Optional :class:`~clm.slides.validation_engine.ValidationCache`;
+            decks and split pairs whose inputs are unchanged since the cached
+            run are not re-validated.
     """
+    from clm.slides.validation_engine import run_file_checks, run_pair_checks
+
     all_findings: list[Finding] = []
     # Created lazily on the first file that produced review material, so a
     # marker-driven voiceover pass (#178) is collected even when ``checks``
     # is an explicit deterministic list.
     combined_review: ReviewMaterial | None = None
 
-    for sf in slide_files:
-        # Cross-file parity is run once per pair below (not per file), so the
-        # per-file pass skips it to avoid duplicate findings.
-        result = validate_file(
-            sf, checks=checks, cross_file_parity=False, marker_opt_in=marker_opt_in
-        )
+    # Cross-file parity is run once per pair below (not per file), so the
+    # per-file pass skips it to avoid duplicate findings.
+    for result in run_file_checks(slide_files, checks, marker_opt_in, jobs=jobs, cache=cache):
         all_findings.extend(result.findings)
         if result.review_material is not None:
             if combined_review is None:
@@ -2627,12 +2660,9 @@ def validate_files(
     # requested via ``checks=`` because the parity is a pairing property.
     check_set = set(checks) if checks else set(DEFAULT_CHECKS)
     if "pairing" in check_set:
-        for de_path, en_path in _slide_files_to_split_pairs(slide_files):
-            all_findings.extend(_check_shared_cell_parity(de_path, en_path))
-            all_findings.extend(_check_split_untranslated_text(de_path, en_path))
-            all_findings.extend(_check_split_tag_parity(de_path, en_path))
-            all_findings.extend(_check_split_slide_id_parity(de_path, en_path))
-            all_findings.extend(_check_split_companion_for_slide_parity(de_path, en_path))
+        pairs = _slide_files_to_split_pairs(slide_files)
+        for findings in run_pair_checks(pairs, jobs=jobs, cache=cache):
+            all_findings.extend(findings)
 
     return ValidationResult(
         files_checked=len(slide_files),
@@ -2649,6 +2679,8 @@ def validate_course(
     checks: list[str] | None = None,
     *,
     marker_opt_in: bool | None = None,
+    jobs: int | None = None,
+    cache: ValidationCache | None = None,
 ) -> ValidationResult:
     """Validate all slides referenced by a course spec.
 
@@ -2660,45 +2692,60 @@ def validate_course(
             ``voiceover`` coverage check (issue #176) unless a deck opts in
             via the ``clm: voiceover-coverage`` header marker (#178).
         marker_opt_in: Passed to :func:`validate_file` (#178).
+        jobs: Passed to :func:`validate_files`.
+        cache: Passed to :func:`validate_files`.
     """
     from clm.core.course_spec import CourseSpec
+    from clm.slides.validation_engine import run_file_checks, run_pair_checks
 
     spec = CourseSpec.from_file(course_spec_path)
     topic_map = build_topic_map(slides_dir)
 
-    all_findings: list[Finding] = []
-    files_checked = 0
-    # Lazy, like validate_files — see the comment there (#178).
-    combined_review: ReviewMaterial | None = None
-
     check_set = set(checks) if checks else set(DEFAULT_CHECKS)
 
+    # Resolve every topic's files and split pairs first, then validate them
+    # in two batches (so the engine can parallelize and consult its cache
+    # across the whole course), and finally reassemble the findings in the
+    # per-topic order: a topic's file findings, then its pair findings.
+    topics: list[tuple[list[Path], list[tuple[Path, Path]]]] = []
     for binding in spec.iter_topic_bindings():
         matches = matches_for_binding(topic_map, binding.topic_id, binding.effective_module)
         for match in matches:
             slide_files = find_slide_files(match.path)
-            for sf in slide_files:
-                # Cross-file parity runs once per pair below, not per file.
-                result = validate_file(
-                    sf, checks=checks, cross_file_parity=False, marker_opt_in=marker_opt_in
-                )
-                all_findings.extend(result.findings)
-                files_checked += 1
-                if result.review_material is not None:
-                    if combined_review is None:
-                        combined_review = ReviewMaterial()
-                    _merge_review_material(combined_review, result.review_material)
-
-            # Phase 6 shared-cell parity per topic: walk the topic's split
-            # pairs and emit pairing-error findings for divergent shared
-            # cells. Scoped per-topic so different topics don't share state.
-            if "pairing" in check_set:
-                for de_path, en_path in _slide_files_to_split_pairs(slide_files):
-                    all_findings.extend(_check_shared_cell_parity(de_path, en_path))
-                    all_findings.extend(_check_split_untranslated_text(de_path, en_path))
-                    all_findings.extend(_check_split_tag_parity(de_path, en_path))
-                    all_findings.extend(_check_split_slide_id_parity(de_path, en_path))
-                    all_findings.extend(_check_split_companion_for_slide_parity(de_path, en_path))
+            # Phase 6 shared-cell parity per topic: scoped per-topic so
+            # different topics don't share state.
+            pairs = _slide_files_to_split_pairs(slide_files) if "pairing" in check_set else []
+            topics.append((slide_files, pairs))
+
+    # Cross-file parity runs once per pair, not per file.
+    file_results = iter(
+        run_file_checks(
+            [sf for files, _ in topics for sf in files],
+            checks,
+            marker_opt_in,
+            jobs=jobs,
+            cache=cache,
+        )
+    )
+    pair_results = iter(
+        run_pair_checks([pair for _, pairs in topics for pair in pairs], jobs=jobs, cache=cache)
+    )
+
+    all_findings: list[Finding] = []
+    files_checked = 0
+    # Lazy, like validate_files — see the comment there (#178).
+    combined_review: ReviewMaterial | None = None
+    for slide_files, pairs in topics:
+        for _ in slide_files:
+            result = next(file_results)
+            all_findings.extend(result.findings)
+            files_checked += 1
+            if result.review_material is not None:
+                if combined_review is None:
+                    combined_review = ReviewMaterial()
+                _merge_review_material(combined_review, result.review_material)
+        for _ in pairs:
+            all_findings.extend(next(pair_results))
 
     return ValidationResult(
         files_checked=files_checked,
@@ -3,13 +3,15 @@
 Public API:
     verify_against(snapshot_dir, output_dir, *, include_html, strict) -> VerifyReport
     verify_against_targets(snapshot_dir, targets, *, include_html, strict) -> VerifyReport
+    write_manifest(snapshot_dir) -> Path
     VerifyReport
 """
 
+from clm.snapshot.manifest import write_manifest
 from clm.snapshot.verifier import (
     VerifyReport,
     verify_against,
     verify_against_targets,
 )
 
-__all__ = ["VerifyReport", "verify_against", "verify_against_targets"]
+__all__ = ["VerifyReport", "verify_against", "verify_against_targets", "write_manifest"]
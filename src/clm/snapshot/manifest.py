@@ -0,0 +1,133 @@
+"""Per-file digest manifest written next to a captured snapshot.
+
+``clm build --snapshot DIR`` records, for every file under ``DIR``, its size,
+the SHA-256 of its raw bytes and — for files the verifier may normalize
+(``.html``) — the SHA-256 of the normalized bytes. ``--verify-against``
+then only has to read the *output* side: a file whose size or hash matches
+the manifest is settled without touching the snapshot copy, and the
+normalizer only runs when the raw hashes differ.
+
+The manifest is an accelerator, never the source of truth. A snapshot
+captured before manifests existed, a manifest with an unknown version, or an
+entry whose recorded size no longer matches the snapshot file (someone
+edited the baseline by hand) all fall back to the byte-by-byte comparison.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from clm.snapshot.normalize import normalize_for_compare
+
+#: File name of the manifest at the snapshot root. Excluded from comparison.
+MANIFEST_NAME = ".clm-snapshot-manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class FileDigest:
+    """Recorded digest of one snapshot file."""
+
+    size: int
+    sha256: str
+    normalized_sha256: str | None = None
+
+
+def normalizable(rel_path: str) -> bool:
+    """True if ``normalize_for_compare`` may rewrite ``rel_path`` (with ``include_html``)."""
+    return rel_path.endswith(".html")
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def digest_bytes(rel_path: str, data: bytes) -> FileDigest:
+    """Digest ``data`` as the snapshot manifest records it."""
+    normalized = None
+    if normalizable(rel_path):
+        normalized = sha256_hex(normalize_for_compare(rel_path, data, include_html=True))
+    return FileDigest(size=len(data), sha256=sha256_hex(data), normalized_sha256=normalized)
+
+
+def collect_files(root: Path) -> set[Path]:
+    """Relative paths of every regular file under ``root``, minus the manifest.
+
+    ``os.walk`` instead of ``rglob`` + ``is_file``: the directory entries
+    already know their type, so a 40k-file tree is listed without a
+    ``stat`` per file.
+    """
+    found: set[Path] = set()
+    for dirpath, _dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root)
+        for name in filenames:
+            if name == MANIFEST_NAME and rel_dir == Path("."):
+                continue
+            path = Path(dirpath) / name
+            if path.is_file():
+                found.add(rel_dir / name)
+    return found
+
+
+def write_manifest(snapshot_dir: Path, *, jobs: int | None = None) -> Path:
+    """Hash every file under ``snapshot_dir`` and write the manifest there.
+
+    Files are hashed on a thread pool (``jobs`` workers; default: the
+    executor's own default). A build that wrote nothing still gets an
+    (empty) manifest. Returns the manifest path.
+    """
+    snapshot_dir = snapshot_dir.resolve()
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    rels = sorted(collect_files(snapshot_dir))
+
+    def digest(rel: Path) -> FileDigest:
+        return digest_bytes(rel.as_posix(), (snapshot_dir / rel).read_bytes())
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        digests = list(pool.map(digest, rels))
+
+    files = {}
+    for rel, d in zip(rels, digests, strict=True):
+        entry: dict[str, object] = {"size": d.size, "sha256": d.sha256}
+        if d.normalized_sha256 is not None:
+            entry["normalized_sha256"] = d.normalized_sha256
+        files[rel.as_posix()] = entry
+    path = snapshot_dir / MANIFEST_NAME
+    path.write_text(
+        json.dumps({"version": MANIFEST_VERSION, "files": files}, indent=1, sort_keys=True),
+        encoding="utf-8",
+    )
+    return path
+
+
+def load_manifest(snapshot_dir: Path) -> dict[str, FileDigest] | None:
+    """The manifest under ``snapshot_dir`` keyed by POSIX path, or ``None``.
+
+    ``None`` when there is no manifest or it cannot be used (unreadable,
+    malformed, other version) — callers then compare byte-by-byte.
+    """
+    try:
+        data = json.loads((snapshot_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return None
+    files = data.get("files")
+    if not isinstance(files, dict):
+        return None
+    out: dict[str, FileDigest] = {}
+    for rel, entry in files.items():
+        try:
+            out[rel] = FileDigest(
+                size=int(entry["size"]),
+                sha256=str(entry["sha256"]),
+                normalized_sha256=entry.get("normalized_sha256"),
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return out
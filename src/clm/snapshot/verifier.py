@@ -17,14 +17,28 @@ run — these are properties of slide content, not of CLM. Skipping HTML
 removes that noise floor; ``--include-html`` re-enables it with hex
 address normalization, and ``--strict`` turns off all skips and
 normalization.
+
+When the snapshot carries a digest manifest (see
+:mod:`clm.snapshot.manifest`) only the output side is read: sizes and hashes
+settle most files before ``normalize_for_compare`` ever runs. Comparisons
+run on a thread pool; the report is assembled in sorted path order, so it
+does not depend on completion order.
 """
 
 from __future__ import annotations
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from clm.snapshot.manifest import (
+    FileDigest,
+    collect_files,
+    load_manifest,
+    normalizable,
+    sha256_hex,
+)
 from clm.snapshot.normalize import normalize_for_compare
 
 # File extensions whose content can vary run-to-run because they include
@@ -122,11 +136,6 @@ class VerifyReport:
         return "\n".join(lines)
 
 
-def _collect_files(root: Path) -> set[Path]:
-    """Return relative paths of every regular file under *root*."""
-    return {f.relative_to(root) for f in root.rglob("*") if f.is_file()}
-
-
 def _should_skip(rel_path: Path, *, include_html: bool, strict: bool) -> bool:
     if strict:
         return False
@@ -145,24 +154,83 @@ def _content_matches(
 
     Normalization is only applied when ``include_html`` is true; under
     ``strict`` even include_html is moot (strict turns off normalization
-    entirely).
+    entirely). Files of different size are unequal under ``strict`` without
+    being read, and equal raw bytes never reach the normalizer.
     """
+    if strict and snap_file.stat().st_size != out_file.stat().st_size:
+        return False
     snap_bytes = snap_file.read_bytes()
     out_bytes = out_file.read_bytes()
+    if snap_bytes == out_bytes:
+        return True
     if strict:
-        return snap_bytes == out_bytes
+        return False
     rel = rel_path.as_posix()
     return normalize_for_compare(
         rel, snap_bytes, include_html=include_html
     ) == normalize_for_compare(rel, out_bytes, include_html=include_html)
 
 
+def _digest_matches(
+    digest: FileDigest,
+    out_file: Path,
+    rel_path: Path,
+    *,
+    include_html: bool,
+    strict: bool,
+) -> bool:
+    """Compare ``out_file`` against a manifest digest of its snapshot copy."""
+    rel = rel_path.as_posix()
+    normalizing = include_html and not strict and normalizable(rel)
+    if not normalizing and out_file.stat().st_size != digest.size:
+        return False
+    out_bytes = out_file.read_bytes()
+    if len(out_bytes) == digest.size and sha256_hex(out_bytes) == digest.sha256:
+        return True
+    if not normalizing or digest.normalized_sha256 is None:
+        return False
+    normalized = normalize_for_compare(rel, out_bytes, include_html=include_html)
+    return sha256_hex(normalized) == digest.normalized_sha256
+
+
+def _compare_common(
+    snap_root: Path,
+    out_root: Path,
+    rels: list[Path],
+    manifest: dict[str, FileDigest] | None,
+    manifest_prefix: str,
+    *,
+    include_html: bool,
+    strict: bool,
+    jobs: int | None,
+) -> list[bool]:
+    """Whether each of ``rels`` matches, in the order given.
+
+    A manifest entry is only trusted while its recorded size still matches
+    the snapshot file; otherwise (or without an entry) both sides are read.
+    """
+
+    def matches(rel: Path) -> bool:
+        snap_file = snap_root / rel
+        out_file = out_root / rel
+        digest = manifest.get(manifest_prefix + rel.as_posix()) if manifest else None
+        if digest is not None and snap_file.stat().st_size == digest.size:
+            return _digest_matches(digest, out_file, rel, include_html=include_html, strict=strict)
+        return _content_matches(snap_file, out_file, rel, include_html=include_html, strict=strict)
+
+    if not rels:
+        return []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(matches, rels))
+
+
 def verify_against(
     snapshot_dir: Path,
     output_dir: Path,
     *,
     include_html: bool = False,
     strict: bool = False,
+    jobs: int | None = None,
 ) -> VerifyReport:
     """Compare *output_dir* against *snapshot_dir* and return a report.
 
@@ -176,6 +244,8 @@ def verify_against(
             objects produces irreducible per-run noise.
         strict: If True, byte-compare every file with no normalization
             and no skipping. Overrides ``include_html``.
+        jobs: Worker threads for the file comparisons (default: the
+            executor's default).
 
     Returns:
         A :class:`VerifyReport`. Inspect ``has_diffs`` for a pass/fail
@@ -189,8 +259,8 @@ def verify_against(
     if not output_dir.is_dir():
         raise FileNotFoundError(f"Output directory does not exist: {output_dir}")
 
-    snap_files = _collect_files(snapshot_dir)
-    out_files = _collect_files(output_dir)
+    snap_files = collect_files(snapshot_dir)
+    out_files = collect_files(output_dir)
 
     report = VerifyReport(snapshot_dir=snapshot_dir, output_dir=output_dir)
 
@@ -198,16 +268,36 @@ def verify_against(
     only_in_snap = snap_files - out_files
     only_in_out = out_files - snap_files
 
+    to_compare = [
+        rel
+        for rel in sorted(common)
+        if not _should_skip(rel, include_html=include_html, strict=strict)
+    ]
+    results = dict(
+        zip(
+            to_compare,
+            _compare_common(
+                snapshot_dir,
+                output_dir,
+                to_compare,
+                load_manifest(snapshot_dir),
+                "",
+                include_html=include_html,
+                strict=strict,
+                jobs=jobs,
+            ),
+            strict=True,
+        )
+    )
+
     for rel in sorted(common):
         ext = rel.suffix
         report.by_extension[ext].total += 1
-        if _should_skip(rel, include_html=include_html, strict=strict):
+        if rel not in results:
             report.skipped.append(rel)
             report.by_extension[ext].skipped += 1
             continue
-        snap_file = snapshot_dir / rel
-        out_file = output_dir / rel
-        if _content_matches(snap_file, out_file, rel, include_html=include_html, strict=strict):
+        if results[rel]:
             report.identical.append(rel)
             report.by_extension[ext].identical += 1
         else:
@@ -232,6 +322,7 @@ def verify_against_targets(
     *,
     include_html: bool = False,
     strict: bool = False,
+    jobs: int | None = None,
 ) -> VerifyReport:
     """Compare a multi-target build against a per-target snapshot tree.
 
@@ -259,6 +350,7 @@ def verify_against_targets(
             shows up as missing on the other.
         include_html: Forwarded to :func:`verify_against`.
         strict: Forwarded to :func:`verify_against`.
+        jobs: Forwarded to :func:`verify_against`.
 
     Returns:
         A combined :class:`VerifyReport`. Each relative path in the
@@ -276,14 +368,17 @@ def verify_against_targets(
         snapshot_dir=snapshot_dir,
         output_dir=(targets[0][1].resolve() if targets else snapshot_dir),
     )
+    # One manifest at the snapshot root covers every target, keyed by
+    # ``<target_name>/<rel>``.
+    manifest = load_manifest(snapshot_dir)
 
     for target_name, output_root in targets:
         prefix = Path(target_name)
         snap_sub = snapshot_dir / target_name
         out_sub = output_root.resolve()
 
-        snap_files = _collect_files(snap_sub) if snap_sub.is_dir() else set()
-        out_files = _collect_files(out_sub) if out_sub.is_dir() else set()
+        snap_files = collect_files(snap_sub) if snap_sub.is_dir() else set()
+        out_files = collect_files(out_sub) if out_sub.is_dir() else set()
 
         if not snap_sub.is_dir() and not out_sub.is_dir():
             # Nothing on either side for this target — skip.
@@ -307,17 +402,37 @@ def verify_against_targets(
         only_in_snap = snap_files - out_files
         only_in_out = out_files - snap_files
 
+        to_compare = [
+            rel
+            for rel in sorted(common)
+            if not _should_skip(rel, include_html=include_html, strict=strict)
+        ]
+        results = dict(
+            zip(
+                to_compare,
+                _compare_common(
+                    snap_sub,
+                    out_sub,
+                    to_compare,
+                    manifest,
+                    f"{prefix.as_posix()}/",
+                    include_html=include_html,
+                    strict=strict,
+                    jobs=jobs,
+                ),
+                strict=True,
+            )
+        )
+
         for rel in sorted(common):
             full_rel = prefix / rel
             ext = full_rel.suffix
             combined.by_extension[ext].total += 1
-            if _should_skip(rel, include_html=include_html, strict=strict):
+            if rel not in results:
                 combined.skipped.append(full_rel)
                 combined.by_extension[ext].skipped += 1
                 continue
-            snap_file = snap_sub / rel
-            out_file = out_sub / rel
-            if _content_matches(snap_file, out_file, rel, include_html=include_html, strict=strict):
+            if results[rel]:
                 combined.identical.append(full_rel)
                 combined.by_extension[ext].identical += 1
             else:
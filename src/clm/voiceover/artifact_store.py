@@ -0,0 +1,220 @@
+"""Indexed on-disk store behind the voiceover artifact caches.
+
+All artifacts of one cache root live in a single SQLite file
+(``artifacts.sqlite``), one row per ``(kind, key)`` holding the entry's
+canonical config string, its size, creation and last-access times, and the
+encoded artifact as the row's last column. A lookup filters on key *and*
+config inside SQLite, so a config mismatch never reads the artifact body,
+and :meth:`ArtifactStore.get_many` resolves a whole run's keys in a few
+queries instead of one file open and parse per entry.
+
+The store is size-bounded: once the bodies exceed ``max_bytes``
+(``CLM_VOICEOVER_CACHE_MAX_BYTES``, default 1 GiB), the least recently used
+entries are evicted (see :mod:`clm.infrastructure.utils.sqlite_lru_store`).
+The encoding of each kind's body is up to the caller;
+see :mod:`clm.voiceover.cache`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from clm.infrastructure.utils.sqlite_lru_store import SqliteLruStore
+
+logger = logging.getLogger(__name__)
+
+#: Filename of the artifact index inside a voiceover cache root.
+STORE_FILENAME = "artifacts.sqlite"
+
+MAX_BYTES_ENV_VAR = "CLM_VOICEOVER_CACHE_MAX_BYTES"
+#: Default bound on the summed artifact sizes of one store.
+DEFAULT_MAX_BYTES = 1 << 30
+
+# Keys per batched lookup; well below SQLite's host-parameter limit.
+_GET_MANY_CHUNK = 200
+# Stores kept open per process. Callers construct caches freely and never
+# close them, so the least recently used store beyond this is closed.
+_MAX_OPEN_STORES = 8
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    config TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS idx_artifacts_accessed ON artifacts(accessed_at);
+"""
+
+
+def max_bytes_from_env() -> int | None:
+    """The configured size bound; ``None`` when ``CLM_VOICEOVER_CACHE_MAX_BYTES`` <= 0."""
+    raw = os.environ.get(MAX_BYTES_ENV_VAR, "").strip()
+    if not raw:
+        return DEFAULT_MAX_BYTES
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", MAX_BYTES_ENV_VAR, raw)
+        return DEFAULT_MAX_BYTES
+    return value if value > 0 else None
+
+
+@dataclass(frozen=True)
+class StoredArtifact:
+    """Index row of one stored artifact (without its body)."""
+
+    kind: str
+    key: str
+    size: int
+    created_at: float
+    accessed_at: float
+
+
+class ArtifactStore(SqliteLruStore):
+    """The artifact index of one cache root.
+
+    Obtain instances with :meth:`for_root`; they are shared per process and
+    safe to use from several threads. Nothing is created on disk until the
+    first :meth:`put`.
+    """
+
+    TABLE = "artifacts"
+    KEY_COLUMNS = ("kind", "key")
+    SCHEMA = _SCHEMA
+
+    _open: OrderedDict[str, ArtifactStore] = OrderedDict()
+    _open_lock = threading.Lock()
+
+    def __init__(self, path: Path, *, max_bytes: int | None = DEFAULT_MAX_BYTES):
+        super().__init__(path, max_bytes=max_bytes)
+
+    @classmethod
+    def for_root(cls, cache_root: Path) -> ArtifactStore:
+        """The process-wide store of *cache_root*."""
+        path = cache_root / STORE_FILENAME
+        name = str(path.resolve())
+        with cls._open_lock:
+            store = cls._open.get(name)
+            if store is None:
+                store = cls(path, max_bytes=max_bytes_from_env())
+                cls._open[name] = store
+                while len(cls._open) > _MAX_OPEN_STORES:
+                    _, evicted = cls._open.popitem(last=False)
+                    evicted.close()
+            else:
+                cls._open.move_to_end(name)
+            return store
+
+    # ------------------------------------------------------------ lookups
+
+    def get_many(self, kind: str, keys: Iterable[str], config: str) -> dict[str, bytes]:
+        """Bodies of the *kind* entries among *keys* stored under *config*.
+
+        Hits have their access time refreshed (for eviction).
+        """
+        wanted = list(dict.fromkeys(keys))
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None or not wanted:
+                return {}
+            found: dict[str, bytes] = {}
+            for start in range(0, len(wanted), _GET_MANY_CHUNK):
+                chunk = wanted[start : start + _GET_MANY_CHUNK]
+                placeholders = ", ".join("?" for _ in chunk)
+                for key, body in conn.execute(
+                    "SELECT key, body FROM artifacts "
+                    f"WHERE kind = ? AND config = ? AND key IN ({placeholders})",
+                    (kind, config, *chunk),
+                ):
+                    found[key] = bytes(body)
+            if found:
+                now = time.time()
+                with conn:
+                    conn.executemany(
+                        "UPDATE artifacts SET accessed_at = ? WHERE kind = ? AND key = ?",
+                        [(now, kind, key) for key in found],
+                    )
+            return found
+
+    def contains(self, kind: str, key: str) -> bool:
+        """Whether an entry exists for ``(kind, key)``, under any config."""
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return False
+            row = conn.execute(
+                "SELECT 1 FROM artifacts WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+            return row is not None
+
+    def entries(self) -> list[StoredArtifact]:
+        """Index rows of every entry, ordered by kind and key."""
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT kind, key, size, created_at, accessed_at FROM artifacts ORDER BY kind, key"
+            ).fetchall()
+        return [StoredArtifact(*row) for row in rows]
+
+    # ------------------------------------------------------------- writes
+
+    def put(
+        self, kind: str, key: str, config: str, body: bytes, *, created_at: float | None = None
+    ) -> None:
+        """Store *body* for ``(kind, key)``, replacing any previous entry.
+
+        *created_at* backdates the entry (used when migrating old files).
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect(create=True)
+            with conn:
+                evicted = self._upsert_locked(
+                    conn,
+                    (kind, key),
+                    {
+                        "config": config,
+                        "created_at": created_at or now,
+                        "accessed_at": now,
+                        "body": body,
+                    },
+                    len(body),
+                )
+        if evicted:
+            logger.info(
+                "Evicted %d voiceover cache entries to stay within %d bytes",
+                evicted,
+                self.max_bytes,
+            )
+
+    def _delete(self, where: str = "", params: tuple = ()) -> int:
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return 0
+            with conn:
+                cursor = conn.execute(f"DELETE FROM artifacts {where}", params)
+            self._forget_total_locked()
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        """Delete every entry; returns the number removed."""
+        return self._delete()
+
+    def prune(self, cutoff: float) -> int:
+        """Delete entries written before the epoch time *cutoff*."""
+        return self._delete("WHERE created_at < ?", (cutoff,))
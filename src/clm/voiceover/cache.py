@@ -30,6 +30,14 @@ The cache is consulted at four points:
 - :class:`TimelinesCache` — keyed by ``video_hash`` + ``slides_hash``.
 - :class:`AlignmentsCache` — keyed by ``video_hash`` + ``slides_hash``.
 
+All four store their entries in one indexed file per root
+(:class:`~clm.voiceover.artifact_store.ArtifactStore`): transcripts and
+timelines in a packed binary encoding, transitions and alignments as compact
+JSON. Each cache also offers ``get_many`` for resolving a whole batch of keys
+at once. Entries from before the index (one JSON file per entry under
+``<root>/<kind>/``) are migrated into it when a lookup misses them, or in
+bulk by :func:`migrate`.
+
 Corrupt or unreadable entries are treated as a miss (the cache overwrites on
 the next successful write). Config mismatch is likewise a miss, not an
 error — callers may cache alternate configurations side by side.
@@ -56,13 +64,15 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-import os
-import tempfile
-from collections.abc import Callable, Sequence
+import struct
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from clm.voiceover.artifact_store import ArtifactStore
+
 if TYPE_CHECKING:
     from clm.voiceover.aligner import AlignmentResult
 
@@ -230,24 +240,6 @@ def legacy_cache_root(base_dir: str | Path | None = None) -> Path:
     return base / CACHE_DIRNAME
 
 
-def _atomic_write_json(path: Path, payload: Any) -> None:
-    """Write JSON to *path* atomically via temp-file + rename."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    # NamedTemporaryFile keeps the file open on Windows, which blocks
-    # rename; use mkstemp + manual write instead.
-    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=str(path.parent))
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False)
-        os.replace(tmp_name, path)
-    except Exception:
-        try:
-            os.unlink(tmp_name)
-        except OSError:
-            pass
-        raise
-
-
 def _read_json(path: Path) -> dict | None:
     """Read JSON from *path*. Returns None on miss or corruption."""
     try:
@@ -264,232 +256,312 @@ def _read_json(path: Path) -> dict | None:
     return data
 
 
+def _config_text(cfg: dict[str, Any]) -> str:
+    """Canonical string form of an entry config; the store compares these."""
+    return json.dumps(cfg, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
 T = TypeVar("T")
 
 
-class _JsonCache(Generic[T]):
-    """Base class for JSON-backed caches under a named subdirectory."""
+class _IndexedCache(ABC, Generic[T]):
+    """Base class for the typed caches over a root's :class:`ArtifactStore`.
+
+    Subclasses name their ``subdir`` (the entry kind, which is also the
+    directory that held per-entry JSON files before the index existed) and
+    provide the binary ``_pack``/``_unpack`` codec plus ``_from_json`` for
+    artifacts in the old JSON encoding. JSON entries still under the root
+    are moved into the index on the first lookup that misses them, or all at
+    once by :func:`migrate`.
+    """
 
     subdir: str
+    #: Type of the ``artifact`` member of a JSON-era entry.
+    _json_type: type = dict
 
-    def __init__(
-        self,
-        cache_root: Path,
-        *,
-        encoder: Callable[[T], Any],
-        decoder: Callable[[Any], T],
-    ):
-        self._root = cache_root / self.subdir
-        self._encoder = encoder
-        self._decoder = decoder
+    def __init__(self, cache_root: Path):
+        self._root = cache_root
+        self._store = ArtifactStore.for_root(cache_root)
 
     @property
     def directory(self) -> Path:
-        return self._root
+        """Where JSON-era entries of this kind live (migrated on access)."""
+        return self._root / self.subdir
+
+    @staticmethod
+    @abstractmethod
+    def _pack(artifact: T) -> bytes:
+        """Encode *artifact* as an index entry body."""
+
+    @staticmethod
+    @abstractmethod
+    def _unpack(body: bytes) -> T:
+        """Decode an index entry body written by :meth:`_pack`."""
+
+    @staticmethod
+    @abstractmethod
+    def _from_json(data: Any) -> T:
+        """Build the artifact from a JSON-era entry's payload."""
+
+    @staticmethod
+    @abstractmethod
+    def _key(*args: Any, **kwargs: Any) -> str:
+        """Index key of an entry, from the parts its ``get`` takes before the config."""
 
-    def _entry_path(self, key: str) -> Path:
-        return self._root / f"{key}.json"
+    @staticmethod
+    @abstractmethod
+    def _config_dict(cfg: Any) -> dict[str, Any]:
+        """The config as a JSON-era entry recorded it."""
+
+    def _get_many(self, keys: list[str], cfg: dict[str, Any]) -> dict[str, T]:
+        config = _config_text(cfg)
+        bodies = self._store.get_many(self.subdir, keys, config)
+        missing = [key for key in keys if key not in bodies]
+        if missing and self.directory.is_dir() and self._migrate(missing):
+            bodies.update(self._store.get_many(self.subdir, missing, config))
+        artifacts: dict[str, T] = {}
+        for key, body in bodies.items():
+            try:
+                artifacts[key] = self._unpack(body)
+            except (struct.error, KeyError, TypeError, ValueError) as exc:
+                logger.warning("Cannot decode cached %s %s: %s", self.subdir, key, exc)
+        return artifacts
+
+    def _put(self, key: str, cfg: dict[str, Any], artifact: T) -> None:
+        self._store.put(self.subdir, key, _config_text(cfg), self._pack(artifact))
+
+    def _migrate(self, keys: Iterable[str] | None = None) -> int:
+        """Move JSON-era entries (all, or those of *keys*) into the index.
+
+        Each file is removed once handled; corrupt ones are dropped (they
+        were misses anyway) and an entry the index already holds is kept.
+        Returns the number of entries imported.
+        """
+        if keys is None:
+            paths = sorted(self.directory.glob("*.json"))
+        else:
+            paths = [self.directory / f"{key}.json" for key in keys]
+        imported = 0
+        for path in paths:
+            if not path.is_file():
+                continue
+            entry = _read_json(path)
+            body = None
+            config = None
+            if entry is not None:
+                stored_cfg = entry.get("config")
+                artifact = entry.get("artifact")
+                if isinstance(stored_cfg, dict) and isinstance(artifact, self._json_type):
+                    try:
+                        body = self._pack(self._from_json(artifact))
+                        config = _config_text(stored_cfg)
+                    except (KeyError, TypeError, ValueError) as exc:
+                        logger.warning("Cannot decode cached %s %s: %s", self.subdir, path, exc)
+            if (
+                body is not None
+                and config is not None
+                and not self._store.contains(self.subdir, path.stem)
+            ):
+                self._store.put(
+                    self.subdir,
+                    path.stem,
+                    config,
+                    body,
+                    created_at=path.stat().st_mtime,
+                )
+                imported += 1
+            try:
+                path.unlink()
+            except OSError as exc:
+                logger.warning("Cannot remove migrated cache entry %s: %s", path, exc)
+        if imported:
+            logger.info("Migrated %d %s cache entries into %s", imported, self.subdir, self._root)
+        try:
+            self.directory.rmdir()
+        except OSError:
+            pass
+        return imported
 
-    def _load(self, key: str) -> dict | None:
-        return _read_json(self._entry_path(key))
 
-    def _store(self, key: str, payload: dict) -> None:
-        _atomic_write_json(self._entry_path(key), payload)
+class _VideoKeyedCache(_IndexedCache[T]):
+    """Entries keyed by one video fingerprint and a config dataclass."""
 
-    def _config_matches(self, entry: dict, expected: dict) -> bool:
-        stored = entry.get("config")
-        if not isinstance(stored, dict):
-            return False
-        return stored == expected
+    @staticmethod
+    def _key(video: VideoKey) -> str:
+        return video.hash
 
+    @staticmethod
+    def _config_dict(cfg: Any) -> dict[str, Any]:
+        return asdict(cfg)
 
-# ---------------------------------------------------------------------------
-# Typed caches
-# ---------------------------------------------------------------------------
+    def get(self, video: VideoKey, cfg: Any) -> T | None:
+        return self._get_many([video.hash], asdict(cfg)).get(video.hash)
 
+    def get_many(self, videos: Iterable[VideoKey], cfg: Any) -> dict[VideoKey, T]:
+        """Look up several videos at once; misses are absent from the result."""
+        videos = list(videos)
+        found = self._get_many([video.hash for video in videos], asdict(cfg))
+        return {video: found[video.hash] for video in videos if video.hash in found}
 
-class TranscriptsCache(_JsonCache):
-    """Cache for :class:`clm.voiceover.transcribe.Transcript` artifacts."""
+    def put(self, video: VideoKey, cfg: Any, artifact: T) -> None:
+        self._put(video.hash, asdict(cfg), artifact)
 
-    subdir = "transcripts"
 
-    def __init__(self, cache_root: Path):
-        from clm.voiceover.transcribe import Transcript
+class _PairKeyedCache(_IndexedCache[T]):
+    """Entries keyed by a video and a slides fingerprint and a config dict."""
 
-        super().__init__(
-            cache_root,
-            encoder=lambda t: t.to_dict(),
-            decoder=Transcript.from_dict,
-        )
+    _json_type: type = list
 
-    def get(self, video: VideoKey, cfg: TranscribeConfig):
-        entry = self._load(video.hash)
-        if entry is None:
-            return None
-        if not self._config_matches(entry, asdict(cfg)):
+    @staticmethod
+    def _compose_key(video: VideoKey | MultiVideoKey, slides: SlidesKey) -> str:
+        return f"{video.hash}_{slides.hash}"
+
+    _key = _compose_key
+
+    @staticmethod
+    def _config_dict(cfg: dict[str, Any]) -> dict[str, Any]:
+        return cfg
+
+    def get(
+        self, video: VideoKey | MultiVideoKey, slides: SlidesKey, cfg: dict[str, Any]
+    ) -> T | None:
+        key = self._compose_key(video, slides)
+        return self._get_many([key], cfg).get(key)
+
+    def get_many(
+        self,
+        pairs: Iterable[tuple[VideoKey | MultiVideoKey, SlidesKey]],
+        cfg: dict[str, Any],
+    ) -> dict[tuple[VideoKey | MultiVideoKey, SlidesKey], T]:
+        """Look up several ``(video, slides)`` pairs at once; misses are absent."""
+        keyed = {self._compose_key(video, slides): (video, slides) for video, slides in pairs}
+        found = self._get_many(list(keyed), cfg)
+        return {pair: found[key] for key, pair in keyed.items() if key in found}
+
+    def put(
+        self,
+        video: VideoKey | MultiVideoKey,
+        slides: SlidesKey,
+        cfg: dict[str, Any],
+        artifact: T,
+    ) -> None:
+        self._put(self._compose_key(video, slides), cfg, artifact)
+
+
+class _LegacyJsonCache:
+    """Read-only view of a pre-#568 per-deck cache of per-entry JSON files.
+
+    Offers the ``get`` of *cache_cls* without touching the legacy tree; the
+    caller promotes hits into the shared index.
+    """
+
+    def __init__(self, cache_cls: type[_IndexedCache], root: Path):
+        self._cls = cache_cls
+        self.directory = root / cache_cls.subdir
+
+    def get(self, *args: Any):
+        *key_parts, cfg = args
+        key = self._cls._key(*key_parts)
+        entry = _read_json(self.directory / f"{key}.json")
+        if entry is None or entry.get("config") != self._cls._config_dict(cfg):
             return None
         artifact = entry.get("artifact")
-        if not isinstance(artifact, dict):
+        if not isinstance(artifact, self._cls._json_type):
             return None
         try:
-            return self._decoder(artifact)
+            return self._cls._from_json(artifact)
         except (KeyError, TypeError, ValueError) as exc:
-            logger.warning("Cannot decode cached transcript %s: %s", video.hash, exc)
+            logger.warning("Cannot decode cached %s %s: %s", self._cls.subdir, key, exc)
             return None
 
-    def put(self, video: VideoKey, cfg: TranscribeConfig, transcript) -> None:
-        payload = {
-            "version": 1,
-            "kind": "transcript",
-            "video": asdict(video),
-            "config": asdict(cfg),
-            "artifact": self._encoder(transcript),
-        }
-        self._store(video.hash, payload)
 
+# ---------------------------------------------------------------------------
+# Typed caches
+# ---------------------------------------------------------------------------
+
+
+class TranscriptsCache(_VideoKeyedCache):
+    """Cache for :class:`clm.voiceover.transcribe.Transcript` artifacts."""
+
+    subdir = "transcripts"
+
+    @staticmethod
+    def _pack(artifact) -> bytes:
+        return _pack_transcript(artifact)
+
+    @staticmethod
+    def _unpack(body: bytes):
+        return _unpack_transcript(body)
+
+    @staticmethod
+    def _from_json(data: dict):
+        from clm.voiceover.transcribe import Transcript
+
+        return Transcript.from_dict(data)
 
-class TransitionsCache(_JsonCache):
+
+class TransitionsCache(_VideoKeyedCache):
     """Cache for lists of :class:`TransitionEvent`."""
 
     subdir = "transitions"
+    _json_type = list
 
-    def __init__(self, cache_root: Path):
-        super().__init__(
-            cache_root,
-            encoder=_encode_transitions,
-            decoder=_decode_transitions,
-        )
+    @staticmethod
+    def _pack(artifact) -> bytes:
+        return _pack_json(_encode_transitions(artifact))
 
-    def get(self, video: VideoKey, cfg: DetectConfig):
-        entry = self._load(video.hash)
-        if entry is None:
-            return None
-        if not self._config_matches(entry, asdict(cfg)):
-            return None
-        artifact = entry.get("artifact")
-        if not isinstance(artifact, list):
-            return None
-        try:
-            return self._decoder(artifact)
-        except (KeyError, TypeError, ValueError) as exc:
-            logger.warning("Cannot decode cached transitions %s: %s", video.hash, exc)
-            return None
+    @staticmethod
+    def _unpack(body: bytes):
+        return _decode_transitions(json.loads(body))
 
-    def put(self, video: VideoKey, cfg: DetectConfig, events) -> None:
-        payload = {
-            "version": 1,
-            "kind": "transitions",
-            "video": asdict(video),
-            "config": asdict(cfg),
-            "artifact": self._encoder(events),
-        }
-        self._store(video.hash, payload)
+    @staticmethod
+    def _from_json(data: list):
+        return _decode_transitions(data)
 
 
-class TimelinesCache(_JsonCache):
+class TimelinesCache(_PairKeyedCache):
     """Cache for slide-timelines (output of ``match_events_to_slides``)."""
 
     subdir = "timelines"
 
-    def __init__(self, cache_root: Path):
-        super().__init__(
-            cache_root,
-            encoder=_encode_timeline,
-            decoder=_decode_timeline,
-        )
-
     @staticmethod
-    def _compose_key(video: VideoKey | MultiVideoKey, slides: SlidesKey) -> str:
-        return f"{video.hash}_{slides.hash}"
+    def _pack(artifact) -> bytes:
+        return _pack_timeline(artifact)
 
-    def get(self, video: VideoKey | MultiVideoKey, slides: SlidesKey, cfg: dict[str, Any]):
-        entry = self._load(self._compose_key(video, slides))
-        if entry is None:
-            return None
-        if not self._config_matches(entry, cfg):
-            return None
-        artifact = entry.get("artifact")
-        if not isinstance(artifact, list):
-            return None
-        try:
-            return self._decoder(artifact)
-        except (KeyError, TypeError, ValueError) as exc:
-            logger.warning(
-                "Cannot decode cached timeline %s: %s",
-                self._compose_key(video, slides),
-                exc,
-            )
-            return None
+    @staticmethod
+    def _unpack(body: bytes):
+        return _unpack_timeline(body)
 
-    def put(
-        self,
-        video: VideoKey | MultiVideoKey,
-        slides: SlidesKey,
-        cfg: dict[str, Any],
-        timeline,
-    ) -> None:
-        payload = {
-            "version": 1,
-            "kind": "timeline",
-            "video": asdict(video),
-            "slides": asdict(slides),
-            "config": cfg,
-            "artifact": self._encoder(timeline),
-        }
-        self._store(self._compose_key(video, slides), payload)
+    @staticmethod
+    def _from_json(data: list):
+        return _decode_timeline(data)
 
 
-class AlignmentsCache(_JsonCache):
+class AlignmentsCache(_PairKeyedCache):
     """Cache for :class:`AlignmentResult` objects."""
 
     subdir = "alignments"
+    _json_type = dict
 
-    def __init__(self, cache_root: Path):
-        super().__init__(
-            cache_root,
-            encoder=_encode_alignment,
-            decoder=decode_alignment,
-        )
+    @staticmethod
+    def _pack(artifact) -> bytes:
+        return _pack_json(_encode_alignment(artifact))
 
     @staticmethod
-    def _compose_key(video: VideoKey | MultiVideoKey, slides: SlidesKey) -> str:
-        return f"{video.hash}_{slides.hash}"
+    def _unpack(body: bytes):
+        return decode_alignment(json.loads(body))
 
-    def get(self, video: VideoKey | MultiVideoKey, slides: SlidesKey, cfg: dict[str, Any]):
-        entry = self._load(self._compose_key(video, slides))
-        if entry is None:
-            return None
-        if not self._config_matches(entry, cfg):
-            return None
-        artifact = entry.get("artifact")
-        if not isinstance(artifact, dict):
-            return None
-        try:
-            return self._decoder(artifact)
-        except (KeyError, TypeError, ValueError) as exc:
-            logger.warning(
-                "Cannot decode cached alignment %s: %s",
-                self._compose_key(video, slides),
-                exc,
-            )
-            return None
+    @staticmethod
+    def _from_json(data: dict):
+        return decode_alignment(data)
 
-    def put(
-        self,
-        video: VideoKey | MultiVideoKey,
-        slides: SlidesKey,
-        cfg: dict[str, Any],
-        alignment,
-    ) -> None:
-        payload = {
-            "version": 1,
-            "kind": "alignment",
-            "video": asdict(video),
-            "slides": asdict(slides),
-            "config": cfg,
-            "artifact": self._encoder(alignment),
-        }
-        self._store(self._compose_key(video, slides), payload)
+
+_CACHE_TYPES: tuple[type[_IndexedCache], ...] = (
+    TranscriptsCache,
+    TransitionsCache,
+    TimelinesCache,
+    AlignmentsCache,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -499,7 +571,11 @@ class AlignmentsCache(_JsonCache):
 
 @dataclass(frozen=True)
 class CacheEntrySummary:
-    """Describes a single cache entry for the ``cache list`` command."""
+    """Describes a single cache entry for the ``cache list`` command.
+
+    ``path`` is the index file holding the entry; ``size`` is the encoded
+    artifact's size.
+    """
 
     subdir: str
     key: str
@@ -507,36 +583,38 @@ class CacheEntrySummary:
     size: int
 
 
+def migrate(cache_root: Path) -> int:
+    """Move every JSON-era entry under *cache_root* into its index.
+
+    Returns the number of entries imported. Lookups migrate the entries they
+    miss on their own; this is for housekeeping and bulk runs.
+    """
+    return sum(
+        cache_cls(cache_root)._migrate()
+        for cache_cls in _CACHE_TYPES
+        if (cache_root / cache_cls.subdir).is_dir()
+    )
+
+
 def iter_entries(cache_root: Path) -> list[CacheEntrySummary]:
-    """Return a flat list of cache entries across all known subdirectories."""
-    summaries: list[CacheEntrySummary] = []
-    for sub in CACHE_SUBDIRS:
-        d = cache_root / sub
-        if not d.exists():
-            continue
-        for entry in sorted(d.glob("*.json")):
-            try:
-                size = entry.stat().st_size
-            except OSError:
-                continue
-            summaries.append(CacheEntrySummary(subdir=sub, key=entry.stem, path=entry, size=size))
-    return summaries
+    """Return a flat list of cache entries across all known kinds."""
+    migrate(cache_root)
+    store = ArtifactStore.for_root(cache_root)
+    order = {name: i for i, name in enumerate(CACHE_SUBDIRS)}
+    return [
+        CacheEntrySummary(subdir=e.kind, key=e.key, path=store.path, size=e.size)
+        for e in sorted(store.entries(), key=lambda e: (order.get(e.kind, len(order)), e.key))
+    ]
 
 
 def clear(cache_root: Path) -> int:
-    """Remove all cache entries. Returns the number of files deleted."""
-    removed = 0
-    for entry in iter_entries(cache_root):
-        try:
-            entry.path.unlink()
-            removed += 1
-        except OSError as exc:
-            logger.warning("Cannot remove %s: %s", entry.path, exc)
-    return removed
+    """Remove all cache entries. Returns the number of entries deleted."""
+    migrate(cache_root)
+    return ArtifactStore.for_root(cache_root).clear()
 
 
 def prune(cache_root: Path, *, max_age_days: float | None = None) -> int:
-    """Remove cache entries older than *max_age_days*.
+    """Remove cache entries written more than *max_age_days* ago.
 
     If *max_age_days* is ``None`` the function is a no-op and returns 0.
     """
@@ -545,16 +623,9 @@ def prune(cache_root: Path, *, max_age_days: float | None = None) -> int:
 
     import time
 
+    migrate(cache_root)
     cutoff = time.time() - max_age_days * 86400.0
-    removed = 0
-    for entry in iter_entries(cache_root):
-        try:
-            if entry.path.stat().st_mtime < cutoff:
-                entry.path.unlink()
-                removed += 1
-        except OSError as exc:
-            logger.warning("Cannot prune %s: %s", entry.path, exc)
-    return removed
+    return ArtifactStore.for_root(cache_root).prune(cutoff)
 
 
 # ---------------------------------------------------------------------------
@@ -562,6 +633,110 @@ def prune(cache_root: Path, *, max_age_days: float | None = None) -> int:
 # ---------------------------------------------------------------------------
 
 
+# Packed transcript: header (magic, duration, segment count, language byte
+# length — _NO_LANGUAGE for None), the language, then per-segment arrays of
+# starts, ends, part indices and text byte lengths, then the texts.
+_TRANSCRIPT_MAGIC = b"VTR1"
+_TRANSCRIPT_HEADER = struct.Struct("<4sdII")
+_NO_LANGUAGE = 0xFFFFFFFF
+# Packed timeline: header (magic, entry count), then fixed-size entries.
+_TIMELINE_MAGIC = b"VTL1"
+_TIMELINE_HEADER = struct.Struct("<4sI")
+_TIMELINE_ENTRY = struct.Struct("<iddd?")
+
+
+def _pack_json(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _pack_transcript(transcript) -> bytes:
+    segments = transcript.segments
+    n = len(segments)
+    language = None if transcript.language is None else transcript.language.encode("utf-8")
+    texts = [segment.text.encode("utf-8") for segment in segments]
+    return b"".join(
+        [
+            _TRANSCRIPT_HEADER.pack(
+                _TRANSCRIPT_MAGIC,
+                transcript.duration,
+                n,
+                _NO_LANGUAGE if language is None else len(language),
+            ),
+            language or b"",
+            struct.pack(f"<{n}d", *(segment.start for segment in segments)),
+            struct.pack(f"<{n}d", *(segment.end for segment in segments)),
+            struct.pack(f"<{n}I", *(segment.source_part_index for segment in segments)),
+            struct.pack(f"<{n}I", *(len(text) for text in texts)),
+            *texts,
+        ]
+    )
+
+
+def _unpack_transcript(body: bytes):
+    from clm.voiceover.transcribe import Transcript, TranscriptSegment
+
+    magic, duration, n, language_len = _TRANSCRIPT_HEADER.unpack_from(body)
+    if magic != _TRANSCRIPT_MAGIC:
+        raise ValueError("not a packed transcript")
+    offset = _TRANSCRIPT_HEADER.size
+    language = None
+    if language_len != _NO_LANGUAGE:
+        language = body[offset : offset + language_len].decode("utf-8")
+        offset += language_len
+    starts = struct.unpack_from(f"<{n}d", body, offset)
+    offset += 8 * n
+    ends = struct.unpack_from(f"<{n}d", body, offset)
+    offset += 8 * n
+    parts = struct.unpack_from(f"<{n}I", body, offset)
+    offset += 4 * n
+    lengths = struct.unpack_from(f"<{n}I", body, offset)
+    offset += 4 * n
+    segments = []
+    for start, end, part, length in zip(starts, ends, parts, lengths, strict=True):
+        text = body[offset : offset + length].decode("utf-8")
+        offset += length
+        segments.append(TranscriptSegment(start=start, end=end, text=text, source_part_index=part))
+    if offset != len(body):
+        raise ValueError("truncated or oversized packed transcript")
+    return Transcript(segments=segments, language=language, duration=duration)
+
+
+def _pack_timeline(timeline) -> bytes:
+    return b"".join(
+        [
+            _TIMELINE_HEADER.pack(_TIMELINE_MAGIC, len(timeline)),
+            *(
+                _TIMELINE_ENTRY.pack(
+                    e.slide_index, e.start_time, e.end_time, e.match_score, e.is_header
+                )
+                for e in timeline
+            ),
+        ]
+    )
+
+
+def _unpack_timeline(body: bytes):
+    from clm.voiceover.matcher import TimelineEntry
+
+    magic, n = _TIMELINE_HEADER.unpack_from(body)
+    if magic != _TIMELINE_MAGIC:
+        raise ValueError("not a packed timeline")
+    if len(body) != _TIMELINE_HEADER.size + n * _TIMELINE_ENTRY.size:
+        raise ValueError("truncated or oversized packed timeline")
+    return [
+        TimelineEntry(
+            slide_index=slide_index,
+            start_time=start_time,
+            end_time=end_time,
+            match_score=match_score,
+            is_header=is_header,
+        )
+        for slide_index, start_time, end_time, match_score, is_header in (
+            _TIMELINE_ENTRY.iter_unpack(body[_TIMELINE_HEADER.size :])
+        )
+    ]
+
+
 def _encode_transitions(events) -> list[dict]:
     return [
         {
@@ -714,7 +889,7 @@ def _legacy_cache(cache_cls, primary_root: Path, base_dir: str | Path | None):
         return None
     if root.resolve() == primary_root.resolve():
         return None
-    return cache_cls(root)
+    return _LegacyJsonCache(cache_cls, root)
 
 
 def cached_transcribe(
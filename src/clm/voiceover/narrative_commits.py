@@ -25,6 +25,7 @@ from difflib import SequenceMatcher
 from pathlib import Path
 
 from clm.core.slide_text.slide_parser import Cell, parse_cells
+from clm.slides.git_cat_file import object_reader, repo_location
 
 
 @dataclass(frozen=True)
@@ -273,19 +274,16 @@ def walk_file_history(
 
 
 def get_file_at_rev(rev: str, path: Path) -> str | None:
-    """Return the file's content at ``rev``, or None if it doesn't exist there."""
-    repo_root = git_toplevel(path)
-    rel = path.resolve().relative_to(repo_root)
-    result = subprocess.run(
-        ["git", "-C", str(repo_root), "show", f"{rev}:{rel.as_posix()}"],
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        check=False,
-    )
-    if result.returncode != 0:
-        return None
-    return result.stdout
+    """Return the file's content at ``rev``, or None if it doesn't exist there.
+
+    Read through the repository's shared ``git cat-file`` session, so the
+    per-commit loops of the revision scorer do not fork git per blob.
+    """
+    target = path.resolve()
+    location = repo_location(target.parent)
+    repo_root = location[0] if location is not None else git_toplevel(path)
+    rel = target.relative_to(repo_root)
+    return object_reader(repo_root).text(rev, rel.as_posix())
 
 
 def scan_slide_file(
@@ -61,7 +61,7 @@ class Transcript:
     """Complete transcript of a video's audio track."""
 
     segments: list[TranscriptSegment]
-    language: str  # detected or specified language code
+    language: str | None  # detected or specified language code; None if unknown
     duration: float  # total audio duration in seconds
 
     @property
@@ -33,6 +33,7 @@ import logging
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from clm.web.services.dashboard_feed import DashboardFeed
 from clm.web.services.monitor_service import MonitorService
 from clm.web.studio.auth import tokens_match
 
@@ -60,6 +61,7 @@ class WebSocketManager:
         """Initialize WebSocket manager."""
         self.active_connections: set[WebSocket] = set()
         self.subscriptions: dict[WebSocket, set[str]] = {}
+        self.feed: DashboardFeed | None = None
 
     async def connect(self, websocket: WebSocket, subprotocol: str | None = None):
         """Accept new WebSocket connection.
@@ -129,30 +131,61 @@ class WebSocketManager:
         for connection in disconnected:
             self.disconnect(connection)
 
-    async def send_periodic_updates(self, monitor_service: MonitorService):
-        """Send periodic status updates to all connected clients.
+    def _has_subscribers(self, channel: str) -> bool:
+        return any(channel in channels for channels in self.subscriptions.values())
+
+    def _feed_for(self, monitor_service: MonitorService) -> DashboardFeed:
+        """The shared delta feed, created on first use."""
+        if self.feed is None or self.feed.monitor_service is not monitor_service:
+            self.feed = DashboardFeed(monitor_service)
+        return self.feed
+
+    async def send_snapshot(self, websocket: WebSocket, monitor_service: MonitorService):
+        """Send one client the full status plus the feed state it applies deltas to.
+
+        Used on subscription to ``status`` and when the client asks to resync
+        (it saw a gap in ``seq``). Runs its database reads in a worker thread.
+        """
+        feed = self._feed_for(monitor_service)
+        status = await asyncio.to_thread(monitor_service.get_status)
+        state = await asyncio.to_thread(feed.snapshot)
+        await websocket.send_json(
+            {
+                "type": "status_update",
+                "seq": state["seq"],
+                "data": json.loads(status.model_dump_json()),
+                "jobs": state["jobs"],
+                "workers": state["workers"],
+                "queue": state["queue"],
+            }
+        )
+
+    async def send_periodic_updates(self, monitor_service: MonitorService, interval: float = 2.0):
+        """Broadcast status deltas to ``status`` subscribers every ``interval`` seconds.
+
+        One producer for all clients: each tick polls the shared
+        :class:`DashboardFeed` once, in a worker thread so the event loop never
+        waits on SQLite, and broadcasts a ``status_delta`` only when something
+        changed. The full status goes out per client via :meth:`send_snapshot`.
 
         Args:
             monitor_service: Monitor service instance
+            interval: Seconds between polls
         """
         while True:
-            await asyncio.sleep(2)  # Update every 2 seconds
+            await asyncio.sleep(interval)
 
-            if not self.active_connections:
+            if not self._has_subscribers("status"):
                 continue
 
             try:
-                # Get current status
-                status = monitor_service.get_status()
-
-                # Broadcast to subscribed clients
-                await self.broadcast(
-                    {
-                        "type": "status_update",
-                        "data": json.loads(status.model_dump_json()),
-                    },
-                    channel="status",
-                )
+                feed = self._feed_for(monitor_service)
+                delta = await asyncio.to_thread(feed.poll)
+                if delta is not None:
+                    await self.broadcast(
+                        {"type": "status_delta", "seq": delta.pop("seq"), "data": delta},
+                        channel="status",
+                    )
             except Exception as e:
                 logger.error(f"Error sending periodic update: {e}", exc_info=True)
 
@@ -249,6 +282,7 @@ async def websocket_endpoint(websocket: WebSocket):
             return
 
     await ws_manager.connect(websocket, subprotocol=subprotocol)
+    monitor_service = getattr(state, "monitor_service", None)
 
     try:
         while True:
@@ -263,6 +297,13 @@ async def websocket_endpoint(websocket: WebSocket):
                 # for: echoing the request back made a typo look like a
                 # success and then go quiet forever.
                 await websocket.send_json({"type": "subscribed", "channels": accepted})
+                if "status" in accepted and monitor_service is not None:
+                    await ws_manager.send_snapshot(websocket, monitor_service)
+
+            # Handle resync: the client missed a status delta (a gap in seq)
+            elif data.get("action") == "resync":
+                if monitor_service is not None:
+                    await ws_manager.send_snapshot(websocket, monitor_service)
 
             # Handle ping
             elif data.get("type") == "ping":
@@ -43,14 +43,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info(f"Database: {app.state.db_path}")
     logger.info(f"Listening on: http://{app.state.host}:{app.state.port}")
 
-    # Start background task for WebSocket updates
-    # import asyncio
-    # asyncio.create_task(ws_manager.send_periodic_updates(app.state.monitor_service))
+    import asyncio
+
+    from clm.web.api.websocket import ws_manager
+
+    # One shared producer feeds the `status` channel with deltas; it idles
+    # while nobody is subscribed.
+    updates_task = asyncio.create_task(ws_manager.send_periodic_updates(app.state.monitor_service))
 
     # Start the Studio external-change watcher (the two-editor guard) when a
     # course spec was configured (clm serve --spec).
-    import asyncio
-
     watcher_task = None
     studio_service = getattr(app.state, "studio_service", None)
     if studio_service is not None:
@@ -62,6 +64,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
     # Shutdown
     logger.info("Shutting down CLM Dashboard Server...")
+    updates_task.cancel()
+    try:
+        await updates_task
+    except (asyncio.CancelledError, Exception):  # noqa: BLE001 - best-effort stop
+        pass
+    if ws_manager.feed is not None:
+        ws_manager.feed.close()
     if watcher_task is not None:
         watcher_task.cancel()
         try:
@@ -0,0 +1,345 @@
+"""Incremental change feed behind the dashboard's ``status`` WebSocket channel.
+
+``MonitorService.get_status`` recomputes everything — queue statistics over
+the whole jobs table, every worker, the payload of every busy job — which is
+fine for one REST call but not as a 2-second broadcast loop. The feed instead
+keeps the dashboard-visible state in memory and, on each poll, reads only
+what can have changed:
+
+* jobs with ``id`` above the last seen id (new submissions; their payload is
+  parsed once, here);
+* the currently open (pending/processing) jobs, found through the status
+  index, plus the jobs that left that set since the last poll;
+* the live worker rows (bounded by the pool size, never by history);
+* worker events with ``id`` above the last seen event id.
+
+Each poll returns a compact delta, or ``None`` when nothing changed. One feed
+serves every connected client, so the database cost is independent of the
+number of open dashboards. Clients get a full snapshot on connect or when they
+ask to resync; a gap in ``seq`` tells a client it missed a delta.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from clm.web.models import JobSummary, WorkerDetailResponse
+
+if TYPE_CHECKING:
+    from clm.web.services.monitor_service import MonitorService
+
+logger = logging.getLogger(__name__)
+
+#: Job states that can still change. Everything else is final.
+OPEN_JOB_STATUSES = ("pending", "processing")
+
+#: Cap on worker events carried by one delta; a burst beyond it is truncated
+#: (the rest arrive on the next poll), keeping one message bounded.
+MAX_EVENTS_PER_DELTA = 200
+
+#: ``IN (...)`` batch size, well below SQLite's bound-parameter limit.
+_ID_BATCH = 500
+
+_JOB_COLUMNS = (
+    "id, job_type, status, input_file, output_file, created_at, started_at, "
+    "completed_at, error, payload"
+)
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+class DashboardFeed:
+    """Cursor-based producer of dashboard deltas over the jobs database.
+
+    Thread-safe: ``poll`` and ``snapshot`` are meant to run in a worker
+    thread (``asyncio.to_thread``) and serialize on an internal lock.
+    """
+
+    def __init__(self, monitor_service: MonitorService):
+        self.monitor_service = monitor_service
+        self.db_path = Path(monitor_service.db_path)
+        self.seq = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._primed = False
+        self._job_cursor = 0
+        self._event_cursor = 0
+        self._open_jobs: dict[int, JobSummary] = {}
+        self._workers: dict[str, WorkerDetailResponse] = {}
+
+    # ------------------------------------------------------------ plumbing
+
+    def _get_conn(self) -> sqlite3.Connection | None:
+        if self._conn is None:
+            if not self.db_path.exists():
+                return None
+            from clm.infrastructure.database.journal_mode import configure_connection
+
+            # One connection, used by whichever executor thread runs the poll;
+            # ``_lock`` guarantees it is never used concurrently.
+            conn = sqlite3.connect(
+                str(self.db_path), timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            configure_connection(conn, self.db_path)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the feed's database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _job_summary(self, row: tuple) -> JobSummary:
+        started = _parse_ts(row[6])
+        completed = _parse_ts(row[7])
+        duration = int((completed - started).total_seconds()) if started and completed else None
+        payload_info = self.monitor_service._parse_job_payload(row[1], row[9])
+        return JobSummary(
+            job_id=row[0],
+            job_type=row[1],
+            status=row[2],
+            input_file=row[3],
+            output_file=row[4],
+            created_at=datetime.fromisoformat(row[5]),
+            started_at=started,
+            completed_at=completed,
+            error_message=row[8],
+            duration_seconds=duration,
+            output_format=payload_info.get("output_format"),
+            prog_lang=payload_info.get("prog_lang"),
+            language=payload_info.get("language"),
+            kind=payload_info.get("kind"),
+        )
+
+    @staticmethod
+    def _with_state(job: JobSummary, row: tuple) -> JobSummary:
+        """``job`` updated from a ``(id, status, started_at, completed_at, error)`` row."""
+        started = _parse_ts(row[2])
+        completed = _parse_ts(row[3])
+        duration = int((completed - started).total_seconds()) if started and completed else None
+        return job.model_copy(
+            update={
+                "status": row[1],
+                "started_at": started,
+                "completed_at": completed,
+                "error_message": row[4],
+                "duration_seconds": duration,
+            }
+        )
+
+    # ------------------------------------------------------------- reading
+
+    def _read_new_jobs(self, conn: sqlite3.Connection) -> list[JobSummary]:
+        rows = conn.execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id > ? ORDER BY id", (self._job_cursor,)
+        ).fetchall()
+        jobs = [self._job_summary(row) for row in rows]
+        if rows:
+            self._job_cursor = rows[-1][0]
+        return jobs
+
+    def _read_open_job_states(self, conn: sqlite3.Connection) -> dict[int, tuple]:
+        placeholders = ", ".join("?" for _ in OPEN_JOB_STATUSES)
+        rows = conn.execute(
+            "SELECT id, status, started_at, completed_at, error FROM jobs "
+            f"WHERE status IN ({placeholders}) AND id <= ?",
+            (*OPEN_JOB_STATUSES, self._job_cursor),
+        ).fetchall()
+        return {row[0]: row for row in rows}
+
+    @staticmethod
+    def _rows_by_id(conn: sqlite3.Connection, columns: str, ids: list[int]) -> list[tuple]:
+        rows: list[tuple] = []
+        for start in range(0, len(ids), _ID_BATCH):
+            batch = ids[start : start + _ID_BATCH]
+            placeholders = ", ".join("?" for _ in batch)
+            rows.extend(
+                conn.execute(f"SELECT {columns} FROM jobs WHERE id IN ({placeholders})", batch)
+            )
+        return rows
+
+    def _read_job_states(self, conn: sqlite3.Connection, ids: list[int]) -> dict[int, tuple]:
+        columns = "id, status, started_at, completed_at, error"
+        return {row[0]: row for row in self._rows_by_id(conn, columns, ids)}
+
+    def _read_jobs(self, conn: sqlite3.Connection, ids: list[int]) -> list[JobSummary]:
+        return [self._job_summary(row) for row in self._rows_by_id(conn, _JOB_COLUMNS, ids)]
+
+    def _read_workers(self, conn: sqlite3.Connection) -> dict[str, WorkerDetailResponse]:
+        now = datetime.now()
+        workers: dict[str, WorkerDetailResponse] = {}
+        for row in conn.execute(
+            """
+            SELECT
+                w.container_id, w.worker_type, w.status, w.execution_mode,
+                w.jobs_processed, w.started_at, w.last_heartbeat,
+                j.id, j.input_file,
+                CAST((julianday('now') - julianday(j.started_at)) * 86400 AS INTEGER)
+            FROM workers w
+            LEFT JOIN jobs j ON j.worker_id = w.id AND j.status = 'processing'
+            WHERE w.status != 'dead'
+            """
+        ):
+            # Elapsed time is computed by SQLite: started_at is a naive UTC
+            # CURRENT_TIMESTAMP, so the local clock cannot be compared with it.
+            workers[row[0]] = WorkerDetailResponse(
+                worker_id=row[0],
+                worker_type=row[1],
+                status=row[2],
+                execution_mode=row[3],
+                current_job_id=str(row[7]) if row[7] else None,
+                current_document=row[8],
+                elapsed_seconds=row[9],
+                jobs_processed=row[4] or 0,
+                uptime_seconds=int((now - datetime.fromisoformat(row[5])).total_seconds()),
+                last_heartbeat=_parse_ts(row[6]),
+            )
+        return workers
+
+    def _read_events(self, conn: sqlite3.Connection) -> list[dict[str, Any]]:
+        rows = conn.execute(
+            "SELECT id, event_type, worker_id, worker_type, execution_mode, message, created_at "
+            "FROM worker_events WHERE id > ? ORDER BY id LIMIT ?",
+            (self._event_cursor, MAX_EVENTS_PER_DELTA),
+        ).fetchall()
+        if rows:
+            self._event_cursor = rows[-1][0]
+        return [
+            {
+                "id": row[0],
+                "event_type": row[1],
+                "worker_id": row[2],
+                "worker_type": row[3],
+                "execution_mode": row[4],
+                "message": row[5],
+                "created_at": row[6],
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def _worker_changed(old: WorkerDetailResponse | None, new: WorkerDetailResponse) -> bool:
+        # Elapsed time, uptime and heartbeat tick on every poll; only a state
+        # change is worth a message. Clients extrapolate the clocks.
+        if old is None:
+            return True
+        return (old.status, old.current_job_id, old.jobs_processed) != (
+            new.status,
+            new.current_job_id,
+            new.jobs_processed,
+        )
+
+    # ------------------------------------------------------------- public
+
+    def _prime(self, conn: sqlite3.Connection) -> None:
+        row = conn.execute("SELECT COALESCE(MAX(id), 0) FROM jobs").fetchone()
+        self._job_cursor = row[0]
+        row = conn.execute("SELECT COALESCE(MAX(id), 0) FROM worker_events").fetchone()
+        self._event_cursor = row[0]
+        placeholders = ", ".join("?" for _ in OPEN_JOB_STATUSES)
+        rows = conn.execute(
+            f"SELECT {_JOB_COLUMNS} FROM jobs WHERE status IN ({placeholders}) AND id <= ?",
+            (*OPEN_JOB_STATUSES, self._job_cursor),
+        ).fetchall()
+        self._open_jobs = {row[0]: self._job_summary(row) for row in rows}
+        self._workers = self._read_workers(conn)
+        self._primed = True
+
+    def poll(self) -> dict[str, Any] | None:
+        """Read what changed since the previous poll and return it as a delta.
+
+        Returns ``None`` when nothing changed (and on the first call, which
+        only establishes the cursors). Otherwise a dict with ``seq`` and any of
+        ``jobs`` (new or changed rows), ``workers`` / ``workers_removed``,
+        ``events`` and ``queue`` (open-job counts).
+        """
+        with self._lock:
+            conn = self._get_conn()
+            if conn is None:
+                return None
+            if not self._primed:
+                self._prime(conn)
+                return None
+
+            changed_jobs: list[JobSummary] = []
+            open_states = self._read_open_job_states(conn)
+            left = [job_id for job_id in self._open_jobs if job_id not in open_states]
+            final_states = self._read_job_states(conn, left) if left else {}
+            for job_id, job in list(self._open_jobs.items()):
+                state = open_states.get(job_id) or final_states.get(job_id)
+                if state is None:  # archived or deleted meanwhile
+                    del self._open_jobs[job_id]
+                    continue
+                updated = self._with_state(job, state)
+                if updated != job:
+                    changed_jobs.append(updated)
+                if state[1] in OPEN_JOB_STATUSES:
+                    self._open_jobs[job_id] = updated
+                else:
+                    del self._open_jobs[job_id]
+            # A finished job put back in the queue (a retry) re-enters the set.
+            reopened = [job_id for job_id in open_states if job_id not in self._open_jobs]
+            for job in self._read_jobs(conn, reopened):
+                changed_jobs.append(job)
+                self._open_jobs[job.job_id] = job
+            for job in self._read_new_jobs(conn):
+                changed_jobs.append(job)
+                if job.status in OPEN_JOB_STATUSES:
+                    self._open_jobs[job.job_id] = job
+
+            workers = self._read_workers(conn)
+            changed_workers = [
+                w for wid, w in workers.items() if self._worker_changed(self._workers.get(wid), w)
+            ]
+            removed_workers = [wid for wid in self._workers if wid not in workers]
+            self._workers = workers
+
+            events = self._read_events(conn)
+
+            if not (changed_jobs or changed_workers or removed_workers or events):
+                return None
+            self.seq += 1
+            delta: dict[str, Any] = {"seq": self.seq}
+            if changed_jobs:
+                delta["jobs"] = [job.model_dump(mode="json") for job in changed_jobs]
+                delta["queue"] = self._queue_counts()
+            if changed_workers:
+                delta["workers"] = [w.model_dump(mode="json") for w in changed_workers]
+            if removed_workers:
+                delta["workers_removed"] = removed_workers
+            if events:
+                delta["events"] = events
+            return delta
+
+    def _queue_counts(self) -> dict[str, int]:
+        counts = dict.fromkeys(OPEN_JOB_STATUSES, 0)
+        for job in self._open_jobs.values():
+            counts[job.status] += 1
+        return counts
+
+    def snapshot(self) -> dict[str, Any]:
+        """The feed's full state: ``seq``, open ``jobs``, live ``workers``, ``queue``.
+
+        Sent to a client on connect or resync, together with the full
+        :meth:`MonitorService.get_status`; deltas with a higher ``seq`` apply
+        on top of it.
+        """
+        with self._lock:
+            conn = self._get_conn()
+            if conn is not None and not self._primed:
+                self._prime(conn)
+            return {
+                "seq": self.seq,
+                "jobs": [job.model_dump(mode="json") for job in self._open_jobs.values()],
+                "workers": [w.model_dump(mode="json") for w in self._workers.values()],
+                "queue": self._queue_counts(),
+            }
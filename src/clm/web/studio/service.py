@@ -28,7 +28,10 @@ from __future__ import annotations
 import hashlib
 import logging
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from clm.core.slide_text.slide_parser import parse_cells
@@ -107,6 +110,46 @@ class StaleWriteError(StudioError):
         self.current = current
 
 
+@dataclass(frozen=True)
+class _PairLockStatus:
+    """The language-independent half of a split pair's lock, as of ``fingerprint``.
+
+    ``fingerprint`` hashes every input of the ledger diff (both halves, both
+    companions, the topic ledger), so a cached status is valid exactly while
+    it matches the files on disk.
+    """
+
+    fingerprint: str
+    de_dirty: bool = False
+    en_dirty: bool = False
+    has_conflicts: bool = False
+    parse_error: str | None = None
+
+
+def _lock_fingerprint(de_path: Path, en_path: Path) -> str:
+    """Content fingerprint of the (DE, EN, companions, ledger) lock inputs."""
+    from clm.core.voiceover_companions import resolve_companion
+    from clm.slides.doc_ledger import ledger_path_for
+
+    digest = hashlib.sha256()
+    inputs = (
+        de_path,
+        en_path,
+        resolve_companion(de_path),
+        resolve_companion(en_path),
+        ledger_path_for(de_path),
+    )
+    for path in inputs:
+        digest.update(b"\0" + str(path).encode("utf-8") + b"\0")
+        if path is None:
+            continue
+        try:
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
 class StudioService:
     """Course-scoped engine for the Studio API."""
 
@@ -122,6 +165,12 @@ class StudioService:
         self._self_writes: dict[str, float] = {}
         #: Deck ids (the DE half, canonical) with a sync subprocess in flight.
         self._sync_inflight: set[str] = set()
+        #: Memoized pair lock status, keyed by the ordered (DE, EN) paths.
+        self._lock_cache: dict[tuple[Path, Path], _PairLockStatus] = {}
+        #: Background recomputations in flight, same keys.
+        self._lock_refreshes: dict[tuple[Path, Path], Future[_PairLockStatus]] = {}
+        self._lock_mutex = threading.Lock()
+        self._lock_executor: ThreadPoolExecutor | None = None
 
     # ------------------------------------------------------------------ paths
 
@@ -150,6 +199,7 @@ class StudioService:
     def mark_self_write(self, deck_id: str) -> None:
         """Record that we are about to write ``deck_id`` (suppresses watcher echo)."""
         self._self_writes[deck_id] = time.monotonic() + SELF_WRITE_WINDOW_SECONDS
+        self.invalidate_lock(deck_id)
 
     def is_self_write(self, deck_id: str) -> bool:
         """Whether a recent filesystem change to ``deck_id`` was our own write."""
@@ -328,33 +378,34 @@ class StudioService:
 
     # ----------------------------------------------------- bilingual lock (P3)
 
+    @staticmethod
+    def _split_pair(path: Path) -> tuple[str | None, Path | None, tuple[Path, Path] | None]:
+        """``(lang, twin, (de_path, en_path))`` for a deck; the pair is ``None`` if unpaired."""
+        from clm.core.slide_text.pairing import derive_split_twin, order_split_pair, split_lang_tag
+
+        lang = split_lang_tag(path)
+        twin = derive_split_twin(path)
+        if lang is None or twin is None or not twin.exists():
+            return lang, twin, None
+        return lang, twin, order_split_pair(path, twin)
+
     def compute_lock(self, deck_id: str, path: Path) -> LockState:
         """Derive the deck's bilingual lock from the committed sync ledger (v3).
 
         A language is editable iff the *other* split half is **clean** relative to
         the ledger baseline (design §3.5): editing one half marks the other stale
         and locks it until a sync (or discard) makes both clean again. The diff is
-        **read-only and LLM-free**. Returns an unlocked state for any deck with no
+        **read-only and LLM-free**, and memoized per pair (see
+        :meth:`_pair_lock_status`). Returns an unlocked state for any deck with no
         split twin on disk.
         """
-        from clm.core.slide_text.pairing import derive_split_twin, order_split_pair, split_lang_tag
-
-        lang = split_lang_tag(path)
-        twin = derive_split_twin(path)
-        if lang is None or twin is None or not twin.exists():
+        lang, twin, ordered = self._split_pair(path)
+        if ordered is None or twin is None or lang is None:
             return LockState(is_pair=False, lang=lang, editable=True, baseline="n/a")
-        ordered = order_split_pair(path, twin)
-        if ordered is None:
-            return LockState(is_pair=False, lang=lang, editable=True, baseline="n/a")
-        de_path, en_path = ordered
         other_lang = "en" if lang == "de" else "de"
 
-        from clm.slides.doc_lenses import DocLensError, load_bundle
-        from clm.slides.doc_report import diff_bundle
-
-        try:
-            bundle = load_bundle(de_path, en_path)
-        except DocLensError as exc:
+        status = self._pair_lock_status(ordered)
+        if status.parse_error is not None:
             # An unparseable pair cannot be diffed — lock both halves rather
             # than let a phone edit race an already-corrupt deck.
             return LockState(
@@ -363,21 +414,14 @@ class StudioService:
                 other_lang=other_lang,
                 twin_deck_id=self._rel(twin),
                 editable=False,
-                locked_reason=f"The pair cannot be parsed: {exc}",
+                locked_reason=f"The pair cannot be parsed: {status.parse_error}",
                 has_conflicts=True,
                 baseline="ledger",
             )
-        diff = diff_bundle(bundle)
-
-        # ``direction`` names the half that drifted (the source). de_to_en ⇒ DE
-        # is dirty; en_to_de ⇒ EN is dirty. Anything needing judgment (a framed
-        # conflict, a both-sided move, a normalize refusal, a cold member) locks
-        # both — the phone editor only ever rides on a mechanically-clean pair.
-        de_dirty = any(i.direction in ("de_to_en", "both") for i in diff.items)
-        en_dirty = any(i.direction in ("en_to_de", "both") for i in diff.items)
-        has_conflicts = diff.needs_agent
-        this_dirty = de_dirty if lang == "de" else en_dirty
-        other_dirty = en_dirty if lang == "de" else de_dirty
+
+        has_conflicts = status.has_conflicts
+        this_dirty = status.de_dirty if lang == "de" else status.en_dirty
+        other_dirty = status.en_dirty if lang == "de" else status.de_dirty
 
         editable = not other_dirty and not has_conflicts
         if has_conflicts:
@@ -405,6 +449,111 @@ class StudioService:
             baseline="ledger",
         )
 
+    def _pair_lock_status(self, pair: tuple[Path, Path]) -> _PairLockStatus:
+        """The pair's lock status, recomputed only when its inputs changed.
+
+        The fingerprint (a hash of the files' bytes) is checked on every call,
+        so a hit is never stale; a miss waits for an in-flight background
+        refresh of the same pair before diffing inline.
+        """
+        fingerprint = _lock_fingerprint(*pair)
+        with self._lock_mutex:
+            cached = self._lock_cache.get(pair)
+            pending = self._lock_refreshes.get(pair)
+        if cached is not None and cached.fingerprint == fingerprint:
+            return cached
+        if pending is not None:
+            try:
+                status = pending.result()
+            except Exception:  # noqa: BLE001 - fall through to an inline diff
+                status = None
+            if status is not None and status.fingerprint == fingerprint:
+                return status
+        return self._diff_pair(pair, fingerprint)
+
+    def _diff_pair(self, pair: tuple[Path, Path], fingerprint: str) -> _PairLockStatus:
+        """Run the full bilingual parse + ledger diff and memoize the result."""
+        from clm.slides.doc_lenses import DocLensError, load_bundle
+        from clm.slides.doc_report import diff_bundle
+
+        de_path, en_path = pair
+        try:
+            bundle = load_bundle(de_path, en_path)
+        except DocLensError as exc:
+            status = _PairLockStatus(fingerprint, parse_error=str(exc))
+        else:
+            diff = diff_bundle(bundle)
+            # ``direction`` names the half that drifted (the source). de_to_en ⇒
+            # DE is dirty; en_to_de ⇒ EN is dirty. Anything needing judgment (a
+            # framed conflict, a both-sided move, a normalize refusal, a cold
+            # member) locks both — the phone editor only ever rides on a
+            # mechanically-clean pair.
+            status = _PairLockStatus(
+                fingerprint,
+                de_dirty=any(i.direction in ("de_to_en", "both") for i in diff.items),
+                en_dirty=any(i.direction in ("en_to_de", "both") for i in diff.items),
+                has_conflicts=diff.needs_agent,
+            )
+        with self._lock_mutex:
+            self._lock_cache[pair] = status
+        return status
+
+    def invalidate_lock(self, deck_id: str) -> None:
+        """Forget the memoized lock of the pair containing ``deck_id``."""
+        try:
+            path = self._resolve_deck_id(deck_id)
+        except InvalidDeckIdError:
+            return
+        with self._lock_mutex:
+            for pair in [p for p in self._lock_cache if path in p]:
+                del self._lock_cache[pair]
+
+    def invalidate_topic_locks(self, topic_dir: Path) -> None:
+        """Forget every memoized lock in ``topic_dir`` (its ledger changed)."""
+        topic_dir = topic_dir.resolve()
+        with self._lock_mutex:
+            for pair in [p for p in self._lock_cache if p[0].parent == topic_dir]:
+                del self._lock_cache[pair]
+
+    def schedule_lock_refresh(self, deck_id: str) -> None:
+        """Recompute the lock of ``deck_id``'s pair on a background thread.
+
+        Called after writes so the next request finds a warm entry instead of
+        paying the parse + diff itself. A no-op for decks without a twin.
+        """
+        try:
+            path = self._resolve_deck_id(deck_id)
+        except InvalidDeckIdError:
+            return
+        if not path.exists():
+            return
+        _lang, _twin, pair = self._split_pair(path)
+        if pair is None:
+            return
+        with self._lock_mutex:
+            if pair in self._lock_refreshes:
+                return
+            if self._lock_executor is None:
+                self._lock_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="studio-lock"
+                )
+            future = self._lock_executor.submit(self._refresh_pair, pair)
+            self._lock_refreshes[pair] = future
+        future.add_done_callback(lambda _f: self._forget_refresh(pair, future))
+
+    def _refresh_pair(self, pair: tuple[Path, Path]) -> _PairLockStatus:
+        fingerprint = _lock_fingerprint(*pair)
+        with self._lock_mutex:
+            cached = self._lock_cache.get(pair)
+        if cached is not None and cached.fingerprint == fingerprint:
+            return cached
+        return self._diff_pair(pair, fingerprint)
+
+    def _forget_refresh(self, pair: tuple[Path, Path], future: Future[_PairLockStatus]) -> None:
+        with self._lock_mutex:
+            if self._lock_refreshes.get(pair) is future:
+                del self._lock_refreshes[pair]
+
     def _enforce_lock(self, deck_id: str, path: Path) -> None:
         """Raise :class:`LanguageLockedError` (→ 423) if this language is locked."""
         lock = self.compute_lock(deck_id, path)
@@ -530,6 +679,7 @@ class StudioService:
         """Flush ``state`` to disk and return fresh guards recomputed from disk."""
         self.mark_self_write(deck_id)
         state.flush()
+        self.schedule_lock_refresh(deck_id)
         fresh = FileState.load(path)
         fresh_cell = fresh.find_cell(slide_id, role)
         new_hash = hash_cell(fresh_cell.metadata, fresh_cell.body) if fresh_cell is not None else ""
@@ -99,4 +99,7 @@ async def run_sync(
         return
 
     mark()
+    # The sync rewrote the halves and the ledger; warm the lock before the
+    # phone re-opens the deck.
+    service.schedule_lock_refresh(de_id)
     await broadcast({"type": "sync-done", "deck_id": deck_id, "ok": code == 0, "exit_code": code})
@@ -6,6 +6,10 @@ on disk *and the change was not our own write*, the server pushes a
 "changed on disk — reload" and disable Save until the user re-fetches. This
 closes the fetch→write gap for the VS Code case that optimistic concurrency
 alone cannot see until a write is attempted.
+
+The same events keep the service's memoized bilingual lock warm: an external
+deck edit or a ledger change invalidates the affected pairs and schedules a
+background recompute.
 """
 
 from __future__ import annotations
@@ -31,6 +35,7 @@ async def watch_slides_dir(service: StudioService) -> None:
         logger.warning("watchfiles unavailable; Studio external-change watcher disabled")
         return
 
+    from clm.slides.doc_ledger import LEDGER_FILENAME
     from clm.web.api.websocket import ws_manager
 
     slides_dir = service.slides_dir
@@ -46,6 +51,11 @@ async def watch_slides_dir(service: StudioService) -> None:
                 from pathlib import Path
 
                 path = Path(raw_path)
+                if path.name == LEDGER_FILENAME:
+                    # A recorded sync changes the baseline of every pair in
+                    # the topic (``<topic>/.clm/sync-ledger.json``).
+                    service.invalidate_topic_locks(path.parent.parent)
+                    continue
                 if path.suffix != ".py":
                     continue
                 try:
@@ -57,6 +67,11 @@ async def watch_slides_dir(service: StudioService) -> None:
                 seen.add(deck_id)
                 if service.is_self_write(deck_id):
                     continue
+                # Self-writes refresh their lock on the write path; an
+                # external edit (VS Code, git) gets it recomputed here, off
+                # the request path of the phone's next save.
+                service.invalidate_lock(deck_id)
+                service.schedule_lock_refresh(deck_id)
                 await ws_manager.broadcast(
                     {"type": "deck-changed-on-disk", "deck_id": deck_id},
                     channel="studio",
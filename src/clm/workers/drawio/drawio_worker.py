@@ -41,6 +41,16 @@ def _configure_logging() -> None:
     )
 
 
+# Smallest diagram Draw.io exports without complaint: one labelled box.
+_PREWARM_DIAGRAM = (
+    '<mxfile><diagram id="prewarm" name="prewarm"><mxGraphModel><root>'
+    '<mxCell id="0"/><mxCell id="1" parent="0"/>'
+    '<mxCell id="2" value="prewarm" vertex="1" parent="1">'
+    '<mxGeometry x="0" y="0" width="80" height="40" as="geometry"/></mxCell>'
+    "</root></mxGraphModel></diagram></mxfile>"
+)
+
+
 class DrawioWorker(Worker):
     """Worker that processes DrawIO conversion jobs from SQLite queue or REST API."""
 
@@ -56,6 +66,20 @@ class DrawioWorker(Worker):
         mode = "API" if api_url else "SQLite"
         logger.info(f"DrawioWorker {worker_id} initialized in {mode} mode")
 
+    def prewarm(self) -> None:
+        """Export one single-shape diagram so Draw.io's Electron runtime is paged in."""
+        from tempfile import TemporaryDirectory
+
+        from clm.workers.drawio.drawio_converter import convert_drawio
+
+        with TemporaryDirectory() as tmp_dir:
+            tmp_input = Path(tmp_dir) / "prewarm.drawio"
+            tmp_input.write_text(_PREWARM_DIAGRAM, encoding="utf-8")
+            loop = self._get_or_create_loop()
+            loop.run_until_complete(
+                convert_drawio(tmp_input, Path(tmp_dir) / "prewarm.png", "png", "prewarm")
+            )
+
     def process_job(self, job: Job):
         """Process a DrawIO conversion job.
 
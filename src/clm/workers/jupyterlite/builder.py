@@ -10,14 +10,22 @@ from __future__ import annotations
 
 import json
 import logging
+import mimetypes
 import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 from clm.core.utils.jupyterlite_manifest import JUPYTERLITE_CORE_VERSION
-from clm.workers.jupyterlite.lite_dir import assemble_lite_dir, hash_manifest
+from clm.workers.jupyterlite.lite_dir import (
+    assemble_lite_dir,
+    hash_manifest,
+    hash_site_manifest,
+    staged_contents,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +83,7 @@ class BuildArgs:
     branding_theme: str = ""
     branding_logo: str = ""
     branding_site_name: str = ""
+    incremental: bool = True
 
 
 @dataclass
@@ -85,6 +94,8 @@ class BuildResult:
     manifest_path: Path
     cache_key: str
     files_count: int
+    mode: str = "full"
+    contents_changed: int = 0
 
 
 def _run_jupyter_lite_build(lite_dir: Path, site_dir: Path, kernel: str) -> None:
@@ -317,17 +328,199 @@ MIME type for `.wasm` files (`application/wasm`) will work.
     (output_dir / "README-offline.md").write_text(readme_text, encoding="utf-8")
 
 
+def _read_previous_manifest(manifest_path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _can_update_in_place(previous: dict[str, Any] | None, site_key: str, site_dir: Path) -> bool:
+    """Whether the existing site differs from the requested one only in contents."""
+    if previous is None or previous.get("site_key") != site_key:
+        return False
+    if not isinstance(previous.get("contents"), dict):
+        return False
+    return (site_dir / "api" / "contents" / "all.json").is_file()
+
+
+def _iso_timestamp(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, tz=UTC).isoformat().replace("+00:00", "Z")
+
+
+def _content_model(files_root: Path, rel: str, template: dict[str, Any] | None) -> dict[str, Any]:
+    """A contents-API model (``content=False``) for ``files_root / rel``.
+
+    Shaped after an entry the real build wrote (``template``) when one is
+    available, so an in-place update keeps whatever optional keys the
+    installed ``jupyterlite-core`` emits.
+    """
+    path = files_root / rel
+    stat = path.stat()
+    name = path.name
+    if path.is_dir():
+        kind, mimetype, size = "directory", None, None
+    elif name.endswith(".ipynb"):
+        kind, mimetype, size = "notebook", None, stat.st_size
+    else:
+        kind, mimetype, size = "file", mimetypes.guess_type(name)[0], stat.st_size
+    model: dict[str, Any] = {"content": None, "format": None, "writable": True}
+    if template is not None:
+        model.update(template)
+        if "hash" in model:
+            model["hash"] = None
+    timestamp = _iso_timestamp(stat.st_mtime)
+    model.update(
+        name=name,
+        path=rel,
+        type=kind,
+        mimetype=mimetype,
+        size=size,
+        created=timestamp,
+        last_modified=timestamp,
+    )
+    return model
+
+
+def _listing_path(site_dir: Path, dir_rel: str) -> Path:
+    contents = site_dir / "api" / "contents"
+    return (contents / dir_rel if dir_rel else contents) / "all.json"
+
+
+def _refresh_listing(
+    site_dir: Path, dir_rel: str, updated: set[str], templates: dict[str, dict[str, Any]]
+) -> None:
+    """Rewrite the ``all.json`` listing of one directory after an in-place update.
+
+    Entries of untouched children are kept verbatim; ``updated`` children and
+    children without an entry get a fresh model. A directory that no longer
+    exists loses its listing.
+    """
+    files_root = site_dir / "files"
+    directory = files_root / dir_rel if dir_rel else files_root
+    listing_path = _listing_path(site_dir, dir_rel)
+    if not dir_rel:
+        directory.mkdir(parents=True, exist_ok=True)
+    if not directory.is_dir():
+        listing_path.unlink(missing_ok=True)
+        try:
+            listing_path.parent.rmdir()
+        except OSError:
+            pass
+        return
+
+    listing: dict[str, Any]
+    try:
+        listing = json.loads(listing_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        listing = _content_model(files_root, dir_rel, templates.get("directory"))
+    existing = {
+        entry.get("name"): entry
+        for entry in listing.get("content") or []
+        if isinstance(entry, dict)
+    }
+    children: list[dict[str, Any]] = []
+    for child in sorted(directory.iterdir(), key=lambda p: p.name):
+        rel = f"{dir_rel}/{child.name}" if dir_rel else child.name
+        entry = existing.get(child.name)
+        if entry is None or rel in updated:
+            kind = (
+                "directory"
+                if child.is_dir()
+                else ("notebook" if child.name.endswith(".ipynb") else "file")
+            )
+            entry = _content_model(files_root, rel, templates.get(kind))
+        children.append(entry)
+    listing["content"] = children
+    listing["type"] = "directory"
+    listing_path.parent.mkdir(parents=True, exist_ok=True)
+    listing_path.write_text(json.dumps(listing, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _listing_templates(site_dir: Path) -> dict[str, dict[str, Any]]:
+    """One entry per model type, taken from the listings the real build wrote."""
+    templates: dict[str, dict[str, Any]] = {}
+    for all_json in sorted((site_dir / "api" / "contents").rglob("all.json")):
+        try:
+            listing = json.loads(all_json.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        for entry in listing.get("content") or []:
+            if isinstance(entry, dict) and entry.get("type") not in templates:
+                templates[str(entry.get("type"))] = entry
+        if len(templates) == 3:
+            break
+    return templates
+
+
+def update_site_contents(
+    site_dir: Path,
+    staged_files: Path,
+    previous: dict[str, str],
+    current: dict[str, str],
+) -> int:
+    """Bring ``site_dir``'s contents from ``previous`` to ``current`` in place.
+
+    Copies changed and added files from the staged ``lite-dir/files`` tree,
+    deletes removed ones (pruning directories they leave empty), and rewrites
+    the ``api/contents`` listing of every directory on the way to a touched
+    file. Returns the number of files added, changed or removed.
+    """
+    files_root = site_dir / "files"
+    removed = sorted(set(previous) - set(current))
+    upserted = sorted(rel for rel, digest in current.items() if previous.get(rel) != digest)
+    if not removed and not upserted:
+        return 0
+
+    templates = _listing_templates(site_dir)
+    for rel in removed:
+        (files_root / rel).unlink(missing_ok=True)
+    for rel in upserted:
+        target = files_root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(staged_files / rel, target)
+
+    touched_dirs: set[str] = set()
+    for rel in (*removed, *upserted):
+        parts = rel.split("/")[:-1]
+        touched_dirs.add("")
+        for depth in range(1, len(parts) + 1):
+            touched_dirs.add("/".join(parts[:depth]))
+    # Deepest first: prune emptied directories before their parents are listed.
+    ordered = sorted(touched_dirs, key=lambda d: (-d.count("/") - bool(d), d))
+    for dir_rel in ordered:
+        directory = files_root / dir_rel
+        if dir_rel and directory.is_dir() and not any(directory.iterdir()):
+            directory.rmdir()
+    # A directory whose listing changed also changes its entry in the parent
+    # listing, so every touched directory counts as updated there.
+    updated = set(upserted) | {d for d in touched_dirs if d}
+    for dir_rel in ordered:
+        _refresh_listing(site_dir, dir_rel, updated, templates)
+    return len(removed) + len(upserted)
+
+
 def build_site(args: BuildArgs) -> BuildResult:
-    """Assemble a ``lite-dir``, run the build, and write a cache manifest.
+    """Assemble a ``lite-dir``, build (or update) the site, and write a cache manifest.
 
     The lite-dir lives in a temporary directory; only the final site
     tree under ``args.output_dir / '_output/'`` is persisted.
+
+    With ``args.incremental`` (the default) and an existing site whose
+    non-content inputs — kernel, wheels, environment, app archive, configs,
+    branding, ``jupyterlite-core`` version (see
+    :func:`~clm.workers.jupyterlite.lite_dir.hash_site_manifest`) — are
+    unchanged, ``jupyter lite build`` is skipped: only the changed, added or
+    removed contents files and their ``api/contents`` listings are updated in
+    place. Anything else gets a clean full build.
     """
     site_dir = args.output_dir / "_output"
-    if site_dir.exists():
-        shutil.rmtree(site_dir)
-    site_dir.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path = args.output_dir / "jupyterlite-manifest.json"
+    previous = _read_previous_manifest(manifest_path) if args.incremental else None
 
+    mode = "full"
+    contents_changed = 0
     with tempfile.TemporaryDirectory(prefix="clm-jupyterlite-") as tmp:
         lite_dir = Path(tmp) / "lite-dir"
         manifest = assemble_lite_dir(
@@ -341,7 +534,26 @@ def build_site(args: BuildArgs) -> BuildResult:
             branding_logo=args.branding_logo,
             branding_site_name=args.branding_site_name,
         )
-        _run_jupyter_lite_build(lite_dir, site_dir, kernel=args.kernel)
+        contents = staged_contents(lite_dir)
+        site_key = hash_site_manifest(
+            manifest, jupyterlite_core_version=args.jupyterlite_core_version
+        )
+        if _can_update_in_place(previous, site_key, site_dir):
+            assert previous is not None
+            mode = "incremental"
+            contents_changed = update_site_contents(
+                site_dir, lite_dir / "files", previous["contents"], contents
+            )
+            logger.info(
+                "Updated JupyterLite site in place (%d contents file(s) changed)",
+                contents_changed,
+            )
+        else:
+            if site_dir.exists():
+                shutil.rmtree(site_dir)
+            site_dir.parent.mkdir(parents=True, exist_ok=True)
+            _run_jupyter_lite_build(lite_dir, site_dir, kernel=args.kernel)
+            contents_changed = len(contents)
 
     _normalize_contents_paths(site_dir)
 
@@ -355,7 +567,6 @@ def build_site(args: BuildArgs) -> BuildResult:
         _emit_readme(args.output_dir, launcher="miniserve")
 
     cache_key = hash_manifest(manifest, jupyterlite_core_version=args.jupyterlite_core_version)
-    manifest_path = args.output_dir / "jupyterlite-manifest.json"
     manifest_path.write_text(
         json.dumps(
             {
@@ -363,6 +574,8 @@ def build_site(args: BuildArgs) -> BuildResult:
                 "kernel": args.kernel,
                 "app_archive": args.app_archive,
                 "cache_key": cache_key,
+                "site_key": site_key,
+                "contents": contents,
                 "jupyterlite_core_version": args.jupyterlite_core_version,
                 "manifest": manifest,
             },
@@ -377,6 +590,8 @@ def build_site(args: BuildArgs) -> BuildResult:
         manifest_path=manifest_path,
         cache_key=cache_key,
         files_count=manifest["files_count"],
+        mode=mode,
+        contents_changed=contents_changed,
     )
 
 
@@ -388,6 +603,8 @@ def build_result_to_summary(result: BuildResult) -> str:
             "manifest_path": str(result.manifest_path),
             "cache_key": result.cache_key,
             "files_count": result.files_count,
+            "mode": result.mode,
+            "contents_changed": result.contents_changed,
         },
         sort_keys=True,
     )
@@ -398,4 +615,5 @@ __all__ = [
     "BuildResult",
     "build_site",
     "build_result_to_summary",
+    "update_site_contents",
 ]
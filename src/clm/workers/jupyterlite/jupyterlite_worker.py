@@ -100,12 +100,14 @@ class JupyterLiteWorker(Worker):
             branding_theme=payload.get("branding_theme", ""),
             branding_logo=payload.get("branding_logo", ""),
             branding_site_name=payload.get("branding_site_name", ""),
+            incremental=payload.get("incremental", True),
         )
 
         result = build_site(args)
         logger.info(
             f"JupyterLite site ready at {result.site_dir} "
-            f"({result.files_count} files, cache_key={result.cache_key[:12]}…)"
+            f"({result.files_count} files, {result.mode} build, "
+            f"cache_key={result.cache_key[:12]}…)"
         )
 
         self.job_queue.add_to_cache(
@@ -360,3 +360,38 @@ def hash_manifest(manifest: dict, *, jupyterlite_core_version: str) -> str:
         sort_keys=True,
     ).encode("utf-8")
     return hashlib.sha256(blob).hexdigest()
+
+
+#: Manifest keys that describe only the notebook *contents* of a site.
+#: Every other key (kernel, wheels, environment, configs, branding) shapes
+#: the JupyterLite app itself.
+CONTENT_MANIFEST_KEYS = frozenset({"notebooks", "files_count"})
+
+
+def hash_site_manifest(manifest: dict, *, jupyterlite_core_version: str) -> str:
+    """Cache key of everything in a site *except* its notebook contents.
+
+    Two builds with the same site key differ only in ``files/`` and the
+    ``api/contents`` listings, so the second can update the first's site in
+    place instead of re-running ``jupyter lite build``. A change of kernel,
+    wheels, environment, branding, app archive or the ``jupyterlite-core``
+    version changes this key and forces a full build.
+    """
+    app_part = {k: v for k, v in manifest.items() if k not in CONTENT_MANIFEST_KEYS}
+    return hash_manifest(app_part, jupyterlite_core_version=jupyterlite_core_version)
+
+
+def staged_contents(lite_dir: Path) -> dict[str, str]:
+    """``{relative POSIX path: sha256}`` of every file staged under ``files/``.
+
+    Hashes the staged bytes — after the kernelspec patch — since that is what
+    ``jupyter lite build`` copies into the site.
+    """
+    files_dir = lite_dir / "files"
+    if not files_dir.is_dir():
+        return {}
+    return {
+        path.relative_to(files_dir).as_posix(): sha256_of_file(path)
+        for path in sorted(files_dir.rglob("*"))
+        if path.is_file()
+    }
@@ -3,14 +3,15 @@ import copy
 import logging
 import os
 import re
+import threading
 import time
 import warnings
 from base64 import b64decode
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
 from hashlib import sha3_224
 from pathlib import Path, PurePosixPath
-from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, cast
 
 import jupytext.config as jupytext_config  # type: ignore[import-untyped]
@@ -27,10 +28,13 @@ from jinja2 import (
 from jupyter_client.manager import AsyncKernelManager
 from jupytext import jupytext
 from nbconvert import HTMLExporter
+from nbconvert.filters.highlight import Highlight2HTML
 from nbconvert.preprocessors import ExecutePreprocessor
 from nbformat import NotebookNode
 from nbformat.validator import normalize
 
+from clm.core import build_trace
+from clm.core.build_trace import tracer
 from clm.core.messaging.notebook_classes import NotebookPayload
 from clm.core.workshop_scope import is_in_workshop
 from clm.infrastructure.database.worker_heartbeats import WorkerHeartbeatStore
@@ -42,6 +46,12 @@ from .output_spec import (
     PartialOutput,
     find_workshop_ranges,
 )
+from .sandbox import (
+    decode_other_files,
+    get_sandbox_materializer,
+    sandbox_fsync_enabled,
+    write_files,
+)
 
 if TYPE_CHECKING:
     from typing import Protocol
@@ -713,6 +723,9 @@ class TrackingExecutePreprocessor(ExecutePreprocessor):
         # stable "N/total" denominator without us threading it through the
         # public API.
         self._total_cells: int | None = None
+        # Build-trace start of ``preprocess``; the first cell closes the
+        # ``kernel start`` span with it (nbclient starts the kernel in between).
+        self._kernel_start_us: int | None = None
 
     def preprocess(
         self, nb: NotebookNode, resources: dict | None = None, km=None
@@ -727,6 +740,7 @@ class TrackingExecutePreprocessor(ExecutePreprocessor):
             self._total_cells = len(nb.get("cells", []))
         except Exception:
             self._total_cells = None
+        self._kernel_start_us = build_trace.now_us() if tracer.enabled else None
         return cast(
             "tuple[NotebookNode, dict]",
             super().preprocess(nb, resources=resources, km=km),
@@ -779,6 +793,13 @@ class TrackingExecutePreprocessor(ExecutePreprocessor):
         cid = getattr(self.processor, "_current_cid", None) or "?"
         total = self._total_cells if self._total_cells is not None else "?"
         cell_started = time.monotonic()
+        if tracer.enabled:
+            cell_started_us = build_trace.now_us()
+            if self._kernel_start_us is not None:
+                tracer.add_span(
+                    build_trace.KERNEL_START, "worker", self._kernel_start_us, cell_started_us
+                )
+                self._kernel_start_us = None
         logger.debug(
             "%s: cell %s/%s begin (%s)",
             cid,
@@ -791,6 +812,14 @@ class TrackingExecutePreprocessor(ExecutePreprocessor):
             result = super().preprocess_cell(cell, resources, cell_index)
         finally:
             elapsed = time.monotonic() - cell_started
+            if tracer.enabled:
+                tracer.add_span(
+                    build_trace.CELL_EXECUTION,
+                    "worker",
+                    cell_started_us,
+                    build_trace.now_us(),
+                    cell=cell_index,
+                )
             logger.debug(
                 "%s: cell %s/%s done in %.2fs",
                 cid,
@@ -864,6 +893,66 @@ class DontWarnForMissingAltTags(logging.Filter):
         return "Alternative text is missing" not in record.getMessage()
 
 
+_HIGHLIGHT_CACHE_MAX_ENTRIES = 4096
+_highlight_cache: "OrderedDict[tuple[str, str | None, str], str]" = OrderedDict()
+_highlight_cache_lock = threading.Lock()
+
+
+class _CachedHighlight2HTML(Highlight2HTML):
+    """``highlight_code`` filter that memoizes Pygments output per worker.
+
+    The Completed, Trainer, Partial and Recording HTML of one notebook
+    highlight mostly the same cell sources, and shared code cells recur
+    across notebooks. The rendered markup depends only on the resolved
+    lexer, the cell's ``magics_language`` and the source text, so those
+    form the key. The LRU is process-wide and shared across jobs.
+    """
+
+    def __call__(self, source, language=None, metadata=None):
+        language = language or self.pygments_lexer
+        magics_language = metadata.get("magics_language") if metadata else None
+        key = (language, magics_language, source)
+        with _highlight_cache_lock:
+            cached = _highlight_cache.get(key)
+            if cached is not None:
+                _highlight_cache.move_to_end(key)
+                return cached
+        html = super().__call__(source, language, metadata)
+        with _highlight_cache_lock:
+            _highlight_cache[key] = html
+            if len(_highlight_cache) > _HIGHLIGHT_CACHE_MAX_ENTRIES:
+                _highlight_cache.popitem(last=False)
+        return html
+
+
+_exporter_pool = threading.local()
+
+
+def _export_html(nb: NotebookNode) -> str:
+    """Render *nb* with this thread's reusable classic ``HTMLExporter``.
+
+    Building an exporter loads and compiles the Jinja template stack, which
+    dominated short HTML jobs. The exporter is kept per thread (it is not
+    safe to share mid-render) and rebuilt only if ``HTMLExporter`` has been
+    swapped, e.g. patched in tests. The lexer default is reset per notebook
+    exactly as nbconvert does when it builds its own highlighter.
+    """
+    pooled = getattr(_exporter_pool, "entry", None)
+    if pooled is None or pooled[0] is not HTMLExporter:
+        highlighter = _CachedHighlight2HTML()
+        exporter = HTMLExporter(template_name="classic", filters={"highlight_code": highlighter})
+        pooled = (HTMLExporter, exporter, highlighter)
+        _exporter_pool.entry = pooled
+    _, exporter, highlighter = pooled
+    langinfo = nb.metadata.get("language_info", {})
+    highlighter.pygments_lexer = (
+        langinfo.get("pygments_lexer", langinfo.get("name", None)) or "ipython3"
+    )
+    with tracer.span(build_trace.HTML_EXPORT, "worker"):
+        (body, _resources) = exporter.from_notebook_node(nb)
+    return body
+
+
 class NotebookProcessor:
     def __init__(
         self,
@@ -938,7 +1027,9 @@ class NotebookProcessor:
                 read directly from this directory instead of from other_files.
 
         Returns:
-            The processed notebook as a string (HTML, notebook, or code)
+            The processed notebook as a string (HTML, notebook, or code), or
+            an empty string for an execute-only payload, whose only product
+            is the executed-notebook cache entry.
         """
         cid = payload.correlation_id
         logger.info(
@@ -976,6 +1067,12 @@ class NotebookProcessor:
             payload.data, payload.input_file_name, cid, payload, source_dir
         )
         processed_nb = await self.process_notebook_for_spec(expanded_nb, payload)
+        if payload.execute_only:
+            # Cache warmup for Completed/Trainer/Partial HTML: execute and
+            # store the notebook, but skip the HTML export nobody reads.
+            await self._execute_and_cache(processed_nb, payload, source_dir=source_dir)
+            logger.debug(f"{cid}:Executed notebook for the execution cache only.")
+            return ""
         result = await self.create_contents(processed_nb, payload, source_dir=source_dir)
         if result:
             logger.debug(f"{cid}:Processed notebook. Result: {result[:100]}...")
@@ -1026,8 +1123,7 @@ class NotebookProcessor:
         traitlets_logger = traitlets.log.get_logger()
         if hasattr(traitlets_logger, "addFilter"):
             traitlets_logger.addFilter(DontWarnForMissingAltTags())
-        html_exporter = HTMLExporter(template_name="classic")
-        (body, _resources) = html_exporter.from_notebook_node(filtered_nb)
+        body = _export_html(filtered_nb)
 
         logger.debug(f"{cid}:Successfully reused cached execution for '{payload.input_file_name}'")
         return body
@@ -1991,10 +2087,30 @@ class NotebookProcessor:
     async def _create_using_nbconvert(
         self, processed_nb, payload: NotebookPayload, source_dir: Path | None = None
     ) -> str:
-        cid = payload.correlation_id
         traitlets_logger = traitlets.log.get_logger()
         if hasattr(traitlets_logger, "addFilter"):
             traitlets_logger.addFilter(DontWarnForMissingAltTags())
+        await self._execute_and_cache(processed_nb, payload, source_dir=source_dir)
+        # The caching spec kept slide_id/for_slide through the cache write
+        # (#732) — strip them at the export boundary. Idempotent for every
+        # other spec (already stripped during processing). It also kept the
+        # ``start`` cells its own delete set excludes (#734) — drop them
+        # here so Recording's HTML is unchanged.
+        if self.output_spec.should_cache_execution:
+            processed_nb.cells = _drop_start_cells(processed_nb.get("cells", []))
+        _strip_internal_cell_metadata(processed_nb.get("cells", []))
+        return _export_html(processed_nb)
+
+    async def _execute_and_cache(
+        self, processed_nb, payload: NotebookPayload, source_dir: Path | None = None
+    ) -> None:
+        """Execute *processed_nb* in place and store it in the execution cache.
+
+        Shared by the HTML export and the execute-only path
+        (``payload.execute_only``); a no-op for specs that do not evaluate
+        for HTML.
+        """
+        cid = payload.correlation_id
         # ``payload.skip_evaluation`` is the per-topic ``evaluate="no"`` opt-out.
         # When set, we render HTML directly from the processed source (cells with
         # empty outputs) and never spawn a kernel or write to the executed-
@@ -2033,7 +2149,7 @@ class NotebookProcessor:
                         # The payload carries ``other_files`` in *both* modes
                         # (``ProcessNotebookOperation.compute_other_files`` is
                         # unconditional), so the source mount was only ever an
-                        # optimization. Writing them into a throwaway directory
+                        # optimization. Writing them into a scratch directory
                         # instead means Docker and Direct now behave
                         # identically — same cwd semantics, same siblings
                         # visible, writes land somewhere harmless — while
@@ -2041,15 +2157,21 @@ class NotebookProcessor:
                         # in play for the read-only uses (the Jinja loader and
                         # image resolution in ``create_contents``).
                         #
-                        # (HTTP-replay recordings are unaffected by the temp
-                        # dir's destruction — the replay proxy writes staging
-                        # cassettes on the host, never the kernel.)
-                        with TemporaryDirectory() as temp_dir:
-                            path = Path(temp_dir)
-                            await self.write_other_files(cid, path, payload)
+                        # The directory comes from the worker's sandbox
+                        # materializer (``sandbox.py``): siblings are
+                        # hardlinked from a content-addressed store, and the
+                        # topic's sandbox is reset and reused by its next
+                        # job, so a reused sandbox looks exactly like a fresh
+                        # one. (HTTP-replay recordings are unaffected — the
+                        # replay proxy writes staging cassettes on the host,
+                        # never the kernel.)
+                        path = await self._checkout_sandbox(cid, payload)
+                        try:
                             await self._execute_notebook_with_path(
                                 cid, path, processed_nb, payload, loop, source_dir
                             )
+                        finally:
+                            get_sandbox_materializer().release(path)
                 except Exception as e:
                     file_name = payload.input_file_name
                     logger.error(
@@ -2077,17 +2199,6 @@ class NotebookProcessor:
                 # The "executed" notebook is just the processed notebook in this case
                 if self.output_spec.should_cache_execution and self.cache is not None:
                     self._cache_executed_notebook(processed_nb, payload)
-        # The caching spec kept slide_id/for_slide through the cache write
-        # (#732) — strip them at the export boundary. Idempotent for every
-        # other spec (already stripped during processing). It also kept the
-        # ``start`` cells its own delete set excludes (#734) — drop them
-        # here so Recording's HTML is unchanged.
-        if self.output_spec.should_cache_execution:
-            processed_nb.cells = _drop_start_cells(processed_nb.get("cells", []))
-        _strip_internal_cell_metadata(processed_nb.get("cells", []))
-        html_exporter = HTMLExporter(template_name="classic")
-        (body, _resources) = html_exporter.from_notebook_node(processed_nb)
-        return body
 
     def _cache_executed_notebook(self, executed_nb: NotebookNode, payload: NotebookPayload) -> None:
         """Cache the executed notebook for reuse by Completed HTML.
@@ -2104,13 +2215,14 @@ class NotebookProcessor:
         )
 
         assert self.cache is not None  # Checked by caller
-        self.cache.store(
-            input_file=payload.input_file,
-            content_hash=cache_hash,
-            language=payload.language,
-            prog_lang=payload.prog_lang,
-            executed_notebook=executed_nb,
-        )
+        with tracer.span(build_trace.CACHE_STORE, "worker", cache="executed"):
+            self.cache.store(
+                input_file=payload.input_file,
+                content_hash=cache_hash,
+                language=payload.language,
+                prog_lang=payload.prog_lang,
+                executed_notebook=executed_nb,
+            )
 
         logger.debug(f"{cid}:Successfully cached executed notebook")
 
@@ -2339,19 +2451,26 @@ class NotebookProcessor:
 
     @staticmethod
     def write_other_files_sync(cid: str, path: Path, payload: NotebookPayload):
-        for extra_file, encoded_contents in payload.other_files.items():
-            contents = b64decode(encoded_contents)
-            logger.debug(f"{cid}:Writing extra file {extra_file}")
-            file_path = path / extra_file
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_bytes(contents)
-        # ``os.sync()`` is global and not namespaced — it flushes the whole
-        # filesystem, not just these files. It runs on the Docker path too
-        # now (S10, #798, where the kernel moved into a temp dir), i.e. on
-        # every worker of a large pool, so skip it when there was nothing
-        # to write.
-        if payload.other_files and hasattr(os, "sync"):
-            os.sync()
+        logger.debug(f"{cid}:Writing extra files {sorted(payload.other_files)}")
+        # No ``os.sync()``: it flushed the whole host filesystem on every
+        # worker of the pool at once, while the kernel reads these files
+        # back through the same page cache. ``CLM_SANDBOX_FSYNC`` opts into
+        # an ``fsync`` of just the written files and their directories.
+        write_files(path, decode_other_files(payload.other_files), durable=sandbox_fsync_enabled())
+
+    async def _checkout_sandbox(self, cid: str, payload: NotebookPayload) -> Path:
+        """Check out this topic's execution sandbox holding ``other_files``.
+
+        Sandboxes are keyed by the topic directory (falling back to the
+        notebook's own directory), so the decks, languages and kinds of one
+        topic reuse a single directory. The caller must release it.
+        """
+        topic_key = payload.source_topic_dir or str(Path(payload.input_file).parent)
+        files = decode_other_files(payload.other_files)
+        logger.debug(f"{cid}:Materializing {len(files)} extra file(s) for '{topic_key}'")
+        loop = asyncio.get_running_loop()
+        materializer = get_sandbox_materializer()
+        return await loop.run_in_executor(None, materializer.checkout, topic_key, files)
 
     def _create_cpp_code_export(self, processed_nb) -> str:
         """Emit a compilable C++ translation unit for ``format="code"``.
@@ -14,6 +14,8 @@ import logging
 import os
 from pathlib import Path
 
+from clm.core import build_trace
+from clm.core.build_trace import tracer
 from clm.core.messaging.notebook_classes import NotebookPayload
 from clm.infrastructure.api.api_executed_notebook_cache import ApiExecutedNotebookCache
 from clm.infrastructure.api.client import WorkerApiClient
@@ -253,6 +255,15 @@ class NotebookWorker(Worker):
                 logger.debug(f"Notebook processing generated {len(warnings)} warning(s)")
                 self.set_job_warnings(warnings)
 
+            if payload.execute_only:
+                # The executed notebook is already in the execution cache and
+                # there is no HTML to write. The host stores the job's stub
+                # result-cache entry, which is what incremental rebuilds use
+                # to skip it; the job cache needs an output on disk, so it is
+                # left alone.
+                logger.info(f"Notebook {input_path.name} executed for the execution cache")
+                return
+
             # Write output file
             # In Docker mode, convert host path to container path
             host_workspace = os.environ.get("CLM_HOST_WORKSPACE")
@@ -272,28 +283,47 @@ class NotebookWorker(Worker):
             # LF. That platform split produces spurious CRLF in built output
             # (noisy diffs, "CRLF will be replaced by LF" warnings). Pinning
             # LF keeps output byte-identical across platforms.
-            with open(output_path, "w", encoding="utf-8", newline="\n") as f:
+            with (
+                tracer.span(build_trace.OUTPUT_WRITE, "worker"),
+                open(output_path, "w", encoding="utf-8", newline="\n") as f,
+            ):
                 f.write(result)
 
             logger.info(f"Notebook written to {output_path}")
 
             # Add to cache (works for both SQLite and API modes)
-            self.job_queue.add_to_cache(
-                job.output_file,
-                job.content_hash,
-                {
-                    "format": payload.format,
-                    "kind": payload.kind,
-                    "prog_lang": payload.prog_lang,
-                    "language": payload.language,
-                },
-            )
+            with tracer.span(build_trace.CACHE_STORE, "worker", cache="results"):
+                self.job_queue.add_to_cache(
+                    job.output_file,
+                    job.content_hash,
+                    {
+                        "format": payload.format,
+                        "kind": payload.kind,
+                        "prog_lang": payload.prog_lang,
+                        "language": payload.language,
+                    },
+                )
             logger.debug(f"Added result to cache for {job.output_file}")
 
         except Exception as e:
             logger.error(f"Error processing notebook job {job.id}: {e}", exc_info=True)
             raise
 
+    def prewarm(self) -> None:
+        """Start and shut down one Python kernel.
+
+        The first kernel a process launches pays for kernelspec discovery and
+        ipykernel's cold imports; a daemon's worker pays it here instead of
+        on the first notebook of the next build.
+        """
+        from jupyter_client.manager import start_new_kernel
+
+        kernel_manager, kernel_client = start_new_kernel(kernel_name="python3", startup_timeout=60)
+        try:
+            kernel_client.stop_channels()
+        finally:
+            kernel_manager.shutdown_kernel(now=True)
+
     def cleanup(self):
         """Clean up resources including the executed notebook cache."""
         # Close the SQLite cache if it was initialized (API cache has no
@@ -0,0 +1,320 @@
+"""Execution sandboxes for notebook kernels.
+
+Every evaluated notebook runs in a scratch directory that holds the topic's
+supporting files (``payload.other_files``), so cells can read their
+siblings and write wherever they like without touching the sources. This
+module builds those directories without per-job churn:
+
+* Each worker process keeps a content-addressed blob store. A supporting
+  file is decoded and written once; sandboxes hardlink it in (or copy it
+  when the filesystem refuses links).
+* Sandboxes are kept per topic and reused. Before each job the directory is
+  reset to exactly the wanted files: anything the previous kernel created,
+  deleted or modified is removed or restored. A reused sandbox is therefore
+  indistinguishable from a fresh one.
+* Nothing calls ``os.sync()``. A sandbox is scratch space read back through
+  the same page cache, so no flush is needed for the kernel to see its
+  files. ``CLM_SANDBOX_FSYNC`` opts into a targeted ``fsync`` of just the
+  written files and their directories for setups that want it.
+
+Hardlinks share an inode with the blob, so a kernel that rewrites a
+supporting file in place also changes the blob. Every linked file's
+``(inode, size, mtime)`` is recorded when it is placed, and both blobs and
+sandbox entries whose stat no longer matches are replaced, never reused.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from base64 import b64decode
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SANDBOX_FSYNC_ENV_VAR = "CLM_SANDBOX_FSYNC"
+
+# Topic sandboxes kept per worker. A worker runs one job at a time, and the
+# jobs of one topic (its decks, languages and kinds) tend to be scheduled
+# close together, so a handful is enough to catch most reuse.
+DEFAULT_MAX_SANDBOXES = 8
+
+
+def sandbox_fsync_enabled() -> bool:
+    """Whether ``CLM_SANDBOX_FSYNC`` asks for durable sandbox writes."""
+    return os.environ.get(SANDBOX_FSYNC_ENV_VAR, "").strip().lower() in ("1", "true", "yes")
+
+
+def decode_other_files(other_files: Mapping[str, bytes | str]) -> dict[str, bytes]:
+    """Decode a payload's base64 ``other_files`` into raw bytes."""
+    return {name: b64decode(encoded) for name, encoded in other_files.items()}
+
+
+def _stat_key(path: Path) -> tuple[int, int, int]:
+    st = os.lstat(path)
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _fsync_path(path: Path) -> None:
+    """``fsync`` one file or directory; directories are skipped where unsupported."""
+    flags = os.O_RDONLY
+    if path.is_dir():
+        if os.name == "nt":
+            return
+        flags |= getattr(os, "O_DIRECTORY", 0)
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_files(path: Path, files: Mapping[str, bytes], *, durable: bool = False) -> None:
+    """Write *files* below *path*, creating parent directories as needed.
+
+    With *durable*, each file and each directory that received an entry is
+    ``fsync``-ed individually — never the whole filesystem.
+    """
+    touched_dirs: set[Path] = set()
+    for name, contents in files.items():
+        file_path = path / name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(contents)
+        if durable:
+            _fsync_path(file_path)
+            touched_dirs.add(file_path.parent)
+    for directory in touched_dirs:
+        _fsync_path(directory)
+
+
+@dataclass
+class _Entry:
+    digest: str
+    stat: tuple[int, int, int]
+    linked: bool
+
+
+@dataclass
+class _Sandbox:
+    path: Path
+    manifest: dict[str, _Entry] = field(default_factory=dict)
+    leased: bool = False
+
+
+class SandboxMaterializer:
+    """Builds and recycles kernel working directories below *root*.
+
+    ``checkout`` returns a directory holding exactly the given files;
+    ``release`` hands it back for reuse by the next job of the same topic.
+    A topic whose sandbox is still leased (concurrent use) gets a throwaway
+    directory instead, removed on release.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_sandboxes: int = DEFAULT_MAX_SANDBOXES,
+        durable: bool = False,
+    ):
+        self.root = root
+        self.max_sandboxes = max_sandboxes
+        self.durable = durable
+        self._blob_dir = root / "blobs"
+        self._sandbox_dir = root / "sandboxes"
+        self._blobs: dict[str, tuple[int, int, int]] = {}
+        self._sandboxes: OrderedDict[str, _Sandbox] = OrderedDict()
+        self._transient: dict[Path, _Sandbox] = {}
+        self._lock = threading.Lock()
+
+    def checkout(self, topic_key: str, files: Mapping[str, bytes]) -> Path:
+        """Return a sandbox for *topic_key* containing exactly *files*."""
+        wanted = {name: (sha256(data).hexdigest(), data) for name, data in files.items()}
+        with self._lock:
+            sandbox = self._sandboxes.get(topic_key)
+            if sandbox is not None and sandbox.leased:
+                self._sandbox_dir.mkdir(parents=True, exist_ok=True)
+                sandbox = _Sandbox(Path(tempfile.mkdtemp(dir=self._sandbox_dir)))
+                self._transient[sandbox.path] = sandbox
+            elif sandbox is None:
+                sandbox = _Sandbox(self._sandbox_dir / sha256(topic_key.encode()).hexdigest()[:16])
+                self._sandboxes[topic_key] = sandbox
+                self._evict_locked()
+            else:
+                self._sandboxes.move_to_end(topic_key)
+            sandbox.leased = True
+            try:
+                try:
+                    self._reset_locked(sandbox, wanted)
+                except OSError as exc:
+                    # Whatever the previous kernel left behind resisted the
+                    # incremental reset (e.g. a read-only file on Windows);
+                    # rebuild the sandbox from scratch.
+                    logger.debug(f"Rebuilding sandbox {sandbox.path}: {exc}")
+                    shutil.rmtree(sandbox.path, ignore_errors=True)
+                    sandbox.manifest = {}
+                    self._reset_locked(sandbox, wanted)
+            except BaseException:
+                sandbox.leased = False
+                raise
+            return sandbox.path
+
+    def release(self, path: Path) -> None:
+        """Return a checked-out sandbox; throwaway sandboxes are deleted."""
+        with self._lock:
+            transient = self._transient.pop(path, None)
+            if transient is not None:
+                shutil.rmtree(path, ignore_errors=True)
+                return
+            for sandbox in self._sandboxes.values():
+                if sandbox.path == path:
+                    sandbox.leased = False
+                    break
+            self._evict_locked()
+
+    def close(self) -> None:
+        """Delete every sandbox and blob below ``root``."""
+        with self._lock:
+            self._sandboxes.clear()
+            self._transient.clear()
+            self._blobs.clear()
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def _evict_locked(self) -> None:
+        evicted = False
+        for key in list(self._sandboxes):
+            if len(self._sandboxes) <= self.max_sandboxes:
+                break
+            sandbox = self._sandboxes[key]
+            if sandbox.leased:
+                continue
+            del self._sandboxes[key]
+            shutil.rmtree(sandbox.path, ignore_errors=True)
+            evicted = True
+        if evicted:
+            self._prune_blobs_locked()
+
+    def _prune_blobs_locked(self) -> None:
+        live = {
+            entry.digest
+            for sandbox in (*self._sandboxes.values(), *self._transient.values())
+            for entry in sandbox.manifest.values()
+        }
+        for digest in [d for d in self._blobs if d not in live]:
+            del self._blobs[digest]
+            (self._blob_dir / digest).unlink(missing_ok=True)
+
+    def _entry_intact(self, path: Path, entry: _Entry) -> bool:
+        try:
+            return _stat_key(path) == entry.stat
+        except OSError:
+            return False
+
+    def _reset_locked(self, sandbox: _Sandbox, wanted: dict[str, tuple[str, bytes]]) -> None:
+        root = sandbox.path
+        root.mkdir(parents=True, exist_ok=True)
+        kept: dict[str, _Entry] = {}
+        for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+            current = Path(dirpath)
+            for name in filenames:
+                file_path = current / name
+                rel = file_path.relative_to(root).as_posix()
+                entry = sandbox.manifest.get(rel)
+                want = wanted.get(rel)
+                if (
+                    entry is not None
+                    and want is not None
+                    and entry.digest == want[0]
+                    and self._entry_intact(file_path, entry)
+                ):
+                    kept[rel] = entry
+                else:
+                    file_path.unlink()
+            for name in dirnames:
+                dir_path = current / name
+                if dir_path.is_symlink():
+                    dir_path.unlink()
+                    continue
+                try:
+                    dir_path.rmdir()  # only succeeds once nothing is left to keep
+                except OSError:
+                    pass
+        sandbox.manifest = kept
+
+        linked_digests = {entry.digest for entry in kept.values() if entry.linked}
+        touched_dirs: set[Path] = set()
+        for rel, (digest, data) in wanted.items():
+            if rel in kept:
+                continue
+            target = root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            linked = False
+            # One inode per digest per sandbox: a second copy of the same
+            # bytes under another name must not change when the first does.
+            if digest not in linked_digests:
+                blob = self._blob_locked(digest, data)
+                try:
+                    os.link(blob, target)
+                    linked = True
+                    linked_digests.add(digest)
+                except OSError:
+                    pass
+            if not linked:
+                target.write_bytes(data)
+                if self.durable:
+                    _fsync_path(target)
+            sandbox.manifest[rel] = _Entry(digest, _stat_key(target), linked)
+            touched_dirs.add(target.parent)
+        if self.durable:
+            for directory in touched_dirs:
+                _fsync_path(directory)
+
+    def _blob_locked(self, digest: str, data: bytes) -> Path:
+        blob = self._blob_dir / digest
+        recorded = self._blobs.get(digest)
+        if recorded is not None:
+            try:
+                if _stat_key(blob) == recorded:
+                    return blob
+            except OSError:
+                pass
+            logger.debug(f"Sandbox blob {digest[:12]} changed on disk; rewriting it")
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        # Write-and-rename gives the blob a new inode, detaching it from any
+        # sandbox entry that modified the old one in place.
+        tmp = self._blob_dir / f".{digest}.tmp"
+        tmp.write_bytes(data)
+        if self.durable:
+            _fsync_path(tmp)
+        os.replace(tmp, blob)
+        if self.durable:
+            _fsync_path(self._blob_dir)
+        self._blobs[digest] = _stat_key(blob)
+        return blob
+
+
+_materializer: SandboxMaterializer | None = None
+_materializer_lock = threading.Lock()
+
+
+def get_sandbox_materializer() -> SandboxMaterializer:
+    """Return this process's sandbox materializer, creating it on first use.
+
+    The store lives in a per-process directory under the system temp dir and
+    is removed at interpreter exit.
+    """
+    global _materializer
+    with _materializer_lock:
+        if _materializer is None:
+            root = Path(tempfile.mkdtemp(prefix=f"clm-sandboxes-{os.getpid()}-"))
+            _materializer = SandboxMaterializer(root, durable=sandbox_fsync_enabled())
+            atexit.register(_materializer.close)
+        return _materializer
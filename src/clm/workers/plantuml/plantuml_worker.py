@@ -56,6 +56,18 @@ class PlantUmlWorker(Worker):
         mode = "API" if api_url else "SQLite"
         logger.info(f"PlantUmlWorker {worker_id} initialized in {mode} mode")
 
+    def prewarm(self) -> None:
+        """Render one tiny diagram so the JVM and the PlantUML JAR are paged in."""
+        from tempfile import TemporaryDirectory
+
+        from clm.workers.plantuml.plantuml_converter import convert_plantuml
+
+        with TemporaryDirectory() as tmp_dir:
+            tmp_input = Path(tmp_dir) / "prewarm.pu"
+            tmp_input.write_text("@startuml prewarm\nA -> B\n@enduml\n", encoding="utf-8")
+            loop = self._get_or_create_loop()
+            loop.run_until_complete(convert_plantuml(tmp_input, "prewarm", output_format="png"))
+
     def process_job(self, job: Job):
         """Process a PlantUML conversion job.
 
@@ -0,0 +1,150 @@
+"""Unit tests for ``clm.bench`` and ``clm bench``.
+
+The build scenarios spawn real ``clm build`` subprocesses and are exercised
+by running the command by hand; these tests cover the generator, the
+baseline comparison and the in-process scenarios so they run in seconds.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from clm.bench import (
+    BaselineError,
+    SyntheticCourseConfig,
+    compare_reports,
+    generate_course,
+    load_baseline,
+)
+from clm.bench.synthetic import EDIT_MARKER
+from clm.cli.main import cli
+from clm.core.course_spec import CourseSpec
+from clm.core.topic_resolver import build_topic_map
+
+
+def _report(**seconds: float | None) -> dict:
+    return {
+        "schema_version": 1,
+        "course": {"decks": 4},
+        "scenarios": {
+            name: {"seconds": value, "ok": value is not None} for name, value in seconds.items()
+        },
+    }
+
+
+class TestSyntheticCourse:
+    def test_spec_references_every_generated_topic(self, tmp_path: Path):
+        config = SyntheticCourseConfig(decks=5, decks_per_module=2, diagrams=2, data_files=2)
+        course = generate_course(tmp_path, config)
+
+        spec = CourseSpec.from_file(course.spec_file)
+        assert len(spec.sections) == 3
+        topic_ids = {t.id for section in spec.sections for t in section.topics}
+        assert topic_ids == set(build_topic_map(course.slides_dir))
+        assert len(course.deck_files) == 5
+
+        topic_dir = course.deck_files[0].parent
+        assert len(list((topic_dir / "pu").glob("*.pu"))) == 1
+        assert len(list((topic_dir / "drawio").glob("*.drawio"))) == 1
+        assert len(list((topic_dir / "data").iterdir())) == 2
+
+    def test_generation_is_deterministic(self, tmp_path: Path):
+        config = SyntheticCourseConfig(decks=3)
+        a = generate_course(tmp_path / "a", config)
+        b = generate_course(tmp_path / "b", config)
+        assert a.deck_files[1].read_bytes() == b.deck_files[1].read_bytes()
+        assert a.spec_file.read_bytes() == b.spec_file.read_bytes()
+
+    def test_edit_appends_a_unique_marker(self, tmp_path: Path):
+        course = generate_course(tmp_path, SyntheticCourseConfig(decks=2))
+        deck = course.edit_deck(1, 7)
+        assert f"{EDIT_MARKER} 7" in deck.read_text(encoding="utf-8")
+
+    def test_rejects_unknown_language(self):
+        with pytest.raises(ValueError, match="unsupported language"):
+            SyntheticCourseConfig(languages=("fr",))
+
+
+class TestCompareReports:
+    def test_slowdown_beyond_threshold_regresses(self):
+        [cmp] = compare_reports(_report(cold_build=13.0), _report(cold_build=10.0))
+        assert cmp.regressed
+        assert cmp.ratio == pytest.approx(1.3)
+
+    def test_slowdown_within_threshold_passes(self):
+        [cmp] = compare_reports(_report(cold_build=11.0), _report(cold_build=10.0))
+        assert not cmp.regressed
+
+    def test_min_delta_absorbs_noise_on_fast_scenarios(self):
+        [cmp] = compare_reports(_report(slide_search=0.02), _report(slide_search=0.01))
+        assert not cmp.regressed
+
+    def test_newly_failing_scenario_regresses(self):
+        [cmp] = compare_reports(_report(noop_build=None), _report(noop_build=2.0))
+        assert cmp.regressed
+
+    def test_scenarios_missing_from_baseline_are_skipped(self):
+        assert compare_reports(_report(noop_build=2.0), _report(cold_build=1.0)) == []
+
+    def test_different_course_is_refused(self):
+        other = _report(cold_build=1.0)
+        other["course"] = {"decks": 400}
+        with pytest.raises(BaselineError, match="different synthetic course"):
+            compare_reports(_report(cold_build=1.0), other)
+
+    def test_load_baseline_rejects_other_schema(self, tmp_path: Path):
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps({"schema_version": 0}), encoding="utf-8")
+        with pytest.raises(BaselineError, match="schema version"):
+            load_baseline(path)
+
+
+class TestBenchCommand:
+    def _invoke(self, tmp_path: Path, *args: str):
+        return CliRunner().invoke(
+            cli,
+            [
+                "bench",
+                "--decks",
+                "3",
+                "--repeat",
+                "1",
+                "--workdir",
+                str(tmp_path / "work"),
+                "--scenario",
+                "slide_search",
+                "--scenario",
+                "monitor_refresh",
+                *args,
+            ],
+        )
+
+    def test_writes_json_report(self, tmp_path: Path):
+        out = tmp_path / "bench.json"
+        result = self._invoke(tmp_path, "--output", str(out))
+        assert result.exit_code == 0, result.output
+
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert set(data["scenarios"]) == {"slide_search", "monitor_refresh"}
+        assert all(s["ok"] for s in data["scenarios"].values())
+        assert data["course"]["decks"] == 3
+
+    def test_regression_against_baseline_exits_nonzero(self, tmp_path: Path):
+        out = tmp_path / "bench.json"
+        assert self._invoke(tmp_path, "--output", str(out)).exit_code == 0
+        baseline = json.loads(out.read_text(encoding="utf-8"))
+        for scenario in baseline["scenarios"].values():
+            scenario["seconds"] = 1e-9
+        base_file = tmp_path / "baseline.json"
+        base_file.write_text(json.dumps(baseline), encoding="utf-8")
+
+        result = self._invoke(
+            tmp_path, "--baseline", str(base_file), "--min-delta", "0", "--output", str(out)
+        )
+        assert result.exit_code == 1
+        comparison = json.loads(out.read_text(encoding="utf-8"))["comparison"]
+        assert all(c["regressed"] for c in comparison["scenarios"].values())
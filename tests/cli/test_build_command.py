@@ -1909,7 +1909,7 @@ class TestMaybeRunSweepSkipReasons:
         from clm.build.engine import _maybe_run_sweep
 
         calls = self._spy_sweep(monkeypatch)
-        config = _make_config(sweep=False, output_dir=tmp_path)
+        config = _make_config(sweep=False, output_dir=tmp_path, cache_db_path=tmp_path / "cache.db")
         _maybe_run_sweep(
             config=config,
             root_dirs=[tmp_path],
@@ -1924,7 +1924,9 @@ class TestMaybeRunSweepSkipReasons:
         from clm.build.engine import _maybe_run_sweep
 
         calls = self._spy_sweep(monkeypatch)
-        config = _make_config(sweep=True, clean=True, output_dir=tmp_path)
+        config = _make_config(
+            sweep=True, clean=True, output_dir=tmp_path, cache_db_path=tmp_path / "cache.db"
+        )
         _maybe_run_sweep(
             config=config,
             root_dirs=[tmp_path],
@@ -1939,7 +1941,7 @@ class TestMaybeRunSweepSkipReasons:
         from clm.build.engine import _maybe_run_sweep
 
         calls = self._spy_sweep(monkeypatch)
-        config = _make_config(sweep=True, output_dir=tmp_path)
+        config = _make_config(sweep=True, output_dir=tmp_path, cache_db_path=tmp_path / "cache.db")
         _maybe_run_sweep(
             config=config,
             root_dirs=[tmp_path],
@@ -1954,7 +1956,9 @@ class TestMaybeRunSweepSkipReasons:
         from clm.build.engine import _maybe_run_sweep
 
         calls = self._spy_sweep(monkeypatch)
-        config = _make_config(sweep=True, watch=True, output_dir=tmp_path)
+        config = _make_config(
+            sweep=True, watch=True, output_dir=tmp_path, cache_db_path=tmp_path / "cache.db"
+        )
         _maybe_run_sweep(
             config=config,
             root_dirs=[tmp_path],
@@ -1969,7 +1973,7 @@ class TestMaybeRunSweepSkipReasons:
         from clm.build.engine import _maybe_run_sweep
 
         calls = self._spy_sweep(monkeypatch)
-        config = _make_config(sweep=True, output_dir=tmp_path)
+        config = _make_config(sweep=True, output_dir=tmp_path, cache_db_path=tmp_path / "cache.db")
         _maybe_run_sweep(
             config=config,
             root_dirs=[tmp_path],
@@ -1985,7 +1989,7 @@ class TestMaybeRunSweepSkipReasons:
         from clm.build.engine import _maybe_run_sweep
 
         calls = self._spy_sweep(monkeypatch)
-        config = _make_config(sweep=True, output_dir=tmp_path)
+        config = _make_config(sweep=True, output_dir=tmp_path, cache_db_path=tmp_path / "cache.db")
         _maybe_run_sweep(
             config=config,
             root_dirs=[tmp_path],
@@ -2106,7 +2110,17 @@ class _FakeMitmManager:
     last_listen_host: str | None = None
     last_trace_dir: object = None
 
-    def __init__(self, *, cassette_path, mode, listen_host, confdir, ignore_hosts, trace_dir=None):
+    def __init__(
+        self,
+        *,
+        cassette_path,
+        mode,
+        listen_host,
+        confdir,
+        ignore_hosts,
+        trace_dir=None,
+        index_path=None,
+    ):
         _FakeMitmManager.last_listen_host = listen_host
         _FakeMitmManager.last_trace_dir = trace_dir
         self._confdir = Path(confdir)
@@ -1742,3 +1742,157 @@ class TestInitDryRunRecovery:
         assert "Error" not in captured.out
         assert "Error" not in captured.err  # the round-1 symptom used err=True
         assert not (out_dir / ".git").exists()  # nothing mutated
+
+
+class TestParallelRepoPipelines:
+    """``--jobs``: per-repo pipelines run concurrently, output stays sequential."""
+
+    @staticmethod
+    def _repos(tmp_path: Path, count: int) -> list[OutputRepo]:
+        repos = []
+        for i in range(count):
+            path = tmp_path / f"repo{i}"
+            path.mkdir()
+            repos.append(OutputRepo(path=path, target_name=f"t{i}", language="de"))
+        return repos
+
+    def test_output_is_grouped_in_repo_order(self, tmp_path: Path, capsys):
+        import threading
+        import time
+
+        from clm.cli.commands.git import _echo, _run_repo_pipelines
+
+        repos = self._repos(tmp_path, 6)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def pipeline(repo: OutputRepo) -> str:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            _echo(f"[{repo.target_name}] start")
+            # Later repos finish first; the replay must not follow completion order.
+            time.sleep(0.01 * (6 - int(repo.target_name[1:])))
+            _echo(f"[{repo.target_name}] done")
+            with lock:
+                running -= 1
+            return repo.target_name
+
+        results = _run_repo_pipelines(repos, pipeline, jobs=3)
+
+        assert results == [f"t{i}" for i in range(6)]
+        expected = "".join(f"[t{i}] start\n[t{i}] done\n" for i in range(6))
+        assert capsys.readouterr().out == expected
+        assert 1 < peak <= 3
+
+    def test_shared_working_tree_never_runs_concurrently(self, tmp_path: Path):
+        import threading
+        import time
+
+        from clm.cli.commands.git import _run_repo_pipelines
+
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        repos = [OutputRepo(path=shared, target_name=f"c{i}", language="de") for i in range(3)]
+        active: set[Path] = set()
+        lock = threading.Lock()
+        overlaps = []
+
+        def pipeline(repo: OutputRepo) -> None:
+            with lock:
+                if repo.path in active:
+                    overlaps.append(repo.target_name)
+                active.add(repo.path)
+            time.sleep(0.01)
+            with lock:
+                active.discard(repo.path)
+
+        _run_repo_pipelines(repos, pipeline, jobs=3)
+        assert overlaps == []
+
+    def test_error_surfaces_after_earlier_output(self, tmp_path: Path, capsys):
+        from clm.cli.commands.git import _echo, _run_repo_pipelines
+
+        repos = self._repos(tmp_path, 3)
+
+        def pipeline(repo: OutputRepo) -> None:
+            _echo(f"[{repo.target_name}]")
+            if repo.target_name == "t1":
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _run_repo_pipelines(repos, pipeline, jobs=3)
+        out = capsys.readouterr().out
+        assert out.startswith("[t0]\n[t1]\n")
+
+    def test_workers_see_dry_run_mode(self, tmp_path: Path):
+        from clm.cli.commands.git import _run_repo_pipelines
+
+        repos = self._repos(tmp_path, 4)
+        _dry_run_mode.set(True)
+        try:
+            seen = _run_repo_pipelines(repos, lambda _repo: _dry_run_mode.get(), jobs=4)
+        finally:
+            _dry_run_mode.set(False)
+        assert seen == [True] * 4
+
+    def test_parallel_git_runs_prompt_free(self, tmp_path: Path):
+        from clm.cli.commands.git import _run_repo_pipelines
+
+        repos = self._repos(tmp_path, 3)
+        envs = []
+
+        def fake_run(cmd, **kwargs):
+            envs.append(kwargs.get("env"))
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        with patch("clm.cli.commands.git.subprocess.run", side_effect=fake_run):
+            _run_repo_pipelines(repos, lambda repo: run_git(repo.path, "status"), jobs=3)
+            run_git(tmp_path, "status")
+
+        assert [env["GIT_TERMINAL_PROMPT"] for env in envs[:3]] == ["0"] * 3
+        assert envs[3] is None
+
+    def test_default_is_sequential_on_a_terminal_without_credential_helper(
+        self, tmp_path: Path, monkeypatch
+    ):
+        from clm.cli.commands import git as git_module
+
+        monkeypatch.setattr(git_module.sys.stdin, "isatty", lambda: True, raising=False)
+        monkeypatch.setattr(
+            git_module.subprocess,
+            "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, "", ""),
+        )
+        assert git_module._default_git_jobs() == 1
+
+        monkeypatch.setattr(
+            git_module.subprocess,
+            "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0, "manager\n", ""),
+        )
+        assert git_module._default_git_jobs() == git_module.DEFAULT_GIT_JOBS
+
+    def test_status_output_matches_sequential_run(self, spec_file: Path, tmp_path: Path):
+        from click.testing import CliRunner
+
+        from clm.cli.commands.git import git_group
+
+        _dry_run_mode.set(False)
+        repos = self._repos(tmp_path, 5)
+        for i, repo in enumerate(repos):
+            if i % 2 == 0:
+                _make_repo_on_branch(repo.path, "main")
+                (repo.path / f"new{i}.txt").write_text("x")
+
+        with patch("clm.cli.commands.git.find_output_repos", return_value=repos):
+            runner = CliRunner()
+            serial = runner.invoke(git_group, ["status", str(spec_file), "-j", "1"])
+            parallel = runner.invoke(git_group, ["status", str(spec_file), "--jobs", "4"])
+
+        assert serial.exit_code == 0, serial.output
+        assert parallel.exit_code == 0, parallel.output
+        assert parallel.output == serial.output
+        assert "?? new4.txt" in parallel.output
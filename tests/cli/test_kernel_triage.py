@@ -9,16 +9,24 @@ path, which the build test suite already covers).
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import threading
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+import pytest
 from click.testing import CliRunner
 
 from clm.cli.commands.kernel_triage import (
     TriageDeck,
     _classify_rerun_outcomes,
+    _default_parallel_builds,
     _extract_build_json,
+    _merge_run_outcomes,
+    _overall_build_status,
+    _run_sharded_triage,
+    _shard_topics,
     write_triage_spec,
 )
 from clm.cli.main import cli
@@ -290,3 +298,140 @@ class TestKernelTriageCli:
         result = self._invoke(tmp_path, "--since-days", "30")
         assert result.exit_code == 0, result.output
         assert "Nothing to triage" in result.output
+
+
+def _deck(name: str, topic_id: str, *, is_workaround: bool = False) -> TriageDeck:
+    return TriageDeck(path=f"C:/c/{name}.py", topic_id=topic_id, is_workaround=is_workaround)
+
+
+class TestShardTopics:
+    def test_topics_are_balanced_by_deck_count(self):
+        decks = [_deck(f"a{i}", "a") for i in range(4)]
+        decks += [_deck(f"b{i}", "b") for i in range(2)]
+        decks += [_deck(f"c{i}", "c") for i in range(2)]
+
+        assert _shard_topics(decks, 2) == [{"a"}, {"b", "c"}]
+
+    def test_never_more_shards_than_topics(self):
+        decks = [_deck("a", "a"), _deck("b", "b")]
+        assert sorted(map(sorted, _shard_topics(decks, 8))) == [["a"], ["b"]]
+
+
+class TestDefaultParallelBuilds:
+    def test_capped_by_cpus_per_build(self, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+        assert _default_parallel_builds(10, 4) == 2
+        assert _default_parallel_builds(10, None) == 4
+
+    def test_never_more_than_the_builds_and_at_least_one(self, monkeypatch):
+        monkeypatch.setattr("os.cpu_count", lambda: 8)
+        assert _default_parallel_builds(3, 1) == 3
+        assert _default_parallel_builds(3, 16) == 1
+
+
+class TestMergeRunOutcomes:
+    def _merged(self, *outcomes: str, is_workaround: bool = True) -> TriageDeck:
+        deck = _deck("x", "x", is_workaround=is_workaround)
+        runs = []
+        for outcome in outcomes:
+            run = dataclasses.replace(deck)
+            run.outcome = outcome
+            run.details = "dead_kernel at cell 3" if outcome == "failed" else ""
+            runs.append(run)
+        _merge_run_outcomes(deck, runs)
+        return deck
+
+    def test_all_clean_passes_lift_the_workaround(self):
+        deck = self._merged("passed", "passed", "passed")
+        assert deck.outcome == "passed"
+        assert deck.flake_rate == 0.0
+        assert "can be lifted" in deck.recommendation
+
+    def test_a_rare_crash_among_passes_is_flaky(self):
+        deck = self._merged("passed", "failed", "passed", "passed")
+        assert deck.outcome == "flaky"
+        assert deck.flake_rate == 0.25
+        assert deck.details == "1/4 runs not clean — dead_kernel at cell 3"
+        assert 'keep evaluate="no"' in deck.recommendation
+
+    def test_failing_every_run_is_a_failure(self):
+        deck = self._merged("failed", "failed")
+        assert deck.outcome == "failed"
+        assert deck.flake_rate == 1.0
+
+    def test_a_single_run_keeps_its_outcome_and_details(self):
+        deck = self._merged("failed")
+        assert deck.outcome == "failed"
+        assert deck.details == "dead_kernel at cell 3"
+        assert deck.runs == ["failed"]
+
+    def test_runs_without_a_summary_are_not_counted(self):
+        deck = self._merged("unknown", "passed")
+        assert deck.outcome == "passed"
+        assert deck.flake_rate == 0.0
+        assert self._merged("unknown", "unknown").outcome == "unknown"
+
+
+class TestRunShardedTriage:
+    def test_runs_every_shard_and_repetition_and_merges_telemetry(self, tmp_path, monkeypatch):
+        spec = tmp_path / "course.xml"
+        spec.write_text(TRIAGE_SOURCE_SPEC, encoding="utf-8")
+        decks = [
+            _deck("slides_algorithms", "algorithms", is_workaround=True),
+            _deck("slides_clean_code", "clean_code", is_workaround=True),
+        ]
+        calls = []
+        lock = threading.Lock()
+
+        def fake_build(triage_spec, build_dir, telemetry_db, *, container_prefix, **options):
+            root = ET.parse(triage_spec).getroot()
+            topics = {t.get("id") or (t.text or "").strip() for t in root.iter("topic")}
+            with lock:
+                calls.append((container_prefix, build_dir))
+            errors = []
+            # clean_code crashes in its first repetition only.
+            if "clean_code" in topics and build_dir.name.endswith("-rep-0"):
+                errors.append({"file_path": "C:/c/slides_clean_code.py", "message": "died"})
+                ExecutionTelemetryStore(telemetry_db).record_event(
+                    TelemetryEvent(
+                        input_file="C:/c/slides_clean_code.py",
+                        outcome="failed",
+                        classification="deterministic",
+                        attempts=2,
+                        failure_type="dead_kernel",
+                    )
+                )
+            status = "failed" if errors else "success"
+            return {"status": status, "errors": errors, "flaky_files": []}, 0, ""
+
+        monkeypatch.setattr("clm.cli.commands.kernel_triage._run_triage_build", fake_build)
+        telemetry = ExecutionTelemetryStore(tmp_path / "telemetry.db")
+
+        runs = _run_sharded_triage(
+            spec,
+            decks,
+            telemetry,
+            tmp_path / "work",
+            shards=2,
+            repetitions=3,
+            parallel_builds=6,
+            build_options={},
+        )
+
+        assert len(runs) == len(calls) == 6
+        assert len({prefix for prefix, _ in calls}) == 6
+        assert len({build_dir for _, build_dir in calls}) == 6
+        assert list(spec.parent.glob(".clm-triage-*")) == []
+
+        by_topic = {deck.topic_id: deck for deck in decks}
+        assert by_topic["algorithms"].outcome == "passed"
+        assert by_topic["algorithms"].runs == ["passed"] * 3
+        clean_code = by_topic["clean_code"]
+        assert clean_code.outcome == "flaky"
+        assert clean_code.flake_rate == pytest.approx(1 / 3)
+        assert "1/3 runs not clean" in clean_code.details
+        assert "dead_kernel" in clean_code.details
+
+        # The run's telemetry reached the shared database.
+        assert [e.failure_type for e in telemetry.events()] == ["dead_kernel"]
+        assert _overall_build_status(runs) == "1 failed, 5 success"
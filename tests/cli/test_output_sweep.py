@@ -9,6 +9,7 @@ between "registry-tracked" and "stray".
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -20,6 +21,7 @@ from clm.build.output_sweep import (
     sweep_stray_files,
 )
 from clm.core.image_registry import ImageRegistry
+from clm.core.output_inventory import OutputInventory
 from clm.core.output_write_registry import OutputWriteRegistry
 
 
@@ -379,6 +381,74 @@ class TestCustomKeepPatterns:
         assert report.kept_due_to_pattern == 1
 
 
+def _age(*paths: Path) -> None:
+    """Backdate ``paths`` past the inventory's racy-timestamp margin."""
+    for path in paths:
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+
+
+class TestInventory:
+    """Directory listings cached across builds in an :class:`OutputInventory`."""
+
+    def _sweep(self, root: Path, registry: OutputWriteRegistry, db_path: Path) -> SweepReport:
+        inventory = OutputInventory.load(db_path, [root])
+        report = sweep_stray_files([root], registry, inventory=inventory)
+        inventory.save()
+        return report
+
+    def test_unchanged_directories_are_not_listed_again(
+        self, tmp_path: Path, empty_registry: OutputWriteRegistry, monkeypatch
+    ):
+        root = tmp_path / "out"
+        kept = _make_file(root / "sec" / "a.txt")
+        _record(empty_registry, kept)
+        _age(root / "sec", root)
+        db_path = tmp_path / "inventory.db"
+        self._sweep(root, empty_registry, db_path)
+
+        def refuse_scandir(path, *args, **kwargs):
+            raise AssertionError(f"{path} was listed")
+
+        with monkeypatch.context() as m:
+            m.setattr("clm.build.output_sweep.os.scandir", refuse_scandir)
+            report = self._sweep(root, empty_registry, db_path)
+
+        assert report.deleted_files == []
+        assert kept.exists()
+
+    def test_file_added_since_the_last_build_is_swept(
+        self, tmp_path: Path, empty_registry: OutputWriteRegistry
+    ):
+        root = tmp_path / "out"
+        kept = _make_file(root / "sec" / "a.txt")
+        _record(empty_registry, kept)
+        _age(root / "sec", root)
+        db_path = tmp_path / "inventory.db"
+        self._sweep(root, empty_registry, db_path)
+
+        stray = _make_file(root / "sec" / "stray.txt")
+        report = self._sweep(root, empty_registry, db_path)
+
+        assert report.deleted_files == [stray]
+        assert kept.exists()
+
+    def test_nested_git_subtree_is_preserved_from_the_cached_listing(
+        self, tmp_path: Path, empty_registry: OutputWriteRegistry
+    ):
+        root = tmp_path / "out"
+        nested_root = root / "vendored_repo"
+        _make_file(nested_root / ".git" / "HEAD", b"ref: refs/heads/main\n")
+        nested_file = _make_file(nested_root / "file.py", b"print()")
+        _age(nested_root, root)
+        db_path = tmp_path / "inventory.db"
+        self._sweep(root, empty_registry, db_path)
+
+        report = self._sweep(root, empty_registry, db_path)
+
+        assert nested_file.exists()
+        assert report.skipped_subtrees == [nested_root]
+
+
 def test_module_does_not_pull_in_build_command() -> None:
     """Importing the sweep module must not transitively import
     ``clm.cli.commands.build`` — the dependency goes build → sweep,
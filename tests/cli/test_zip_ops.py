@@ -11,6 +11,7 @@ from clm.cli.commands import zip as zip_ops_module
 from clm.cli.commands.zip import (
     OutputDirectory,
     _archive_name,
+    _split_jobs,
     find_output_directories,
     zip_directory,
     zip_group,
@@ -107,13 +108,18 @@ class TestZipDirectory:
             names = zf.namelist()
             assert not any(name.endswith(".pyc") for name in names)
 
-    def test_uses_deflated_compression(self, sample_tree: Path, tmp_path: Path):
+    def test_deflates_text_and_stores_compressed_formats(self, sample_tree: Path, tmp_path: Path):
+        (sample_tree / "notes.md").write_text("lorem ipsum dolor sit amet\n" * 200)
         archive = tmp_path / "output.zip"
         zip_directory(sample_tree, archive)
 
         with zipfile.ZipFile(archive) as zf:
-            for info in zf.infolist():
-                assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert zf.getinfo("MyCourse/notes.md").compress_type == zipfile.ZIP_DEFLATED
+            # PNG is already compressed; deflating it only costs time.
+            assert zf.getinfo("MyCourse/img/diagram.png").compress_type == zipfile.ZIP_STORED
+            # Members deflate cannot shrink are stored as well.
+            assert zf.getinfo("MyCourse/file1.txt").compress_type == zipfile.ZIP_STORED
+            assert zf.testzip() is None
 
     def test_deterministic_ordering(self, sample_tree: Path, tmp_path: Path):
         archive1 = tmp_path / "output1.zip"
@@ -462,3 +468,38 @@ class TestZipGroupCreateCommand:
         expected = archives_root / _archive_name(dirs[0])
         assert expected.is_file()
         assert not (built.parent / _archive_name(dirs[0])).exists()
+
+    def test_jobs_are_split_between_archives(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        (tmp_path / "spec.xml").touch()
+        dirs = []
+        for lang in ("de", "en"):
+            built = tmp_path / f"course-{lang}"
+            built.mkdir()
+            (built / "content.html").write_text("<html></html>")
+            dirs.append(OutputDirectory(path=built, target_name="public", language=lang))
+        _patch_find_output_directories(monkeypatch, dirs)
+        seen_jobs = []
+
+        def fake_zip_directory(source, archive, *, jobs=None, reuse=True):
+            seen_jobs.append(jobs)
+            return archive
+
+        monkeypatch.setattr(zip_ops_module, "zip_directory", fake_zip_directory)
+
+        result = CliRunner().invoke(
+            zip_group, ["create", str(tmp_path / "spec.xml"), "--jobs", "8"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert seen_jobs == [4, 4]
+
+
+class TestSplitJobs:
+    def test_budget_is_divided_between_concurrent_archives(self):
+        assert _split_jobs(8, 2) == (2, 4)
+
+    def test_fewer_jobs_than_archives_runs_one_thread_each(self):
+        assert _split_jobs(2, 6) == (2, 1)
+
+    def test_single_archive_gets_the_whole_budget(self):
+        assert _split_jobs(12, 1) == (1, 12)
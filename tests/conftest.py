@@ -169,6 +169,49 @@ def _isolate_clm_log_dir(tmp_path_factory):
             os.environ[LOG_DIR_ENV_VAR] = previous
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_validation_cache(tmp_path_factory):
+    """Point ``clm validate``'s result cache at a per-worker temp file.
+
+    The CLI caches validation results in the per-user cache directory by
+    default; the suite must neither read a developer's cache nor leave
+    entries behind in it. Same pattern as ``_isolate_clm_log_dir``.
+    """
+    from clm.slides.validation_engine import CACHE_PATH_ENV_VAR
+
+    cache_file = tmp_path_factory.mktemp("clm-validation") / "validation-cache.db"
+    previous = os.environ.get(CACHE_PATH_ENV_VAR)
+    os.environ[CACHE_PATH_ENV_VAR] = str(cache_file)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(CACHE_PATH_ENV_VAR, None)
+        else:
+            os.environ[CACHE_PATH_ENV_VAR] = previous
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolate_cassette_index(tmp_path_factory):
+    """Point the parsed-cassette index at a per-worker temp file.
+
+    Cassette merges and the replay proxy use a per-user index by default;
+    same reasoning and pattern as ``_isolate_validation_cache``.
+    """
+    from clm.infrastructure.http_replay_mitm.http_replay_cassette import INDEX_PATH_ENV_VAR
+
+    index_file = tmp_path_factory.mktemp("clm-cassette-index") / "http-replay-index.sqlite"
+    previous = os.environ.get(INDEX_PATH_ENV_VAR)
+    os.environ[INDEX_PATH_ENV_VAR] = str(index_file)
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(INDEX_PATH_ENV_VAR, None)
+        else:
+            os.environ[INDEX_PATH_ENV_VAR] = previous
+
+
 @pytest.fixture(autouse=True)
 def _isolate_http_replay_env():
     """Restore the ``CLM_HTTP_REPLAY_*`` env vars around every test.
@@ -6,10 +6,12 @@ Tests cover NotebookPayload, NotebookResult, and helper functions.
 import pytest
 
 from clm.core.messaging.notebook_classes import (
+    EXECUTE_ONLY_FORMAT_TAG,
     NotebookPayload,
     NotebookResult,
     notebook_metadata,
     notebook_metadata_tags,
+    notebook_metadata_tags_from_payload,
 )
 
 
@@ -106,6 +108,7 @@ class TestNotebookPayload:
             "author": "Ada Lovelace",
             "organization": "Coding Academy",
             "cross_references": {"workshop": "../Workshops/02%20Workshop.html"},
+            "execute_only": True,
         }
         assert set(values) == set(NotebookPayload.model_fields), (
             "NotebookPayload fields changed — add the new field above with a "
@@ -191,6 +194,45 @@ class TestNotebookPayload:
         assert sample_payload.output_metadata() == "completed:python:en:html"
 
 
+class TestExecuteOnlyPayload:
+    """Execute-only payloads share the execution key but not the result key."""
+
+    def _payload(self, **overrides):
+        defaults = {
+            "correlation_id": "cid",
+            "input_file": "/slides.py",
+            "input_file_name": "slides.py",
+            "output_file": "/.clm-implicit/slides.html",
+            "data": "cell contents",
+            "kind": "recording",
+            "prog_lang": "python",
+            "language": "en",
+            "format": "html",
+        }
+        defaults.update(overrides)
+        return NotebookPayload(**defaults)
+
+    def test_execution_cache_hash_matches_recording_html(self):
+        """Consumers look the execution up under Recording's key."""
+        execute_only = self._payload(execute_only=True)
+        assert execute_only.execution_cache_hash() == self._payload().execution_cache_hash()
+
+    def test_result_key_differs_from_recording_html(self):
+        """The stub result must never replay as Recording HTML."""
+        execute_only = self._payload(execute_only=True)
+        recording = self._payload()
+
+        assert execute_only.output_metadata() == f"recording:python:en:{EXECUTE_ONLY_FORMAT_TAG}"
+        assert execute_only.content_hash() != recording.content_hash()
+
+    def test_metadata_tags_from_serialized_payload(self):
+        """Host-side bookkeeping rebuilds the same key from the job payload."""
+        payload = self._payload(execute_only=True)
+        tags = notebook_metadata_tags_from_payload(payload.model_dump(mode="json"))
+
+        assert notebook_metadata(*tags) == payload.output_metadata()
+
+
 class TestExecutionCacheHash:
     """Cassette bytes are intentionally NOT folded into the hash.
 
@@ -0,0 +1,155 @@
+"""Tests for the whole-build trace recorder (``CLM_BUILD_TRACE``)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from clm.core import build_trace as bt
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    return bt.BuildTracer(tmp_path / "trace.json")
+
+
+def _worker_trace(job_start, *, worker_id=7, stages=((bt.KERNEL_START, 2, 5),)):
+    spans = [
+        {"name": bt.CLAIM, "cat": "worker", "ts": job_start - 3, "dur": 3},
+        {"name": bt.JOB, "cat": "worker", "ts": job_start, "dur": 100},
+    ]
+    spans += [
+        {"name": name, "cat": "worker", "ts": job_start + offset, "dur": dur}
+        for name, offset, dur in stages
+    ]
+    return {
+        "worker": {"worker_id": worker_id, "worker_type": "notebook", "execution_mode": "docker"},
+        "spans": spans,
+    }
+
+
+class TestEnvSensing:
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv(bt.TRACE_ENV_VAR, raising=False)
+        assert bt.trace_path_from_env() is None
+
+    @pytest.mark.parametrize("value", ["0", "false", "no", "off", " "])
+    def test_falsy_values_leave_it_off(self, monkeypatch, value):
+        monkeypatch.setenv(bt.TRACE_ENV_VAR, value)
+        assert bt.trace_path_from_env() is None
+
+    def test_flag_uses_the_default_file(self, monkeypatch):
+        monkeypatch.setenv(bt.TRACE_ENV_VAR, "1")
+        assert bt.trace_path_from_env() == Path(bt.DEFAULT_TRACE_FILENAME)
+
+    def test_path_value(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(bt.TRACE_ENV_VAR, str(tmp_path / "b.json"))
+        assert bt.trace_path_from_env() == tmp_path / "b.json"
+
+
+class TestRecording:
+    def test_disabled_tracer_records_nothing(self):
+        tracer = bt.BuildTracer(None)
+        with tracer.span(bt.SPEC_LOAD, "host"):
+            pass
+        tracer.add_job_trace(1, _worker_trace(10))
+
+        assert tracer.drain() == []
+        assert tracer.critical_path() == {}
+
+    def test_span_records_even_when_the_body_raises(self, tracer):
+        with pytest.raises(RuntimeError), tracer.span(bt.SPEC_LOAD, "host", course="c"):
+            raise RuntimeError
+
+        (span,) = tracer.drain()
+        assert span["name"] == bt.SPEC_LOAD
+        assert span["args"] == {"course": "c"}
+        assert span["dur"] >= 0
+
+    def test_drain_empties_the_buffer(self, tracer):
+        tracer.add_span(bt.CELL_EXECUTION, "worker", 10, 20, cell=3)
+
+        assert tracer.drain() == [
+            {"name": bt.CELL_EXECUTION, "cat": "worker", "ts": 10, "dur": 10, "args": {"cell": 3}}
+        ]
+        assert tracer.drain() == []
+
+    def test_threads_get_their_own_tracks(self, tracer):
+        tracer.add_span("a", "host", 0, 1)
+        thread = threading.Thread(target=tracer.add_span, args=("b", "host", 1, 2))
+        thread.start()
+        thread.join()
+
+        events = tracer.to_chrome_trace()["traceEvents"]
+        tids = {e["name"]: e["tid"] for e in events if e.get("ph") == "X"}
+        assert tids["a"] != tids["b"]
+
+
+class TestHostSide:
+    def test_worker_spans_land_on_a_worker_track_with_a_queue_span(self, tracer):
+        tracer.job_submitted(1, 1_000, input_file="a.py")
+        tracer.add_job_trace(1, _worker_trace(2_000))
+
+        events = tracer.to_chrome_trace()["traceEvents"]
+        names = {e["args"]["name"]: e["pid"] for e in events if e["name"] == "process_name"}
+        worker_pid = names["worker 7 (notebook, docker)"]
+        job = next(e for e in events if e["name"] == bt.JOB)
+        queued = [e for e in events if e["name"] == bt.QUEUED]
+
+        assert job["pid"] == worker_pid
+        assert job["args"]["job_id"] == 1
+        assert [(e["ph"], e["ts"]) for e in queued] == [("b", 1_000), ("e", 2_000)]
+
+    def test_untraced_job_is_still_retired(self, tracer):
+        tracer.job_submitted(1, 1_000)
+        tracer.add_job_trace(1, None)
+
+        events = tracer.to_chrome_trace()["traceEvents"]
+        assert [e["name"] for e in events if e.get("ph") == "i"] == ["retired"]
+        assert not [e for e in events if e["name"] == bt.QUEUED]
+
+
+class TestCriticalPath:
+    def test_last_retired_job_is_the_critical_path(self, tracer, monkeypatch):
+        clock = iter([5_000_000, 9_000_000])
+        monkeypatch.setattr(bt, "now_us", lambda: next(clock))
+        tracer.add_span(bt.SPEC_LOAD, "host", 0, 500_000)
+        tracer.job_submitted(1, 1_000_000, input_file="a.py")
+        tracer.job_submitted(2, 1_000_000, input_file="b.py")
+        tracer.add_job_trace(1, _worker_trace(2_000_000))
+        tracer.add_job_trace(
+            2,
+            _worker_trace(
+                3_000_000,
+                worker_id=8,
+                stages=((bt.CELL_EXECUTION, 10, 20), (bt.CELL_EXECUTION, 40, 30)),
+            ),
+        )
+
+        summary = tracer.critical_path()
+
+        assert summary["wall_s"] == 9.0
+        last = summary["last_job"]
+        assert last["job_id"] == 2
+        assert last["input_file"] == "b.py"
+        assert last["segments_s"]["build start -> submitted"] == 1.0
+        assert last["segments_s"]["finished -> retired"] == 6.0
+        assert last["stages_s"] == {bt.CELL_EXECUTION: 0.0}
+        assert summary["stage_totals_s"] == {bt.KERNEL_START: 0.0, bt.CELL_EXECUTION: 0.0}
+        assert summary["workers"]["worker 7 (notebook, docker)"]["jobs"] == 1
+
+    def test_export_writes_chrome_trace_and_logs_summary(self, tracer, caplog, monkeypatch):
+        # The module logger does not propagate (it owns a stderr handler).
+        monkeypatch.setattr(bt.logger, "handlers", [*bt.logger.handlers, caplog.handler])
+        tracer.add_span(bt.SPEC_LOAD, "host", 0, 1_500_000)
+
+        tracer.export()
+
+        data = json.loads(tracer.path.read_text(encoding="utf-8"))
+        assert data["displayTimeUnit"] == "ms"
+        assert any(e["name"] == bt.SPEC_LOAD for e in data["traceEvents"])
+        assert data["otherData"]["critical_path"]["wall_s"] == 1.5
+        assert "[build-trace] wall time 1.50s" in caplog.messages
@@ -968,6 +968,7 @@ class TestImplicitExecutionIsolation:
         what this collects is what a real build would submit.
         """
         from clm.core.operation import Concurrently, NoOperation
+        from clm.core.operations.process_notebook import ProcessNotebookOperation
 
         def flatten(op):
             if isinstance(op, NoOperation):
@@ -987,7 +988,7 @@ class TestImplicitExecutionIsolation:
                     implicit_executions=implicit,
                 )
                 ops.extend((target, o) for o in flatten(op))
-        return [(target, o) for target, o in ops if type(o).__name__ == "ProcessNotebookOperation"]
+        return [(target, o) for target, o in ops if isinstance(o, ProcessNotebookOperation)]
 
     async def test_cache_producer_still_scheduled(self, course):
         """The restricted build must still execute the recording notebook."""
@@ -996,6 +997,17 @@ class TestImplicitExecutionIsolation:
 
         assert [(o.language, o.format, o.kind) for o in implicit] == [("en", "html", "recording")]
 
+    async def test_cache_producer_is_execute_only(self, course):
+        """The producer runs the kernel without rendering or writing HTML."""
+        from clm.core.operations.process_notebook import ExecuteNotebookOperation
+
+        ops = await self._notebook_ops(course, HTML_SPEAKER_STAGE)
+        implicit = [o for _target, o in ops if o.is_implicit_execution]
+        explicit = [o for _target, o in ops if not o.is_implicit_execution]
+
+        assert implicit and all(isinstance(o, ExecuteNotebookOperation) for o in implicit)
+        assert not any(o.execute_only for o in explicit)
+
     async def test_implicit_output_stays_out_of_every_target_tree(self, course):
         """The intermediate must not be written into any target's output root."""
         ops = await self._notebook_ops(course, HTML_SPEAKER_STAGE)
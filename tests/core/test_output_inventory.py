@@ -0,0 +1,159 @@
+"""Tests for :mod:`clm.core.output_inventory`."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from clm.core.output_inventory import (
+    DEFAULT_INVENTORY_DB_NAME,
+    KIND_DIR,
+    KIND_FILE,
+    OutputInventory,
+    default_inventory_db_path,
+)
+
+OLD_MTIME = 1_000_000_000
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / DEFAULT_INVENTORY_DB_NAME
+
+
+def _old_file(path: Path, content: bytes = b"x") -> os.stat_result:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    os.utime(path, (OLD_MTIME, OLD_MTIME))
+    return path.stat()
+
+
+def test_default_path_sits_next_to_the_cache_db(tmp_path):
+    assert default_inventory_db_path(tmp_path / "clm_cache.db") == (
+        tmp_path / DEFAULT_INVENTORY_DB_NAME
+    )
+
+
+def test_missing_database_loads_empty(tmp_path, db_path):
+    inventory = OutputInventory.load(db_path, [tmp_path / "out"])
+
+    assert inventory.digest_if_unchanged(tmp_path / "out" / "a", os.stat(tmp_path)) is None
+    assert inventory.listing_if_unchanged(tmp_path / "out", 1) is None
+
+
+def test_unreadable_database_loads_empty(tmp_path, db_path):
+    db_path.parent.mkdir(parents=True)
+    db_path.write_bytes(b"not a database")
+
+    inventory = OutputInventory.load(db_path, [tmp_path])
+
+    assert inventory.listing_if_unchanged(tmp_path, 1) is None
+
+
+class TestFiles:
+    def test_digest_survives_a_round_trip(self, tmp_path, db_path):
+        out = tmp_path / "out" / "a.txt"
+        st = _old_file(out)
+        inventory = OutputInventory.load(db_path, [tmp_path / "out"])
+        inventory.record_file(out, st, "sha256:aa")
+        inventory.save()
+
+        reloaded = OutputInventory.load(db_path, [tmp_path / "out"])
+
+        assert reloaded.digest_if_unchanged(out, out.stat()) == "sha256:aa"
+
+    def test_changed_file_has_no_digest(self, tmp_path, db_path):
+        out = tmp_path / "out" / "a.txt"
+        inventory = OutputInventory.load(db_path, [tmp_path / "out"])
+        inventory.record_file(out, _old_file(out), "sha256:aa")
+        inventory.save()
+
+        _old_file(out, b"longer")
+        reloaded = OutputInventory.load(db_path, [tmp_path / "out"])
+
+        assert reloaded.digest_if_unchanged(out, out.stat()) is None
+
+    def test_recently_modified_file_is_not_recorded(self, tmp_path, db_path):
+        # Another write within the same timestamp tick would go unnoticed.
+        out = tmp_path / "out" / "a.txt"
+        out.parent.mkdir()
+        out.write_bytes(b"x")
+        inventory = OutputInventory.load(db_path, [tmp_path / "out"])
+        inventory.record_file(out, out.stat(), "sha256:aa")
+        inventory.save()
+
+        reloaded = OutputInventory.load(db_path, [tmp_path / "out"])
+
+        assert reloaded.digest_if_unchanged(out, out.stat()) is None
+
+    def test_untouched_rows_are_dropped(self, tmp_path, db_path):
+        root = tmp_path / "out"
+        a, b = root / "a.txt", root / "b.txt"
+        inventory = OutputInventory.load(db_path, [root])
+        inventory.record_file(a, _old_file(a), "sha256:aa")
+        inventory.record_file(b, _old_file(b), "sha256:bb")
+        inventory.save()
+
+        second = OutputInventory.load(db_path, [root])
+        assert second.digest_if_unchanged(a, a.stat()) == "sha256:aa"
+        second.save()
+
+        third = OutputInventory.load(db_path, [root])
+        assert third.digest_if_unchanged(a, a.stat()) == "sha256:aa"
+        assert third.digest_if_unchanged(b, b.stat()) is None
+
+
+class TestScoping:
+    def test_rows_outside_the_roots_are_neither_loaded_nor_dropped(self, tmp_path, db_path):
+        mine, sibling = tmp_path / "out", tmp_path / "out-other"
+        a, b = mine / "a.txt", sibling / "b.txt"
+        inventory = OutputInventory.load(db_path, [mine, sibling])
+        inventory.record_file(a, _old_file(a), "sha256:aa")
+        inventory.record_file(b, _old_file(b), "sha256:bb")
+        inventory.save()
+
+        scoped = OutputInventory.load(db_path, [mine])
+        assert scoped.digest_if_unchanged(b, b.stat()) is None
+        scoped.digest_if_unchanged(a, a.stat())
+        scoped.save()
+
+        assert (
+            OutputInventory.load(db_path, [sibling]).digest_if_unchanged(b, b.stat()) == "sha256:bb"
+        )
+
+    def test_an_unused_table_is_left_alone(self, tmp_path, db_path):
+        # The manifest only consults files, the sweep only directories; each
+        # saving its own inventory must not wipe the other's rows.
+        root = tmp_path / "out"
+        a = root / "a.txt"
+        st = _old_file(a)
+        os.utime(root, (OLD_MTIME, OLD_MTIME))
+        inventory = OutputInventory.load(db_path, [root])
+        inventory.record_file(a, st, "sha256:aa")
+        inventory.record_listing(root, OLD_MTIME * 10**9, [("a.txt", KIND_FILE)])
+        inventory.save()
+
+        sweep = OutputInventory.load(db_path, [root])
+        sweep.listing_if_unchanged(root, OLD_MTIME * 10**9)
+        sweep.save()
+
+        reloaded = OutputInventory.load(db_path, [root])
+        assert reloaded.digest_if_unchanged(a, a.stat()) == "sha256:aa"
+
+
+class TestListings:
+    def test_listing_is_valid_only_for_the_same_mtime(self, tmp_path, db_path):
+        root = tmp_path / "out"
+        entries = [("a.txt", KIND_FILE), ("sec", KIND_DIR)]
+        inventory = OutputInventory.load(db_path, [root])
+        inventory.record_listing(root, OLD_MTIME, entries)
+        inventory.save()
+
+        reloaded = OutputInventory.load(db_path, [root])
+
+        listing = reloaded.listing_if_unchanged(root, OLD_MTIME)
+        assert listing is not None
+        assert list(listing.entries) == entries
+        assert reloaded.listing_if_unchanged(root, OLD_MTIME + 1) is None
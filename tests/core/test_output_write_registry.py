@@ -73,7 +73,7 @@ class TestRecordWriteBytes:
         assert result.entry.last_writer_source == Path("/src/a.txt")
         assert result.entry.dedup_count == 0
         assert result.entry.conflict_count == 0
-        assert result.entry.content_hash  # non-empty hex string
+        assert result.entry.content_hash.startswith("sha256:")
         assert registry.total_dedups == 0
         assert registry.total_conflicts == 0
 
@@ -385,3 +385,48 @@ class TestIsDestinationIdentical:
         assert registry.get(out) is None
         assert registry.total_dedups == 0
         assert registry.total_conflicts == 0
+
+    def test_known_content_hash_skips_hashing_the_source(self, tmp_path, monkeypatch):
+        registry = OutputWriteRegistry()
+        out = _abs(tmp_path, "out", "a.txt")
+        out.write_bytes(b"hello")
+        content_hash = registry.record_write(out, content=b"hello").entry.content_hash
+
+        def fail_hash_bytes(data):
+            raise AssertionError("content hashed twice")
+
+        monkeypatch.setattr("clm.core.output_write_registry._hash_bytes", fail_hash_bytes)
+
+        assert registry.is_destination_identical(out, content=b"hello", content_hash=content_hash)
+
+
+class TestDigestFor:
+    def test_matches_the_manifest_digest(self, tmp_path):
+        from clm.core.provenance_manifest import hash_file
+
+        registry = OutputWriteRegistry()
+        out = _abs(tmp_path, "out", "a.txt")
+        out.write_bytes(b"hello")
+        registry.record_write(out, content=b"hello")
+
+        assert registry.digest_for(out) == hash_file(out)
+
+    def test_unrecorded_path(self, tmp_path):
+        assert OutputWriteRegistry().digest_for(tmp_path / "a.txt") is None
+
+    def test_conflicted_path_is_not_trusted(self, tmp_path):
+        # Which write landed last depends on job completion order.
+        registry = OutputWriteRegistry()
+        out = _abs(tmp_path, "out", "a.txt")
+        registry.record_write(out, content=b"version 1")
+        registry.record_write(out, content=b"version 2")
+
+        assert registry.digest_for(out) is None
+
+    def test_large_file_has_no_digest(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CLM_OUTPUT_DEDUP_HASH_LIMIT_MB", "0")
+        registry = OutputWriteRegistry()
+        out = _abs(tmp_path, "out", "a.txt")
+        registry.record_write(out, content=b"hello")
+
+        assert registry.digest_for(out) is None
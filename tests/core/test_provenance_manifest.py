@@ -565,3 +565,93 @@ def test_clean_build_manifest_is_not_partial(course_1):
     )
     assert manifest["partial"] is False
     assert manifest["failed_topics"] == []
+
+
+def _refuse_hashing(monkeypatch):
+    def refuse(path):
+        raise AssertionError(f"{path} was read")
+
+    monkeypatch.setattr("clm.core.provenance_manifest.hash_file", refuse)
+
+
+def test_manifest_takes_written_outputs_digests_from_the_registry(course_1, monkeypatch):
+    from clm.core.output_write_registry import OutputWriteRegistry
+
+    target = course_1.output_targets[0]
+    out_path, _record = next(iter(enumerate_expected_outputs(course_1, target)))
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text("x", encoding="utf-8")
+    registry = OutputWriteRegistry()
+    registry.record_write(out_path, content=b"x")
+    _refuse_hashing(monkeypatch)
+
+    manifest = build_provenance_manifest(
+        course_1,
+        target,
+        source_commit="abc",
+        source_dirty=False,
+        built_at=BUILT_AT,
+        output_write_registry=registry,
+    )
+
+    (entry,) = manifest["files"]
+    assert entry["content_hash"] == registry.digest_for(out_path)
+
+
+def test_manifest_skips_registered_outputs_deleted_since(course_1):
+    from clm.core.output_write_registry import OutputWriteRegistry
+
+    target = course_1.output_targets[0]
+    out_path, _record = next(iter(enumerate_expected_outputs(course_1, target)))
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text("x", encoding="utf-8")
+    registry = OutputWriteRegistry()
+    registry.record_write(out_path, content=b"x")
+    out_path.unlink()
+
+    manifest = build_provenance_manifest(
+        course_1,
+        target,
+        source_commit="abc",
+        source_dirty=False,
+        built_at=BUILT_AT,
+        output_write_registry=registry,
+    )
+
+    assert manifest["files"] == []
+
+
+def test_manifest_reuses_inventory_digests_of_unchanged_outputs(course_1, tmp_path, monkeypatch):
+    import os
+
+    from clm.core.output_inventory import OutputInventory
+
+    target = course_1.output_targets[0]
+    out_path, _record = next(iter(enumerate_expected_outputs(course_1, target)))
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text("x", encoding="utf-8")
+    # Older than the inventory's racy-timestamp margin.
+    os.utime(out_path, (1_000_000_000, 1_000_000_000))
+    db_path = tmp_path / "inventory.db"
+
+    def manifest_digest():
+        inventory = OutputInventory.load(db_path, [target.output_root])
+        manifest = build_provenance_manifest(
+            course_1,
+            target,
+            source_commit="abc",
+            source_dirty=False,
+            built_at=BUILT_AT,
+            inventory=inventory,
+        )
+        inventory.save()
+        (entry,) = manifest["files"]
+        return entry["content_hash"]
+
+    first = manifest_digest()
+    with monkeypatch.context() as m:
+        _refuse_hashing(m)
+        assert manifest_digest() == first
+
+    out_path.write_text("changed", encoding="utf-8")
+    assert manifest_digest() != first
@@ -1555,6 +1555,113 @@ async def test_recording_html_cache_replay_proceeds_when_executed_notebooks_warm
         await backend.shutdown()
 
 
+@pytest.mark.asyncio
+async def test_execute_only_cache_hit_writes_nothing(temp_db, temp_workspace, temp_cache_db):
+    """A warm execute-only job is skipped without touching its output path.
+
+    Its stored result is a stub; the execution it stands for lives in
+    ``executed_notebooks``, so there is no HTML to replay.
+    """
+    from nbformat.v4 import new_code_cell, new_notebook
+
+    from clm.core.messaging.notebook_classes import NotebookResult
+    from clm.infrastructure.database.executed_notebook_cache import ExecutedNotebookCache
+
+    backend = SqliteBackend(
+        db_path=temp_db,
+        workspace_path=temp_workspace,
+        ignore_db=False,
+        skip_worker_check=True,
+    )
+
+    try:
+        payload = _make_recording_html_payload().model_copy(update={"execute_only": True})
+        stub = NotebookResult(
+            correlation_id="test",
+            output_file=payload.output_file,
+            input_file=payload.input_file,
+            content_hash=payload.content_hash(),
+            result="",
+            output_metadata_tags=("recording", "python", "en", "executed"),
+        )
+        backend.db_manager = _make_mock_db_manager(temp_cache_db, stub)
+        with ExecutedNotebookCache(temp_cache_db) as nb_cache:
+            nb_cache.store(
+                input_file=payload.input_file,
+                content_hash=payload.execution_cache_hash(),
+                language=payload.language,
+                prog_lang=payload.prog_lang,
+                executed_notebook=new_notebook(cells=[new_code_cell("x = 1")]),
+            )
+
+        await backend.execute_operation(MockOperation(), payload)
+
+        assert len(backend.active_jobs) == 0
+        assert not (temp_workspace / payload.output_file).exists()
+        assert backend.output_write_registry.entries == {}
+    finally:
+        await backend.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_execute_only_job_skips_the_job_cache_probe(temp_db, temp_workspace, temp_cache_db):
+    """Execute-only jobs never leave an output on disk for the job cache."""
+    backend = SqliteBackend(
+        db_path=temp_db,
+        workspace_path=temp_workspace,
+        ignore_db=False,
+        skip_worker_check=True,
+    )
+
+    try:
+        backend.db_manager = _make_mock_db_manager(temp_cache_db, None)
+        assert backend.job_queue is not None
+        backend.job_queue.check_cache = Mock(return_value={"hit": True})
+        payload = _make_recording_html_payload().model_copy(update={"execute_only": True})
+
+        await backend.execute_operation(MockOperation(), payload)
+
+        backend.job_queue.check_cache.assert_not_called()
+        (job_info,) = backend.active_jobs.values()
+        assert job_info["execute_only"] is True
+    finally:
+        backend.active_jobs.clear()
+        await backend.shutdown()
+
+
+def test_execute_only_result_is_cached_as_a_stub(temp_db, temp_workspace):
+    """The stored result needs no output file and has its own metadata key."""
+    backend = SqliteBackend(db_path=temp_db, workspace_path=temp_workspace)
+    try:
+        payload = _make_recording_html_payload().model_copy(update={"execute_only": True})
+        assert backend.job_queue is not None
+        job_id = backend.job_queue.add_job(
+            job_type="notebook",
+            input_file=payload.input_file,
+            output_file=payload.output_file,
+            content_hash=payload.content_hash(),
+            payload=payload.model_dump(mode="json"),
+        )
+        db_manager = Mock()
+        job_info = {
+            "job_type": "notebook",
+            "input_file": payload.input_file,
+            "output_file": payload.output_file,
+            "correlation_id": "test-cid",
+            "execute_only": True,
+        }
+
+        backend._persist_result_to_cache(
+            job_id, job_info, temp_workspace / payload.output_file, db_manager
+        )
+
+        stored = db_manager.store_latest_result.call_args.kwargs["result"]
+        assert stored.result == ""
+        assert stored.output_metadata() == payload.output_metadata()
+    finally:
+        backend.job_queue.close()
+
+
 @pytest.mark.asyncio
 async def test_completed_html_cache_replay_proceeds_without_executed_notebooks_peek(
     temp_db, temp_workspace, temp_cache_db
@@ -481,6 +481,43 @@ async def test_build_end_cleanup_prunes_and_vacuums(temp_db, temp_workspace, tmp
     assert not decoy.exists()
 
 
+@pytest.mark.asyncio
+async def test_shutdown_archives_finished_jobs(temp_db, temp_workspace, monkeypatch):
+    # Regression: ``shutdown()`` stops the archiver thread before the build-end
+    # cleanup, and the final archival pass used to bail out on the stop event
+    # without archiving anything.
+    from clm.infrastructure import config as config_mod
+    from clm.infrastructure.database.job_archive import JobArchiver
+
+    monkeypatch.setattr(config_mod, "_config", None)
+    # Only the build-end pass may archive, not the background thread.
+    monkeypatch.setattr(JobArchiver, "start", lambda self: None)
+    conn = sqlite3.connect(temp_db)
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO jobs (job_type, status, input_file, output_file, content_hash, "
+            "payload, session_id, completed_at) VALUES ('notebook', 'completed', 'deck.py', "
+            "'deck.html', 'h', '{}', 'old-session', datetime('now', '-2 hours'))"
+        )
+    job_id = cursor.lastrowid
+    conn.close()
+
+    backend = _backend(temp_db, temp_workspace)
+    try:
+        await backend.start()
+        assert backend._job_archiver is not None
+    finally:
+        await backend.shutdown()
+        config_mod._config = None
+
+    conn = sqlite3.connect(temp_db)
+    try:
+        assert conn.execute("SELECT id FROM jobs").fetchall() == []
+        assert conn.execute("SELECT id FROM jobs_archive").fetchall() == [(job_id,)]
+    finally:
+        conn.close()
+
+
 @pytest.mark.asyncio
 async def test_build_end_cleanup_handles_exception(temp_db, temp_workspace):
     backend = _backend(temp_db, temp_workspace)
@@ -1,7 +1,9 @@
 """Tests for the ExecutedNotebookCache class."""
 
+import base64
 import json
 import logging
+import os
 import pickle
 import sqlite3
 import tempfile
@@ -13,8 +15,10 @@ from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook
 from clm.infrastructure.database.executed_notebook_cache import (
     _USER_VERSION_JSON_ONLY,
     PAYLOAD_FORMAT,
+    SPLIT_PAYLOAD_FORMAT,
     ExecutedNotebookCache,
 )
+from clm.infrastructure.notebook_serialization import serialize_notebook
 
 
 @pytest.fixture
@@ -382,3 +386,130 @@ class TestPickleEradication:
             assert cache.get("/path/old.py", "hash-legacy", "en", "python") is None
             # And the JSON row written before is unaffected.
             assert cache.get("/path/nb.py", "hash-json", "en", "python") is not None
+
+
+def _plot_notebook(caption: str, image: str):
+    """A notebook whose outputs are large enough to be split into blobs."""
+    nb = new_notebook()
+    nb.cells = [new_code_cell(f"plot('{caption}')"), new_code_cell("table()")]
+    nb.cells[0]["execution_count"] = 1
+    nb.cells[0]["outputs"] = [
+        {
+            "output_type": "display_data",
+            "data": {"image/png": image, "text/plain": f"<Figure {caption}>"},
+            "metadata": {},
+        }
+    ]
+    nb.cells[1]["execution_count"] = 2
+    nb.cells[1]["outputs"] = [
+        {"output_type": "stream", "name": "stdout", "text": "row ä\n" * 400},
+    ]
+    return nb
+
+
+@pytest.fixture
+def plot_image():
+    return base64.b64encode(os.urandom(6000)).decode("ascii")
+
+
+class TestOutputBlobs:
+    """Large outputs are stored once, and reads return the original bytes."""
+
+    def test_get_raw_is_byte_identical(self, temp_db_path, plot_image):
+        nb = _plot_notebook("de", plot_image)
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            cache.store("/path/nb.py", "hash1", "de", "python", nb)
+
+            (fmt,) = cache.conn.execute("SELECT payload_format FROM executed_notebooks").fetchone()
+            assert fmt == SPLIT_PAYLOAD_FORMAT
+            assert cache.get_raw("/path/nb.py", "hash1", "de", "python") == serialize_notebook(nb)
+            cached = cache.get("/path/nb.py", "hash1", "de", "python")
+            assert cached.cells[0]["outputs"][0]["data"]["image/png"] == plot_image
+
+    def test_outputs_shared_between_languages_are_stored_once(self, temp_db_path, plot_image):
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            cache.store("/path/nb.py", "h", "de", "python", _plot_notebook("de", plot_image))
+            cache.store("/path/nb.py", "h", "en", "python", _plot_notebook("en", plot_image))
+
+            stats = cache.get_stats()
+            # One image and one stream, shared by both rows.
+            assert stats["output_blobs"] == 2
+            full_size = 2 * len(serialize_notebook(_plot_notebook("de", plot_image)))
+            assert stats["stored_bytes"] < full_size * 0.6
+
+    def test_replacing_an_entry_drops_blobs_only_it_used(self, temp_db_path, plot_image):
+        other_image = base64.b64encode(os.urandom(6000)).decode("ascii")
+        replacement = _plot_notebook("de", other_image)
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            cache.store("/path/nb.py", "h", "de", "python", _plot_notebook("de", plot_image))
+            cache.store("/path/nb.py", "h", "de", "python", replacement)
+
+            assert cache.get_stats()["output_blobs"] == 2
+            raw = cache.get_raw("/path/nb.py", "h", "de", "python")
+            assert raw == serialize_notebook(replacement)
+
+    def test_missing_blob_reads_as_a_miss(self, temp_db_path, plot_image):
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            cache.store("/path/nb.py", "h", "de", "python", _plot_notebook("de", plot_image))
+            cache.conn.execute("DELETE FROM executed_notebook_outputs")
+            cache.conn.commit()
+
+            assert cache.get_raw("/path/nb.py", "h", "de", "python") is None
+            assert cache.get("/path/nb.py", "h", "de", "python") is None
+
+    def test_small_notebooks_stay_plain_json(self, temp_db_path, sample_notebook):
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            cache.store("/path/nb.py", "h", "de", "python", sample_notebook)
+
+            assert cache.get_stats()["output_blobs"] == 0
+            (fmt,) = cache.conn.execute("SELECT payload_format FROM executed_notebooks").fetchone()
+            assert fmt == PAYLOAD_FORMAT
+
+    def test_clear_removes_unreferenced_blobs(self, temp_db_path, plot_image):
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            cache.store("/path/a.py", "h", "de", "python", _plot_notebook("de", plot_image))
+            cache.store("/path/b.py", "h", "de", "python", _plot_notebook("de", plot_image))
+
+            cache.clear(input_file="/path/a.py")
+            assert cache.get_stats()["output_blobs"] == 2  # still used by b.py
+            cache.clear()
+            assert cache.get_stats()["output_blobs"] == 0
+
+
+class TestCollectGarbage:
+    def test_sweeps_blobs_of_rows_deleted_elsewhere(self, temp_db_path, plot_image):
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            cache.store("/path/nb.py", "h", "de", "python", _plot_notebook("de", plot_image))
+            # e.g. the path migration dropping a colliding row
+            cache.conn.execute("DELETE FROM executed_notebooks")
+            cache.conn.commit()
+
+            result = cache.collect_garbage()
+
+            assert result == {"evicted_entries": 0, "deleted_blobs": 2, "stored_bytes": 0}
+
+    def test_evicts_oldest_entries_over_budget(self, temp_db_path, plot_image):
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            for i in range(3):
+                image = base64.b64encode(os.urandom(6000)).decode("ascii")
+                cache.store(f"/path/nb{i}.py", "h", "de", "python", _plot_notebook("de", image))
+                cache.conn.execute(
+                    "UPDATE executed_notebooks SET created_at = ? WHERE input_file = ?",
+                    (f"2026-01-0{i + 1} 00:00:00", f"/path/nb{i}.py"),
+                )
+            cache.conn.commit()
+            budget = cache.get_stats()["stored_bytes"] - 1
+
+            result = cache.collect_garbage(max_bytes=budget)
+
+            assert result["evicted_entries"] == 1
+            assert result["stored_bytes"] == cache.get_stats()["stored_bytes"] <= budget
+            assert cache.get("/path/nb0.py", "h", "de", "python") is None
+            assert cache.get("/path/nb2.py", "h", "de", "python") is not None
+
+    def test_without_budget_keeps_everything_referenced(self, temp_db_path, plot_image):
+        with ExecutedNotebookCache(temp_db_path) as cache:
+            cache.store("/path/nb.py", "h", "de", "python", _plot_notebook("de", plot_image))
+
+            assert cache.collect_garbage()["evicted_entries"] == 0
+            assert cache.get("/path/nb.py", "h", "de", "python") is not None
@@ -100,3 +100,26 @@ class TestRecordAndQuery:
 
         monkeypatch.setattr(store, "_connect", explode)
         store.record_event(_event())  # must not raise
+
+
+class TestImportEvents:
+    def test_imported_events_keep_their_timestamps(self, tmp_path):
+        source = ExecutionTelemetryStore(tmp_path / "run.db")
+        source.record_event(_event())
+        source.record_event(_event(outcome="failed", classification="deterministic"))
+        recorded = source.events()
+
+        target = ExecutionTelemetryStore(tmp_path / "telemetry.db")
+        target.record_event(_event(input_file="C:/course/slides_other.py"))
+        assert target.import_events(list(reversed(recorded))) == 2
+
+        imported = target.events(input_file="C:/course/slides_flaky.py")
+        assert [(e.outcome, e.created_at) for e in imported] == [
+            (e.outcome, e.created_at) for e in recorded
+        ]
+        assert imported[0].attempts_detail == [{"attempt": 1, "failure_type": "dead_kernel"}]
+
+    def test_nothing_to_import_leaves_the_db_alone(self, tmp_path):
+        store = ExecutionTelemetryStore(tmp_path / "telemetry.db")
+        assert store.import_events([]) == 0
+        assert not (tmp_path / "telemetry.db").exists()
@@ -0,0 +1,211 @@
+"""Tests for archiving finished jobs and rolling up worker events."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from clm.infrastructure.database.job_archive import JobArchiver
+from clm.infrastructure.database.job_queue import JobQueue
+from clm.infrastructure.database.schema import init_database
+
+
+@pytest.fixture
+def job_queue(tmp_path):
+    db_path = tmp_path / "jobs.db"
+    init_database(db_path)
+    queue = JobQueue(db_path)
+    yield queue
+    queue.close()
+
+
+def _finished_job(
+    job_queue: JobQueue, session_id: str | None, *, status="completed", age="-2 hours"
+):
+    job_id = job_queue.add_job(
+        job_type="notebook",
+        input_file="deck.py",
+        output_file=f"deck-{session_id}.html",
+        content_hash="h",
+        payload={"data": "x" * 100},
+    )
+    job_queue._get_conn().execute(
+        "UPDATE jobs SET status = ?, session_id = ?, completed_at = datetime('now', ?), "
+        "cancelled_at = CASE WHEN ? = 'cancelled' THEN datetime('now', ?) END WHERE id = ?",
+        (status, session_id, age, status, age, job_id),
+    )
+    return job_id
+
+
+def _live_worker(job_queue: JobQueue, session_id: str) -> int:
+    cursor = job_queue._get_conn().execute(
+        "INSERT INTO workers (worker_type, container_id, status, session_id) "
+        "VALUES ('notebook', ?, 'idle', ?)",
+        (f"worker-{session_id}", session_id),
+    )
+    return cursor.lastrowid
+
+
+def _event(job_queue: JobQueue, session_id: str | None, age="-2 hours"):
+    job_queue._get_conn().execute(
+        "INSERT INTO worker_events (event_type, worker_type, session_id, created_at) "
+        "VALUES ('worker_ready', 'notebook', ?, datetime('now', ?))",
+        (session_id, age),
+    )
+
+
+def _ids(job_queue: JobQueue, table: str) -> set[int]:
+    return {row[0] for row in job_queue._get_conn().execute(f"SELECT id FROM {table}")}
+
+
+class TestArchiveFinishedJobs:
+    def test_moves_past_sessions_jobs_without_payload(self, job_queue):
+        job_id = _finished_job(job_queue, "old")
+
+        assert job_queue.archive_finished_jobs(current_session_id="cur") == 1
+
+        assert _ids(job_queue, "jobs") == set()
+        row = job_queue._get_conn().execute("SELECT * FROM jobs_archive").fetchone()
+        assert row["id"] == job_id and row["status"] == "completed"
+        assert "payload" not in row.keys()
+
+    def test_keeps_current_and_live_sessions(self, job_queue):
+        current = _finished_job(job_queue, "cur")
+        live = _finished_job(job_queue, "live")
+        _live_worker(job_queue, "live")
+
+        assert job_queue.archive_finished_jobs(current_session_id="cur") == 0
+        assert _ids(job_queue, "jobs") == {current, live}
+
+    def test_keeps_recent_failed_and_unfinished_jobs(self, job_queue):
+        recent = _finished_job(job_queue, "old", age="-5 minutes")
+        failed = _finished_job(job_queue, "old", status="failed")
+        pending = job_queue.add_job(
+            job_type="notebook",
+            input_file="p.py",
+            output_file="p.html",
+            content_hash="h",
+            payload={},
+        )
+
+        assert job_queue.archive_finished_jobs(min_age_minutes=60) == 0
+        assert _ids(job_queue, "jobs") == {recent, failed, pending}
+
+    def test_archives_cancelled_jobs(self, job_queue):
+        job_id = _finished_job(job_queue, "old", status="cancelled")
+
+        assert job_queue.archive_finished_jobs() == 1
+        assert _ids(job_queue, "jobs_archive") == {job_id}
+
+    def test_works_in_bounded_batches(self, job_queue):
+        for _ in range(5):
+            _finished_job(job_queue, "old")
+
+        assert job_queue.archive_finished_jobs(batch_size=2) == 2
+        assert job_queue.archive_finished_jobs(batch_size=2) == 2
+        assert job_queue.archive_finished_jobs(batch_size=2) == 1
+        assert job_queue.archive_finished_jobs(batch_size=2) == 0
+
+
+class TestRollUpWorkerEvents:
+    def test_rolls_up_past_sessions_per_type(self, job_queue):
+        _event(job_queue, "old", age="-3 hours")
+        _event(job_queue, "old", age="-2 hours")
+        _event(job_queue, None)
+
+        assert job_queue.roll_up_worker_events() == 3
+
+        summaries = {
+            row["session_id"]: row["event_count"]
+            for row in job_queue._get_conn().execute("SELECT * FROM worker_event_summaries")
+        }
+        assert summaries == {"old": 2, "": 1}
+        assert _ids(job_queue, "worker_events") == set()
+
+    def test_repeated_rollups_accumulate(self, job_queue):
+        _event(job_queue, "old")
+        job_queue.roll_up_worker_events()
+        _event(job_queue, "old")
+        job_queue.roll_up_worker_events()
+
+        (count,) = (
+            job_queue._get_conn()
+            .execute("SELECT event_count FROM worker_event_summaries WHERE session_id = 'old'")
+            .fetchone()
+        )
+        assert count == 2
+
+    def test_keeps_live_session_events(self, job_queue):
+        _live_worker(job_queue, "live")
+        _event(job_queue, "live")
+
+        assert job_queue.roll_up_worker_events() == 0
+
+
+def test_clear_stale_heartbeats_keeps_live_workers(job_queue):
+    live = _live_worker(job_queue, "live")
+    conn = job_queue._get_conn()
+    conn.execute("INSERT INTO worker_heartbeats (worker_id) VALUES (?)", (live,))
+    conn.execute("INSERT INTO worker_heartbeats (worker_id) VALUES (?)", (live + 100,))
+
+    assert job_queue.clear_stale_heartbeats() == 1
+    assert [row[0] for row in conn.execute("SELECT worker_id FROM worker_heartbeats")] == [live]
+
+
+def test_clear_old_archive(job_queue):
+    _finished_job(job_queue, "old")
+    job_queue.archive_finished_jobs()
+    job_queue._get_conn().execute(
+        "UPDATE jobs_archive SET archived_at = datetime('now', '-100 days')"
+    )
+
+    assert job_queue.clear_old_archive(None) == 0
+    assert job_queue.clear_old_archive(90) == 1
+
+
+class TestJobArchiver:
+    def test_run_once_drains_all_tables(self, job_queue):
+        for _ in range(5):
+            _finished_job(job_queue, "old")
+        _event(job_queue, "old")
+
+        archiver = JobArchiver(job_queue.db_path, current_session_id="cur", batch_size=2)
+        result = archiver.run_once(job_queue)
+
+        assert result == {"archived_jobs": 5, "rolled_up_events": 1, "stale_heartbeats": 0}
+
+    def test_pass_is_bounded(self, job_queue):
+        for _ in range(5):
+            _finished_job(job_queue, "old")
+
+        archiver = JobArchiver(job_queue.db_path, batch_size=2, max_batches_per_pass=1)
+
+        assert archiver.run_once(job_queue)["archived_jobs"] == 2
+
+    def test_background_thread_archives_and_stops(self, job_queue):
+        _finished_job(job_queue, "old")
+        archiver = JobArchiver(Path(job_queue.db_path), interval=0.01)
+
+        archiver.start()
+        try:
+            for _ in range(200):
+                if _ids(job_queue, "jobs") == set():
+                    break
+                threading.Event().wait(0.01)
+        finally:
+            archiver.stop()
+
+        assert _ids(job_queue, "jobs") == set()
+        assert archiver._thread is None
+
+    def test_direct_pass_runs_after_stop(self, job_queue):
+        # The backend stops the thread first, then runs the build-end pass.
+        _finished_job(job_queue, "old")
+        archiver = JobArchiver(Path(job_queue.db_path))
+        archiver.start()
+        archiver.stop()
+
+        _finished_job(job_queue, "old")
+        archiver.run_once(job_queue)
+
+        assert _ids(job_queue, "jobs") == set()
@@ -788,6 +788,32 @@ class TestMigrateDatabase:
         finally:
             conn.close()
 
+    def test_init_database_adds_v12_archive_tables_to_existing_v11_db(self, tmp_path):
+        """An existing v11 database gains the job archive and event summary tables."""
+        db_path = tmp_path / "test.db"
+        init_database(db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute("DELETE FROM schema_version WHERE version >= 12")
+            conn.execute("DROP TABLE jobs_archive")
+            conn.execute("DROP TABLE worker_event_summaries")
+            conn.commit()
+        finally:
+            conn.close()
+
+        init_database(db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        try:
+            tables = {
+                row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            }
+            assert {"jobs_archive", "worker_event_summaries"} <= tables
+            assert get_schema_version(conn) == 12
+        finally:
+            conn.close()
+
     def test_init_database_adds_v9_indexes_to_existing_v8_db(self, tmp_path):
         """init_database upgrades a pre-v9 database in place.
 
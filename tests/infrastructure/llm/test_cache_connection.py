@@ -0,0 +1,172 @@
+"""Tests for the pooled connection and batched writes behind the LLM caches."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from clm.infrastructure.llm import cache as cache_module
+from clm.infrastructure.llm.cache import (
+    CoverageCache,
+    SummaryCache,
+    TitleSuggestionCache,
+    TranslationCache,
+)
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "clm-llm.sqlite"
+
+
+@pytest.fixture
+def no_timer(monkeypatch):
+    """Keep the flush timer out of the way so tests control when rows commit."""
+    monkeypatch.setattr(cache_module, "WRITE_FLUSH_INTERVAL", 3600.0)
+
+
+def _stored_rows(path: Path, table: str) -> int:
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSharedConnection:
+    def test_caches_on_one_file_share_a_connection(self, path):
+        titles = TitleSuggestionCache(path)
+        coverage = CoverageCache(path)
+        try:
+            assert titles._db is coverage._db
+        finally:
+            titles.close()
+            coverage.close()
+
+    def test_last_close_releases_the_connection(self, path):
+        first = TranslationCache(path)
+        second = TranslationCache(path)
+        first.close()
+        assert str(path.resolve()) in cache_module._CacheConnection._open
+        second.close()
+        assert str(path.resolve()) not in cache_module._CacheConnection._open
+
+    def test_uses_wal_journal(self, path):
+        cache = SummaryCache(path)
+        try:
+            assert cache._db.query("PRAGMA journal_mode") == [("wal",)]
+        finally:
+            cache.close()
+
+    def test_close_is_idempotent(self, path):
+        cache = CoverageCache(path)
+        cache.close()
+        cache.close()
+
+
+class TestBatchedWrites:
+    def test_put_is_staged_until_flush(self, path, no_timer):
+        cache = TranslationCache(path)
+        try:
+            cache.put("h1", "v1", "de", "en", "markdown", "Hello")
+            assert cache.get("h1", "v1", "de", "en", "markdown") == "Hello"
+            assert _stored_rows(path, "translations") == 0
+
+            cache.flush()
+            assert _stored_rows(path, "translations") == 1
+        finally:
+            cache.close()
+
+    def test_close_commits_staged_rows(self, path, no_timer):
+        cache = SummaryCache(path)
+        cache.put("h1", "client", "m1", "Summary")
+        cache.close()
+        assert _stored_rows(path, "summaries") == 1
+
+    def test_pending_limit_forces_a_commit(self, path, no_timer, monkeypatch):
+        monkeypatch.setattr(cache_module, "MAX_PENDING_WRITES", 3)
+        cache = TitleSuggestionCache(path)
+        try:
+            cache.put("h1", "v1", "One")
+            cache.put("h1", "v1", "One again")  # same key: still one staged row
+            cache.put("h2", "v1", "Two")
+            assert _stored_rows(path, "title_suggestions") == 0
+            cache.put("h3", "v1", "Three")
+            assert _stored_rows(path, "title_suggestions") == 3
+            assert cache.get("h1", "v1") == "One again"
+        finally:
+            cache.close()
+
+    def test_timer_commits_staged_rows(self, path, monkeypatch):
+        monkeypatch.setattr(cache_module, "WRITE_FLUSH_INTERVAL", 0.01)
+        cache = CoverageCache(path)
+        try:
+            cache.put("sh", "vh", "v1", "en", "covered", None)
+            deadline = time.monotonic() + 5
+            while _stored_rows(path, "coverage") == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert _stored_rows(path, "coverage") == 1
+        finally:
+            cache.close()
+
+    def test_invalidation_also_drops_staged_rows(self, path, no_timer):
+        cache = TranslationCache(path)
+        try:
+            cache.put("h1", "v1", "de", "en", "markdown", "old")
+            cache.put("h2", "v2", "de", "en", "markdown", "new")
+            assert cache.invalidate_prompt_version("v2") == 1
+            assert cache.get("h1", "v1", "de", "en", "markdown") is None
+            assert cache.get("h2", "v2", "de", "en", "markdown") == "new"
+        finally:
+            cache.close()
+
+
+class TestGetMany:
+    def test_returns_hits_from_disk_and_staging(self, path, no_timer):
+        cache = SummaryCache(path)
+        try:
+            cache.put("stored", "client", "m1", "From disk")
+            cache.flush()
+            cache.put("staged", "client", "m1", "From staging")
+
+            hits = cache.get_many(
+                [
+                    ("stored", "client", "m1", "en", "prose"),
+                    ("staged", "client", "m1", "en", "prose"),
+                    ("missing", "client", "m1", "en", "prose"),
+                    ("stored", "trainer", "m1", "en", "prose"),
+                ]
+            )
+
+            assert hits == {
+                ("stored", "client", "m1", "en", "prose"): "From disk",
+                ("staged", "client", "m1", "en", "prose"): "From staging",
+            }
+        finally:
+            cache.close()
+
+    def test_spans_several_query_chunks(self, path, monkeypatch):
+        monkeypatch.setattr(cache_module, "_GET_MANY_CHUNK", 7)
+        cache = CoverageCache(path)
+        try:
+            for i in range(20):
+                cache.put(f"sh{i}", "vh", "v1", "en", "covered", None)
+            cache.flush()
+
+            keys = [(f"sh{i}", "vh", "v1", "en") for i in range(25)]
+            hits = cache.get_many(keys)
+
+            assert set(hits) == set(keys[:20])
+            assert hits[("sh3", "vh", "v1", "en")] == ("covered", None)
+        finally:
+            cache.close()
+
+    def test_empty_request(self, path):
+        cache = TitleSuggestionCache(path)
+        try:
+            assert cache.get_many([]) == {}
+        finally:
+            cache.close()
@@ -312,3 +312,71 @@ class TestMergePreserveSequence:
         merged = cf.load_interactions(canonical)
         bodies = [resp["body"]["string"] for _, resp in merged]
         assert [b if isinstance(b, bytes) else b.encode() for b in bodies] == [b"R1", b"R2"]
+
+
+class TestMergeWithIndex:
+    """Merging through the parsed-cassette index writes the same bytes.
+
+    The index lets the merge skip re-parsing canonical and splice appended
+    interactions onto its text; both are only acceptable if the canonical
+    cassette ends up byte-identical to the index-free merge.
+    """
+
+    @staticmethod
+    def _interaction(cf, url, resp_body):
+        request = cf.vcr_request_from_parts("POST", url, [(b"content-type", b"text/plain")], b"q")
+        response = cf.vcr_response_dict_from_parts(
+            200, "OK", [(b"content-type", b"text/plain")], resp_body
+        )
+        return request, response
+
+    def _merge(self, cf, canonical, staging_pairs, index, **kwargs):
+        staging = canonical.parent / f"{canonical.name}.staging-mitm-{len(staging_pairs)}"
+        cf.write_cassette(staging, staging_pairs)
+        paths = CassettePaths(canonical=canonical, staging=staging)
+        write_completion_marker(paths)
+        return merge_staging_into_canonical(paths, index=index, **kwargs)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"preserve_sequence": True},
+            {"overwrite_existing": True},
+            {"overwrite_existing": True, "preserve_sequence": True},
+        ],
+    )
+    def test_successive_merges_match_index_free_merges(self, tmp_path, kwargs):
+        cf = pytest.importorskip("clm.infrastructure.http_replay_mitm.cassette_format")
+        ci = pytest.importorskip("clm.infrastructure.http_replay_mitm.cassette_index")
+        index = ci.CassetteIndex(tmp_path / "index.sqlite")
+        with_index = tmp_path / "a" / "slides.http-cassette.yaml"
+        without_index = tmp_path / "b" / "slides.http-cassette.yaml"
+        rounds = [
+            [self._interaction(cf, "https://o.ai/1", b"R1")],
+            [self._interaction(cf, "https://o.ai/2", "Antwort über".encode())],
+            [
+                self._interaction(cf, "https://o.ai/1", b"R1-again"),
+                self._interaction(cf, "https://o.ai/3", bytes(range(256))),
+            ],
+        ]
+
+        for staging_pairs in rounds:
+            assert self._merge(cf, with_index, staging_pairs, index, **kwargs) == 1
+            assert self._merge(cf, without_index, staging_pairs, None, **kwargs) == 1
+            assert with_index.read_bytes() == without_index.read_bytes()
+        index.close()
+
+    def test_merged_cassette_is_indexed_for_replay(self, tmp_path):
+        cf = pytest.importorskip("clm.infrastructure.http_replay_mitm.cassette_format")
+        ci = pytest.importorskip("clm.infrastructure.http_replay_mitm.cassette_index")
+        index = ci.CassetteIndex(tmp_path / "index.sqlite")
+        canonical = tmp_path / "slides.http-cassette.yaml"
+
+        self._merge(cf, canonical, [self._interaction(cf, "https://o.ai/1", b"R1")], index)
+        loaded = ci.read_cassette(canonical, index)
+        index.close()
+
+        assert loaded.from_index
+        assert loaded.canonical
+        assert [req.uri for req in loaded.requests] == ["https://o.ai/1"]
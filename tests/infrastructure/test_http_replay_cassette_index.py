@@ -0,0 +1,199 @@
+"""Tests for the parsed-cassette index (``cassette_index``).
+
+The index may only ever be a faster way to get what the YAML parse
+returns: every test here compares against the plain ``load_cassette`` /
+``serialize_cassette`` result rather than against hand-written values.
+"""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from clm.infrastructure.http_replay_mitm import cassette_format as cf
+from clm.infrastructure.http_replay_mitm import cassette_index as ci
+from clm.infrastructure.http_replay_mitm import vcr_format as vf
+
+GOLDEN = Path(__file__).parent / "fixtures" / "golden.http-cassette.yaml"
+
+
+def _interaction(uri, resp_body, req_body=b'{"q": 1}'):
+    request = cf.vcr_request_from_parts(
+        "POST", uri, [(b"content-type", b"application/json"), (b"X-Trace", b"t")], req_body
+    )
+    response = cf.vcr_response_dict_from_parts(
+        200, "OK", [(b"content-type", b"application/json")], resp_body
+    )
+    return request, response
+
+
+def _pairs(n, start=0):
+    return [
+        _interaction(f"https://o.ai/v1/c?i={i}", f'{{"text": "Antwort {i} über"}}'.encode())
+        for i in range(start, start + n)
+    ]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = ci.CassetteIndex(tmp_path / "index.sqlite")
+    yield index
+    index.close()
+
+
+def _as_yaml(requests, responses):
+    return cf.serialize_interactions(list(zip(requests, responses, strict=False)))
+
+
+class TestReadCassette:
+    def test_miss_parses_and_stores(self, tmp_path, index):
+        path = tmp_path / "c.http-cassette.yaml"
+        cf.write_cassette(path, _pairs(3))
+
+        first = ci.read_cassette(path, index)
+        second = ci.read_cassette(path, index)
+
+        assert not first.from_index
+        assert second.from_index
+        assert not second.canonical
+        assert second.responses == first.responses
+        assert [r.headers for r in second.requests] == [r.headers for r in first.requests]
+
+    def test_index_hit_reserializes_byte_identically(self, tmp_path, index):
+        path = tmp_path / "golden.http-cassette.yaml"
+        path.write_bytes(GOLDEN.read_bytes())
+        ci.read_cassette(path, index)
+
+        hit = ci.read_cassette(path, index)
+
+        assert hit.from_index
+        assert _as_yaml(hit.requests, hit.responses) == GOLDEN.read_text(encoding="utf-8")
+
+    def test_binary_and_text_bodies_keep_their_types(self, tmp_path, index):
+        path = tmp_path / "c.http-cassette.yaml"
+        cf.write_cassette(path, [_interaction("https://o.ai/bin", bytes(range(256)), b"")])
+        requests, responses = vf.load_cassette(path)
+        ci.read_cassette(path, index)
+
+        hit = ci.read_cassette(path, index)
+
+        assert hit.responses == responses
+        assert hit.requests[0].body == requests[0].body
+        assert hit.text == path.read_text(encoding="utf-8")
+
+    def test_edited_cassette_misses(self, tmp_path, index):
+        path = tmp_path / "c.http-cassette.yaml"
+        cf.write_cassette(path, _pairs(2))
+        ci.read_cassette(path, index)
+
+        cf.write_cassette(path, _pairs(3))
+        reread = ci.read_cassette(path, index)
+
+        assert not reread.from_index
+        assert len(reread.requests) == 3
+
+    def test_unindexable_cassette_still_loads(self, tmp_path, index):
+        # A hand-written timestamp resolves to a datetime under the safe
+        # loader; JSON cannot carry it, so the cassette is parsed every time.
+        text = cf.serialize_interactions(_pairs(1)).replace(
+            "message: OK", "message: 2024-01-01 10:00:00"
+        )
+        path = tmp_path / "c.http-cassette.yaml"
+        path.write_text(text, encoding="utf-8")
+
+        ci.read_cassette(path, index)
+        again = ci.read_cassette(path, index)
+
+        assert not again.from_index
+        assert again.responses == vf.load_cassette(path)[1]
+
+    def test_dollar_keys_round_trip(self):
+        request, response = _interaction("https://o.ai/x", b"{}")
+        response["extra"] = {"$u": "not a tag", "$d": [1, None, True]}
+
+        entry = ci.encode_interactions([request], [response])
+        _, decoded = ci.decode_interactions(entry)
+
+        assert decoded == [response]
+
+    def test_corrupt_entry_falls_back_to_yaml(self, tmp_path, index):
+        path = tmp_path / "c.http-cassette.yaml"
+        cf.write_cassette(path, _pairs(2))
+        index.put(ci.cassette_digest(path.read_bytes()), b"garbage")
+
+        loaded = ci.read_cassette(path, index)
+
+        assert not loaded.from_index
+        assert len(loaded.requests) == 2
+
+    def test_missing_file_raises_like_load_cassette(self, tmp_path, index):
+        with pytest.raises(vf.CassetteNotFoundError):
+            ci.read_cassette(tmp_path / "absent.yaml", index)
+
+    def test_load_interactions_uses_the_index(self, tmp_path, index):
+        path = tmp_path / "c.http-cassette.yaml"
+        cf.write_cassette(path, _pairs(2))
+
+        plain = cf.load_interactions(path)
+        indexed = cf.load_interactions(path, index)
+        again = cf.load_interactions(path, index)
+
+        assert cf.serialize_interactions(again) == cf.serialize_interactions(plain)
+        assert cf.serialize_interactions(indexed) == cf.serialize_interactions(plain)
+
+
+class TestAppendSerialized:
+    def test_matches_full_serialization(self):
+        existing, added = _pairs(4), _pairs(3, start=4)
+        text = cf.serialize_interactions(existing)
+        expected = cf.serialize_interactions(existing + added)
+        added = copy.deepcopy(added)
+
+        spliced = ci.append_serialized(text, [req for req, _ in added], [resp for _, resp in added])
+
+        assert spliced == expected
+
+    def test_nothing_to_append_returns_text(self):
+        text = cf.serialize_interactions(_pairs(2))
+
+        assert ci.append_serialized(text, [], []) == text
+
+    def test_empty_document_is_not_spliced(self):
+        text = cf.serialize_interactions([])
+        added = _pairs(1)
+
+        assert ci.append_serialized(text, [added[0][0]], [added[0][1]]) is None
+
+    def test_anchors_force_reserialization(self):
+        text = cf.serialize_interactions(_pairs(1))
+        request, response = _pairs(1, start=1)[0]
+        shared = ["application/json"]
+        response["headers"] = {"content-type": shared, "x-copy": shared}
+
+        assert ci.append_serialized(text, [request], [response]) is None
+
+
+class TestEviction:
+    def test_least_recently_used_entries_go_first(self, tmp_path, monkeypatch):
+        clock = iter(range(100))
+        monkeypatch.setattr(ci.time, "time", lambda: next(clock))
+        index = ci.CassetteIndex(tmp_path / "index.sqlite", max_bytes=25)
+        try:
+            index.put("a", b"x" * 10)
+            index.put("b", b"x" * 10)
+            index.get("a")
+            index.put("c", b"x" * 10)
+
+            assert index.get("a") is not None
+            assert index.get("b") is None
+            assert index.get("c") is not None
+        finally:
+            index.close()
+
+    def test_missing_index_file_is_a_miss(self, tmp_path):
+        index = ci.CassetteIndex(tmp_path / "absent.sqlite")
+
+        assert index.get("digest") is None
+        assert not (tmp_path / "absent.sqlite").exists()
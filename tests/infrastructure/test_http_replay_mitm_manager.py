@@ -241,6 +241,13 @@ class TestStartCommandTraceDir:
         cmd = self._captured_cmd(monkeypatch)
         assert not any("clm_trace_dir=" in str(part) for part in cmd)
 
+    def test_index_path_adds_clm_cassette_index_set(self, monkeypatch, tmp_path) -> None:
+        index = tmp_path / "index.sqlite"
+        cmd = self._captured_cmd(monkeypatch, index_path=index)
+        assert any(str(part) == f"clm_cassette_index={index}" for part in cmd)
+        bare = self._captured_cmd(monkeypatch)
+        assert not any("clm_cassette_index=" in str(part) for part in bare)
+
 
 def _raise_oserror(*_args, **_kwargs):
     """Stand-in for ``socket.create_connection`` that always refuses."""
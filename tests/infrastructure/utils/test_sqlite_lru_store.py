@@ -0,0 +1,87 @@
+"""Tests for :mod:`clm.infrastructure.utils.sqlite_lru_store`."""
+
+from __future__ import annotations
+
+import itertools
+from pathlib import Path
+
+from clm.infrastructure.utils.sqlite_lru_store import SqliteLruStore
+
+_clock = itertools.count()
+
+
+class _Store(SqliteLruStore):
+    TABLE = "entries"
+    KEY_COLUMNS = ("name",)
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        name TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        accessed_at REAL NOT NULL
+    );
+    """
+
+    def put(self, name: str, size: int) -> int:
+        with self._lock:
+            conn = self._connect(create=True)
+            with conn:
+                return self._upsert_locked(conn, (name,), {"accessed_at": next(_clock)}, size)
+
+    def names(self) -> list[str]:
+        with self._lock:
+            conn = self._connect(create=True)
+            return [name for (name,) in conn.execute("SELECT name FROM entries ORDER BY name")]
+
+
+def test_nothing_is_created_before_the_first_write(tmp_path: Path):
+    store = _Store(tmp_path / "sub" / "store.db", max_bytes=10)
+
+    assert store._connect(create=False) is None
+    assert not (tmp_path / "sub").exists()
+
+
+def test_least_recently_accessed_rows_are_evicted(tmp_path: Path):
+    store = _Store(tmp_path / "store.db", max_bytes=10)
+    store.put("a", 4)
+    store.put("b", 4)
+
+    assert store.put("c", 4) == 1
+    assert store.names() == ["b", "c"]
+
+
+def test_replacing_a_row_counts_only_its_new_size(tmp_path: Path):
+    store = _Store(tmp_path / "store.db", max_bytes=10)
+    store.put("a", 4)
+    store.put("b", 4)
+
+    assert store.put("b", 6) == 0
+    assert store.names() == ["a", "b"]
+
+
+def test_the_new_row_is_never_evicted(tmp_path: Path):
+    store = _Store(tmp_path / "store.db", max_bytes=10)
+    store.put("a", 4)
+
+    assert store.put("big", 20) == 1
+    assert store.names() == ["big"]
+
+
+def test_writes_from_another_store_are_seen_at_the_bound(tmp_path: Path):
+    path = tmp_path / "store.db"
+    first, second = _Store(path, max_bytes=10), _Store(path, max_bytes=10)
+    first.put("a", 4)
+    second.put("b", 4)
+
+    # first's running total misses b, so c alone does not trigger eviction;
+    # once the total crosses the bound the real sum is re-read.
+    assert first.put("c", 4) == 0
+    assert first.put("d", 4) == 2
+    assert first.names() == ["c", "d"]
+
+
+def test_unbounded_store_never_evicts(tmp_path: Path):
+    store = _Store(tmp_path / "store.db", max_bytes=None)
+    for name in "abc":
+        store.put(name, 100)
+
+    assert store.names() == ["a", "b", "c"]
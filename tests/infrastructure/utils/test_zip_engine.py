@@ -0,0 +1,134 @@
+"""Tests for the parallel, incremental ZIP writer."""
+
+import os
+import random
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from clm.infrastructure.utils import zip_engine
+from clm.infrastructure.utils.zip_engine import ZipSource, write_zip
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "src"
+    (root / "nb").mkdir(parents=True)
+    (root / "img").mkdir()
+    for i in range(20):
+        (root / "nb" / f"{i:02}.ipynb").write_text(f'{{"cell": {i}}}\n' * (50 + i))
+    rng = random.Random(0)
+    (root / "img" / "photo.jpg").write_bytes(rng.randbytes(5000))
+    (root / "img" / "noise.bin").write_bytes(rng.randbytes(3000))
+    (root / "tiny.txt").write_text("hi")
+    (root / "ümlaut.txt").write_text("non-ascii name " * 10)
+    return root
+
+
+def _sources(root: Path) -> list[ZipSource]:
+    files = sorted(p for p in root.rglob("*") if p.is_file())
+    return [ZipSource(p, f"course/{p.relative_to(root).as_posix()}") for p in files]
+
+
+def _reference_zip(root: Path, archive: Path) -> None:
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+        for source in _sources(root):
+            zf.write(source.path, source.arcname)
+
+
+class TestWriteZip:
+    def test_round_trips_every_member(self, tree: Path, tmp_path: Path):
+        archive = tmp_path / "out.zip"
+        stats = write_zip(_sources(tree), archive, jobs=4)
+
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist() == [s.arcname for s in _sources(tree)]
+            for source in _sources(tree):
+                assert zf.read(source.arcname) == source.path.read_bytes()
+                info = zf.getinfo(source.arcname)
+                expected = zipfile.ZipInfo.from_file(source.path).date_time
+                # DOS timestamps have two-second resolution, as with zipfile.
+                assert info.date_time == (*expected[:5], expected[5] // 2 * 2)
+        assert stats.members == 24
+        assert stats.reused == 0
+
+    def test_storage_policy(self, tree: Path, tmp_path: Path):
+        archive = tmp_path / "out.zip"
+        write_zip(_sources(tree), archive)
+        with zipfile.ZipFile(archive) as zf:
+            methods = {info.filename: info.compress_type for info in zf.infolist()}
+        assert methods["course/nb/00.ipynb"] == zipfile.ZIP_DEFLATED
+        assert methods["course/img/photo.jpg"] == zipfile.ZIP_STORED
+        # Random bytes do not deflate smaller, so they are stored too.
+        assert methods["course/img/noise.bin"] == zipfile.ZIP_STORED
+        assert methods["course/tiny.txt"] == zipfile.ZIP_STORED
+
+    def test_output_is_independent_of_thread_count(self, tree: Path, tmp_path: Path):
+        one, many = tmp_path / "one.zip", tmp_path / "many.zip"
+        write_zip(_sources(tree), one, jobs=1, reuse=False)
+        write_zip(_sources(tree), many, jobs=8, reuse=False)
+        assert one.read_bytes() == many.read_bytes()
+
+    def test_unchanged_members_are_reused_byte_identically(self, tree: Path, tmp_path: Path):
+        archive = tmp_path / "out.zip"
+        write_zip(_sources(tree), archive)
+        fresh = archive.read_bytes()
+
+        stats = write_zip(_sources(tree), archive)
+        assert stats.reused == stats.members == 24
+        assert archive.read_bytes() == fresh
+
+    def test_changed_member_is_recompressed(self, tree: Path, tmp_path: Path):
+        archive = tmp_path / "out.zip"
+        write_zip(_sources(tree), archive)
+        changed = tree / "nb" / "03.ipynb"
+        # Same size and mtime — only the CRC tells the edit apart.
+        stat = changed.stat()
+        changed.write_text(changed.read_text().replace("3", "4"))
+        os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        stats = write_zip(_sources(tree), archive)
+        assert stats.reused == 23
+        incremental = archive.read_bytes()
+        write_zip(_sources(tree), tmp_path / "fresh.zip", reuse=False)
+        assert incremental == (tmp_path / "fresh.zip").read_bytes()
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.read("course/nb/03.ipynb") == changed.read_bytes()
+
+    def test_reuses_members_of_a_zipfile_archive(self, tree: Path, tmp_path: Path):
+        """An archive written by ``zipfile`` (the old engine) seeds the reuse."""
+        archive = tmp_path / "out.zip"
+        _reference_zip(tree, archive)
+        stats = write_zip(_sources(tree), archive)
+        # Deflated text members carry over; stored-policy members were deflated
+        # by zipfile, so they are redone to match a fresh run.
+        assert stats.reused == 21
+        write_zip(_sources(tree), tmp_path / "fresh.zip", reuse=False)
+        assert archive.read_bytes() == (tmp_path / "fresh.zip").read_bytes()
+
+    def test_corrupt_previous_archive_is_ignored(self, tree: Path, tmp_path: Path):
+        archive = tmp_path / "out.zip"
+        archive.write_bytes(b"not a zip")
+        stats = write_zip(_sources(tree), archive)
+        assert stats.reused == 0
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.testzip() is None
+
+    def test_failure_leaves_previous_archive_in_place(self, tree: Path, tmp_path: Path):
+        archive = tmp_path / "out.zip"
+        write_zip(_sources(tree), archive)
+        before = archive.read_bytes()
+        sources = [*_sources(tree), ZipSource(tmp_path / "missing.txt", "course/missing.txt")]
+        with pytest.raises(FileNotFoundError):
+            write_zip(sources, archive)
+        assert archive.read_bytes() == before
+        assert sorted(p.name for p in tmp_path.iterdir() if p.suffix == ".tmp") == []
+
+    def test_large_members_spill_to_disk(self, tree: Path, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(zip_engine, "SPOOL_MAX", 64)
+        archive = tmp_path / "out.zip"
+        write_zip(_sources(tree), archive, jobs=3)
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.testzip() is None
@@ -0,0 +1,243 @@
+"""Tests for the queue-depth autoscaler and its pool-manager wiring.
+
+The controller is pure, so most tests feed it hand-written
+:class:`TypeLoad` snapshots tick by tick. The pool-manager tests use a real
+jobs database with a mock executor: they check that loads are read the way
+workers claim jobs and that draining never takes a worker holding a job.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from clm.infrastructure.database.job_queue import JobQueue
+from clm.infrastructure.database.schema import init_database
+from clm.infrastructure.workers import pool_size_cap
+from clm.infrastructure.workers.autoscaler import (
+    AutoscaleController,
+    AutoscalePolicy,
+    ScaleDecision,
+    TypeLoad,
+)
+from clm.infrastructure.workers.pool_manager import WorkerConfig, WorkerPoolManager
+
+
+def _policy(**overrides) -> AutoscalePolicy:
+    values = {"budget": 6, "max_per_type": 4, "scale_up_ticks": 2, "scale_down_ticks": 3}
+    values.update(overrides)
+    return AutoscalePolicy(**values)
+
+
+def _ticks(controller, loads, n, headroom=8) -> list[ScaleDecision]:
+    return [controller.decide(loads, headroom) for _ in range(n)]
+
+
+class TestAutoscaleController:
+    def test_backlog_must_persist_before_scaling_up(self):
+        controller = AutoscaleController(_policy(budget=8))
+        loads = {"notebook": TypeLoad(pending=20, workers=2, idle=0)}
+
+        first, second = _ticks(controller, loads, 2)
+
+        assert not first
+        assert second.start == {"notebook": 2}
+
+    def test_short_backlog_does_not_scale(self):
+        controller = AutoscaleController(_policy(budget=8))
+        # Two busy workers and four pending jobs: within backlog_per_worker.
+        loads = {"notebook": TypeLoad(pending=4, workers=2, idle=0)}
+        assert not any(_ticks(controller, loads, 5))
+
+    def test_idle_worker_means_not_starved(self):
+        controller = AutoscaleController(_policy(budget=8))
+        loads = {"notebook": TypeLoad(pending=20, workers=2, idle=1)}
+        assert not any(_ticks(controller, loads, 5))
+
+    def test_budget_exhausted_takes_idle_workers_from_other_types(self):
+        controller = AutoscaleController(_policy())
+        loads = {
+            "notebook": TypeLoad(pending=30, workers=2, idle=0),
+            "plantuml": TypeLoad(pending=0, workers=2, idle=2),
+            "drawio": TypeLoad(pending=0, workers=2, idle=2),
+        }
+
+        decisions = _ticks(controller, loads, 2)
+
+        assert decisions[-1].start == {"notebook": 2}
+        # Each donor keeps its floor of one worker.
+        assert decisions[-1].drain == {"plantuml": 1, "drawio": 1}
+
+    def test_donors_keep_their_floor(self):
+        controller = AutoscaleController(_policy(budget=3))
+        loads = {
+            "notebook": TypeLoad(pending=30, workers=1, idle=0),
+            "plantuml": TypeLoad(pending=0, workers=1, idle=1),
+            "drawio": TypeLoad(pending=0, workers=1, idle=1),
+        }
+        assert not any(_ticks(controller, loads, 4))
+
+    def test_busy_types_are_not_donors(self):
+        controller = AutoscaleController(_policy(budget=4))
+        loads = {
+            "notebook": TypeLoad(pending=30, workers=2, idle=0),
+            "plantuml": TypeLoad(pending=5, workers=2, idle=0),
+        }
+        assert not any(d.drain for d in _ticks(controller, loads, 4))
+
+    def test_memory_headroom_limits_scale_up(self):
+        controller = AutoscaleController(_policy(budget=8))
+        loads = {"notebook": TypeLoad(pending=20, workers=2, idle=0)}
+
+        decisions = _ticks(controller, loads, 2, headroom=1)
+        assert decisions[-1].start == {"notebook": 1}
+
+        controller = AutoscaleController(_policy(budget=8))
+        assert not any(_ticks(controller, loads, 4, headroom=0))
+
+    def test_max_per_type_is_respected(self):
+        controller = AutoscaleController(_policy(budget=10, max_per_type=3))
+        loads = {"notebook": TypeLoad(pending=50, workers=2, idle=0)}
+        assert _ticks(controller, loads, 2)[-1].start == {"notebook": 1}
+
+    def test_surplus_drains_after_hysteresis_down_to_floor(self):
+        controller = AutoscaleController(_policy(scale_down_ticks=3))
+        loads = {"plantuml": TypeLoad(pending=0, workers=3, idle=3)}
+
+        decisions = _ticks(controller, loads, 3)
+
+        assert not decisions[0] and not decisions[1]
+        assert decisions[2].drain == {"plantuml": 2}
+
+    def test_cooldown_after_acting(self):
+        controller = AutoscaleController(_policy(budget=10, max_per_type=10, cooldown_ticks=2))
+        loads = {"notebook": TypeLoad(pending=100, workers=2, idle=0)}
+
+        decisions = _ticks(controller, loads, 6)
+
+        acted = [i for i, d in enumerate(decisions) if d]
+        # Two ticks to qualify, act, then sit out two ticks (which count
+        # towards qualifying again) before acting once more.
+        assert acted == [1, 4]
+
+    def test_policy_for_counts_defaults_budget_to_total(self, monkeypatch):
+        monkeypatch.delenv("CLM_MAX_WORKERS", raising=False)
+        monkeypatch.setattr(pool_size_cap, "_compute_cpu_cap", lambda: 4)
+        monkeypatch.setattr(pool_size_cap, "_compute_mem_cap", lambda: 16)
+
+        policy = AutoscalePolicy.for_counts([4, 1, 1, 0])
+        assert (policy.budget, policy.max_per_type) == (6, 4)
+
+        assert AutoscalePolicy.for_counts([4, 1], budget=3).budget == 3
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "jobs.db"
+    init_database(path)
+    return path
+
+
+@pytest.fixture
+def manager(db_path, tmp_path):
+    configs = [
+        WorkerConfig(worker_type="notebook", execution_mode="direct", count=1),
+        WorkerConfig(worker_type="plantuml", execution_mode="direct", count=1),
+    ]
+    mgr = WorkerPoolManager(
+        db_path=db_path,
+        workspace_path=tmp_path,
+        worker_configs=configs,
+        session_id="s1",
+        max_startup_concurrency=2,
+    )
+    executor = MagicMock()
+    executor.start_worker.side_effect = lambda worker_type, index, config, db_worker_id: (
+        f"direct-{worker_type}-{index}"
+    )
+    executor.stop_worker.return_value = True
+    mgr.executors["direct"] = executor
+    yield mgr
+    mgr.running = False
+    mgr.close()
+
+
+def _add_job(jq: JobQueue, job_type: str, **kwargs) -> int:
+    return jq.add_job(
+        job_type=job_type,
+        input_file="in",
+        output_file=f"out-{job_type}",
+        content_hash="h",
+        payload={},
+        **kwargs,
+    )
+
+
+def _set_status(db_path, worker_id, status):
+    with JobQueue(db_path) as jq:
+        jq._get_conn().execute("UPDATE workers SET status = ? WHERE id = ?", (status, worker_id))
+
+
+class TestPoolManagerAutoscaling:
+    def test_reads_claimable_pending_jobs_and_own_worker_states(self, manager, db_path):
+        manager.start_pools()
+        notebook = manager.workers["notebook"][0]["db_worker_id"]
+        _set_status(db_path, notebook, "idle")
+
+        with JobQueue(db_path) as jq:
+            _add_job(jq, "notebook", session_id="s1")
+            _add_job(jq, "notebook")  # untagged legacy job: claimable
+            _add_job(jq, "notebook", session_id="other-build")
+            _add_job(jq, "notebook", execution_mode="docker")
+            _add_job(jq, "plantuml", session_id="s1", execution_mode="direct")
+
+        loads = manager._read_type_loads()
+
+        assert loads["notebook"] == TypeLoad(pending=2, workers=1, idle=1)
+        assert loads["plantuml"] == TypeLoad(pending=1, workers=1, idle=0)
+
+    def test_apply_starts_and_drains(self, manager, db_path):
+        manager.start_pools()
+        plantuml = manager.workers["plantuml"][0]
+        _set_status(db_path, plantuml["db_worker_id"], "idle")
+
+        manager._apply_scale_decision(ScaleDecision(start={"notebook": 2}, drain={"plantuml": 1}))
+
+        assert len(manager.workers["notebook"]) == 3
+        assert manager.workers["plantuml"] == []
+        manager.executors["direct"].stop_worker.assert_called_once_with(plantuml["executor_id"])
+        with JobQueue(db_path) as jq:
+            row = (
+                jq._get_conn()
+                .execute("SELECT 1 FROM workers WHERE id = ?", (plantuml["db_worker_id"],))
+                .fetchone()
+            )
+        assert row is None
+        # New workers get fresh indices after the configured ones.
+        indices = [c.args[1] for c in manager.executors["direct"].start_worker.call_args_list]
+        assert indices[-2:] == [1, 2]
+
+    def test_drain_never_takes_a_worker_holding_a_job(self, manager, db_path):
+        manager.start_pools()
+        info = manager.workers["notebook"][0]
+        worker_id = info["db_worker_id"]
+        _set_status(db_path, worker_id, "idle")
+        with JobQueue(db_path) as jq:
+            _add_job(jq, "notebook", session_id="s1")
+            # The worker claimed the job but has not flipped itself to busy yet.
+            assert jq.get_next_job("notebook", worker_id) is not None
+
+        assert manager._drain_worker(info) is False
+        assert manager.workers["notebook"] == [info]
+        manager.executors["direct"].stop_worker.assert_not_called()
+
+    def test_stop_pools_joins_autoscaler(self, manager):
+        manager.start_pools()
+        manager.start_autoscaling(_policy(), check_interval=300)
+        assert manager.autoscale_thread is not None and manager.autoscale_thread.is_alive()
+
+        manager.stop_pools()
+
+        assert not manager.autoscale_thread.is_alive()
@@ -0,0 +1,210 @@
+"""Tests for the persistent worker daemon and how builds find it.
+
+The daemon's run loop starts real worker processes, so it is covered by the
+integration suite; here the pieces it is built from are tested in isolation:
+fingerprint matching, the published state file, attaching, and the pool's
+dead-worker replacement.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from clm.infrastructure.database.job_queue import JobQueue
+from clm.infrastructure.database.schema import init_database
+from clm.infrastructure.workers.daemon import (
+    DAEMON_HEARTBEAT_STALE_SECONDS,
+    DaemonState,
+    daemon_fingerprint,
+    daemon_lease_path,
+    daemon_state_path,
+    find_attachable_daemon,
+    fingerprint_mismatch,
+)
+from clm.infrastructure.workers.pool_manager import WorkerConfig, WorkerPoolManager
+
+
+def _fingerprint(tmp_path: Path, **overrides) -> dict:
+    configs = overrides.pop(
+        "configs",
+        [
+            WorkerConfig(worker_type="notebook", execution_mode="direct", count=2),
+            WorkerConfig(worker_type="plantuml", execution_mode="direct", count=1),
+        ],
+    )
+    kwargs = {
+        "workspace_path": tmp_path / "output",
+        "data_dir": tmp_path / "course",
+        "cache_db_path": tmp_path / "clm_cache.db",
+    }
+    kwargs.update(overrides)
+    return daemon_fingerprint(configs, **kwargs)
+
+
+def _state(fingerprint: dict, **overrides) -> DaemonState:
+    values = {
+        "pid": os.getpid(),
+        "session_id": "daemon-1",
+        "started_at": "2026-01-01T00:00:00",
+        "heartbeat": time.time(),
+        "idle_timeout": 1800.0,
+        "fingerprint": fingerprint,
+    }
+    values.update(overrides)
+    return DaemonState(**values)
+
+
+class TestFingerprint:
+    def test_identical_setups_match(self, tmp_path):
+        assert fingerprint_mismatch(_fingerprint(tmp_path), _fingerprint(tmp_path)) is None
+
+    def test_worker_counts_do_not_matter(self, tmp_path):
+        build = _fingerprint(
+            tmp_path,
+            configs=[WorkerConfig(worker_type="notebook", execution_mode="direct", count=8)],
+        )
+        assert fingerprint_mismatch(_fingerprint(tmp_path), build) is None
+
+    def test_build_needing_a_type_the_daemon_lacks(self, tmp_path):
+        build = _fingerprint(
+            tmp_path,
+            configs=[WorkerConfig(worker_type="jupyterlite", execution_mode="direct", count=1)],
+        )
+        assert "jupyterlite" in fingerprint_mismatch(_fingerprint(tmp_path), build)
+
+    def test_different_image_does_not_match(self, tmp_path):
+        def docker(image):
+            return _fingerprint(
+                tmp_path,
+                configs=[
+                    WorkerConfig(
+                        worker_type="notebook", execution_mode="docker", count=1, image=image
+                    )
+                ],
+            )
+
+        assert "notebook" in fingerprint_mismatch(docker("clm:full"), docker("clm:lite"))
+
+    @pytest.mark.parametrize("key", ["workspace_path", "data_dir", "cache_db_path"])
+    def test_different_paths_do_not_match(self, tmp_path, key):
+        build = _fingerprint(tmp_path, **{key: tmp_path / "elsewhere"})
+        assert key in fingerprint_mismatch(_fingerprint(tmp_path), build)
+
+    def test_different_clm_version_does_not_match(self, tmp_path):
+        daemon = _fingerprint(tmp_path) | {"clm_version": "0.0.1"}
+        assert "clm_version" in fingerprint_mismatch(daemon, _fingerprint(tmp_path))
+
+    def test_kernel_interpreter_only_matters_for_notebooks(self, tmp_path):
+        daemon = _fingerprint(tmp_path, notebook_kernel_python="/venv/bin/python")
+        assert fingerprint_mismatch(daemon, _fingerprint(tmp_path)) is not None
+
+        diagrams_only = _fingerprint(
+            tmp_path,
+            configs=[WorkerConfig(worker_type="plantuml", execution_mode="direct", count=1)],
+        )
+        assert fingerprint_mismatch(daemon, diagrams_only) is None
+
+
+class TestDaemonState:
+    def test_round_trip(self, tmp_path):
+        path = daemon_state_path(tmp_path / "clm_jobs.db")
+        state = _state(_fingerprint(tmp_path), workers={"notebook": 2})
+
+        state.write(path)
+
+        assert DaemonState.read(path) == state
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_missing_or_corrupt_state_reads_as_none(self, tmp_path):
+        path = daemon_state_path(tmp_path / "clm_jobs.db")
+        assert DaemonState.read(path) is None
+        path.write_text("{not json", encoding="utf-8")
+        assert DaemonState.read(path) is None
+
+    def test_stale_heartbeat_is_not_alive(self, tmp_path):
+        state = _state({}, heartbeat=time.time() - DAEMON_HEARTBEAT_STALE_SECONDS - 1)
+        assert not state.is_alive()
+        assert _state({}).is_alive()
+
+
+class TestFindAttachableDaemon:
+    def test_attaches_to_compatible_daemon_and_touches_lease(self, tmp_path):
+        jobs_db = tmp_path / "clm_jobs.db"
+        _state(_fingerprint(tmp_path)).write(daemon_state_path(jobs_db))
+
+        daemon = find_attachable_daemon(jobs_db, _fingerprint(tmp_path))
+
+        assert daemon is not None and daemon.session_id == "daemon-1"
+        assert daemon_lease_path(jobs_db).exists()
+
+    def test_ignores_incompatible_daemon(self, tmp_path):
+        jobs_db = tmp_path / "clm_jobs.db"
+        _state(_fingerprint(tmp_path)).write(daemon_state_path(jobs_db))
+
+        build = _fingerprint(tmp_path, workspace_path=tmp_path / "other")
+        assert find_attachable_daemon(jobs_db, build) is None
+        assert not daemon_lease_path(jobs_db).exists()
+
+    def test_ignores_dead_daemon(self, tmp_path, monkeypatch):
+        jobs_db = tmp_path / "clm_jobs.db"
+        _state(_fingerprint(tmp_path)).write(daemon_state_path(jobs_db))
+        monkeypatch.setattr("psutil.pid_exists", lambda pid: False)
+
+        assert find_attachable_daemon(jobs_db, _fingerprint(tmp_path)) is None
+
+
+@pytest.fixture
+def manager(tmp_path):
+    db_path = tmp_path / "jobs.db"
+    init_database(db_path)
+    mgr = WorkerPoolManager(
+        db_path=db_path,
+        workspace_path=tmp_path,
+        worker_configs=[WorkerConfig(worker_type="notebook", execution_mode="direct", count=2)],
+        session_id="daemon-1",
+        max_startup_concurrency=2,
+    )
+    executor = MagicMock()
+    executor.start_worker.side_effect = lambda worker_type, index, config, db_worker_id: (
+        f"direct-{worker_type}-{index}"
+    )
+    executor.stop_worker.return_value = True
+    mgr.executors["direct"] = executor
+    yield mgr
+    mgr.running = False
+    mgr.close()
+
+
+class TestReplaceDeadWorkers:
+    def test_dead_worker_is_stopped_deleted_and_replaced(self, manager):
+        manager.start_pools()
+        dead, alive = manager.workers["notebook"]
+        with JobQueue(manager.db_path) as jq:
+            jq._get_conn().execute(
+                "UPDATE workers SET status = 'dead' WHERE id = ?", (dead["db_worker_id"],)
+            )
+
+        assert manager.replace_dead_workers() == 1
+
+        workers = manager.workers["notebook"]
+        assert len(workers) == 2 and dead not in workers and alive in workers
+        manager.executors["direct"].stop_worker.assert_called_once_with(dead["executor_id"])
+        with JobQueue(manager.db_path) as jq:
+            row = (
+                jq._get_conn()
+                .execute("SELECT 1 FROM workers WHERE id = ?", (dead["db_worker_id"],))
+                .fetchone()
+            )
+        assert row is None
+        # The replacement gets a fresh index after the configured ones.
+        assert manager.executors["direct"].start_worker.call_args.args[1] == 2
+
+    def test_healthy_pool_is_left_alone(self, manager):
+        manager.start_pools()
+        assert manager.replace_dead_workers() == 0
+        manager.executors["direct"].stop_worker.assert_not_called()
@@ -66,6 +66,9 @@ def mock_config():
     config.auto_stop = True
     config.reuse_workers = False
     config.network_name = "test-network"
+    config.autoscale = False
+    config.docker_standby_containers = 0
+    config.container_name_prefix = "clm"
 
     # Mock worker config for notebook
     notebook_config = WorkerConfig(
@@ -362,6 +365,39 @@ class TestStartManagedWorkers:
 
                 mock_pool_instance.start_pools.assert_called_once()
 
+    def test_start_managed_workers_autoscaling_is_opt_in(
+        self, db_path, workspace_path, mock_config
+    ):
+        """The autoscaler only runs with ``autoscale`` enabled, budgeted on the pool's counts."""
+        mock_config.max_workers_cap = None
+        mock_config.autoscale_interval = 3.0
+        for autoscale, budget in [(False, None), (True, None), (True, 5)]:
+            mock_config.autoscale = autoscale
+            mock_config.autoscale_budget = budget
+            with patch("clm.infrastructure.workers.lifecycle_manager.DirectWorkerExecutor"):
+                with patch(
+                    "clm.infrastructure.workers.lifecycle_manager.WorkerPoolManager"
+                ) as mock_pool:
+                    mock_pool_instance = MagicMock()
+                    mock_pool_instance.workers = {}
+                    mock_pool.return_value = mock_pool_instance
+
+                    manager = WorkerLifecycleManager(
+                        config=mock_config,
+                        db_path=db_path,
+                        workspace_path=workspace_path,
+                    )
+                    manager.start_managed_workers()
+
+                    start = mock_pool_instance.start_autoscaling
+                    if not autoscale:
+                        start.assert_not_called()
+                        continue
+                    start.assert_called_once()
+                    policy = start.call_args.args[0]
+                    assert policy.budget == (budget or 1)
+                    assert start.call_args.kwargs["check_interval"] == 3.0
+
     def test_start_managed_workers_logs_events(self, db_path, workspace_path, mock_config):
         """Should log pool starting and started events."""
         with patch("clm.infrastructure.workers.lifecycle_manager.DirectWorkerExecutor"):
@@ -1684,3 +1684,81 @@ class TestWorkerPreRegistration:
             assert result is False
 
             manager.close()
+
+
+class TestTimeToFirstClaim:
+    """Start-up latency per worker, measured from the jobs database."""
+
+    def _manager(self, db_path, workspace_path):
+        manager = WorkerPoolManager(
+            db_path=db_path,
+            workspace_path=workspace_path,
+            worker_configs=[],
+            max_startup_concurrency=1,
+        )
+        conn = manager.job_queue._get_conn()
+        infos = []
+        for container_id in ("a", "b"):
+            worker_id = conn.execute(
+                "INSERT INTO workers (worker_type, container_id, status, started_at) "
+                "VALUES ('notebook', ?, 'idle', '2026-01-01 10:00:00')",
+                (container_id,),
+            ).lastrowid
+            infos.append({"db_worker_id": worker_id})
+        manager.workers["notebook"] = infos
+        return manager, conn, [info["db_worker_id"] for info in infos]
+
+    @staticmethod
+    def _claimed_job(conn, worker_id, created_at, started_at, path):
+        conn.execute(
+            "INSERT INTO jobs (job_type, status, input_file, output_file, content_hash, "
+            "payload, worker_id, created_at, started_at) "
+            "VALUES ('notebook', 'completed', ?, ?, 'h', '{}', ?, ?, ?)",
+            (path, path + ".out", worker_id, created_at, started_at),
+        )
+
+    def test_measures_from_the_later_of_worker_start_and_job_creation(
+        self, db_path, workspace_path
+    ):
+        manager, conn, (early, late) = self._manager(db_path, workspace_path)
+        # The job waited for the worker: measured from the worker's start.
+        self._claimed_job(conn, early, "2026-01-01 09:59:00", "2026-01-01 10:00:04", "a.py")
+        self._claimed_job(conn, early, "2026-01-01 09:59:00", "2026-01-01 10:00:09", "b.py")
+        # The worker waited for the job: measured from the job's creation.
+        self._claimed_job(conn, late, "2026-01-01 10:05:00", "2026-01-01 10:05:01", "c.py")
+
+        latencies = manager.time_to_first_claim()
+
+        assert latencies[early] == pytest.approx(4.0, abs=0.01)
+        assert latencies[late] == pytest.approx(1.0, abs=0.01)
+        manager.close()
+
+    def test_workers_without_a_claim_report_none(self, db_path, workspace_path):
+        manager, _conn, worker_ids = self._manager(db_path, workspace_path)
+        assert manager.time_to_first_claim() == dict.fromkeys(worker_ids)
+        manager.close()
+
+
+def test_start_pools_parks_standby_containers_for_docker_configs(db_path, workspace_path):
+    from clm.infrastructure.workers.worker_executor import DockerWorkerExecutor
+
+    config = WorkerConfig(worker_type="notebook", image="clm:latest", count=1)
+    manager = WorkerPoolManager(
+        db_path=db_path,
+        workspace_path=workspace_path,
+        worker_configs=[config],
+        max_startup_concurrency=1,
+        docker_standby=2,
+    )
+    executor = MagicMock(spec=DockerWorkerExecutor)
+    executor.start_worker.return_value = "container0"
+    filled = threading.Event()
+    executor.fill_standby.side_effect = lambda *args: filled.set()
+    manager.executors["docker"] = executor
+
+    manager.start_pools()
+
+    assert filled.wait(5)
+    executor.fill_standby.assert_called_once_with("notebook", config, 2)
+    manager.running = False
+    manager.close()
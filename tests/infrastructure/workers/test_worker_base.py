@@ -13,6 +13,8 @@ import pytest
 from clm.infrastructure.database.job_queue import Job, JobQueue
 from clm.infrastructure.database.schema import init_database
 from clm.infrastructure.workers.worker_base import (
+    PREWARM_ENV_VAR,
+    STANDBY_ENV_VAR,
     Worker,
     missing_jobs_db_error,
     parse_worker_args,
@@ -214,6 +216,20 @@ def test_worker_custom_poll_interval(worker_id, db_path):
     assert worker.poll_interval == 0.5
 
 
+def test_worker_prewarms_only_when_requested(worker_id, db_path, monkeypatch):
+    """prewarm() runs once when CLM_WORKER_PREWARM is set, and a failure is not fatal."""
+    worker = MockWorker(worker_id, db_path)
+    worker.prewarm = Mock(side_effect=RuntimeError("no kernel"))
+
+    monkeypatch.delenv(PREWARM_ENV_VAR, raising=False)
+    worker._prewarm_if_requested()
+    worker.prewarm.assert_not_called()
+
+    monkeypatch.setenv(PREWARM_ENV_VAR, "1")
+    worker._prewarm_if_requested()
+    worker.prewarm.assert_called_once()
+
+
 def test_worker_processes_single_job(worker_id, db_path):
     """Test worker processes a single job successfully."""
     # Add a job
@@ -315,6 +331,40 @@ def test_worker_handles_job_failure(worker_id, db_path):
     queue.close()
 
 
+def test_worker_ships_build_trace_in_job_result(worker_id, db_path, tmp_path, monkeypatch):
+    """Under CLM_BUILD_TRACE the claim and job spans travel in the result JSON."""
+    import json
+
+    from clm.core.build_trace import BuildTracer
+    from clm.infrastructure.workers import worker_base
+
+    monkeypatch.setattr(worker_base, "tracer", BuildTracer(tmp_path / "trace.json"))
+    queue = JobQueue(db_path)
+    job_id = queue.add_job(
+        job_type="test",
+        input_file="input.txt",
+        output_file="output.txt",
+        content_hash="hash123",
+        payload={"data": "test"},
+    )
+
+    worker = MockWorker(worker_id, db_path)
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+    try:
+        _wait_until(lambda: queue.get_job(job_id).status == "completed")
+    finally:
+        worker.stop()
+        thread.join(timeout=5)
+
+    row = queue._get_conn().execute("SELECT result FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    queue.close()
+    trace = json.loads(row[0])["trace"]
+    assert trace["worker"]["worker_id"] == worker_id
+    assert [span["name"] for span in trace["spans"]] == ["claim", "job"]
+    assert trace["spans"][1]["args"]["input_file"] == "input.txt"
+
+
 def test_worker_updates_heartbeat(worker_id, db_path):
     """Test worker updates heartbeat regularly during operation.
 
@@ -856,6 +906,46 @@ class TestWorkerPreRegistration:
                 Worker.get_or_register_worker(None, None, "notebook")
 
 
+class TestStandbyAssignment:
+    """A standby container parks until the executor assigns it a worker row."""
+
+    def test_waits_for_the_assignment_file(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(STANDBY_ENV_VAR, "5")
+        assignment = tmp_path / "assignment.json"
+        # A half-written file is retried, not taken as an answer.
+        assignment.write_text('{"worker_', encoding="utf-8")
+
+        def deliver():
+            time.sleep(0.2)
+            assignment.write_text('{"worker_id": 42}', encoding="utf-8")
+
+        threading.Thread(target=deliver).start()
+        assert Worker.wait_for_standby_assignment(assignment, poll_interval=0.01) == "42"
+
+    def test_gives_up_after_the_standby_wait(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(STANDBY_ENV_VAR, "0.1")
+        with pytest.raises(SystemExit, match="not assigned"):
+            Worker.wait_for_standby_assignment(tmp_path / "never.json", poll_interval=0.01)
+
+    def test_get_or_register_worker_activates_the_assigned_row(self, db_path, monkeypatch):
+        with JobQueue(db_path) as queue:
+            pre_registered_id = (
+                queue._get_conn()
+                .execute(
+                    "INSERT INTO workers (worker_type, container_id, status) "
+                    "VALUES ('notebook', 'standby', 'created')"
+                )
+                .lastrowid
+            )
+        monkeypatch.delenv("CLM_WORKER_ID", raising=False)
+        monkeypatch.setenv(STANDBY_ENV_VAR, "5")
+        monkeypatch.setattr(
+            Worker, "wait_for_standby_assignment", staticmethod(lambda: str(pre_registered_id))
+        )
+
+        assert Worker.get_or_register_worker(db_path, None, "notebook") == pre_registered_id
+
+
 class TestResolveJobsDbPath:
     """The one-name-one-default jobs-DB contract (A8).
 
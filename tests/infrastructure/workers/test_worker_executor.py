@@ -804,6 +804,154 @@ class TestDockerWorkerExecutor:
         assert executor.is_worker_running(worker_id) is False
 
 
+def test_docker_container_names_use_the_configured_prefix(db_path, workspace_path):
+    """Concurrent builds on one Docker host must not reuse each other's names."""
+    import docker.errors
+
+    client = MagicMock()
+    client.containers.run.return_value.id = "abc123def456"
+    client.containers.get.side_effect = docker.errors.NotFound("not found")
+    executor = DockerWorkerExecutor(client, db_path, workspace_path, name_prefix="clm-triage-7")
+    config = WorkerConfig(worker_type="notebook", count=1, image="clm:latest")
+
+    executor.start_worker("notebook", 2, config, db_worker_id=1)
+    executor.fill_standby("notebook", config, 1)
+
+    names = [c.kwargs["name"] for c in client.containers.run.call_args_list]
+    assert names[0] == "clm-triage-7-notebook-worker-2"
+    assert names[1].startswith("clm-triage-7-notebook-standby-")
+
+
+class TestDockerStandbyContainers:
+    """Standby containers are parked ahead of time and handed to new workers."""
+
+    @pytest.fixture
+    def client(self):
+        import docker.errors
+
+        client = MagicMock()
+        counter = iter(range(1000))
+
+        def run(**kwargs):
+            container = MagicMock()
+            container.id = f"container{next(counter):04d}-0123456789"
+            container.status = "running"
+            container.put_archive.return_value = True
+            container.run_kwargs = kwargs
+            return container
+
+        client.containers.run.side_effect = run
+        client.containers.get.side_effect = docker.errors.NotFound("not found")
+        return client
+
+    @pytest.fixture
+    def config(self):
+        return WorkerConfig(
+            worker_type="notebook",
+            count=1,
+            execution_mode="docker",
+            image="clm-notebook-processor:latest",
+        )
+
+    @staticmethod
+    def _wait_for(condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline, "condition not reached"
+            time.sleep(0.01)
+
+    def test_standby_containers_start_without_a_worker_id(
+        self, client, config, db_path, workspace_path
+    ):
+        from clm.infrastructure.workers.worker_base import STANDBY_ENV_VAR
+
+        executor = DockerWorkerExecutor(client, db_path, workspace_path)
+
+        assert executor.fill_standby("notebook", config, 2) == 2
+        assert executor.fill_standby("notebook", config, 2) == 0
+
+        assert executor.standby_count("notebook", config) == 2
+        for run_call in client.containers.run.call_args_list:
+            assert "-standby-" in run_call.kwargs["name"]
+            env = run_call.kwargs["environment"]
+            assert "CLM_WORKER_ID" not in env
+            assert env[STANDBY_ENV_VAR] == str(executor.standby_max_wait)
+        # Parked containers are not workers until they are assigned.
+        assert executor.containers == {}
+
+    def test_start_worker_assigns_a_standby_container_and_refills(
+        self, client, config, db_path, workspace_path
+    ):
+        import io
+        import json
+        import tarfile
+
+        executor = DockerWorkerExecutor(client, db_path, workspace_path)
+        executor.fill_standby("notebook", config, 1)
+        (standby,) = executor._standby[executor._standby_key("notebook", config)]
+
+        worker_id = executor.start_worker("notebook", 3, config, db_worker_id=17)
+
+        assert worker_id == standby.id
+        assert executor.containers[worker_id] is standby
+        standby.rename.assert_called_once_with("clm-notebook-worker-3")
+        directory, archive = standby.put_archive.call_args.args
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            (member,) = tar.getmembers()
+            assert f"{directory}/{member.name}" == "/tmp/clm-worker-assignment.json"
+            assert json.load(tar.extractfile(member)) == {"worker_id": 17}
+
+        # The taken container is replaced in the background.
+        self._wait_for(lambda: executor.standby_count("notebook", config) == 1)
+        assert client.containers.run.call_count == 2
+
+    def test_exited_standby_container_falls_back_to_a_cold_start(
+        self, client, config, db_path, workspace_path
+    ):
+        executor = DockerWorkerExecutor(client, db_path, workspace_path)
+        executor.fill_standby("notebook", config, 1)
+        (standby,) = executor._standby[executor._standby_key("notebook", config)]
+        standby.status = "exited"
+
+        worker_id = executor.start_worker("notebook", 0, config, db_worker_id=5)
+
+        assert worker_id != standby.id
+        standby.remove.assert_called_once_with(force=True)
+        cold = client.containers.run.call_args
+        assert cold.kwargs["name"] == "clm-notebook-worker-0"
+        assert cold.kwargs["environment"]["CLM_WORKER_ID"] == "5"
+
+    def test_other_configurations_do_not_share_standby_containers(
+        self, client, config, db_path, workspace_path
+    ):
+        executor = DockerWorkerExecutor(client, db_path, workspace_path)
+        executor.fill_standby("notebook", config, 1)
+        other = WorkerConfig(
+            worker_type="notebook",
+            count=1,
+            execution_mode="docker",
+            image="clm-notebook-processor:lite",
+        )
+
+        executor.start_worker("notebook", 0, other, db_worker_id=5)
+
+        assert executor.standby_count("notebook", config) == 1
+
+    def test_cleanup_removes_standby_containers_and_stops_refilling(
+        self, client, config, db_path, workspace_path
+    ):
+        executor = DockerWorkerExecutor(client, db_path, workspace_path)
+        executor.fill_standby("notebook", config, 2)
+        parked = list(executor._standby[executor._standby_key("notebook", config)])
+
+        executor.cleanup()
+
+        for container in parked:
+            container.remove.assert_called_once_with(force=True)
+        assert executor.standby_count("notebook", config) == 0
+        assert executor.fill_standby("notebook", config, 2) == 0
+
+
 class TestMitmproxyDockerEnv:
     """The mitmproxy transport's per-container env + CA mount (issue #165 P4)."""
 
@@ -332,9 +332,16 @@ class TestHandleHarvestCacheList:
         assert data["total_bytes"] == 0
 
     async def test_lists_entries(self, tmp_path: Path):
+        from clm.voiceover.cache import TranscribeConfig, TranscriptsCache, VideoKey
+        from clm.voiceover.transcribe import Transcript
+
         cache = tmp_path / "cache"
-        (cache / "transcripts").mkdir(parents=True)
-        (cache / "transcripts" / "abc123.json").write_text('{"x": 1}', encoding="utf-8")
+        video = VideoKey(abspath="/v.mp4", mtime_ns=1, size=1)
+        cfg = TranscribeConfig(
+            backend="faster-whisper", model="large-v3", language="de", device_class="cpu"
+        )
+        transcript = Transcript(segments=[], language="de", duration=1.0)
+        TranscriptsCache(cache).put(video, cfg, transcript)
 
         out = await handle_harvest_cache_list(tmp_path, cache_root=str(cache))
         data = json.loads(out)
@@ -342,7 +349,7 @@ class TestHandleHarvestCacheList:
         assert len(data["entries"]) == 1
         entry = data["entries"][0]
         assert entry["kind"] == "transcripts"
-        assert entry["key"] == "abc123"
+        assert entry["key"] == video.hash
 
 
 # ---------------------------------------------------------------------------
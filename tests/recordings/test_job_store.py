@@ -1,11 +1,12 @@
-"""Tests for :class:`JsonFileJobStore`."""
+"""Tests for :class:`JsonFileJobStore` and :class:`JournalJobStore`."""
 
 from __future__ import annotations
 
 import json
 from pathlib import Path
 
-from clm.recordings.workflow.job_store import JsonFileJobStore
+from clm.recordings.workflow import job_store as job_store_module
+from clm.recordings.workflow.job_store import JournalJobStore, JsonFileJobStore
 from clm.recordings.workflow.jobs import JobState, ProcessingJob
 
 
@@ -151,3 +152,126 @@ class TestJsonFileJobStorePersistence:
         assert raw["version"] == 1
         assert isinstance(raw["jobs"], list)
         assert len(raw["jobs"]) == 1
+
+
+class TestJournalJobStore:
+    def test_missing_file_starts_empty(self, tmp_path: Path):
+        store = JournalJobStore(tmp_path / ".clm" / "jobs.jsonl")
+        assert store.load_all() == []
+
+    def test_save_delete_and_reopen(self, tmp_path: Path):
+        path = tmp_path / ".clm" / "jobs.jsonl"
+        store = JournalJobStore(path)
+        a = _make_job(tmp_path, backend_ref="abc-123")
+        b = _make_job(tmp_path)
+        store.save(a)
+        store.save(b)
+        a.state = JobState.COMPLETED
+        store.save(a)
+        store.delete(b.id)
+
+        loaded = JournalJobStore(path).load_all()
+        assert len(loaded) == 1
+        assert loaded[0].id == a.id
+        assert loaded[0].state == JobState.COMPLETED
+        assert loaded[0].backend_ref == "abc-123"
+
+    def test_save_appends_one_record(self, tmp_path: Path):
+        path = tmp_path / "jobs.jsonl"
+        store = JournalJobStore(path)
+        store.save(_make_job(tmp_path))
+        store.save(_make_job(tmp_path))
+        size = path.stat().st_size
+
+        store.save(_make_job(tmp_path))
+
+        lines = path.read_bytes().splitlines(keepends=True)
+        assert len(lines) == 3
+        assert path.stat().st_size == size + len(lines[-1])
+
+    def test_torn_trailing_record_is_discarded(self, tmp_path: Path):
+        path = tmp_path / "jobs.jsonl"
+        store = JournalJobStore(path)
+        job = _make_job(tmp_path)
+        store.save(job)
+        with path.open("ab") as f:
+            f.write(b'{"op":"save","job":{"backend_na')
+
+        reopened = JournalJobStore(path)
+        assert [j.id for j in reopened.load_all()] == [job.id]
+
+        # The next append starts on a clean line.
+        other = _make_job(tmp_path)
+        reopened.save(other)
+        assert {j.id for j in JournalJobStore(path).load_all()} == {job.id, other.id}
+
+    def test_invalid_records_are_skipped(self, tmp_path: Path):
+        path = tmp_path / "jobs.jsonl"
+        valid = _make_job(tmp_path)
+        path.write_text(
+            "not json\n"
+            + json.dumps({"op": "save", "job": {"backend_name": "bogus"}})
+            + "\n"
+            + json.dumps({"op": "save", "job": valid.model_dump(mode="json")})
+            + "\n",
+            encoding="utf-8",
+        )
+
+        loaded = JournalJobStore(path).load_all()
+        assert [j.id for j in loaded] == [valid.id]
+
+    def test_compaction_keeps_one_record_per_job(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(job_store_module, "COMPACT_MIN_RECORDS", 10)
+        path = tmp_path / "jobs.jsonl"
+        store = JournalJobStore(path)
+        job = _make_job(tmp_path)
+        for i in range(10):
+            job.progress = i / 10
+            store.save(job)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert not path.with_suffix(path.suffix + ".tmp").exists()
+
+        store.save(job)
+        loaded = JournalJobStore(path).load_all()
+        assert len(loaded) == 1
+        assert loaded[0].progress == 0.9
+
+    def test_two_stores_share_a_journal_across_compaction(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(job_store_module, "COMPACT_MIN_RECORDS", 10)
+        path = tmp_path / "jobs.jsonl"
+        first, second = JournalJobStore(path), JournalJobStore(path)
+        other = _make_job(tmp_path)
+        second.save(other)
+
+        # first never saw other's record; its compaction must still keep it.
+        job = _make_job(tmp_path)
+        for i in range(10):
+            job.progress = i / 10
+            first.save(job)
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+        # second's next append lands in the compacted journal, not the old file.
+        late = _make_job(tmp_path)
+        second.save(late)
+
+        loaded = {j.id: j for j in JournalJobStore(path).load_all()}
+        assert set(loaded) == {other.id, job.id, late.id}
+        assert loaded[job.id].progress == 0.9
+
+    def test_migrates_legacy_json_file(self, tmp_path: Path):
+        legacy = tmp_path / ".clm" / "jobs.json"
+        old = JsonFileJobStore(legacy)
+        job = _make_job(tmp_path, backend_ref="abc-123")
+        old.save(job)
+
+        store = JournalJobStore(tmp_path / ".clm" / "jobs.jsonl")
+
+        assert [j.backend_ref for j in store.load_all()] == ["abc-123"]
+        assert not legacy.exists()
+        assert (tmp_path / ".clm" / "jobs.json.migrated").exists()
+
+        # An existing journal wins over a reappearing legacy file.
+        JsonFileJobStore(legacy).save(_make_job(tmp_path))
+        assert len(JournalJobStore(tmp_path / ".clm" / "jobs.jsonl").load_all()) == 1
@@ -522,8 +522,17 @@ def test_every_validation_scope_runs_the_whole_family(entry: str) -> None:
     """
     import inspect
 
-    from clm.slides import validator
+    from clm.slides import validation_engine, validator
+
+    # All scopes funnel through ``check_split_pair`` — the single-file scope
+    # directly, the directory/course scopes via the validation engine's
+    # ``run_pair_checks`` — so the family is enumerated in exactly one place.
+    bundle = inspect.getsource(validator.check_split_pair)
+    missing = {name for name in SPLIT_PAIR_CHECKS if name not in bundle}
+    assert not missing, f"check_split_pair does not run {sorted(missing)}"
 
     source = inspect.getsource(getattr(validator, entry))
-    missing = {name for name in SPLIT_PAIR_CHECKS if name not in source}
-    assert not missing, f"{entry} does not run {sorted(missing)}"
+    if "check_split_pair" in source:
+        return
+    assert "run_pair_checks" in source, f"{entry} does not run the split-pair family"
+    assert "check_split_pair" in inspect.getsource(validation_engine._pair_task)
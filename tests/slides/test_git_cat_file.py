@@ -0,0 +1,188 @@
+"""Persistent ``git cat-file`` sessions behind :mod:`clm.slides.git_text`.
+
+The helpers must answer exactly what the old one-``git show``-per-blob code
+answered — including after a new commit moves ``HEAD`` and after the git
+process dies — while spawning git once per repository instead of per read.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from clm.slides import git_cat_file
+from clm.slides.git_cat_file import close_readers, object_reader, repo_location
+from clm.slides.git_text import (
+    bundle_texts_at_ref,
+    git_ref_text,
+    recent_change_refs,
+    resolve_commit,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not on PATH")
+
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "t",
+    "GIT_AUTHOR_EMAIL": "t@example.com",
+    "GIT_COMMITTER_NAME": "t",
+    "GIT_COMMITTER_EMAIL": "t@example.com",
+}
+
+
+def _git(repo: Path, *args: str) -> str:
+    completed = subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        env={**os.environ, **_GIT_ENV},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return completed.stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_readers():
+    close_readers()
+    yield
+    close_readers()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    (root / "topic").mkdir(parents=True)
+    _git(root, "init", "-q")
+    return root
+
+
+def _commit(root: Path, files: dict[str, str | bytes], msg: str = "c") -> str:
+    for rel, content in files.items():
+        target = root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            target.write_bytes(content)
+        else:
+            target.write_text(content, encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-qm", msg)
+    return _git(root, "rev-parse", "HEAD")
+
+
+class TestReads:
+    def test_reads_text_at_head_and_older_refs(self, repo: Path) -> None:
+        deck = repo / "topic" / "slides_a.py"
+        first = _commit(repo, {"topic/slides_a.py": "one\n"})
+        _commit(repo, {"topic/slides_a.py": "two\n"})
+        assert git_ref_text(deck) == "two\n"
+        assert git_ref_text(deck, "HEAD~1") == "one\n"
+        assert git_ref_text(deck, first) == "one\n"
+
+    def test_head_is_re_resolved_after_a_commit(self, repo: Path) -> None:
+        deck = repo / "topic" / "slides_a.py"
+        _commit(repo, {"topic/slides_a.py": "one\n"})
+        assert git_ref_text(deck) == "one\n"
+        sha = _commit(repo, {"topic/slides_a.py": "two\n"})
+        assert git_ref_text(deck) == "two\n"
+        assert resolve_commit(deck, "HEAD") == sha
+        assert recent_change_refs(deck, deck, cap=5)[0] == sha
+
+    def test_absent_file_ref_or_repo_is_none(self, repo: Path, tmp_path: Path) -> None:
+        deck = repo / "topic" / "slides_a.py"
+        _commit(repo, {"topic/slides_a.py": "one\n"})
+        assert git_ref_text(repo / "topic" / "slides_missing.py") is None
+        assert git_ref_text(deck, "no-such-branch") is None
+        assert resolve_commit(deck, "no-such-branch") is None
+        outside = tmp_path / "plain"
+        outside.mkdir()
+        assert git_ref_text(outside / "slides_a.py") is None
+        assert bundle_texts_at_ref(outside / "a.de.py", outside / "a.en.py", "HEAD") == (
+            None,
+            None,
+            None,
+            None,
+        )
+
+    def test_follows_renames(self, repo: Path) -> None:
+        _commit(repo, {"topic/slides_old.py": "body\n" * 20})
+        _git(repo, "mv", "topic/slides_old.py", "topic/slides_new.py")
+        _git(repo, "commit", "-qm", "rename")
+        assert git_ref_text(repo / "topic" / "slides_new.py", "HEAD~1") == "body\n" * 20
+
+    def test_decodes_like_text_mode_git_show(self, repo: Path) -> None:
+        """CRLF reads as LF and invalid UTF-8 degrades to replacement chars."""
+        _commit(
+            repo,
+            {"topic/crlf.py": b"a\r\nb\r\n", "topic/latin.py": "über\n".encode("latin-1")},
+        )
+        assert git_ref_text(repo / "topic" / "crlf.py") == "a\nb\n"
+        assert git_ref_text(repo / "topic" / "latin.py") == "�ber\n"
+
+    def test_bundle_texts_resolve_companions(self, repo: Path) -> None:
+        _commit(
+            repo,
+            {
+                "topic/slides_t.de.py": "de\n",
+                "topic/slides_t.en.py": "en\n",
+                "topic/voiceover/voiceover_t.de.py": "vo de\n",
+                "topic/voiceover_t.en.py": "vo en\n",
+            },
+        )
+        de, en = repo / "topic" / "slides_t.de.py", repo / "topic" / "slides_t.en.py"
+        assert bundle_texts_at_ref(de, en, "HEAD") == ("de\n", "en\n", "vo de\n", "vo en\n")
+
+
+class TestSessions:
+    def test_reads_do_not_spawn_git_per_blob(self, repo: Path, monkeypatch) -> None:
+        files = {f"topic/slides_{i}.py": f"deck {i}\n" for i in range(10)}
+        _commit(repo, files)
+        runs: list[tuple[str, ...]] = []
+        real_run = subprocess.run
+
+        def counting_run(cmd, *args, **kwargs):
+            runs.append(tuple(cmd))
+            return real_run(cmd, *args, **kwargs)
+
+        monkeypatch.setattr(git_cat_file.subprocess, "run", counting_run)
+        for _ in range(3):
+            for i in range(10):
+                assert git_ref_text(repo / "topic" / f"slides_{i}.py") == f"deck {i}\n"
+        # One rev-parse to locate the directory; every blob went through cat-file.
+        assert len(runs) == 1
+
+    def test_restarts_after_git_dies(self, repo: Path) -> None:
+        deck = repo / "topic" / "slides_a.py"
+        _commit(repo, {"topic/slides_a.py": "one\n"})
+        assert git_ref_text(deck) == "one\n"
+        location = repo_location(deck.parent)
+        assert location is not None
+        reader = object_reader(location[0])
+        for session in (reader._batch, reader._check):
+            assert session._proc is not None
+            session._proc.kill()
+            session._proc.wait()
+        assert git_ref_text(deck, "HEAD") == "one\n"
+        assert git_ref_text(repo / "topic" / "slides_b.py") is None
+
+    def test_concurrent_readers_get_their_own_blobs(self, repo: Path) -> None:
+        files = {f"topic/slides_{i}.py": f"deck {i}\n" * (i + 1) for i in range(8)}
+        _commit(repo, files)
+        errors: list[str] = []
+
+        def worker(i: int) -> None:
+            for _ in range(25):
+                got = git_ref_text(repo / "topic" / f"slides_{i}.py")
+                if got != f"deck {i}\n" * (i + 1):
+                    errors.append(f"{i}: {got!r}")
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
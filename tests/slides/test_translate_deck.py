@@ -22,6 +22,8 @@ protocol, driven here by ``StaticSlideTranslator``.
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 from clm.core.slide_text.raw_cells import split_cells
@@ -356,3 +358,134 @@ class TestErrors:
         rogue = StaticSlideTranslator(default="# %%\n_INJECTED_ = 1")
         with pytest.raises(TranslateDeckError, match="split"):
             translate_deck_text(de, source_lang="de", target_lang="en", translator=rogue)
+
+
+# ---------------------------------------------------------------------------
+# Planned translation — dedup, concurrency, cache prefetch
+# ---------------------------------------------------------------------------
+
+
+def _multi_slide_deck() -> str:
+    return (
+        HEADER_PREAMBLE
+        + _shared_code("setup")
+        + _slide_pair("a", "Eins", "One")
+        + _localized_code_pair("c1", 'print("Hallo")', 'print("Hello")')
+        + _slide_pair("b", "Zwei", "Two")
+        + _voiceover_pair("b")
+        + _slide_pair("c", "Drei", "Three")
+        + _shared_code("end")
+    )
+
+
+class _BarrierTranslator(_RoleRecorder):
+    """Echoes like ``_RoleRecorder`` but only returns once ``parties`` calls overlap."""
+
+    def __init__(self, parties: int) -> None:
+        super().__init__()
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def translate(self, *, source_body: str, source_lang: str, target_lang: str, role: str) -> str:
+        self.barrier.wait()
+        return super().translate(
+            source_body=source_body, source_lang=source_lang, target_lang=target_lang, role=role
+        )
+
+
+class TestPlannedTranslation:
+    def test_concurrent_output_matches_sequential(self):
+        de, en = _split(_multi_slide_deck())
+        sequential = translate_deck_text(
+            de,
+            source_lang="de",
+            target_lang="en",
+            translator=_mirror_translator(de, en),
+            max_concurrent=1,
+        )
+        concurrent = translate_deck_text(
+            de,
+            source_lang="de",
+            target_lang="en",
+            translator=_mirror_translator(de, en),
+            max_concurrent=4,
+        )
+        assert concurrent.target_text == sequential.target_text
+        assert concurrent.cells == sequential.cells
+        assert concurrent.target_text == en
+
+    def test_calls_overlap(self):
+        text = (
+            _slide_pair("a", "Eins", "One")
+            + _slide_pair("b", "Zwei", "Two")
+            + _slide_pair("c", "Drei", "Three")
+        )
+        de, _ = _split(text)
+        # Three distinct bodies and a three-party barrier: a sequential engine
+        # would time out on the first call.
+        translator = _BarrierTranslator(parties=3)
+        result = translate_deck_text(
+            de, source_lang="de", target_lang="en", translator=translator, max_concurrent=3
+        )
+        assert result.translated_count == 3
+        assert len(translator.calls) == 3
+
+    def test_identical_bodies_are_translated_once(self):
+        text = _slide_pair("a", "Gleich", "Same") + _slide_pair("b", "Gleich", "Same")
+        de, _ = _split(text)
+        rec = _RoleRecorder()
+        result = translate_deck_text(de, source_lang="de", target_lang="en", translator=rec)
+        assert result.translated_count == 2
+        assert len(rec.calls) == 1
+
+    def test_first_failure_in_deck_order_is_reported(self):
+        de, en = _split(_multi_slide_deck())
+        mapping = dict(_mirror_translator(de, en).mapping)
+        # Break a late slide and the first one; the error must name the first.
+        for body in list(mapping):
+            if "Eins" in body or "Drei" in body:
+                del mapping[body]
+        translator = StaticSlideTranslator(mapping=mapping)
+        with pytest.raises(TranslateDeckError, match="'a'"):
+            translate_deck_text(
+                de, source_lang="de", target_lang="en", translator=translator, max_concurrent=4
+            )
+
+    def test_sequential_run_stops_at_first_failure(self):
+        de, _ = _split(_slide_pair("a", "Eins", "One") + _slide_pair("b", "Zwei", "Two"))
+
+        class _FailingRecorder(_RoleRecorder):
+            def translate(self, **kwargs) -> str:
+                super().translate(**kwargs)
+                raise TranslationError("offline")
+
+        translator = _FailingRecorder()
+        with pytest.raises(TranslateDeckError, match="'a'"):
+            translate_deck_text(
+                de, source_lang="de", target_lang="en", translator=translator, max_concurrent=1
+            )
+        assert len(translator.calls) == 1
+
+    def test_cached_translations_skip_the_translator(self, tmp_path):
+        from clm.infrastructure.llm.cache import TranslationCache
+        from clm.slides.sync_translate import CachingSlideTranslator
+
+        de, en = _split(_multi_slide_deck())
+        cache = TranslationCache(tmp_path / "clm-llm.sqlite")
+        try:
+            warm = translate_deck_text(
+                de,
+                source_lang="de",
+                target_lang="en",
+                translator=CachingSlideTranslator(inner=_mirror_translator(de, en), cache=cache),
+            )
+            # Every entry is cached now: an inner translator with the same prompt
+            # version but no mapping would raise if it were consulted.
+            cached = translate_deck_text(
+                de,
+                source_lang="de",
+                target_lang="en",
+                translator=CachingSlideTranslator(inner=StaticSlideTranslator(), cache=cache),
+            )
+        finally:
+            cache.close()
+        assert cached.target_text == warm.target_text == en
@@ -0,0 +1,208 @@
+"""Parallel, cached slide validation (``clm.slides.validation_engine``).
+
+The engine must be invisible in the result: cached, parallel and serial runs
+return the same findings in the same order. What it buys is that unchanged
+decks (and split pairs) are not re-validated — so these tests count the
+calls that actually reach the checks.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from textwrap import dedent
+
+import pytest
+from click.testing import CliRunner
+
+from clm.slides import validation_engine
+from clm.slides.validation_engine import (
+    ValidationCache,
+    resolve_jobs,
+    run_file_checks,
+)
+from clm.slides.validator import validate_files
+
+GERMAN_SHARED_CELL = "# %%\n# Der Wert wird hier berechnet.\nx = 1\n"
+
+
+def _write_pair(topic: Path, name: str = "slides_demo") -> tuple[Path, Path]:
+    topic.mkdir(parents=True, exist_ok=True)
+    de = topic / f"{name}.de.py"
+    en = topic / f"{name}.en.py"
+    de.write_text(
+        dedent(
+            """\
+            # %% [markdown] lang="de" tags=["slide"] slide_id="intro"
+            # ## Einführung
+
+            """
+        )
+        + GERMAN_SHARED_CELL,
+        encoding="utf-8",
+    )
+    en.write_text(
+        dedent(
+            """\
+            # %% [markdown] lang="en" tags=["slide"] slide_id="intro"
+            # ## Introduction
+
+            """
+        )
+        + GERMAN_SHARED_CELL,
+        encoding="utf-8",
+    )
+    return de, en
+
+
+def _write_bad_deck(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # An unknown tag is a deterministic per-file finding.
+    path.write_text(
+        dedent(
+            """\
+            # %% [markdown] lang="de" tags=["slide", "no-such-tag"]
+            # ## Titel
+
+            # %% [markdown] lang="en" tags=["slide", "no-such-tag"]
+            # ## Title
+            """
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def deck_files(tmp_path: Path) -> list[Path]:
+    de, en = _write_pair(tmp_path / "topic_010_demo")
+    bad = _write_bad_deck(tmp_path / "topic_020_bad" / "slides_bad.py")
+    return [de, en, bad]
+
+
+@pytest.fixture
+def call_counter(monkeypatch):
+    """Count the validations that actually run (i.e. were not cache hits)."""
+    calls: dict[str, list] = {"file": [], "pair": []}
+    real_file = validation_engine.validate_file
+    real_pair = validation_engine.check_split_pair
+
+    def counting_file(path, *args, **kwargs):
+        calls["file"].append(path)
+        return real_file(path, *args, **kwargs)
+
+    def counting_pair(de_path, en_path):
+        calls["pair"].append((de_path, en_path))
+        return real_pair(de_path, en_path)
+
+    monkeypatch.setattr(validation_engine, "validate_file", counting_file)
+    monkeypatch.setattr(validation_engine, "check_split_pair", counting_pair)
+    return calls
+
+
+class TestCache:
+    def test_cached_run_matches_uncached(self, tmp_path: Path, deck_files: list[Path]) -> None:
+        uncached = validate_files(deck_files, jobs=1)
+        assert uncached.findings, "fixture should produce findings"
+        with ValidationCache(tmp_path / "cache.db") as cache:
+            cold = validate_files(deck_files, jobs=1, cache=cache)
+            warm = validate_files(deck_files, jobs=1, cache=cache)
+        assert cold.findings == uncached.findings
+        assert warm.findings == uncached.findings
+        assert warm.files_checked == uncached.files_checked
+
+    def test_warm_run_skips_every_check(
+        self, tmp_path: Path, deck_files: list[Path], call_counter
+    ) -> None:
+        with ValidationCache(tmp_path / "cache.db") as cache:
+            validate_files(deck_files, jobs=1, cache=cache)
+            assert len(call_counter["file"]) == 3
+            assert len(call_counter["pair"]) == 1
+            validate_files(deck_files, jobs=1, cache=cache)
+        assert len(call_counter["file"]) == 3
+        assert len(call_counter["pair"]) == 1
+
+    def test_editing_one_half_revalidates_it_and_the_pair(
+        self, tmp_path: Path, deck_files: list[Path], call_counter
+    ) -> None:
+        de, en, _bad = deck_files
+        with ValidationCache(tmp_path / "cache.db") as cache:
+            validate_files(deck_files, jobs=1, cache=cache)
+            call_counter["file"].clear()
+            call_counter["pair"].clear()
+            en.write_text(en.read_text(encoding="utf-8") + "\n# %%\ny = 2\n", encoding="utf-8")
+            result = validate_files(deck_files, jobs=1, cache=cache)
+        assert call_counter["file"] == [en]
+        assert call_counter["pair"] == [(de, en)]
+        assert result.findings == validate_files(deck_files, jobs=1).findings
+
+    def test_companion_edit_invalidates_the_deck(
+        self, tmp_path: Path, deck_files: list[Path], call_counter
+    ) -> None:
+        de = deck_files[0]
+        with ValidationCache(tmp_path / "cache.db") as cache:
+            validate_files(deck_files, jobs=1, cache=cache)
+            call_counter["file"].clear()
+            (de.parent / "voiceover_demo.de.py").write_text(
+                '# %% [markdown] tags=["voiceover"] for_slide="intro"\n# Hallo.\n',
+                encoding="utf-8",
+            )
+            validate_files(deck_files, jobs=1, cache=cache)
+        assert de in call_counter["file"]
+
+    def test_check_set_is_part_of_the_key(
+        self, tmp_path: Path, deck_files: list[Path], call_counter
+    ) -> None:
+        with ValidationCache(tmp_path / "cache.db") as cache:
+            validate_files(deck_files, checks=["format", "tags"], jobs=1, cache=cache)
+            call_counter["file"].clear()
+            result = validate_files(deck_files, checks=["format"], jobs=1, cache=cache)
+        assert len(call_counter["file"]) == 3
+        assert result.findings == validate_files(deck_files, checks=["format"]).findings
+
+    def test_validator_version_bump_invalidates(
+        self, tmp_path: Path, deck_files: list[Path], call_counter, monkeypatch
+    ) -> None:
+        with ValidationCache(tmp_path / "cache.db") as cache:
+            validate_files(deck_files, jobs=1, cache=cache)
+            call_counter["file"].clear()
+            monkeypatch.setattr(
+                validation_engine, "VALIDATOR_VERSION", validation_engine.VALIDATOR_VERSION + 1
+            )
+            validate_files(deck_files, jobs=1, cache=cache)
+        assert len(call_counter["file"]) == 3
+
+
+class TestParallel:
+    def test_pool_preserves_serial_order(self, tmp_path: Path) -> None:
+        files: list[Path] = []
+        for i in range(6):
+            files.extend(_write_pair(tmp_path / f"topic_{i:03d}_demo"))
+            files.append(_write_bad_deck(tmp_path / f"topic_{i:03d}_demo" / "slides_bad.py"))
+        serial = validate_files(files, jobs=1)
+        parallel = validate_files(files, jobs=2)
+        assert parallel.findings == serial.findings
+        assert [r.findings for r in run_file_checks(files, None, None, jobs=2)] == [
+            r.findings for r in run_file_checks(files, None, None, jobs=1)
+        ]
+
+    @pytest.mark.parametrize(
+        ("jobs", "pending", "expected"),
+        [(1, 100, 1), (4, 2, 2), (4, 100, 4), (None, 3, 1), (0, 3, 1)],
+    )
+    def test_resolve_jobs(self, jobs, pending, expected) -> None:
+        assert resolve_jobs(jobs, pending) == expected
+
+
+class TestCli:
+    def test_cache_and_jobs_flags_do_not_change_output(self, tmp_path: Path) -> None:
+        from clm.cli.commands.validate_slides import validate_slides_cmd
+
+        _write_pair(tmp_path / "topic_010_demo")
+        _write_bad_deck(tmp_path / "topic_020_bad" / "slides_bad.py")
+        runner = CliRunner()
+        outputs = [
+            runner.invoke(validate_slides_cmd, [str(tmp_path), "--json", *flags]).output
+            for flags in ([], [], ["--no-cache"], ["-j", "2", "--no-cache"])
+        ]
+        assert outputs[0] == outputs[1] == outputs[2] == outputs[3]
+        assert '"findings"' in outputs[0]
@@ -0,0 +1,141 @@
+"""Unit tests for ``clm.snapshot.manifest`` and manifest-backed verification.
+
+A verification backed by the manifest must give exactly the report the
+byte-by-byte comparison gives — it may only skip reading the snapshot side.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from clm.snapshot import verify_against, verify_against_targets, write_manifest
+from clm.snapshot.manifest import MANIFEST_NAME, collect_files, load_manifest
+
+
+def _write(root: Path, rel: str, content: bytes) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+def _report_shape(report) -> tuple:
+    return (
+        report.identical,
+        report.differing,
+        report.skipped,
+        report.missing_in_output,
+        report.missing_in_snapshot,
+        {ext: vars(c) for ext, c in report.by_extension.items()},
+    )
+
+
+@pytest.fixture
+def trees(tmp_path: Path) -> tuple[Path, Path]:
+    snap = tmp_path / "snap"
+    out = tmp_path / "out"
+    files = {
+        "a.ipynb": (b"same", b"same"),
+        "b.py": (b"old", b"new"),
+        "c.py": (b"short", b"much longer"),
+        "page.html": (b"<p>0x7f3a2b1c</p>", b"<p>0x55aa11bb</p>"),
+        "other.html": (b"<p>a</p>", b"<p>b</p>"),
+        "gone.txt": (b"x", None),
+        "extra.txt": (None, b"y"),
+    }
+    for rel, (before, after) in files.items():
+        if before is not None:
+            _write(snap, rel, before)
+        if after is not None:
+            _write(out, rel, after)
+    return snap, out
+
+
+class TestWriteManifest:
+    def test_records_sizes_and_hashes(self, trees):
+        snap, _ = trees
+        path = write_manifest(snap)
+        assert path == snap.resolve() / MANIFEST_NAME
+        manifest = load_manifest(snap)
+        assert manifest is not None
+        assert set(manifest) == {"a.ipynb", "b.py", "c.py", "page.html", "other.html", "gone.txt"}
+        assert manifest["b.py"].size == 3
+        assert manifest["b.py"].normalized_sha256 is None
+        # HTML carries the normalized hash, which differs once addresses are masked.
+        page = manifest["page.html"]
+        assert page.normalized_sha256 is not None
+        assert page.normalized_sha256 != page.sha256
+
+    def test_is_deterministic_and_not_a_compared_file(self, trees):
+        snap, _ = trees
+        first = write_manifest(snap).read_bytes()
+        assert write_manifest(snap).read_bytes() == first
+        assert Path(MANIFEST_NAME) not in collect_files(snap)
+
+    def test_empty_snapshot_gets_an_empty_manifest(self, tmp_path):
+        write_manifest(tmp_path / "snap")
+        assert load_manifest(tmp_path / "snap") == {}
+
+    @pytest.mark.parametrize("payload", ["not json", '{"version": 99, "files": {}}'])
+    def test_unusable_manifest_loads_as_none(self, tmp_path, payload):
+        (tmp_path / MANIFEST_NAME).write_text(payload, encoding="utf-8")
+        assert load_manifest(tmp_path) is None
+
+
+class TestManifestBackedVerify:
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"include_html": True}, {"strict": True}, {"include_html": True, "strict": True}],
+    )
+    def test_report_matches_byte_comparison(self, trees, options):
+        snap, out = trees
+        expected = _report_shape(verify_against(snap, out, **options))
+        write_manifest(snap)
+        assert _report_shape(verify_against(snap, out, jobs=4, **options)) == expected
+
+    def test_snapshot_side_is_not_read(self, trees, monkeypatch):
+        snap, out = trees
+        write_manifest(snap)
+        snap_root = snap.resolve()
+        real_read = Path.read_bytes
+
+        def guarded(self):
+            assert not self.is_relative_to(snap_root), f"read snapshot file {self}"
+            return real_read(self)
+
+        monkeypatch.setattr(Path, "read_bytes", guarded)
+        report = verify_against(snap, out, include_html=True)
+        assert [p.as_posix() for p in report.identical] == ["a.ipynb", "page.html"]
+        assert [p.as_posix() for p in report.differing] == ["b.py", "c.py", "other.html"]
+
+    def test_hand_edited_snapshot_file_falls_back_to_bytes(self, trees):
+        snap, out = trees
+        write_manifest(snap)
+        # Grow the baseline so the recorded size is stale; the edit now matches.
+        _write(snap, "c.py", b"much longer")
+        report = verify_against(snap, out)
+        assert Path("c.py") in report.identical
+
+    def test_targets_share_one_root_manifest(self, tmp_path):
+        snap = tmp_path / "snap"
+        outputs = {name: tmp_path / "out" / name for name in ("shared", "speaker")}
+        for name, out in outputs.items():
+            _write(snap / name, "x.py", b"same")
+            _write(out, "x.py", b"same")
+            _write(snap / name, "y.py", b"before")
+            _write(out, "y.py", b"after!")
+        write_manifest(snap)
+        report = verify_against_targets(snap, list(outputs.items()), jobs=2)
+        assert [p.as_posix() for p in report.identical] == ["shared/x.py", "speaker/x.py"]
+        assert [p.as_posix() for p in report.differing] == ["shared/y.py", "speaker/y.py"]
+        assert report.missing_in_snapshot == []
+
+    def test_manifest_in_output_tree_is_ignored(self, trees):
+        """Verifying one snapshot against another does not compare the manifests."""
+        snap, out = trees
+        write_manifest(snap)
+        write_manifest(out)
+        report = verify_against(snap, out)
+        assert Path(MANIFEST_NAME) not in report.missing_in_snapshot
+        assert Path(MANIFEST_NAME) not in report.identical + report.differing
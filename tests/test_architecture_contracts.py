@@ -209,6 +209,7 @@ class TestWorkerPayloadContract:
     NOTEBOOK_FIELDS = BASE_FIELDS | {
         "author",
         "cross_references",
+        "execute_only",
         "fallback_execute",
         "format",
         "http_replay_cassette_name",
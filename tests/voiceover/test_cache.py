@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
 
+from clm.voiceover.artifact_store import STORE_FILENAME
 from clm.voiceover.cache import (
     CACHE_DIRNAME,
     AlignmentsCache,
@@ -24,6 +27,7 @@ from clm.voiceover.cache import (
     cached_transcribe,
     clear,
     iter_entries,
+    migrate,
     prune,
     resolve_cache_root,
     video_key_for,
@@ -36,6 +40,16 @@ def _touch_video(tmp_path: Path, name: str = "video.mp4", size: int = 1024) -> P
     return p
 
 
+def _write_json_entry(cache_root: Path, subdir: str, key: str, config: dict, artifact) -> Path:
+    """Write an entry in the pre-index one-JSON-file-per-entry layout."""
+    path = cache_root / subdir / f"{key}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"version": 1, "config": config, "artifact": artifact}), encoding="utf-8"
+    )
+    return path
+
+
 class TestVideoKey:
     def test_from_path_produces_stable_hash(self, tmp_path):
         video = _touch_video(tmp_path)
@@ -402,6 +416,146 @@ class TestAlignmentsCache:
         assert loaded.unassigned_segments[0].text == "noise"
 
 
+class TestIndexedStore:
+    @staticmethod
+    def _cfg(language: str = "de") -> TranscribeConfig:
+        return TranscribeConfig(
+            backend="faster-whisper", model="large-v3", language=language, device_class="cpu"
+        )
+
+    def test_entries_share_one_index_file(self, tmp_path):
+        from clm.voiceover.transcribe import Transcript
+
+        cache_root = tmp_path / "cache"
+        cache = TranscriptsCache(cache_root)
+        for i in range(3):
+            video = VideoKey(abspath=f"/v{i}.mp4", mtime_ns=i, size=i)
+            cache.put(video, self._cfg(), Transcript(segments=[], language="de", duration=1.0))
+
+        assert (cache_root / STORE_FILENAME).is_file()
+        assert not cache.directory.exists()
+        assert len(iter_entries(cache_root)) == 3
+
+    def test_packed_transcript_round_trip(self, tmp_path):
+        from clm.voiceover.transcribe import Transcript, TranscriptSegment
+
+        transcript = Transcript(
+            segments=[
+                TranscriptSegment(start=0.25, end=1.5, text="Grüße, 世界"),
+                TranscriptSegment(start=1.5, end=3.0, text="", source_part_index=2),
+            ],
+            language=None,
+            duration=3.0,
+        )
+        video = VideoKey(abspath="/v.mp4", mtime_ns=1, size=1)
+        cache = TranscriptsCache(tmp_path / "cache")
+        cache.put(video, self._cfg(), transcript)
+
+        assert cache.get(video, self._cfg()) == transcript
+
+    def test_get_many_resolves_hits_only(self, tmp_path):
+        from clm.voiceover.transcribe import Transcript
+
+        cache = TranscriptsCache(tmp_path / "cache")
+        videos = [VideoKey(abspath=f"/v{i}.mp4", mtime_ns=i, size=i) for i in range(4)]
+        for video in videos[:2]:
+            cache.put(video, self._cfg(), Transcript(segments=[], language="de", duration=1.0))
+        cache.put(videos[2], self._cfg("en"), Transcript(segments=[], language="en", duration=1.0))
+
+        found = cache.get_many(videos, self._cfg())
+
+        assert set(found) == set(videos[:2])
+
+    def test_pair_get_many(self, tmp_path):
+        from clm.voiceover.matcher import TimelineEntry
+
+        cache = TimelinesCache(tmp_path / "cache")
+        video = VideoKey(abspath="/v.mp4", mtime_ns=1, size=1)
+        hit, miss = SlidesKey(hash="a" * 16), SlidesKey(hash="b" * 16)
+        timeline = [
+            TimelineEntry(slide_index=0, start_time=0.0, end_time=2.0, match_score=80.0),
+            TimelineEntry(
+                slide_index=1, start_time=2.0, end_time=4.0, match_score=55.5, is_header=True
+            ),
+        ]
+        cache.put(video, hit, {"lang": "de"}, timeline)
+
+        found = cache.get_many([(video, hit), (video, miss)], {"lang": "de"})
+
+        assert found == {(video, hit): timeline}
+
+    def test_corrupt_body_is_miss(self, tmp_path):
+        from clm.voiceover.artifact_store import ArtifactStore
+
+        cache_root = tmp_path / "cache"
+        video = VideoKey(abspath="/v.mp4", mtime_ns=1, size=1)
+        cfg = asdict(self._cfg())
+        ArtifactStore.for_root(cache_root).put(
+            "transcripts", video.hash, json.dumps(cfg, sort_keys=True, separators=(",", ":")), b"x"
+        )
+
+        assert TranscriptsCache(cache_root).get(video, self._cfg()) is None
+
+    def test_json_entries_migrate_on_lookup(self, tmp_path):
+        from clm.voiceover.transcribe import Transcript, TranscriptSegment
+
+        cache_root = tmp_path / "cache"
+        video = VideoKey(abspath="/v.mp4", mtime_ns=1, size=1)
+        transcript = Transcript(
+            segments=[TranscriptSegment(start=0.0, end=1.0, text="hallo")],
+            language="de",
+            duration=1.0,
+        )
+        path = _write_json_entry(
+            cache_root, "transcripts", video.hash, asdict(self._cfg()), transcript.to_dict()
+        )
+
+        assert TranscriptsCache(cache_root).get(video, self._cfg()) == transcript
+        assert not path.exists()
+        assert TranscriptsCache(cache_root).get(video, self._cfg()) == transcript
+
+    def test_bulk_migration_keeps_entry_age(self, tmp_path):
+        import os
+        import time
+
+        cache_root = tmp_path / "cache"
+        path = _write_json_entry(
+            cache_root,
+            "transitions",
+            "0123456789abcdef",
+            {"sample_fps": 2.0},
+            [{"timestamp": 1.0, "peak_diff": 0.5, "confidence": 2.0, "num_frames": 1}],
+        )
+        old = time.time() - 10 * 86400
+        os.utime(path, (old, old))
+
+        assert migrate(cache_root) == 1
+        assert [e.subdir for e in iter_entries(cache_root)] == ["transitions"]
+        assert prune(cache_root, max_age_days=7) == 1
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        from clm.voiceover import artifact_store
+        from clm.voiceover.artifact_store import MAX_BYTES_ENV_VAR
+        from clm.voiceover.transcribe import Transcript, TranscriptSegment
+
+        monkeypatch.setenv(MAX_BYTES_ENV_VAR, "400")
+        clock = iter(range(1, 100))
+        monkeypatch.setattr(artifact_store.time, "time", lambda: float(next(clock)))
+        cache = TranscriptsCache(tmp_path / "cache")
+        videos = [VideoKey(abspath=f"/v{i}.mp4", mtime_ns=i, size=i) for i in range(3)]
+
+        def transcript(i):
+            segment = TranscriptSegment(start=0.0, end=1.0, text="x" * 150)
+            return Transcript(segments=[segment], language="de", duration=float(i))
+
+        cache.put(videos[0], self._cfg(), transcript(0))
+        cache.put(videos[1], self._cfg(), transcript(1))
+        assert cache.get(videos[0], self._cfg()) is not None  # now the most recent
+        cache.put(videos[2], self._cfg(), transcript(2))
+
+        assert set(cache.get_many(videos, self._cfg())) == {videos[0], videos[2]}
+
+
 class TestHousekeeping:
     def test_iter_entries_lists_all_subdirs(self, tmp_path):
         from clm.voiceover.transcribe import Transcript
@@ -437,10 +591,10 @@ class TestHousekeeping:
         assert removed == 1
         assert iter_entries(cache_root) == []
 
-    def test_prune_respects_max_age(self, tmp_path):
-        import os
+    def test_prune_respects_max_age(self, tmp_path, monkeypatch):
         import time
 
+        from clm.voiceover import artifact_store
         from clm.voiceover.transcribe import Transcript
 
         cache_root = tmp_path / "cache"
@@ -450,12 +604,11 @@ class TestHousekeeping:
             backend="faster-whisper", model="large-v3", language="de", device_class="cpu"
         )
         tc = TranscriptsCache(cache_root)
-        tc.put(video_key, cfg, Transcript(segments=[], language="de", duration=1.0))
-
-        entry_path = iter_entries(cache_root)[0].path
-        # Backdate the file by 10 days
+        # Write the entry 10 days ago
         old = time.time() - 10 * 86400
-        os.utime(entry_path, (old, old))
+        monkeypatch.setattr(artifact_store.time, "time", lambda: old)
+        tc.put(video_key, cfg, Transcript(segments=[], language="de", duration=1.0))
+        monkeypatch.undo()
 
         # 7-day window: removes it
         assert prune(cache_root, max_age_days=7) == 1
@@ -684,8 +837,12 @@ class TestLegacyPromotion:
         cfg = TranscribeConfig(
             backend="faster-whisper", model="large-v3", language="de", device_class="cpu"
         )
-        TranscriptsCache(legacy_cache_root(deck_dir)).put(
-            VideoKey.from_path(video), cfg, transcript
+        _write_json_entry(
+            legacy_cache_root(deck_dir),
+            "transcripts",
+            VideoKey.from_path(video).hash,
+            asdict(cfg),
+            transcript.to_dict(),
         )
 
     def test_transcript_promoted_from_per_deck_cache(self, tmp_path):
@@ -713,7 +870,7 @@ class TestLegacyPromotion:
         assert transcript.segments[0].text == "hi"
         # Promoted: the shared root now holds the entry itself.
         key = VideoKey.from_path(video)
-        assert (shared / "transcripts" / f"{key.hash}.json").is_file()
+        assert [entry.key for entry in iter_entries(shared)] == [key.hash]
         _, hit2 = cached_transcribe(video, **kwargs)
         assert hit2 is True
 
@@ -769,8 +926,14 @@ class TestLegacyPromotion:
         deck = tmp_path / "topic_010"
         deck.mkdir()
         cfg = DetectConfig(sample_fps=2.0, threshold_factor=3.0, percentile=95.0, merge_window=3.0)
-        events = [TransitionEvent(timestamp=5.0, peak_diff=0.4, confidence=2.0, num_frames=2)]
-        TransitionsCache(legacy_cache_root(deck)).put(VideoKey.from_path(video), cfg, events)
+        event = TransitionEvent(timestamp=5.0, peak_diff=0.4, confidence=2.0, num_frames=2)
+        _write_json_entry(
+            legacy_cache_root(deck),
+            "transitions",
+            VideoKey.from_path(video).hash,
+            asdict(cfg),
+            [asdict(event)],
+        )
 
         loaded, hit = cached_detect(
             video,
@@ -782,7 +945,7 @@ class TestLegacyPromotion:
         assert loaded[0].timestamp == 5.0
 
     def test_timeline_and_alignment_promoted(self, tmp_path):
-        from clm.voiceover.aligner import AlignmentResult, SlideNotes
+        from clm.voiceover.aligner import SlideNotes
         from clm.voiceover.cache import legacy_cache_root
         from clm.voiceover.matcher import TimelineEntry
 
@@ -796,21 +959,19 @@ class TestLegacyPromotion:
         legacy = legacy_cache_root(deck)
         tl_cfg = {"lang": "de"}
         al_cfg = {"bias": 0.4}
-        TimelinesCache(legacy).put(
-            video_key,
-            slides_key,
+        key = f"{video_key.hash}_{slides_key.hash}"
+        _write_json_entry(
+            legacy,
+            "timelines",
+            key,
             tl_cfg,
-            [TimelineEntry(slide_index=1, start_time=0.0, end_time=5.0, match_score=90.0)],
-        )
-        AlignmentsCache(legacy).put(
-            video_key,
-            slides_key,
-            al_cfg,
-            AlignmentResult(
-                slide_notes={1: SlideNotes(slide_index=1, segments=["hi"])},
-                unassigned_segments=[],
-            ),
+            [asdict(TimelineEntry(slide_index=1, start_time=0.0, end_time=5.0, match_score=90.0))],
         )
+        alignment = {
+            "slide_notes": {"1": asdict(SlideNotes(slide_index=1, segments=["hi"]))},
+            "unassigned_segments": [],
+        }
+        _write_json_entry(legacy, "alignments", key, al_cfg, alignment)
 
         policy = CachePolicy(cache_root=tmp_path / "shared-cache")
 
@@ -858,7 +1019,7 @@ class TestForkedDecksShareCache:
         _, hit_b = cached_transcribe(video, base_dir=deck_b, **kwargs)
         assert (hit_a, hit_b) == (False, True)
         assert calls["n"] == 1
-        assert (tmp_path / ".clm-cache" / "voiceover" / "transcripts").is_dir()
+        assert (tmp_path / ".clm-cache" / "voiceover" / STORE_FILENAME).is_file()
 
 
 @pytest.fixture(autouse=True)
@@ -302,6 +302,52 @@ class TestWebSocketManagerPeriodicUpdates:
 
         # Should not have crashed - error was caught
 
+    @pytest.mark.asyncio
+    async def test_periodic_updates_broadcast_feed_deltas(self):
+        """A changed feed poll goes out once as a status_delta."""
+        manager = WebSocketManager()
+        mock_ws = AsyncMock()
+        mock_service = MagicMock()
+        manager.feed = MagicMock(monitor_service=mock_service)
+        manager.feed.poll.side_effect = [{"seq": 3, "jobs": []}, None]
+
+        await manager.connect(mock_ws)
+        await manager.subscribe(mock_ws, ["status"])
+
+        task = asyncio.create_task(manager.send_periodic_updates(mock_service, interval=0.01))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        mock_ws.send_json.assert_awaited_once_with(
+            {"type": "status_delta", "seq": 3, "data": {"jobs": []}}
+        )
+        mock_service.get_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_periodic_updates_do_not_poll_without_status_subscribers(self):
+        """Clients subscribed to other channels do not cost a feed poll."""
+        manager = WebSocketManager()
+        mock_ws = AsyncMock()
+        mock_service = MagicMock()
+        manager.feed = MagicMock(monitor_service=mock_service)
+
+        await manager.connect(mock_ws)
+        await manager.subscribe(mock_ws, ["studio"])
+
+        task = asyncio.create_task(manager.send_periodic_updates(mock_service, interval=0.01))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        manager.feed.poll.assert_not_called()
+
 
 class TestGlobalManagerInstance:
     """Test the global ws_manager instance."""
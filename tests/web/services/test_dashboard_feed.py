@@ -0,0 +1,226 @@
+"""Unit tests for the dashboard delta feed."""
+
+import json
+import sqlite3
+import time
+
+import pytest
+
+from clm.web.services.dashboard_feed import MAX_EVENTS_PER_DELTA, DashboardFeed
+from clm.web.services.monitor_service import MonitorService
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    from clm.infrastructure.database.schema import init_database
+
+    path = tmp_path / "jobs.db"
+    init_database(path)
+    return path
+
+
+@pytest.fixture
+def feed(db_path):
+    feed = DashboardFeed(MonitorService(db_path))
+    yield feed
+    feed.close()
+
+
+def _execute(db_path, sql, params=()):
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.execute(sql, params)
+        conn.commit()
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
+
+def _add_job(db_path, status="pending", payload=None):
+    return _execute(
+        db_path,
+        "INSERT INTO jobs (job_type, status, input_file, output_file, content_hash, payload, "
+        "created_at) VALUES ('notebook', ?, '/in/a.py', '/out/a.html', 'h', ?, datetime('now'))",
+        (status, json.dumps(payload or {})),
+    )
+
+
+def _add_worker(db_path, container_id, status="idle", jobs_processed=0):
+    return _execute(
+        db_path,
+        "INSERT INTO workers (container_id, worker_type, status, execution_mode, jobs_processed) "
+        "VALUES (?, 'notebook', ?, 'direct', ?)",
+        (container_id, status, jobs_processed),
+    )
+
+
+def _add_event(db_path, message):
+    return _execute(
+        db_path,
+        "INSERT INTO worker_events (event_type, worker_type, execution_mode, message) "
+        "VALUES ('worker_ready', 'notebook', 'direct', ?)",
+        (message,),
+    )
+
+
+class TestPoll:
+    def test_first_poll_only_primes(self, db_path, feed):
+        _add_job(db_path)
+
+        assert feed.poll() is None
+        assert feed.seq == 0
+
+    def test_missing_database_yields_nothing(self, tmp_path):
+        feed = DashboardFeed(MonitorService(tmp_path / "missing.db"))
+
+        assert feed.poll() is None
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_unchanged_database_yields_nothing(self, db_path, feed):
+        _add_job(db_path)
+        _add_worker(db_path, "w1")
+        feed.poll()
+
+        assert feed.poll() is None
+
+    def test_new_job_is_reported_with_parsed_payload(self, db_path, feed):
+        feed.poll()
+        job_id = _add_job(db_path, payload={"format": "html", "language": "de"})
+
+        delta = feed.poll()
+
+        assert delta["seq"] == 1
+        assert [job["job_id"] for job in delta["jobs"]] == [job_id]
+        assert delta["jobs"][0]["output_format"] == "html"
+        assert delta["jobs"][0]["language"] == "de"
+        assert delta["queue"] == {"pending": 1, "processing": 0}
+
+    def test_status_transitions_are_reported(self, db_path, feed):
+        job_id = _add_job(db_path)
+        feed.poll()
+
+        _execute(
+            db_path,
+            "UPDATE jobs SET status = 'processing', started_at = datetime('now') WHERE id = ?",
+            (job_id,),
+        )
+        processing = feed.poll()
+        _execute(
+            db_path,
+            "UPDATE jobs SET status = 'failed', completed_at = datetime('now'), error = 'boom' "
+            "WHERE id = ?",
+            (job_id,),
+        )
+        failed = feed.poll()
+
+        assert processing["jobs"][0]["status"] == "processing"
+        assert processing["queue"] == {"pending": 0, "processing": 1}
+        assert failed["jobs"][0]["status"] == "failed"
+        assert failed["jobs"][0]["error_message"] == "boom"
+        assert failed["queue"] == {"pending": 0, "processing": 0}
+        assert failed["seq"] == processing["seq"] + 1
+
+    def test_finished_jobs_are_not_reported_again(self, db_path, feed):
+        feed.poll()
+        _add_job(db_path, status="completed")
+        feed.poll()
+
+        assert feed.poll() is None
+
+    def test_retried_job_reenters_the_open_set(self, db_path, feed):
+        job_id = _add_job(db_path, status="failed")
+        feed.poll()
+
+        _execute(db_path, "UPDATE jobs SET status = 'pending' WHERE id = ?", (job_id,))
+        delta = feed.poll()
+
+        assert [job["status"] for job in delta["jobs"]] == ["pending"]
+        assert delta["queue"]["pending"] == 1
+
+    def test_worker_changes_and_removals(self, db_path, feed):
+        _add_worker(db_path, "w1")
+        _add_worker(db_path, "w2")
+        feed.poll()
+
+        _execute(db_path, "UPDATE workers SET status = 'busy' WHERE container_id = 'w1'")
+        _execute(db_path, "UPDATE workers SET status = 'dead' WHERE container_id = 'w2'")
+        delta = feed.poll()
+
+        assert [w["worker_id"] for w in delta["workers"]] == ["w1"]
+        assert delta["workers"][0]["status"] == "busy"
+        assert delta["workers_removed"] == ["w2"]
+        assert "jobs" not in delta
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+    def test_busy_worker_elapsed_time_ignores_the_local_time_zone(self, db_path, feed, monkeypatch):
+        monkeypatch.setenv("TZ", "Etc/GMT+5")
+        time.tzset()
+        try:
+            worker_id = _add_worker(db_path, "w1", status="busy")
+            job_id = _add_job(db_path, status="processing")
+            _execute(
+                db_path,
+                "UPDATE jobs SET worker_id = ?, started_at = datetime('now', '-30 seconds') "
+                "WHERE id = ?",
+                (worker_id, job_id),
+            )
+
+            (worker,) = feed.snapshot()["workers"]
+        finally:
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+        assert worker["current_job_id"] == str(job_id)
+        assert 29 <= worker["elapsed_seconds"] <= 35
+
+    def test_heartbeat_alone_is_not_a_change(self, db_path, feed):
+        _add_worker(db_path, "w1")
+        feed.poll()
+
+        _execute(db_path, "UPDATE workers SET last_heartbeat = datetime('now', '+5 seconds')")
+
+        assert feed.poll() is None
+
+    def test_events_follow_the_cursor(self, db_path, feed):
+        _add_event(db_path, "old")
+        feed.poll()
+        _add_event(db_path, "new")
+
+        delta = feed.poll()
+
+        assert [event["message"] for event in delta["events"]] == ["new"]
+        assert feed.poll() is None
+
+    def test_event_bursts_are_split_across_deltas(self, db_path, feed):
+        feed.poll()
+        for i in range(MAX_EVENTS_PER_DELTA + 3):
+            _add_event(db_path, f"e{i}")
+
+        first = feed.poll()
+        second = feed.poll()
+
+        assert len(first["events"]) == MAX_EVENTS_PER_DELTA
+        assert len(second["events"]) == 3
+
+
+class TestSnapshot:
+    def test_snapshot_holds_open_jobs_and_live_workers(self, db_path, feed):
+        pending = _add_job(db_path)
+        _add_job(db_path, status="completed")
+        _add_worker(db_path, "w1")
+
+        state = feed.snapshot()
+
+        assert state["seq"] == 0
+        assert [job["job_id"] for job in state["jobs"]] == [pending]
+        assert [w["worker_id"] for w in state["workers"]] == ["w1"]
+        assert state["queue"] == {"pending": 1, "processing": 0}
+
+    def test_deltas_apply_on_top_of_the_snapshot(self, db_path, feed):
+        feed.snapshot()
+        job_id = _add_job(db_path)
+
+        delta = feed.poll()
+
+        assert delta["seq"] == 1
+        assert [job["job_id"] for job in delta["jobs"]] == [job_id]
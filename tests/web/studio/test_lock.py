@@ -201,3 +201,89 @@ class TestLockOverHttp:
         )
         assert r.status_code == 423
         assert r.json()["detail"]["reason"]
+
+
+class TestLockMemoization:
+    """The pair's parse + ledger diff is memoized against a content fingerprint."""
+
+    @pytest.fixture()
+    def diff_calls(self, monkeypatch) -> list[tuple]:
+        from clm.slides import doc_lenses
+
+        calls: list[tuple] = []
+        real_load_bundle = doc_lenses.load_bundle
+
+        def counting_load_bundle(*args, **kwargs):
+            calls.append(args)
+            return real_load_bundle(*args, **kwargs)
+
+        monkeypatch.setattr(doc_lenses, "load_bundle", counting_load_bundle)
+        return calls
+
+    def _wait_for_refreshes(self, service: StudioService) -> None:
+        for future in list(service._lock_refreshes.values()):
+            future.result(timeout=30)
+
+    def test_unchanged_pair_is_diffed_once(
+        self, bilingual_service: StudioService, bilingual: Bilingual, diff_calls
+    ):
+        record_pair(bilingual.de_path, bilingual.en_path)
+        diff_calls.clear()
+        first = bilingual_service.open_deck(bilingual.de_id)
+        second = bilingual_service.open_deck(bilingual.en_id)
+        assert len(diff_calls) == 1
+        assert first.lock.editable is True and second.lock.editable is True
+
+    def test_disk_change_recomputes(self, bilingual_service: StudioService, bilingual: Bilingual):
+        record_pair(bilingual.de_path, bilingual.en_path)
+        assert bilingual_service.open_deck(bilingual.en_id).lock.editable is True
+        _dirty_de(bilingual)  # no watcher in this test: the fingerprint alone catches it
+        assert bilingual_service.open_deck(bilingual.en_id).lock.editable is False
+
+    def test_ledger_change_recomputes(self, bilingual_service: StudioService, bilingual: Bilingual):
+        assert bilingual_service.open_deck(bilingual.de_id).lock.editable is False  # cold
+        record_pair(bilingual.de_path, bilingual.en_path)
+        assert bilingual_service.open_deck(bilingual.de_id).lock.editable is True
+
+    def test_write_refreshes_lock_off_the_request_path(
+        self, bilingual_service: StudioService, bilingual: Bilingual, diff_calls, monkeypatch
+    ):
+        record_pair(bilingual.de_path, bilingual.en_path)
+        de = bilingual_service.open_deck(bilingual.de_id)
+        slide = next(c for c in de.cells if c.role == "slide")
+        result = bilingual_service.edit_body(
+            bilingual.de_id,
+            slide.slide_id,
+            slide.role,
+            "# geändert\n#\n# text",
+            expected_deck_version=de.deck_version,
+            expected_cell_hash=slide.content_hash,
+        )
+        self._wait_for_refreshes(bilingual_service)
+        diff_calls.clear()
+        # Keep the second write's own refresh from racing the assertion below.
+        monkeypatch.setattr(bilingual_service, "schedule_lock_refresh", lambda deck_id: None)
+
+        # The background refresh already diffed the post-write pair: the next
+        # save's lock check is a cache hit, and it sees EN locked.
+        en = bilingual_service.open_deck(bilingual.en_id)
+        bilingual_service.edit_body(
+            bilingual.de_id,
+            slide.slide_id,
+            slide.role,
+            "# nochmal\n#\n# text",
+            expected_deck_version=result.deck_version,
+            expected_cell_hash=result.cell_hash,
+        )
+        assert en.lock.editable is False
+        assert diff_calls == []
+
+    def test_invalidate_lock_drops_the_entry(
+        self, bilingual_service: StudioService, bilingual: Bilingual, diff_calls
+    ):
+        record_pair(bilingual.de_path, bilingual.en_path)
+        diff_calls.clear()
+        bilingual_service.open_deck(bilingual.de_id)
+        bilingual_service.invalidate_lock(bilingual.en_id)
+        bilingual_service.open_deck(bilingual.de_id)
+        assert len(diff_calls) == 2
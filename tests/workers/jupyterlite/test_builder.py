@@ -10,6 +10,7 @@ integration test that does exercise the CLI lives in
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 from unittest.mock import patch
 
@@ -277,3 +278,213 @@ def test_build_result_summary_is_valid_json(
     summary = json.loads(build_result_to_summary(result))
     assert summary["cache_key"] == result.cache_key
     assert Path(summary["site_dir"]) == result.site_dir
+
+
+# ---------------------------------------------------------------------------
+# Incremental builds
+# ---------------------------------------------------------------------------
+
+
+def _write_notebook(path: Path, marker: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "cells": [{"cell_type": "markdown", "metadata": {}, "source": marker}],
+                "metadata": {},
+                "nbformat": 4,
+                "nbformat_minor": 5,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def _fake_contents_site(lite_dir: Path, site_dir: Path, *, kernel: str) -> None:
+    """Mimic the contents addon: copy ``files/`` and write one listing per dir."""
+    site_dir.mkdir(parents=True, exist_ok=True)
+    (site_dir / "index.html").write_text("<html>lite</html>", encoding="utf-8")
+    shutil.copytree(lite_dir / "files", site_dir / "files")
+    files_root = site_dir / "files"
+    for directory in [files_root, *sorted(p for p in files_root.rglob("*") if p.is_dir())]:
+        rel = directory.relative_to(files_root).as_posix()
+        rel = "" if rel == "." else rel
+        children = []
+        for child in sorted(directory.iterdir()):
+            child_rel = f"{rel}/{child.name}" if rel else child.name
+            kind = "directory" if child.is_dir() else "notebook"
+            children.append(
+                {
+                    "name": child.name,
+                    "path": child_rel,
+                    "type": kind,
+                    "size": None if child.is_dir() else child.stat().st_size,
+                    "content": None,
+                    "format": None,
+                    "mimetype": None,
+                    "writable": True,
+                    "created": "2024-01-01T00:00:00Z",
+                    "last_modified": "2024-01-01T00:00:00Z",
+                }
+            )
+        listing_dir = site_dir / "api" / "contents" / rel if rel else site_dir / "api" / "contents"
+        listing_dir.mkdir(parents=True, exist_ok=True)
+        (listing_dir / "all.json").write_text(
+            json.dumps({"name": directory.name if rel else "", "path": rel, "content": children}),
+            encoding="utf-8",
+        )
+
+
+@pytest.fixture
+def fake_contents_build():
+    with patch.object(
+        builder_module, "_run_jupyter_lite_build", side_effect=_fake_contents_site
+    ) as m:
+        yield m
+
+
+def _listing(site_dir: Path, rel: str = "") -> dict[str, str]:
+    base = site_dir / "api" / "contents"
+    data = json.loads(((base / rel) if rel else base).joinpath("all.json").read_text("utf-8"))
+    return {entry["name"]: entry["path"] for entry in data["content"]}
+
+
+def _two_kind_args(tmp_path: Path, **overrides) -> BuildArgs:
+    trees = {"code-along": tmp_path / "ca", "completed": tmp_path / "co"}
+    fields = {
+        "notebook_trees": trees,
+        "output_dir": tmp_path / "out",
+        "kernel": "pyodide",
+        "wheels": [],
+        "environment_yml": None,
+        "app_archive": "offline",
+        "launcher": "none",
+        "target_label": "t/en",
+        "jupyterlite_core_version": "0.7.4",
+    }
+    fields.update(overrides)
+    return BuildArgs(**fields)
+
+
+@pytest.fixture
+def two_kind_trees(tmp_path: Path) -> None:
+    for kind in ("ca", "co"):
+        _write_notebook(tmp_path / kind / "week1" / "01.ipynb", f"{kind} one")
+        _write_notebook(tmp_path / kind / "week1" / "02.ipynb", f"{kind} two")
+
+
+def test_content_only_change_updates_site_in_place(
+    tmp_path: Path, two_kind_trees, fake_contents_build
+) -> None:
+    args = _two_kind_args(tmp_path)
+    first = build_site(args)
+    assert first.mode == "full"
+
+    _write_notebook(tmp_path / "ca" / "week1" / "01.ipynb", "ca one, edited")
+    second = build_site(args)
+
+    assert fake_contents_build.call_count == 1
+    assert second.mode == "incremental"
+    assert second.contents_changed == 1
+    assert second.cache_key != first.cache_key
+    site_nb = json.loads(
+        (second.site_dir / "files" / "code-along" / "week1" / "01.ipynb").read_text("utf-8")
+    )
+    assert site_nb["cells"][0]["source"] == "ca one, edited"
+    # The kernelspec patch is applied to updated files too.
+    assert site_nb["metadata"]["kernelspec"]["name"] == "python"
+    assert (second.site_dir / "index.html").is_file()
+
+
+def test_added_and_removed_files_update_listings(
+    tmp_path: Path, two_kind_trees, fake_contents_build
+) -> None:
+    args = _two_kind_args(tmp_path)
+    build_site(args)
+
+    (tmp_path / "co" / "week1" / "01.ipynb").unlink()
+    (tmp_path / "co" / "week1" / "02.ipynb").unlink()
+    _write_notebook(tmp_path / "ca" / "week2" / "03.ipynb", "new")
+    result = build_site(args)
+
+    assert result.mode == "incremental"
+    assert result.contents_changed == 3
+    site = result.site_dir
+    # Emptied directories are pruned, exactly as a full build would never stage them.
+    assert not (site / "files" / "completed").exists()
+    assert not (site / "api" / "contents" / "completed").exists()
+    assert _listing(site) == {"code-along": "code-along"}
+    assert _listing(site, "code-along") == {
+        "week1": "code-along/week1",
+        "week2": "code-along/week2",
+    }
+    assert _listing(site, "code-along/week2") == {"03.ipynb": "code-along/week2/03.ipynb"}
+
+
+def test_unchanged_rebuild_touches_nothing(
+    tmp_path: Path, two_kind_trees, fake_contents_build
+) -> None:
+    args = _two_kind_args(tmp_path)
+    first = build_site(args)
+    second = build_site(args)
+    assert fake_contents_build.call_count == 1
+    assert second.mode == "incremental"
+    assert second.contents_changed == 0
+    assert second.cache_key == first.cache_key
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"kernel": "xeus-python"},
+        {"branding_site_name": "Course"},
+        {"jupyterlite_core_version": "0.8.0"},
+        {"app_archive": "cdn"},
+        {"incremental": False},
+    ],
+)
+def test_app_level_changes_force_a_full_build(
+    tmp_path: Path, two_kind_trees, fake_contents_build, change
+) -> None:
+    build_site(_two_kind_args(tmp_path))
+    result = build_site(_two_kind_args(tmp_path, **change))
+    assert fake_contents_build.call_count == 2
+    assert result.mode == "full"
+
+
+def test_wheel_change_forces_a_full_build(
+    tmp_path: Path, two_kind_trees, fake_contents_build
+) -> None:
+    wheel = tmp_path / "pkg-1.0-py3-none-any.whl"
+    wheel.write_bytes(b"v1")
+    build_site(_two_kind_args(tmp_path, wheels=[wheel]))
+    wheel.write_bytes(b"v2")
+    result = build_site(_two_kind_args(tmp_path, wheels=[wheel]))
+    assert result.mode == "full"
+    assert fake_contents_build.call_count == 2
+
+
+def test_incremental_site_matches_a_full_build(
+    tmp_path: Path, two_kind_trees, fake_contents_build
+) -> None:
+    args = _two_kind_args(tmp_path)
+    build_site(args)
+    _write_notebook(tmp_path / "ca" / "week1" / "02.ipynb", "changed")
+    _write_notebook(tmp_path / "co" / "week3" / "09.ipynb", "added")
+    incremental = build_site(args)
+
+    full = build_site(_two_kind_args(tmp_path, output_dir=tmp_path / "full", incremental=False))
+
+    def tree(site: Path) -> dict[str, bytes]:
+        root = site / "files"
+        return {
+            p.relative_to(root).as_posix(): p.read_bytes() for p in root.rglob("*") if p.is_file()
+        }
+
+    def listings(site: Path) -> dict[str, dict[str, str]]:
+        root = site / "api" / "contents"
+        rels = [p.parent.relative_to(root).as_posix() for p in root.rglob("all.json")]
+        return {rel: _listing(site, "" if rel == "." else rel) for rel in rels}
+
+    assert tree(incremental.site_dir) == tree(full.site_dir)
+    assert listings(incremental.site_dir) == listings(full.site_dir)
@@ -28,7 +28,9 @@ from clm.workers.notebook.notebook_processor import (
     CellIdGenerator,
     NotebookProcessor,
     TrackingExecutePreprocessor,
+    _CachedHighlight2HTML,
     _effective_cell_timeout,
+    _export_html,
     _normalize_jupytext_metadata_filters,
     _strip_lines_to_next_cell,
 )
@@ -899,6 +901,52 @@ class TestOutputFormatHtml:
         assert "<html>" in result
         MockExporter.assert_called_once()
 
+    def test_exporter_is_reused_across_exports(self):
+        """The worker builds one HTMLExporter per thread, not one per job."""
+        notebook = make_notebook_node([make_cell("markdown", "# Test")])
+
+        with patch("clm.workers.notebook.notebook_processor.HTMLExporter") as MockExporter:
+            MockExporter.return_value.from_notebook_node.return_value = ("<html></html>", {})
+
+            _export_html(notebook)
+            _export_html(notebook)
+
+        MockExporter.assert_called_once()
+        highlighter = MockExporter.call_args.kwargs["filters"]["highlight_code"]
+        assert isinstance(highlighter, _CachedHighlight2HTML)
+        assert MockExporter.return_value.from_notebook_node.call_count == 2
+
+    def test_pooled_export_matches_fresh_exporter(self):
+        """Reusing the exporter and highlight cache keeps the HTML byte-identical."""
+        from nbconvert import HTMLExporter
+
+        notebook = make_notebook_node(
+            [
+                make_cell("markdown", "# Title"),
+                make_cell("code", "def f(x):\n    return x + 1"),
+                make_cell("code", "%%bash\necho hi"),
+            ]
+        )
+        expected, _ = HTMLExporter(template_name="classic").from_notebook_node(notebook)
+
+        assert _export_html(notebook) == expected
+        assert _export_html(notebook) == expected
+
+    def test_highlight_cache_is_keyed_by_language(self):
+        """The same source highlighted for two lexers yields two cache entries."""
+        from nbconvert.filters.highlight import Highlight2HTML
+
+        highlighter = _CachedHighlight2HTML()
+        source = f"x = {uuid.uuid4().hex!r}"
+
+        as_python = highlighter(source, "python")
+        as_text = highlighter(source, "text")
+
+        assert as_python == Highlight2HTML()(source, "python")
+        assert as_text == Highlight2HTML()(source, "text")
+        assert as_python != as_text
+        assert highlighter(source, "python") is as_python
+
 
 # ============================================================================
 # Jinja Template Expansion Tests
@@ -1117,6 +1165,25 @@ class TestExecutionCaching:
             assert spec.should_cache_execution is False
             assert spec.can_reuse_execution is False
 
+    @pytest.mark.asyncio
+    async def test_execute_only_caches_without_exporting_html(self):
+        """An execute-only Recording payload only populates the cache."""
+        notebook_json = make_notebook_json([make_cell("markdown", "# Title")])
+
+        cache = MagicMock()
+        processor = NotebookProcessor(RecordingOutput(format="html", language="en"), cache=cache)
+        payload = make_payload(notebook_json, format_="html", kind="recording").model_copy(
+            update={"execute_only": True}
+        )
+
+        with patch("clm.workers.notebook.notebook_processor.HTMLExporter") as MockExporter:
+            result = await processor.process_notebook(payload)
+
+        assert result == ""
+        MockExporter.assert_not_called()
+        cache.store.assert_called_once()
+        assert cache.store.call_args.kwargs["content_hash"] == payload.execution_cache_hash()
+
 
 # ============================================================================
 # Other Files Handling Tests
@@ -1859,6 +1926,39 @@ class TestSourceDirectoryHandling:
         assert written_file.exists()
         assert written_file.read_bytes() == test_data
 
+    @pytest.mark.asyncio
+    async def test_kernel_runs_in_a_reused_topic_sandbox(self, tmp_path, monkeypatch):
+        """Jobs of one topic execute in the same sandbox, reset to the siblings."""
+        from clm.workers.notebook.sandbox import SandboxMaterializer
+
+        materializer = SandboxMaterializer(tmp_path / "sandboxes")
+        monkeypatch.setattr(
+            notebook_processor_module, "get_sandbox_materializer", lambda: materializer
+        )
+        seen: list[tuple[Any, set[str]]] = []
+
+        async def fake_execute(cid, path, nb, payload, loop, source_dir):
+            seen.append((path, {p.name for p in path.iterdir()}))
+            (path / "written-by-kernel.txt").write_text("x")
+
+        notebook_json = make_notebook_json([make_cell("code", "x = 1")])
+        payload = make_payload(
+            notebook_json,
+            kind="speaker",
+            format_="html",
+            other_files={"data.txt": b64encode(b"data").decode("utf-8")},
+        ).model_copy(update={"source_topic_dir": "/course/slides/topic_010"})
+
+        for _ in range(2):
+            processor = NotebookProcessor(SpeakerOutput(format="html"))
+            monkeypatch.setattr(processor, "_execute_notebook_with_path", fake_execute)
+            with patch("clm.workers.notebook.notebook_processor.HTMLExporter") as MockExporter:
+                MockExporter.return_value.from_notebook_node.return_value = ("<html/>", {})
+                await processor.process_notebook(payload)
+
+        assert seen[0][0] == seen[1][0]
+        assert seen[0][1] == seen[1][1] == {"data.txt"}
+
 
 # ============================================================================
 # Metadata Stripping Tests — slide_id and for_slide
@@ -563,6 +563,52 @@ class TestNotebookWorkerProcessJob:
                     assert call_args[0][0] == str(output_file)
                     assert call_args[0][1] == "test-hash"
 
+    @pytest.mark.asyncio
+    async def test_process_job_async_execute_only_writes_nothing(
+        self, worker_id, db_path, tmp_path
+    ):
+        """An execute-only job leaves neither an output file nor a job-cache row."""
+        from clm.workers.notebook.notebook_worker import NotebookWorker
+
+        input_file = tmp_path / "notebook.py"
+        input_file.write_text("# %%\nx = 1\n")
+        output_file = tmp_path / ".clm-implicit" / "notebook.html"
+
+        job = Job(
+            id=1,
+            job_type="notebook",
+            input_file=str(input_file),
+            output_file=str(output_file),
+            content_hash="test-hash",
+            payload={
+                "kind": "recording",
+                "prog_lang": "python",
+                "language": "en",
+                "format": "html",
+                "execute_only": True,
+            },
+            status="processing",
+            created_at=datetime.now(),
+        )
+
+        worker = NotebookWorker(worker_id, db_path)
+
+        with patch("clm.workers.notebook.notebook_worker.create_output_spec"):
+            with patch("clm.workers.notebook.notebook_worker.NotebookProcessor") as MockProcessor:
+                mock_processor = MagicMock()
+                mock_processor.process_notebook = AsyncMock(return_value="")
+                mock_processor.get_warnings.return_value = []
+                MockProcessor.return_value = mock_processor
+
+                with patch.object(worker.job_queue, "add_to_cache") as mock_cache:
+                    await worker._process_job_async(job)
+
+        payload = mock_processor.process_notebook.call_args.args[0]
+        assert payload.execute_only is True
+        assert not output_file.exists()
+        assert not output_file.parent.exists()
+        mock_cache.assert_not_called()
+
     def test_process_job_uses_event_loop(self, worker_id, db_path, tmp_path):
         """process_job should use persistent event loop."""
         from clm.workers.notebook.notebook_worker import NotebookWorker
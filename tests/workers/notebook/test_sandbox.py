@@ -0,0 +1,157 @@
+"""Tests for the notebook execution sandbox materializer."""
+
+import os
+from base64 import b64encode
+
+import pytest
+
+from clm.workers.notebook import sandbox as sandbox_module
+from clm.workers.notebook.sandbox import (
+    SandboxMaterializer,
+    decode_other_files,
+    sandbox_fsync_enabled,
+    write_files,
+)
+
+
+@pytest.fixture
+def materializer(tmp_path):
+    m = SandboxMaterializer(tmp_path / "store")
+    yield m
+    m.close()
+
+
+def _tree(path):
+    return {p.relative_to(path).as_posix(): p.read_bytes() for p in path.rglob("*") if p.is_file()}
+
+
+class TestCheckout:
+    def test_sandbox_holds_exactly_the_files(self, materializer):
+        files = {"data.txt": b"hello", "sub/dir/more.csv": b"a,b\n"}
+
+        path = materializer.checkout("topic", files)
+
+        assert _tree(path) == files
+
+    def test_files_are_linked_from_the_blob_store(self, materializer):
+        path = materializer.checkout("topic", {"data.txt": b"hello"})
+
+        assert (path / "data.txt").stat().st_nlink >= 2
+
+    def test_duplicate_contents_do_not_share_an_inode(self, materializer):
+        path = materializer.checkout("topic", {"a.txt": b"same", "b.txt": b"same"})
+
+        assert (path / "a.txt").stat().st_ino != (path / "b.txt").stat().st_ino
+
+    def test_falls_back_to_copies_when_links_fail(self, materializer, monkeypatch):
+        def refuse(*args, **kwargs):
+            raise OSError("links not supported")
+
+        monkeypatch.setattr(sandbox_module.os, "link", refuse)
+
+        path = materializer.checkout("topic", {"data.txt": b"hello"})
+
+        assert (path / "data.txt").read_bytes() == b"hello"
+        assert (path / "data.txt").stat().st_nlink == 1
+
+
+class TestReuse:
+    def test_same_topic_reuses_the_directory(self, materializer):
+        first = materializer.checkout("topic", {"data.txt": b"hello"})
+        materializer.release(first)
+
+        second = materializer.checkout("topic", {"data.txt": b"hello"})
+
+        assert second == first
+
+    def test_kernel_leftovers_are_removed(self, materializer):
+        path = materializer.checkout("topic", {"data.txt": b"hello"})
+        (path / "plot.png").write_bytes(b"png")
+        (path / "out" / "nested").mkdir(parents=True)
+        (path / "out" / "nested" / "result.txt").write_text("x")
+        materializer.release(path)
+
+        path = materializer.checkout("topic", {"data.txt": b"hello"})
+
+        assert _tree(path) == {"data.txt": b"hello"}
+        assert not (path / "out").exists()
+
+    def test_in_place_modification_is_undone_everywhere(self, materializer):
+        files = {"data.txt": b"hello"}
+        path = materializer.checkout("topic-a", files)
+        with open(path / "data.txt", "ab") as f:
+            f.write(b" world")
+        materializer.release(path)
+
+        reused = materializer.checkout("topic-a", files)
+        materializer.release(reused)
+        other = materializer.checkout("topic-b", files)
+
+        assert (reused / "data.txt").read_bytes() == b"hello"
+        assert (other / "data.txt").read_bytes() == b"hello"
+
+    def test_deleted_and_changed_files_are_restored(self, materializer):
+        path = materializer.checkout("topic", {"a.txt": b"a", "b.txt": b"b"})
+        (path / "a.txt").unlink()
+        materializer.release(path)
+
+        path = materializer.checkout("topic", {"a.txt": b"a", "b.txt": b"B", "c.txt": b"c"})
+
+        assert _tree(path) == {"a.txt": b"a", "b.txt": b"B", "c.txt": b"c"}
+
+    def test_leased_topic_gets_a_throwaway_sandbox(self, materializer):
+        first = materializer.checkout("topic", {"data.txt": b"hello"})
+
+        second = materializer.checkout("topic", {"data.txt": b"hello"})
+        materializer.release(second)
+
+        assert second != first
+        assert not second.exists()
+        assert first.exists()
+
+    def test_least_recently_used_sandbox_is_evicted(self, tmp_path):
+        materializer = SandboxMaterializer(tmp_path / "store", max_sandboxes=1)
+        first = materializer.checkout("one", {"one.txt": b"1"})
+        materializer.release(first)
+
+        second = materializer.checkout("two", {"two.txt": b"2"})
+        materializer.release(second)
+
+        assert not first.exists()
+        assert second.exists()
+        assert len(list((tmp_path / "store" / "blobs").iterdir())) == 1
+
+
+class TestDurability:
+    def test_no_fsync_or_global_sync_by_default(self, materializer, monkeypatch):
+        calls = []
+        monkeypatch.setattr(sandbox_module.os, "fsync", lambda fd: calls.append(fd))
+        monkeypatch.setattr(os, "sync", lambda: calls.append("sync"), raising=False)
+
+        materializer.checkout("topic", {"data.txt": b"hello"})
+        write_files(materializer.root / "plain", {"data.txt": b"hello"})
+
+        assert calls == []
+
+    def test_durable_mode_fsyncs_written_files(self, tmp_path, monkeypatch):
+        calls = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(sandbox_module.os, "fsync", lambda fd: calls.append(real_fsync(fd)))
+
+        write_files(tmp_path, {"a.txt": b"a", "sub/b.txt": b"b"}, durable=True)
+
+        assert len(calls) >= 2
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [("1", True), ("true", True), ("0", False), ("", False)]
+    )
+    def test_fsync_env_var(self, monkeypatch, value, expected):
+        monkeypatch.setenv("CLM_SANDBOX_FSYNC", value)
+
+        assert sandbox_fsync_enabled() is expected
+
+
+def test_decode_other_files():
+    encoded = {"data.txt": b64encode(b"hello").decode("ascii")}
+
+    assert decode_other_files(encoded) == {"data.txt": b"hello"}